@@ -0,0 +1,5 @@
+"""
+Benchmarks of the layout on synthetic graphs
+
+python3 -m layeredGraphLayouter.benchmarks --help
+"""
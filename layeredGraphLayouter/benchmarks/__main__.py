@@ -0,0 +1,72 @@
+"""
+python3 -m layeredGraphLayouter.benchmarks --sizes 100 1000 --baseline baseline.json
+
+Exits with code 1 if there is a regression against the baseline.
+"""
+import argparse
+import sys
+
+from layeredGraphLayouter.benchmarks.generators import GENERATORS
+from layeredGraphLayouter.benchmarks.runner import BenchmarkRunner,\
+    compareWithBaseline, loadResults, saveResults
+from layeredGraphLayouter.trace import tracing
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python3 -m layeredGraphLayouter.benchmarks",
+        description="Run layout benchmarks and compare them with baseline")
+    parser.add_argument("--generators", nargs="+", choices=sorted(GENERATORS),
+                        default=None, help="default: all")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000],
+                        help="numbers of nodes (default: 100 1000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="number of timed runs, the fastest is used")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="do not measure peak memory")
+    parser.add_argument("--baseline", help="baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write results to the baseline file")
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--memory-tolerance", type=float, default=0.1)
+    parser.add_argument("--min-time", type=float, default=0.005)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--trace",
+                        help="write spans of the timed runs to this file"
+                        " (Chrome trace format, speedscope format"
+                        " if the name ends with .speedscope.json)")
+    args = parser.parse_args(argv)
+
+    runner = BenchmarkRunner(traceMemory=not args.no_memory,
+                             repeat=args.repeat)
+    if args.trace:
+        with tracing() as tracer:
+            results = runner.run(args.generators, args.sizes, seed=args.seed,
+                                 log=print)
+        tracer.write(args.trace)
+    else:
+        results = runner.run(args.generators, args.sizes, seed=args.seed,
+                             log=print)
+    if args.output:
+        saveResults(results, args.output)
+
+    if args.baseline is None:
+        return 0
+
+    if args.update_baseline:
+        saveResults(results, args.baseline)
+        return 0
+
+    regressions = compareWithBaseline(
+        results, loadResults(args.baseline),
+        timeTolerance=args.time_tolerance,
+        memoryTolerance=args.memory_tolerance,
+        minTime=args.min_time)
+    for r in regressions:
+        print("REGRESSION", r, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Seeded generators of synthetic graphs for benchmarks
+
+Each generator has the signature (nodeCnt: int, seed: int) -> LGraph,
+the same arguments always produce the same graph.
+"""
+from random import Random
+
+from layeredGraphLayouter.containers.constants import PortSide, PortType,\
+    HierarchyHandling
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lGraphBulkBuilder import LGraphBulkBuilder
+
+
+class GraphTables():
+    """
+    Tables of the generated graph for
+    :class:`layeredGraphLayouter.containers.lGraphBulkBuilder.LGraphBulkBuilder`
+    """
+
+    def __init__(self):
+        self.nodeNames = []
+        self.portNodes = []
+        self.portSides = []
+        self.portTypes = []
+        self.portNames = []
+        self.edgeSrc = []
+        self.edgeDst = []
+
+    def addNode(self) -> int:
+        i = len(self.nodeNames)
+        self.nodeNames.append("n%d" % i)
+        return i
+
+    def addPort(self, node: int, isOutput: bool) -> int:
+        i = len(self.portNodes)
+        self.portNodes.append(node)
+        if isOutput:
+            self.portSides.append(PortSide.EAST)
+            self.portTypes.append(PortType.OUTPUT)
+            self.portNames.append("o")
+        else:
+            self.portSides.append(PortSide.WEST)
+            self.portTypes.append(PortType.INPUT)
+            self.portNames.append("i")
+        return i
+
+    def addEdge(self, src: int, dst: int):
+        self.edgeSrc.append(src)
+        self.edgeDst.append(dst)
+
+    def build(self, graph: LGraph=None) -> LGraph:
+        b = LGraphBulkBuilder(graph)
+        g = b.build(self.nodeNames, self.portNodes, self.portSides,
+                    self.portTypes, self.edgeSrc, self.edgeDst,
+                    portNames=self.portNames)
+        for n in b.nodes:
+            if n.west or n.east:
+                n.initDim()
+            else:
+                n.size.x = n.size.y = 20
+        return g
+
+
+def randomDag(nodeCnt: int, seed: int, edgeFactor=1.5) -> LGraph:
+    """
+    Random DAG, each node has one input and one output port,
+    edges go from lower to higher node index
+    """
+    r = Random(seed)
+    t = GraphTables()
+    for _ in range(nodeCnt):
+        n = t.addNode()
+        t.addPort(n, False)
+        t.addPort(n, True)
+
+    for _ in range(int(nodeCnt * edgeFactor)):
+        if nodeCnt < 2:
+            break
+        a = r.randrange(nodeCnt - 1)
+        # prefer short edges as in real netlists
+        b = min(nodeCnt - 1, a + 1 + int(r.expovariate(0.2)))
+        t.addEdge(2 * a + 1, 2 * b)
+    return t.build()
+
+
+def deepPipeline(nodeCnt: int, seed: int, width=4) -> LGraph:
+    """
+    Chain of stages of width nodes, each node is connected
+    to one or two nodes of the next stage
+    """
+    r = Random(seed)
+    t = GraphTables()
+    prevStage = []
+    stage = []
+    for i in range(nodeCnt):
+        n = t.addNode()
+        inp = t.addPort(n, False)
+        t.addPort(n, True)
+        stage.append(n)
+        if prevStage:
+            src = r.choice(prevStage)
+            t.addEdge(2 * src + 1, inp)
+            if r.random() < 0.3:
+                src = r.choice(prevStage)
+                t.addEdge(2 * src + 1, inp)
+        if len(stage) == width:
+            prevStage = stage
+            stage = []
+    return t.build()
+
+
+def wideBus(nodeCnt: int, seed: int, busWidth=8) -> LGraph:
+    """
+    Nodes with busWidth ports, neighbor nodes are connected by permuted buses
+    """
+    r = Random(seed)
+    t = GraphTables()
+    prevOutputs = None
+    for _ in range(nodeCnt):
+        n = t.addNode()
+        inputs = [t.addPort(n, False) for _ in range(busWidth)]
+        outputs = [t.addPort(n, True) for _ in range(busWidth)]
+        if prevOutputs is not None:
+            perm = list(range(busWidth))
+            # partially shuffled bus to produce crossings
+            for i in range(0, busWidth - 1, 2):
+                if r.random() < 0.5:
+                    perm[i], perm[i + 1] = perm[i + 1], perm[i]
+            for src, dstI in zip(prevOutputs, perm):
+                t.addEdge(src, inputs[dstI])
+        prevOutputs = outputs if r.random() < 0.8 or prevOutputs is None else prevOutputs
+    return t.build()
+
+
+def portHeavyBus(nodeCnt: int, seed: int) -> LGraph:
+    """
+    wideBus with 32 bit buses, most of the time of the crossing
+    minimization is spent on ports
+    """
+    return wideBus(nodeCnt, seed, busWidth=32)
+
+
+def hyperedgeNets(nodeCnt: int, seed: int, fanout=8) -> LGraph:
+    """
+    Nets with one driver and many sinks (e.g. clock, reset, enable)
+    """
+    r = Random(seed)
+    t = GraphTables()
+    outputs = []
+    for i in range(nodeCnt):
+        n = t.addNode()
+        inp = t.addPort(n, False)
+        if outputs:
+            t.addEdge(r.choice(outputs[-fanout * 4:]), inp)
+        if i % 3 == 0:
+            outputs.append(t.addPort(n, True))
+    return t.build()
+
+
+def highFanout(nodeCnt: int, seed: int, netCnt=2) -> LGraph:
+    """
+    Few global nets (clock, reset) driven from first nodes and connected
+    to all other nodes and a random DAG of data edges between the other
+    nodes, the global nets are split to long edges with thousands of edges
+    on a single port
+    """
+    r = Random(seed)
+    t = GraphTables()
+    netCnt = max(0, min(netCnt, nodeCnt - 1))
+    drivers = []
+    for _ in range(netCnt):
+        n = t.addNode()
+        drivers.append(t.addPort(n, True))
+
+    dataOutputs = []
+    for _ in range(nodeCnt - netCnt):
+        n = t.addNode()
+        for d in drivers:
+            t.addEdge(d, t.addPort(n, False))
+        inp = t.addPort(n, False)
+        if dataOutputs:
+            # prefer short edges as in real netlists
+            i = max(0, len(dataOutputs) - 1 - int(r.expovariate(0.2)))
+            t.addEdge(dataOutputs[i], inp)
+        dataOutputs.append(t.addPort(n, True))
+    return t.build()
+
+
+def cyclicControl(nodeCnt: int, seed: int, backEdgeRatio=0.2) -> LGraph:
+    """
+    Control graph (state machine like) with many cycles
+    """
+    r = Random(seed)
+    t = GraphTables()
+    for _ in range(nodeCnt):
+        n = t.addNode()
+        t.addPort(n, False)
+        t.addPort(n, True)
+
+    for a in range(nodeCnt - 1):
+        t.addEdge(2 * a + 1, 2 * (a + 1))
+        if r.random() < backEdgeRatio:
+            b = r.randrange(a + 1)
+            t.addEdge(2 * (a + 1) + 1, 2 * b)
+        if r.random() < 0.3:
+            b = r.randrange(a + 1, nodeCnt)
+            t.addEdge(2 * a + 1, 2 * b)
+    return t.build()
+
+
+def multiLevelHierarchy(nodeCnt: int, seed: int, graphSize=25) -> LGraph:
+    """
+    Hierarchy of graphs, nodes contain nested graphs (LNode.nestedLgraph)
+    with random DAGs of graphSize nodes, graphs are filled in breadth first
+    order so the depth grows with nodeCnt, total number of nodes is nodeCnt,
+    each graph is meant to be layouted separately (SEPARATE_CHILDREN)
+    """
+    r = Random(seed)
+    topCnt = min(graphSize, max(1, nodeCnt // (graphSize * graphSize)))
+
+    root = randomDag(topCnt, seed)
+    root.hierarchyHandling = HierarchyHandling.SEPARATE_CHILDREN
+    remaining = nodeCnt - topCnt
+    graphs = [root]
+    i = 0
+    while remaining > 0 and i < len(graphs):
+        g = graphs[i]
+        i += 1
+        for n in g.nodes:
+            if remaining <= 0:
+                break
+            cnt = min(remaining, graphSize)
+            nested = randomDag(cnt, r.randrange(1 << 30))
+            remaining -= cnt
+            nested.hierarchyHandling = HierarchyHandling.SEPARATE_CHILDREN
+            n.compoundNode = True
+            n.nestedLgraph = nested
+            nested.parentLnode = n
+            graphs.append(nested)
+    return root
+
+
+GENERATORS = {
+    "randomDag": randomDag,
+    "deepPipeline": deepPipeline,
+    "wideBus": wideBus,
+    "portHeavyBus": portHeavyBus,
+    "hyperedgeNets": hyperedgeNets,
+    "highFanout": highFanout,
+    "cyclicControl": cyclicControl,
+    "multiLevelHierarchy": multiLevelHierarchy,
+}
@@ -0,0 +1,226 @@
+"""
+Runner of benchmarks, times each phase and processor of LayoutProcessor
+on graphs from :mod:`layeredGraphLayouter.benchmarks.generators`,
+measures peak memory and compares the results with stored baseline
+
+Results and baseline are JSON serializable dicts
+{"<generator>/<nodeCnt>": case result}, case result is:
+
+* generator, nodeCnt, seed, nodes, edges
+* buildTime: time of the generator in seconds
+* total: time of the whole layout in seconds
+* phases: {phase name: seconds}
+* processors: {"<phase name>:<processor class name>": seconds}
+* peakMemory: peak of traced memory during the layout in bytes
+  (None if not traced)
+* error: None or the description of the exception from the layout
+"""
+import gc
+import json
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+from layeredGraphLayouter.benchmarks.generators import GENERATORS
+from layeredGraphLayouter.containers.constants import HierarchyHandling
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.layoutProcessor import LayoutProcessor, defaultConfig
+from layeredGraphLayouter.layoutProcessorConfiguration import LayoutProcessorConfiguration
+from layeredGraphLayouter.trace import span, disableTracing, enableTracing
+
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+
+
+def iterGraphsBottomUp(graph: LGraph):
+    """
+    Yield the graphs which are layouted separately, nested graphs
+    (LNode.nestedLgraph) of graphs with SEPARATE_CHILDREN hierarchy handling
+    are yielded before its parent graph
+    """
+    stack = [(graph, False)]
+    while stack:
+        g, childrenDone = stack.pop()
+        if childrenDone:
+            yield g
+            continue
+        stack.append((g, True))
+        if g.hierarchyHandling != HierarchyHandling.SEPARATE_CHILDREN:
+            continue
+        for n in reversed(g.nodes):
+            if n.nestedLgraph is not None:
+                stack.append((n.nestedLgraph, False))
+
+
+def caseKey(generatorName: str, nodeCnt: int) -> str:
+    return "%s/%d" % (generatorName, nodeCnt)
+
+
+class BenchmarkRunner():
+    """
+    :ivar configFactory: function which creates new LayoutProcessorConfiguration
+        (new one is required for each graph as the configuration
+        is loaded for specified graph)
+    :ivar traceMemory: if True the layout is executed once more
+        with tracemalloc to get peak memory (not in timed run as tracing
+        slows the execution)
+    :ivar repeat: number of timed runs, the fastest one is used
+    """
+
+    def __init__(self,
+                 configFactory: Callable[[], LayoutProcessorConfiguration]=defaultConfig,
+                 traceMemory=True, repeat=1):
+        self.configFactory = configFactory
+        self.traceMemory = traceMemory
+        self.repeat = repeat
+
+    def layout(self, graph: LGraph, phases: Dict[str, float],
+               processors: Dict[str, float]):
+        """
+        Run layout on all graphs of the hierarchy and accumulate the times
+        of phases and processors
+        """
+        def processorTimer(phaseName, slotName, proc, t):
+            k = "%s:%s" % (slotName, proc.__class__.__name__)
+            processors[k] = processors.get(k, 0.0) + t
+            phases[phaseName] = phases.get(phaseName, 0.0) + t
+
+        perf_counter = time.perf_counter
+        for g in iterGraphsBottomUp(graph):
+            config = self.configFactory()
+            t = perf_counter()
+            lp = LayoutProcessor(g, config, processorTimer=processorTimer)
+            k = "load"
+            phases[k] = phases.get(k, 0.0) + perf_counter() - t
+            lp.run()
+
+    def runCase(self, generatorName: str, nodeCnt: int, seed: int=0) -> dict:
+        gen = GENERATORS[generatorName]
+        res = {
+            "generator": generatorName,
+            "nodeCnt": nodeCnt,
+            "seed": seed,
+            "error": None,
+            "peakMemory": None,
+        }
+        best = None
+        for _ in range(self.repeat):
+            gc.collect()
+            t = time.perf_counter()
+            graph = gen(nodeCnt, seed)
+            buildTime = time.perf_counter() - t
+            graphs = list(iterGraphsBottomUp(graph))
+            res["nodes"] = sum(len(g.nodes) for g in graphs)
+            res["edges"] = sum(len(g.edges) for g in graphs)
+
+            phases = {}
+            processors = {}
+            t = time.perf_counter()
+            try:
+                with span(caseKey(generatorName, nodeCnt), "benchmark"):
+                    self.layout(graph, phases, processors)
+            except Exception as e:
+                res["error"] = "%s: %s" % (e.__class__.__name__, e)
+            total = time.perf_counter() - t
+            if best is None or total < best[0]:
+                best = (total, buildTime, phases, processors)
+            if res["error"] is not None:
+                break
+
+        res["total"], res["buildTime"], res["phases"], res["processors"] = best
+
+        if self.traceMemory and res["error"] is None:
+            graph = gen(nodeCnt, seed)
+            gc.collect()
+            # spans of this run are distorted by tracemalloc
+            tracer = disableTracing()
+            tracemalloc.start()
+            try:
+                self.layout(graph, {}, {})
+                res["peakMemory"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+                if tracer is not None:
+                    enableTracing(tracer)
+
+        return res
+
+    def run(self, generators: Optional[Sequence[str]]=None,
+            sizes: Sequence[int]=DEFAULT_SIZES, seed: int=0,
+            log: Optional[Callable[[str], None]]=None) -> Dict[str, dict]:
+        if generators is None:
+            generators = list(GENERATORS.keys())
+        results = {}
+        for g in generators:
+            for size in sizes:
+                r = self.runCase(g, size, seed=seed)
+                results[caseKey(g, size)] = r
+                if log is not None:
+                    log(formatCase(r))
+        return results
+
+
+def formatCase(res: dict) -> str:
+    s = "%s/%d: nodes=%d edges=%d build=%.3fs layout=%.3fs" % (
+        res["generator"], res["nodeCnt"], res["nodes"], res["edges"],
+        res["buildTime"], res["total"])
+    if res["peakMemory"] is not None:
+        s += " peak=%.1fMiB" % (res["peakMemory"] / (1 << 20))
+    if res["error"] is not None:
+        s += " ERROR " + res["error"]
+    return s
+
+
+def compareWithBaseline(results: Dict[str, dict], baseline: Dict[str, dict],
+                        timeTolerance=0.25, memoryTolerance=0.1,
+                        minTime=0.005) -> List[str]:
+    """
+    :param timeTolerance: allowed relative increase of time
+    :param memoryTolerance: allowed relative increase of peak memory
+    :param minTime: absolute increase of time in seconds which is always
+        tolerated (times of tiny processors are mostly noise)
+    :return: list of descriptions of regressions (empty if there is none)
+    """
+    regressions = []
+
+    def checkTime(name, cur, base):
+        if cur > base * (1 + timeTolerance) and cur - base > minTime:
+            regressions.append("%s: time %.4fs > baseline %.4fs (+%.0f%%)" % (
+                name, cur, base, (cur / base - 1) * 100 if base else float("inf")))
+
+    for k, res in results.items():
+        base = baseline.get(k)
+        if base is None:
+            continue
+
+        if res["error"] is not None and base.get("error") is None:
+            regressions.append("%s: failed (%s)" % (k, res["error"]))
+            continue
+        if res["error"] is not None or base.get("error") is not None:
+            # times of incomplete layout are not comparable
+            continue
+
+        checkTime(k, res["total"], base["total"])
+        baseProcessors = base.get("processors", {})
+        for pk, t in res["processors"].items():
+            bt = baseProcessors.get(pk)
+            if bt is not None:
+                checkTime("%s %s" % (k, pk), t, bt)
+
+        m = res["peakMemory"]
+        bm = base.get("peakMemory")
+        if m is not None and bm is not None and m > bm * (1 + memoryTolerance):
+            regressions.append("%s: peak memory %d > baseline %d (+%.0f%%)" % (
+                k, m, bm, (m / bm - 1) * 100 if bm else float("inf")))
+
+    return regressions
+
+
+def loadResults(fileName: str) -> Dict[str, dict]:
+    with open(fileName) as f:
+        return json.load(f)
+
+
+def saveResults(results: Dict[str, dict], fileName: str):
+    with open(fileName, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
@@ -9,10 +9,10 @@ class EdgeChecker(ILayoutProcessor):
             try:
                 assert e.src is not None, e
                 assert e.srcNode is not None, e
-                assert e.srcNode is e.src.getNode(), e
+                assert e.srcNode is e.src.node, e
                 assert e.dst is not None, e
                 assert e.dstNode is not None, e
-                assert e.dstNode is e.dst.getNode() is not None, e
+                assert e.dstNode is e.dst.node is not None, e
                 assert e.isSelfLoop == (e.srcNode is e.dstNode), e
             except AssertionError:
                 raise
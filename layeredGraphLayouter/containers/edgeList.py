@@ -0,0 +1,162 @@
+from typing import Iterable, Iterator, List
+
+
+# number of edges from which the position of the edge is looked up
+# in dict instead of linear search
+_INDEX_THRESHOLD = 8
+
+
+class EdgeList():
+    """
+    Ordered list of edges of the port (LPort.outgoingEdges/incomingEdges)
+    with constant time removal
+
+    Removed edges are replaced by None (a hole) in the underlying list
+    and the list is compacted once there is more holes than edges,
+    so the order of the remaining edges never changes. Position of each
+    edge is tracked in dict once the list is longer than _INDEX_THRESHOLD.
+
+    :note: each edge can be in the list only once
+    :note: same as for list, do not remove edges while iterating the list,
+        iterate over list(edges) instead
+    """
+    __slots__ = ("_items", "_pos", "_holes")
+
+    def __init__(self, edges: Iterable["LEdge"]=()):
+        self._items = list(edges)
+        self._holes = 0
+        self._pos = None
+        if len(self._items) > _INDEX_THRESHOLD:
+            self._buildIndex()
+
+    def _buildIndex(self):
+        self._pos = {e: i for i, e in enumerate(self._items) if e is not None}
+
+    def _compact(self):
+        self._items = [e for e in self._items if e is not None]
+        self._holes = 0
+        if self._pos is not None:
+            self._buildIndex()
+
+    def append(self, e: "LEdge"):
+        items = self._items
+        pos = self._pos
+        if pos is not None:
+            pos[e] = len(items)
+        items.append(e)
+        if pos is None and len(items) > _INDEX_THRESHOLD:
+            self._buildIndex()
+
+    def extend(self, edges: Iterable["LEdge"]):
+        for e in edges:
+            self.append(e)
+
+    def _indexOf(self, e: "LEdge") -> int:
+        """
+        :return: index of the edge in the underlying list (including holes)
+        """
+        pos = self._pos
+        if pos is None:
+            # linear search on short list, edges are compared by identity
+            for i, e2 in enumerate(self._items):
+                if e2 is e:
+                    return i
+        else:
+            i = pos.get(e)
+            if i is not None:
+                return i
+        raise ValueError("%r is not in EdgeList" % (e, ))
+
+    def remove(self, e: "LEdge"):
+        i = self._indexOf(e)
+        items = self._items
+        pos = self._pos
+        if pos is not None:
+            del pos[e]
+
+        if i == len(items) - 1:
+            items.pop()
+            # drop holes at the end
+            while items and items[-1] is None:
+                items.pop()
+                self._holes -= 1
+        else:
+            items[i] = None
+            self._holes += 1
+            if self._holes > len(items) - self._holes:
+                self._compact()
+
+    def replace(self, old: "LEdge", new: "LEdge"):
+        """
+        Put the new edge on the place of the old edge
+        """
+        i = self._indexOf(old)
+        self._items[i] = new
+        pos = self._pos
+        if pos is not None:
+            del pos[old]
+            pos[new] = i
+
+    def insert(self, index: int, e: "LEdge"):
+        """
+        :note: O(n), same as list.insert
+        """
+        if self._holes:
+            self._compact()
+        self._items.insert(index, e)
+        if self._pos is not None or len(self._items) > _INDEX_THRESHOLD:
+            self._buildIndex()
+
+    def index(self, e: "LEdge") -> int:
+        if self._holes:
+            self._compact()
+        return self._indexOf(e)
+
+    def clear(self):
+        self._items = []
+        self._holes = 0
+        self._pos = None
+
+    def __iter__(self) -> Iterator["LEdge"]:
+        if self._holes:
+            # LEdge instances are always true
+            return filter(None, self._items)
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator["LEdge"]:
+        if self._holes:
+            self._compact()
+        return reversed(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items) - self._holes
+
+    def __bool__(self) -> bool:
+        return len(self._items) != self._holes
+
+    def __contains__(self, e: "LEdge") -> bool:
+        pos = self._pos
+        if pos is not None:
+            return e in pos
+        return any(e2 is e for e2 in self._items)
+
+    def __getitem__(self, index):
+        if self._holes:
+            self._compact()
+        return self._items[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (EdgeList, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return list(self)
+
+    def __setstate__(self, state: List["LEdge"]):
+        self.__init__(state)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, list(self))
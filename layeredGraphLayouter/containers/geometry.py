@@ -69,9 +69,42 @@ class GeometryPath():
         return "<% %r>" % (self.__class__.__name__, self.points)
 
 
+class StoredGeometry():
+    """
+    Geometry attribute (possition, size, anchor, margin) of LRectangle
+    attached to GeometryStore
+
+    The attached element does not have the attribute in its __dict__,
+    a view on the values in the store is created on each access
+    (views are not kept, so the attached element does not own any geometry objects).
+    The attribute of the element which is not attached is in its __dict__
+    and it shadows this (non-data) descriptor.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = obj._geometry
+        if store is None:
+            raise AttributeError(self.name)
+        return store.view(self.name, obj._geometryId)
+
+
 class LRectangle():
+    # used only if the element is attached to GeometryStore
+    possition = StoredGeometry()
+    margin = StoredGeometry()
+    size = StoredGeometry()
+    anchor = StoredGeometry()
+
     def __init__(self):
         self.parent = None
+        # GeometryStore which the geometry is stored in and id in it
+        self._geometry = None
+        self._geometryId = None
         self.possition = Point()
         self.margin = Spacing()
         self.size = Point()
@@ -0,0 +1,337 @@
+"""
+Struct-of-arrays store of geometry of LNode/LPort instances
+
+Values of possition, size, anchor and margin of each attached element
+are stored in contiguous float arrays indexed by id of the element,
+the element keeps only the store and its id. The access to the attributes
+returns a view (PointView, SpacingView, created on access
+by :class:`layeredGraphLayouter.containers.geometry.StoredGeometry`)
+so the existing code which accesses them one attribute
+at a time still works. Bulk operations (translate, scale, boundingBox)
+work on the arrays directly (using numpy if available).
+
+The store is optional, it is enabled by LGraph.enableGeometryStore(),
+nodes and ports created in the graph later are attached automatically.
+"""
+from array import array
+from typing import Iterable, Optional, Sequence, Tuple
+
+from layeredGraphLayouter.containers.geometry import Point, Spacing, LRectangle
+
+try:
+    import numpy as np
+except ImportError:
+    # bulk operations fall back to python loops
+    np = None
+
+
+# number of elements from which the numpy is used for bulk operations
+_NUMPY_THRESHOLD = 64
+
+
+class PointView():
+    """
+    Point whose x, y are stored in arrays of GeometryStore
+
+    :note: the view does not inherit the data slots of Point,
+        it is only a reference to the values in the store
+    """
+    __slots__ = ("_cols", "_i")
+
+    def __init__(self, cols: Tuple[array, array], i: int):
+        self._cols = cols
+        self._i = i
+
+    @property
+    def x(self):
+        return self._cols[0][self._i]
+
+    @x.setter
+    def x(self, v):
+        self._cols[0][self._i] = v
+
+    @property
+    def y(self):
+        return self._cols[1][self._i]
+
+    @y.setter
+    def y(self, v):
+        self._cols[1][self._i] = v
+
+    def __add__(self, other):
+        return Point(self.x + other.x, self.y + other.y)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Point(self.x, self.y)[index]
+        return self._cols[index][self._i]
+
+    def __setitem__(self, index, value):
+        self._cols[index][self._i] = value
+
+    def __len__(self):
+        return 2
+
+    def __iter__(self):
+        i = self._i
+        return (c[i] for c in self._cols)
+
+    def __repr__(self):
+        return "<PointView x:%f, y:%f>" % (self.x, self.y)
+
+
+class SpacingView():
+    """
+    Spacing whose values are stored in arrays of GeometryStore
+    """
+    __slots__ = ("_cols", "_i")
+
+    def __init__(self, cols: Tuple[array, array, array, array], i: int):
+        self._cols = cols
+        self._i = i
+
+    def __getitem__(self, index):
+        return self._cols[index][self._i]
+
+    def __setitem__(self, index, value):
+        self._cols[index][self._i] = value
+
+    def __len__(self):
+        return 4
+
+    def __iter__(self):
+        i = self._i
+        return (c[i] for c in self._cols)
+
+    def __repr__(self):
+        return "<SpacingView t:%f, b:%f, l:%f, r:%f>" % tuple(self)
+
+
+def _spacingProperty(index):
+    def get(self):
+        return self._cols[index][self._i]
+
+    def set(self, v):
+        self._cols[index][self._i] = v
+
+    return property(get, set)
+
+
+for _i, _name in enumerate(Spacing.__slots__):
+    setattr(SpacingView, _name, _spacingProperty(_i))
+
+
+class GeometryStore():
+    """
+    Struct-of-arrays geometry (described in module docstring)
+
+    :ivar x, y: possition of elements
+    :ivar w, h: size of elements
+    :ivar anchorX, anchorY: anchor of elements
+    :ivar marginTop, marginBottom, marginLeft, marginRight: margin of elements
+    :ivar elements: list of attached elements, index is the id of the element
+    :ivar _views: dict {name of attribute: (view class, columns)}
+    :note: ids are never reused, elements removed from the graph
+        keep its values in the store
+    :note: assignment of a new Point/Spacing to the attribute of an attached
+        element shadows the values in the store, use detach() first
+    """
+    COLUMNS = ("x", "y", "w", "h", "anchorX", "anchorY",
+               "marginTop", "marginBottom", "marginLeft", "marginRight")
+
+    def __init__(self):
+        for c in self.COLUMNS:
+            setattr(self, c, array("d"))
+        self.elements = []
+        self._views = {
+            "possition": (PointView, (self.x, self.y)),
+            "size": (PointView, (self.w, self.h)),
+            "anchor": (PointView, (self.anchorX, self.anchorY)),
+            "margin": (SpacingView, (self.marginTop, self.marginBottom,
+                                     self.marginLeft, self.marginRight)),
+        }
+
+    def __len__(self):
+        return len(self.elements)
+
+    def indexOf(self, r: LRectangle) -> Optional[int]:
+        """
+        :return: id of the element or None if the element is not in this store
+        """
+        if r._geometry is self:
+            return r._geometryId
+        return None
+
+    def view(self, name: str, i: int):
+        """
+        :return: view on the values of the attribute of the element
+        """
+        viewCls, cols = self._views[name]
+        return viewCls(cols, i)
+
+    def attach(self, r: LRectangle) -> int:
+        """
+        Move the geometry of the element to this store
+
+        :return: id of the element
+        """
+        i = self.indexOf(r)
+        if i is not None:
+            return i
+
+        i = len(self.elements)
+        p = r.possition
+        s = r.size
+        a = r.anchor
+        m = r.margin
+        for col, v in zip((self.x, self.y, self.w, self.h,
+                           self.anchorX, self.anchorY,
+                           self.marginTop, self.marginBottom,
+                           self.marginLeft, self.marginRight),
+                          (p.x, p.y, s.x, s.y, a.x, a.y,
+                           m.top, m.bottom, m.left, m.right)):
+            col.append(v)
+
+        if r._geometry is None:
+            # the element attached to other store has no own geometry objects
+            del r.possition
+            del r.size
+            del r.anchor
+            del r.margin
+        r._geometry = self
+        r._geometryId = i
+        self.elements.append(r)
+        return i
+
+    def detach(self, r: LRectangle):
+        """
+        Move the geometry of the element back to its own Point/Spacing objects
+        """
+        i = self.indexOf(r)
+        if i is None:
+            return
+        r._geometry = None
+        r._geometryId = None
+        r.possition = Point(self.x[i], self.y[i])
+        r.size = Point(self.w[i], self.h[i])
+        r.anchor = Point(self.anchorX[i], self.anchorY[i])
+        r.margin = Spacing(self.marginTop[i], self.marginBottom[i],
+                           self.marginLeft[i], self.marginRight[i])
+        self.elements[i] = None
+
+    def idsOf(self, rects: Iterable[LRectangle], withPorts=False) -> array:
+        """
+        :param rects: attached elements (e.g. LNodeLayer, LGraph.nodes)
+        :param withPorts: if True the ports of the nodes are included as well
+            (port possitions are in the coordinates of the graph,
+            they have to move with the node)
+        """
+        ids = array("q")
+        indexOf = self.indexOf
+        for r in rects:
+            i = indexOf(r)
+            if i is None:
+                raise KeyError(r)
+            ids.append(i)
+            if withPorts:
+                for p in r.iterPorts():
+                    i = indexOf(p)
+                    if i is None:
+                        raise KeyError(p)
+                    ids.append(i)
+        return ids
+
+    def translate(self, ids: Sequence[int], dx: float, dy: float):
+        """
+        Move the elements (ids have to be unique)
+        """
+        if np is not None and len(ids) >= _NUMPY_THRESHOLD:
+            idx = np.asarray(ids, dtype=np.int64)
+            np.frombuffer(self.x, dtype=np.float64)[idx] += dx
+            np.frombuffer(self.y, dtype=np.float64)[idx] += dy
+            return
+
+        xs = self.x
+        ys = self.y
+        for i in ids:
+            xs[i] += dx
+            ys[i] += dy
+
+    def scale(self, ids: Sequence[int], sx: float, sy: float,
+              originX: float=0.0, originY: float=0.0):
+        """
+        Scale possitions (relatively to origin), sizes, anchors
+        and margins of the elements (ids have to be unique)
+        """
+        xCols = (self.w, self.anchorX, self.marginLeft, self.marginRight)
+        yCols = (self.h, self.anchorY, self.marginTop, self.marginBottom)
+        if np is not None and len(ids) >= _NUMPY_THRESHOLD:
+            idx = np.asarray(ids, dtype=np.int64)
+            xs = np.frombuffer(self.x, dtype=np.float64)
+            xs[idx] = originX + (xs[idx] - originX) * sx
+            ys = np.frombuffer(self.y, dtype=np.float64)
+            ys[idx] = originY + (ys[idx] - originY) * sy
+            for cols, f in ((xCols, sx), (yCols, sy)):
+                for c in cols:
+                    np.frombuffer(c, dtype=np.float64)[idx] *= f
+            return
+
+        xs = self.x
+        ys = self.y
+        for i in ids:
+            xs[i] = originX + (xs[i] - originX) * sx
+            ys[i] = originY + (ys[i] - originY) * sy
+            for cols, f in ((xCols, sx), (yCols, sy)):
+                for c in cols:
+                    c[i] *= f
+
+    def boundingBox(self, ids: Sequence[int], withMargins=False
+                    ) -> Optional[Tuple[float, float, float, float]]:
+        """
+        :return: (x0, y0, x1, y1) or None if ids are empty
+        """
+        if not len(ids):
+            return None
+
+        if np is not None and len(ids) >= _NUMPY_THRESHOLD:
+            idx = np.asarray(ids, dtype=np.int64)
+
+            def col(c):
+                return np.frombuffer(c, dtype=np.float64)[idx]
+
+            x0 = col(self.x)
+            y0 = col(self.y)
+            x1 = x0 + col(self.w)
+            y1 = y0 + col(self.h)
+            if withMargins:
+                x0 = x0 - col(self.marginLeft)
+                y0 = y0 - col(self.marginTop)
+                x1 = x1 + col(self.marginRight)
+                y1 = y1 + col(self.marginBottom)
+            return (float(x0.min()), float(y0.min()),
+                    float(x1.max()), float(y1.max()))
+
+        xs, ys, ws, hs = self.x, self.y, self.w, self.h
+        ml, mt, mr, mb = (self.marginLeft, self.marginTop,
+                          self.marginRight, self.marginBottom)
+        bx0 = by0 = float("inf")
+        bx1 = by1 = float("-inf")
+        for i in ids:
+            x0 = xs[i]
+            y0 = ys[i]
+            x1 = x0 + ws[i]
+            y1 = y0 + hs[i]
+            if withMargins:
+                x0 -= ml[i]
+                y0 -= mt[i]
+                x1 += mr[i]
+                y1 += mb[i]
+            if x0 < bx0:
+                bx0 = x0
+            if y0 < by0:
+                by0 = y0
+            if x1 > bx1:
+                bx1 = x1
+            if y1 > by1:
+                by1 = y1
+        return (bx0, by0, bx1, by1)
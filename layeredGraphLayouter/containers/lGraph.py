@@ -7,22 +7,160 @@ from layeredGraphLayouter.containers.lNode import LNode
 from layeredGraphLayouter.containers.lPort import LPort
 from layeredGraphLayouter.containers.spacings import LGraphSpacings
 from layeredGraphLayouter.containers.geometry import Point
+from layeredGraphLayouter.containers.geometryStore import GeometryStore
 
 
 class LNodeLayer(list):
+    """
+    Layer of nodes (list of nodes in order from top to bottom)
+
+    The layer maintains the index of each node (:meth:`indexOf`),
+    the index is updated lazily, mutations only mark the positions
+    from the first modified index as invalid and the positions
+    are recomputed in a single pass on the next lookup.
+
+    :ivar graph: LGraph instance which this layer belongs to
+    :ivar _pos: dict {node: index of node in this layer}
+    :ivar _validTo: positions in _pos are valid for indexes < _validTo
+    """
+
     def __init__(self, graph: "LGraph" = None, registerOnGraph=True):
         self.graph = graph
+        self._invalidateIndex()
         if registerOnGraph:
             self.graph.layers.append(self)
 
+    def _invalidateIndex(self):
+        self._pos = {}
+        self._validTo = 0
+
+    def _updateIndex(self):
+        v = self._validTo
+        end = len(self)
+        if v < end:
+            self._pos.update(zip(self[v:], range(v, end)))
+            self._validTo = end
+
+    def indexOf(self, node: LNode) -> int:
+        """
+        :return: index of the node in this layer
+        :raise ValueError: if the node is not in this layer
+        """
+        i = self._pos.get(node)
+        if i is not None and i < self._validTo:
+            return i
+        self._updateIndex()
+        i = self._pos.get(node)
+        if i is None:
+            raise ValueError("%r is not in layer" % (node, ))
+        return i
+
+    def index(self, node: LNode, *args) -> int:
+        if args:
+            return list.index(self, node, *args)
+        return self.indexOf(node)
+
+    def __contains__(self, node: LNode) -> bool:
+        try:
+            self.indexOf(node)
+        except ValueError:
+            return False
+        return True
+
     def append(self, v):
         v.layer = self
+        if self._validTo == len(self):
+            self._pos[v] = self._validTo
+            self._validTo += 1
         return list.append(self, v)
 
     def extend(self, iterable):
         for v in iterable:
             self.append(v)
 
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+    def insert(self, index: int, v):
+        if index < 0:
+            index = max(0, index + len(self))
+        self._validTo = min(self._validTo, index)
+        list.insert(self, index, v)
+
+    def remove(self, v):
+        i = self.indexOf(v)
+        list.__delitem__(self, i)
+        del self._pos[v]
+        self._validTo = min(self._validTo, i)
+
+    def removeAll(self, nodes):
+        """
+        Remove all nodes from the collection (in a single pass)
+        """
+        if not isinstance(nodes, (set, frozenset, dict)):
+            nodes = set(nodes)
+        if not nodes:
+            return
+        list.__setitem__(self, slice(None), [n for n in self if n not in nodes])
+        self._invalidateIndex()
+
+    def pop(self, index: int=-1):
+        if index < 0:
+            index += len(self)
+        v = list.pop(self, index)
+        self._pos.pop(v, None)
+        self._validTo = min(self._validTo, index)
+        return v
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            list.__delitem__(self, index)
+            self._invalidateIndex()
+        else:
+            self.remove(self[index])
+
+    def __setitem__(self, index, v):
+        if isinstance(index, slice):
+            list.__setitem__(self, index, v)
+            self._invalidateIndex()
+        else:
+            if index < 0:
+                index += len(self)
+            pos = self._pos
+            old = self[index]
+            i = pos.get(old)
+            # the node may be temporarily twice in the layer (swap of nodes),
+            # the entry is kept only if it is a valid position of other occurrence,
+            # a stale entry of the other occurrence is recomputed by _updateIndex
+            if i is not None and (i == index or i >= self._validTo):
+                del pos[old]
+            list.__setitem__(self, index, v)
+            if index < self._validTo:
+                pos[v] = index
+
+    def setOrder(self, nodes):
+        """
+        Replace the order of the nodes and update the positions
+        in a single pass
+        """
+        list.__setitem__(self, slice(None), nodes)
+        self._pos = {n: i for i, n in enumerate(self)}
+        self._validTo = len(self)
+
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        # all nodes are still in the layer, just the positions are invalid
+        self._validTo = 0
+
+    def reverse(self):
+        list.reverse(self)
+        self._validTo = 0
+
+    def clear(self):
+        list.clear(self)
+        self._invalidateIndex()
+
     def __eq__(self, other):
         return self is other
 
@@ -77,6 +215,8 @@ class LGraph():
         self.spacings = LGraphSpacings(self)
         self.nodePlacementBkEdgeStraightening = EdgeStraighteningStrategy.IMPROVE_STRAIGHTNESS
         self.portConstraints = PortConstraints.UNDEFINED
+        # optional GeometryStore of nodes and ports
+        self.geometry = None
 
     def getLayerlessNodes(self):
         """
@@ -92,6 +232,35 @@ class LGraph():
         self.nodes.append(n)
         return n
 
+    def enableGeometryStore(self) -> GeometryStore:
+        """
+        Move geometry of all nodes and ports to GeometryStore,
+        nodes and ports created later are added automatically
+
+        :return: the store
+        """
+        g = self.geometry
+        if g is None:
+            g = self.geometry = GeometryStore()
+        attach = g.attach
+        for n in self.nodes:
+            attach(n)
+            for p in n.iterPorts():
+                attach(p)
+        return g
+
+    def disableGeometryStore(self):
+        """
+        Move geometry back to Point/Spacing objects of nodes and ports
+        """
+        g = self.geometry
+        if g is None:
+            return
+        for r in g.elements:
+            if r is not None:
+                g.detach(r)
+        self.geometry = None
+
     def add_edge(self, src: LPort, dst: LPort, name=None, originObj=None):
         e = LEdge(name, originObj=originObj)
         e.setSrcDst(src, dst)
@@ -103,3 +272,11 @@ class LGraph():
         for n in nodes:
             n.setLayer(layer)
         return layer
+
+    def __reduce__(self):
+        """
+        Pickle the graph in flattened form
+        (:mod:`layeredGraphLayouter.containers.lGraphCodec`)
+        """
+        from layeredGraphLayouter.containers.lGraphCodec import encodeLGraph, decodeLGraph
+        return (decodeLGraph, (encodeLGraph(self), ))
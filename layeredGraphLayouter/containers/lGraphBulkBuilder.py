@@ -0,0 +1,187 @@
+"""
+Bulk construction of LGraph from tables of nodes, ports and edges
+
+Unlike LGraph.add_node/LNode.addPort/LGraph.add_edge the whole graph is
+created in one pass, owning node of each port is known from the port table
+(no LPort.getNode() walk) and the edge lists of ports are built directly.
+The feature flags of the graph (p_selfLoops, p_hyperedges, ...) are
+updated on the way.
+
+Tables are parallel sequences (lists, tuples or numpy arrays),
+id of node/port/edge is its index in its table.
+"""
+from typing import Optional, Sequence, Tuple
+
+from layeredGraphLayouter.containers.constants import PortConstraints,\
+    PortSide, PortType
+from layeredGraphLayouter.containers.lEdge import LEdge
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lNode import LNode, LayoutExternalPort
+from layeredGraphLayouter.containers.lPort import LPort
+
+
+def _toList(seq) -> list:
+    # numpy arrays are converted to python numbers at once
+    tolist = getattr(seq, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    return seq
+
+
+def _toEnums(values, enumCls) -> list:
+    members = {m.value: m for m in enumCls}
+    members.update({m: m for m in enumCls})
+    return [members[v] for v in _toList(values)]
+
+
+class LGraphBulkBuilder():
+    """
+    Builder of LGraph from tables (described in module docstring)
+
+    :ivar graph: graph where new objects are added
+    :ivar nodes: list of LNode created by last build()
+    :ivar ports: list of LPort created by last build()
+    :ivar edges: list of LEdge created by last build()
+    """
+
+    def __init__(self, graph: Optional[LGraph]=None):
+        if graph is None:
+            graph = LGraph()
+        self.graph = graph
+        self.nodes = []
+        self.ports = []
+        self.edges = []
+
+    def build(self,
+              nodeNames: Sequence[Optional[str]],
+              portNodes: Sequence[int],
+              portSides: Sequence[PortSide],
+              portTypes: Sequence[PortType],
+              edgeSrc: Sequence[int],
+              edgeDst: Sequence[int],
+              portNames: Optional[Sequence[Optional[str]]]=None,
+              edgeNames: Optional[Sequence[Optional[str]]]=None,
+              nodeSizes: Optional[Sequence[Tuple[float, float]]]=None,
+              nodeExternalPortDirections: Optional[Sequence[Optional[PortType]]]=None,
+              nodeOriginObjs: Optional[Sequence]=None,
+              portConstraints=PortConstraints.FIXED_ORDER) -> LGraph:
+        """
+        :param nodeNames: name for each node (defines the number of nodes)
+        :param portNodes: index of the node for each port, ports are
+            appended to the side lists of the node in order of this table
+        :param portSides: PortSide (or its value) for each port
+        :param portTypes: PortType (or its value) for each port
+        :param edgeSrc: index of the source port for each edge
+        :param edgeDst: index of the destination port for each edge
+        :param nodeSizes: optional (width, height) for each node
+        :param nodeExternalPortDirections: optional, if the item is not None
+            LayoutExternalPort with this direction is created instead of LNode
+        :param portConstraints: port constraints of all new nodes
+            (same default as in LGraph.add_node)
+        :return: the graph
+        """
+        graph = self.graph
+        nodeNames = _toList(nodeNames)
+        portNodes = _toList(portNodes)
+        portSides = _toEnums(portSides, PortSide)
+        portTypes = _toEnums(portTypes, PortType)
+        edgeSrc = _toList(edgeSrc)
+        edgeDst = _toList(edgeDst)
+        nodeCnt = len(nodeNames)
+        portCnt = len(portNodes)
+        edgeCnt = len(edgeSrc)
+        if len(portSides) != portCnt or len(portTypes) != portCnt:
+            raise ValueError("Port tables have different lengths")
+        if len(edgeDst) != edgeCnt:
+            raise ValueError("Edge tables have different lengths")
+        if portNames is None:
+            portNames = [None] * portCnt
+        if edgeNames is None:
+            edgeNames = [None] * edgeCnt
+
+        # nodes
+        nodes = [None] * nodeCnt
+        hasExternalPorts = False
+        for i, name in enumerate(nodeNames):
+            if nodeExternalPortDirections is not None:
+                d = nodeExternalPortDirections[i]
+            else:
+                d = None
+
+            originObj = None if nodeOriginObjs is None else nodeOriginObjs[i]
+            if d is None:
+                n = LNode(graph, name=name, originObj=originObj)
+            else:
+                n = LayoutExternalPort(graph, name=name, direction=d)
+                n.originObj = originObj
+                hasExternalPorts = True
+
+            n.portConstraints = portConstraints
+            if originObj is not None:
+                graph._node2lnode[originObj] = n
+            nodes[i] = n
+
+        if nodeSizes is not None:
+            for n, (w, h) in zip(nodes, _toList(nodeSizes)):
+                size = n.size
+                size.x = w
+                size.y = h
+
+        # ports
+        ports = [None] * portCnt
+        hasNorthSouthPorts = False
+        NORTH = PortSide.NORTH
+        SOUTH = PortSide.SOUTH
+        for i, (ni, side, t, name) in enumerate(
+                zip(portNodes, portSides, portTypes, portNames)):
+            n = nodes[ni]
+            p = LPort(n, t, side, name=name)
+            if side is NORTH or side is SOUTH:
+                hasNorthSouthPorts = True
+            n.getPortSideView(side).append(p)
+            ports[i] = p
+
+        # edges, srcNode/dstNode are resolved from the port table
+        edges = [None] * edgeCnt
+        hasSelfLoops = False
+        for i, (si, di, name) in enumerate(zip(edgeSrc, edgeDst, edgeNames)):
+            e = LEdge(name)
+            src = ports[si]
+            dst = ports[di]
+            srcNode = nodes[portNodes[si]]
+            dstNode = nodes[portNodes[di]]
+            e.src = src
+            e.dst = dst
+            e.srcNode = srcNode
+            e.dstNode = dstNode
+            isSelfLoop = srcNode is dstNode
+            e.isSelfLoop = isSelfLoop
+            hasSelfLoops |= isSelfLoop
+            src.outgoingEdges.append(e)
+            dst.incomingEdges.append(e)
+            edges[i] = e
+
+        hasHyperedges = any(len(p.outgoingEdges) + len(p.incomingEdges) > 1
+                            for p in ports)
+
+        graph.nodes.extend(nodes)
+        graph.edges.extend(edges)
+        graph.p_externalPorts |= hasExternalPorts
+        graph.p_northSouthPorts |= hasNorthSouthPorts
+        graph.p_selfLoops |= hasSelfLoops
+        graph.p_hyperedges |= hasHyperedges
+        if nodes and portConstraints not in (PortConstraints.FREE,
+                                             PortConstraints.UNDEFINED):
+            graph.p_nonFreePorts = True
+
+        self.nodes = nodes
+        self.ports = ports
+        self.edges = edges
+        return graph
+
+
+def buildLGraph(*args, **kwargs) -> LGraph:
+    """
+    Shortcut for LGraphBulkBuilder().build(...)
+    """
+    return LGraphBulkBuilder().build(*args, **kwargs)
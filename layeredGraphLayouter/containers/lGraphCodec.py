@@ -0,0 +1,722 @@
+"""
+Compact serialization of LGraph for the transport between processes
+
+The graph (including nested graphs) is flattened to id-indexed tables:
+numeric data (geometry, enum values, flags, cross references) are stored
+in typed arrays (:mod:`array`), other values (names, origin objects, ...)
+in lists. References between nodes, ports, edges, layers and graphs are
+replaced by indexes, so the pickled state contains no object graph
+and it is not limited by the recursion limit.
+
+Numeric columns can be placed in to :mod:`multiprocessing.shared_memory`
+so worker processes can attach them without copying
+(:func:`encodeLGraphToSharedMemory`, :func:`decodeLGraphFromSharedMemory`).
+
+:note: Graphs of the hierarchy are found from the root graph through
+    LNode.nestedLgraph, LNode.childGraphs and LGraph.childGraphs.
+    References to objects outside of this hierarchy (e.g. parentLnode
+    of the encoded child graph) are decoded as None.
+:note: Numbers of geometry are stored as float.
+"""
+from array import array
+from collections import namedtuple
+from random import Random
+
+from layeredGraphLayouter.containers.constants import NodeType,\
+    PortConstraints, InLayerConstraint, LayerConstraint, PortSide, PortType
+from layeredGraphLayouter.containers.edgeList import EdgeList
+from layeredGraphLayouter.containers.geometry import Point, Spacing
+from layeredGraphLayouter.containers.lEdge import LEdge
+from layeredGraphLayouter.containers.lGraph import LGraph, LNodeLayer
+from layeredGraphLayouter.containers.lNode import LNode, LayoutExternalPort
+from layeredGraphLayouter.containers.lPort import LPort
+from layeredGraphLayouter.containers.spacings import LGraphSpacings
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # python < 3.8
+    shared_memory = None
+
+
+LGRAPH_CODEC_VERSION = 3
+
+# reference to node/port/edge/layer/graph in encoded values
+_Ref = namedtuple("_Ref", ["kind", "index"])
+
+# possition, size, margin, anchor
+_GEOM_SIZE = 10
+
+# attributes stored in columns or restored from the structure of the tables
+_GRAPH_STRUCTURAL = {"nodes", "edges", "layers", "random", "spacings",
+                     "geometry"}
+_NODE_ENUMS = (("type", NodeType),
+               ("portConstraints", PortConstraints),
+               ("inLayerConstraint", InLayerConstraint),
+               ("layeringLayerConstraint", LayerConstraint))
+_NODE_INTS = ("indeg", "outdeg", "mark")
+_NODE_BOOLS = ("compoundNode", "longEdgeHasLabelDummies")
+_NODE_OBJECTS = ("name", "originObj", "parent", "childGraphs", "normHeight",
+                 "nestedGraph", "inLayerSuccessorConstraint", "nestedLgraph",
+                 "origin", "extPortSide", "barycenterAssociates")
+_NODE_KNOWN = {"possition", "size", "margin", "anchor",
+               "_geometry", "_geometryId", "north", "east",
+               "south", "west", "graph", "layer", "inLayerLayoutUnit",
+               "direction",
+               *(k for k, _ in _NODE_ENUMS), *_NODE_INTS, *_NODE_BOOLS,
+               *_NODE_OBJECTS}
+_PORT_ENUMS = (("side", PortSide),
+               ("direction", PortType))
+_PORT_BOOLS = ("insideConnections", "inputCollect")
+_PORT_OBJECTS = ("name", "originObj", "parent", "node", "children", "portDummy")
+_PORT_KNOWN = {"possition", "size", "margin", "anchor",
+               "_geometry", "_geometryId",
+               "outgoingEdges", "incomingEdges",
+               *(k for k, _ in _PORT_ENUMS), *_PORT_BOOLS, *_PORT_OBJECTS}
+_EDGE_FLOATS = ("edgeThickness", "priorityStraightness")
+_EDGE_OBJECTS = ("name", "originObj", "junctionPoints", "labels")
+_EDGE_KNOWN = {"src", "dst", "srcNode", "dstNode", "reversed", "isSelfLoop",
+               "bendPoints", *_EDGE_FLOATS, *_EDGE_OBJECTS}
+
+
+def _appendGeom(r, out: array):
+    p = r.possition
+    s = r.size
+    m = r.margin
+    a = r.anchor
+    out.extend((p.x, p.y, s.x, s.y, m.top, m.bottom, m.left, m.right, a.x, a.y))
+
+
+def _setGeom(d: dict, g: list, i: int):
+    i *= _GEOM_SIZE
+    d["possition"] = Point(g[i], g[i + 1])
+    d["size"] = Point(g[i + 2], g[i + 3])
+    d["margin"] = Spacing(g[i + 4], g[i + 5], g[i + 6], g[i + 7])
+    d["anchor"] = Point(g[i + 8], g[i + 9])
+    # GeometryStore is recreated after all objects are decoded
+    d["_geometry"] = None
+    d["_geometryId"] = None
+
+
+def _offsets(lists) -> (array, array):
+    """
+    :return: offsets and flat items of list of lists of ints
+    """
+    offsets = array("q", [0])
+    items = array("q")
+    for l in lists:
+        items.extend(l)
+        offsets.append(len(items))
+    return offsets, items
+
+
+class _LGraphEncoder():
+    """
+    Flattens the hierarchy of LGraph in to tables (described in module docstring)
+    """
+
+    def __init__(self, root: LGraph):
+        self.graphs = []
+        self.graphIndex = {}
+        self.nodes = []
+        self.nodeIndex = {}
+        self.ports = []
+        self.portIndex = {}
+        self.edges = []
+        self.edgeIndex = {}
+        self.layers = []
+        self.layerIndex = {}
+
+        # collect the hierarchy of graphs
+        stack = [root]
+        while stack:
+            g = stack.pop()
+            if g in self.graphIndex:
+                continue
+            self.graphIndex[g] = len(self.graphs)
+            self.graphs.append(g)
+            children = list(g.childGraphs)
+            for n in g.nodes:
+                if n.nestedLgraph is not None:
+                    children.append(n.nestedLgraph)
+                children.extend(n.childGraphs)
+            stack.extend(reversed(children))
+
+    def registerGraph(self, g: LGraph):
+        return self.graphIndex.get(g)
+
+    def registerNode(self, n: LNode):
+        i = self.nodeIndex.get(n)
+        if i is not None or n.graph not in self.graphIndex:
+            return i
+        i = self.nodeIndex[n] = len(self.nodes)
+        self.nodes.append(n)
+        for p in n.iterPorts():
+            if p not in self.portIndex:
+                self.portIndex[p] = len(self.ports)
+                self.ports.append(p)
+        return i
+
+    def registerPort(self, p: LPort):
+        i = self.portIndex.get(p)
+        if i is not None:
+            return i
+        if self.registerNode(p.node) is None:
+            return None
+        i = self.portIndex.get(p)
+        if i is None:
+            # port which is not in the side lists of the node
+            i = self.portIndex[p] = len(self.ports)
+            self.ports.append(p)
+        return i
+
+    def registerEdge(self, e: LEdge):
+        i = self.edgeIndex.get(e)
+        if i is None:
+            i = self.edgeIndex[e] = len(self.edges)
+            self.edges.append(e)
+        return i
+
+    def registerLayer(self, l: LNodeLayer):
+        i = self.layerIndex.get(l)
+        if i is None and l.graph in self.graphIndex:
+            i = self.layerIndex[l] = len(self.layers)
+            self.layers.append(l)
+        return i
+
+    def encodeValue(self, v):
+        t = v.__class__
+        if t is int or t is str or t is float or t is bool or v is None:
+            return v
+        elif t is LNodeLayer:
+            i = self.registerLayer(v)
+            return None if i is None else _Ref("l", i)
+        elif isinstance(v, LNode):
+            i = self.registerNode(v)
+            return None if i is None else _Ref("n", i)
+        elif t is LPort:
+            i = self.registerPort(v)
+            return None if i is None else _Ref("p", i)
+        elif t is LEdge:
+            return _Ref("e", self.registerEdge(v))
+        elif t is LGraph:
+            i = self.registerGraph(v)
+            return None if i is None else _Ref("g", i)
+        elif t is list:
+            return [self.encodeValue(x) for x in v]
+        elif t is tuple:
+            return tuple(self.encodeValue(x) for x in v)
+        elif t is set:
+            return {self.encodeValue(x) for x in v}
+        elif t is dict:
+            return {self.encodeValue(k): self.encodeValue(x) for k, x in v.items()}
+        else:
+            return v
+
+    def refIndex(self, v, register) -> int:
+        if v is None:
+            return -1
+        i = register(v)
+        return -1 if i is None else i
+
+    def encodeExtras(self, obj, known, extras: dict, i: int):
+        """
+        Encode attributes which are not stored in columns
+        """
+        e = None
+        for k, v in obj.__dict__.items():
+            if k not in known:
+                if e is None:
+                    e = extras[i] = {}
+                e[k] = self.encodeValue(v)
+        return e
+
+    def encode(self) -> dict:
+        enc = self.encodeValue
+        cols = {}
+        objs = {}
+
+        # graphs
+        graphNodes = []
+        graphEdges = []
+        graphLayers = []
+        graphAttrs = []
+        graphRandom = []
+        # graphs often share one Random instance
+        randoms = []
+        randomIndex = {}
+        for g in self.graphs:
+            graphNodes.append([self.registerNode(n) for n in g.nodes])
+            graphLayers.append([self.registerLayer(l) for l in g.layers])
+            graphEdges.append([self.registerEdge(e) for e in g.edges])
+            graphAttrs.append({k: enc(v) for k, v in g.__dict__.items()
+                               if k not in _GRAPH_STRUCTURAL})
+            r = g.random
+            ri = randomIndex.get(id(r))
+            if ri is None:
+                ri = randomIndex[id(r)] = len(randoms)
+                # state of subclasses (e.g. mocks) is pickled as it is
+                randoms.append(r.getstate() if r.__class__ is Random else r)
+            graphRandom.append(ri)
+        cols["graph_node_offsets"], cols["graph_nodes"] = _offsets(graphNodes)
+        cols["graph_edge_offsets"], cols["graph_edges"] = _offsets(graphEdges)
+        cols["graph_layer_offsets"], cols["graph_layers"] = _offsets(graphLayers)
+        objs["graph_attrs"] = graphAttrs
+        objs["graph_random"] = graphRandom
+        # geometry is stored in node/port columns, the store is recreated
+        objs["graph_geometry"] = [g.geometry is not None for g in self.graphs]
+        objs["graph_spacings"] = [g.spacings.options for g in self.graphs]
+        objs["randoms"] = randoms
+
+        node_geom = array("d")
+        node_graph = array("q")
+        node_layer = array("q")
+        node_firstPort = array("q")
+        node_ports = array("q")
+        node_unit = array("q")
+        node_enums = array("q")
+        node_ints = array("q")
+        node_flags = array("B")
+        node_objs = {k: [] for k in _NODE_OBJECTS}
+        node_extras = {}
+        node_direction = {}
+
+        port_geom = array("d")
+        port_enums = array("q")
+        port_flags = array("B")
+        port_out = []
+        port_in = []
+        port_objs = {k: [] for k in _PORT_OBJECTS}
+        port_extras = {}
+
+        edge_ends = array("q")
+        edge_flags = array("B")
+        edge_floats = array("d")
+        edge_bend_offsets = array("q", [0])
+        edge_bends = array("d")
+        edge_objs = {k: [] for k in _EDGE_OBJECTS}
+        edge_extras = {}
+
+        layer_node_lists = []
+        layer_graph = array("q")
+
+        registerNode = self.registerNode
+        registerPort = self.registerPort
+        registerEdge = self.registerEdge
+        refIndex = self.refIndex
+        nodes = self.nodes
+        ports = self.ports
+        edges = self.edges
+        layers = self.layers
+        ni = pi = ei = li = 0
+        # objects can be discovered while encoding other objects
+        while ni < len(nodes) or pi < len(ports) or ei < len(edges) or li < len(layers):
+            while ni < len(nodes):
+                n = nodes[ni]
+                d = n.__dict__
+                extras = self.encodeExtras(n, _NODE_KNOWN, node_extras, ni)
+                _appendGeom(n, node_geom)
+                node_graph.append(self.graphIndex[n.graph])
+                node_layer.append(refIndex(n.layer, self.registerLayer))
+                # ports of the node were registered together with the node
+                # in iterPorts() order
+                firstPort = next(n.iterPorts(), None)
+                node_firstPort.append(-1 if firstPort is None
+                                      else self.portIndex[firstPort])
+                for side in n.iterSides():
+                    node_ports.append(len(side))
+                node_unit.append(refIndex(n.inLayerLayoutUnit, registerNode))
+
+                for k, cls in _NODE_ENUMS:
+                    v = d[k]
+                    if v.__class__ is cls:
+                        node_enums.append(v.value)
+                    else:
+                        node_enums.append(-1)
+                        if extras is None:
+                            extras = node_extras[ni] = {}
+                        extras[k] = enc(v)
+                for k in _NODE_INTS:
+                    v = d[k]
+                    if v.__class__ is int:
+                        node_ints.append(v)
+                    else:
+                        node_ints.append(0)
+                        if extras is None:
+                            extras = node_extras[ni] = {}
+                        extras[k] = enc(v)
+                flags = 0
+                for bit, k in enumerate(_NODE_BOOLS):
+                    if d[k]:
+                        flags |= 1 << bit
+                if n.__class__ is LayoutExternalPort:
+                    flags |= 1 << len(_NODE_BOOLS)
+                    node_direction[ni] = enc(n.direction)
+                elif n.__class__ is not LNode:
+                    raise TypeError("Unsupported node class", n.__class__)
+                node_flags.append(flags)
+
+                for k in _NODE_OBJECTS:
+                    node_objs[k].append(enc(d[k]))
+                ni += 1
+
+            while pi < len(ports):
+                p = ports[pi]
+                d = p.__dict__
+                extras = self.encodeExtras(p, _PORT_KNOWN, port_extras, pi)
+                _appendGeom(p, port_geom)
+                for k, cls in _PORT_ENUMS:
+                    v = d[k]
+                    if v.__class__ is cls:
+                        port_enums.append(v.value)
+                    else:
+                        port_enums.append(-1)
+                        if extras is None:
+                            extras = port_extras[pi] = {}
+                        extras[k] = enc(v)
+                flags = 0
+                for bit, k in enumerate(_PORT_BOOLS):
+                    if d[k]:
+                        flags |= 1 << bit
+                port_flags.append(flags)
+                port_out.append([registerEdge(e) for e in p.outgoingEdges])
+                port_in.append([registerEdge(e) for e in p.incomingEdges])
+                for k in _PORT_OBJECTS:
+                    port_objs[k].append(enc(d[k]))
+                pi += 1
+
+            while ei < len(edges):
+                e = edges[ei]
+                d = e.__dict__
+                extras = self.encodeExtras(e, _EDGE_KNOWN, edge_extras, ei)
+                edge_ends.extend((refIndex(e.src, registerPort),
+                                  refIndex(e.dst, registerPort),
+                                  refIndex(e.srcNode, registerNode),
+                                  refIndex(e.dstNode, registerNode)))
+                isSelfLoop = e.isSelfLoop
+                edge_flags.append((1 if e.reversed else 0)
+                                  | (2 if isSelfLoop else 0)
+                                  | (4 if isSelfLoop is None else 0))
+                for k in _EDGE_FLOATS:
+                    v = d[k]
+                    if isinstance(v, (int, float)):
+                        edge_floats.append(v)
+                    else:
+                        edge_floats.append(0)
+                        if extras is None:
+                            extras = edge_extras[ei] = {}
+                        extras[k] = enc(v)
+                for bp in e.bendPoints:
+                    edge_bends.append(bp.x)
+                    edge_bends.append(bp.y)
+                edge_bend_offsets.append(len(edge_bends) // 2)
+                for k in _EDGE_OBJECTS:
+                    edge_objs[k].append(enc(d[k]))
+                ei += 1
+
+            while li < len(layers):
+                l = layers[li]
+                layer_graph.append(self.graphIndex[l.graph])
+                layer_node_lists.append([registerNode(n) for n in l])
+                li += 1
+
+        cols.update({
+            "node_geom": node_geom,
+            "node_graph": node_graph,
+            "node_layer": node_layer,
+            "node_firstPort": node_firstPort,
+            "node_ports": node_ports,
+            "node_unit": node_unit,
+            "node_enums": node_enums,
+            "node_ints": node_ints,
+            "node_flags": node_flags,
+            "port_geom": port_geom,
+            "port_enums": port_enums,
+            "port_flags": port_flags,
+            "edge_ends": edge_ends,
+            "edge_flags": edge_flags,
+            "edge_floats": edge_floats,
+            "edge_bend_offsets": edge_bend_offsets,
+            "edge_bends": edge_bends,
+            "layer_graph": layer_graph,
+        })
+        cols["port_out_offsets"], cols["port_out"] = _offsets(port_out)
+        cols["port_in_offsets"], cols["port_in"] = _offsets(port_in)
+        cols["layer_node_offsets"], cols["layer_nodes"] = _offsets(layer_node_lists)
+        objs.update({
+            "node_objs": node_objs,
+            "node_extras": node_extras,
+            "node_direction": node_direction,
+            "port_objs": port_objs,
+            "port_extras": port_extras,
+            "edge_objs": edge_objs,
+            "edge_extras": edge_extras,
+        })
+
+        return {
+            "version": LGRAPH_CODEC_VERSION,
+            "columns": cols,
+            "objects": objs,
+        }
+
+
+def _ranges(offsets: list, items: list):
+    return [items[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+class _LGraphDecoder():
+    """
+    Rebuilds the objects from tables created by :class:`_LGraphEncoder`
+    """
+
+    def __init__(self, state: dict):
+        if state["version"] != LGRAPH_CODEC_VERSION:
+            raise ValueError("Unsupported version of LGraph state", state["version"])
+        self.cols = {k: v.tolist() for k, v in state["columns"].items()}
+        self.objs = state["objects"]
+
+    def decodeValue(self, v):
+        t = v.__class__
+        if t is int or t is str or t is float or t is bool or v is None:
+            return v
+        elif t is _Ref:
+            return self.refTables[v.kind][v.index]
+        elif t is list:
+            return [self.decodeValue(x) for x in v]
+        elif t is tuple:
+            return tuple(self.decodeValue(x) for x in v)
+        elif t is set:
+            return {self.decodeValue(x) for x in v}
+        elif t is dict:
+            return {self.decodeValue(k): self.decodeValue(x) for k, x in v.items()}
+        else:
+            return v
+
+    def decode(self) -> LGraph:
+        cols = self.cols
+        objs = self.objs
+        dec = self.decodeValue
+
+        graphAttrs = objs["graph_attrs"]
+        graphs = [LGraph.__new__(LGraph) for _ in graphAttrs]
+        nodeFlags = cols["node_flags"]
+        externalFlag = 1 << len(_NODE_BOOLS)
+        nodes = [(LayoutExternalPort.__new__(LayoutExternalPort)
+                  if f & externalFlag else LNode.__new__(LNode))
+                 for f in nodeFlags]
+        ports = [LPort.__new__(LPort) for _ in range(len(cols["port_flags"]))]
+        edges = [LEdge.__new__(LEdge) for _ in range(len(cols["edge_flags"]))]
+        layers = [LNodeLayer.__new__(LNodeLayer) for _ in cols["layer_graph"]]
+        self.refTables = {"g": graphs, "n": nodes, "p": ports, "e": edges,
+                          "l": layers}
+
+        def ref(table, i):
+            return None if i < 0 else table[i]
+
+        # graphs
+        graphNodes = _ranges(cols["graph_node_offsets"], cols["graph_nodes"])
+        graphEdges = _ranges(cols["graph_edge_offsets"], cols["graph_edges"])
+        graphLayers = _ranges(cols["graph_layer_offsets"], cols["graph_layers"])
+        randoms = []
+        for r in objs["randoms"]:
+            if r.__class__ is tuple:
+                state = r
+                r = Random()
+                r.setstate(state)
+            randoms.append(r)
+
+        for gi, g in enumerate(graphs):
+            d = g.__dict__
+            for k, v in graphAttrs[gi].items():
+                d[k] = dec(v)
+            g.nodes = [nodes[i] for i in graphNodes[gi]]
+            g.edges = [edges[i] for i in graphEdges[gi]]
+            g.layers = [layers[i] for i in graphLayers[gi]]
+            g.random = randoms[objs["graph_random"][gi]]
+            g.spacings = LGraphSpacings(g, objs["graph_spacings"][gi])
+            g.geometry = None
+
+        # layers
+        for l, gi, lNodes in zip(layers, cols["layer_graph"],
+                                 _ranges(cols["layer_node_offsets"], cols["layer_nodes"])):
+            l.graph = graphs[gi]
+            list.extend(l, (nodes[i] for i in lNodes))
+            l._invalidateIndex()
+
+        # nodes
+        geom = cols["node_geom"]
+        nodeGraph = cols["node_graph"]
+        nodeLayer = cols["node_layer"]
+        nodeFirstPort = cols["node_firstPort"]
+        nodePorts = cols["node_ports"]
+        nodeUnit = cols["node_unit"]
+        nodeEnums = cols["node_enums"]
+        nodeInts = cols["node_ints"]
+        nodeObjs = [(k, objs["node_objs"][k]) for k in _NODE_OBJECTS]
+        nodeDirection = objs["node_direction"]
+        enumCnt = len(_NODE_ENUMS)
+        intCnt = len(_NODE_INTS)
+        for i, n in enumerate(nodes):
+            d = n.__dict__
+            _setGeom(d, geom, i)
+            d["graph"] = graphs[nodeGraph[i]]
+            d["layer"] = ref(layers, nodeLayer[i])
+            p = nodeFirstPort[i]
+            for si, side in enumerate(("north", "east", "south", "west")):
+                cnt = nodePorts[i * 4 + si]
+                d[side] = ports[p:p + cnt]
+                p += cnt
+            d["inLayerLayoutUnit"] = ref(nodes, nodeUnit[i])
+            for ki, (k, cls) in enumerate(_NODE_ENUMS):
+                v = nodeEnums[i * enumCnt + ki]
+                d[k] = None if v < 0 else cls(v)
+            for ki, k in enumerate(_NODE_INTS):
+                d[k] = nodeInts[i * intCnt + ki]
+            f = nodeFlags[i]
+            for bit, k in enumerate(_NODE_BOOLS):
+                d[k] = bool(f & (1 << bit))
+            for k, vals in nodeObjs:
+                d[k] = dec(vals[i])
+            if f & externalFlag:
+                d["direction"] = dec(nodeDirection[i])
+
+        # ports
+        geom = cols["port_geom"]
+        portEnums = cols["port_enums"]
+        portFlags = cols["port_flags"]
+        portOut = _ranges(cols["port_out_offsets"], cols["port_out"])
+        portIn = _ranges(cols["port_in_offsets"], cols["port_in"])
+        portObjs = [(k, objs["port_objs"][k]) for k in _PORT_OBJECTS]
+        enumCnt = len(_PORT_ENUMS)
+        for i, p in enumerate(ports):
+            d = p.__dict__
+            _setGeom(d, geom, i)
+            for ki, (k, cls) in enumerate(_PORT_ENUMS):
+                v = portEnums[i * enumCnt + ki]
+                d[k] = None if v < 0 else cls(v)
+            f = portFlags[i]
+            for bit, k in enumerate(_PORT_BOOLS):
+                d[k] = bool(f & (1 << bit))
+            d["outgoingEdges"] = EdgeList([edges[e] for e in portOut[i]])
+            d["incomingEdges"] = EdgeList([edges[e] for e in portIn[i]])
+            for k, vals in portObjs:
+                d[k] = dec(vals[i])
+
+        # edges
+        ends = cols["edge_ends"]
+        edgeFlags = cols["edge_flags"]
+        edgeFloats = cols["edge_floats"]
+        bendOffsets = cols["edge_bend_offsets"]
+        bends = cols["edge_bends"]
+        edgeObjs = [(k, objs["edge_objs"][k]) for k in _EDGE_OBJECTS]
+        floatCnt = len(_EDGE_FLOATS)
+        for i, e in enumerate(edges):
+            d = e.__dict__
+            d["src"] = ref(ports, ends[i * 4])
+            d["dst"] = ref(ports, ends[i * 4 + 1])
+            d["srcNode"] = ref(nodes, ends[i * 4 + 2])
+            d["dstNode"] = ref(nodes, ends[i * 4 + 3])
+            f = edgeFlags[i]
+            d["reversed"] = bool(f & 1)
+            d["isSelfLoop"] = None if f & 4 else bool(f & 2)
+            for ki, k in enumerate(_EDGE_FLOATS):
+                d[k] = edgeFloats[i * floatCnt + ki]
+            d["bendPoints"] = [Point(bends[2 * b], bends[2 * b + 1])
+                               for b in range(bendOffsets[i], bendOffsets[i + 1])]
+            for k, vals in edgeObjs:
+                d[k] = dec(vals[i])
+
+        for table, extras in ((nodes, objs["node_extras"]),
+                              (ports, objs["port_extras"]),
+                              (edges, objs["edge_extras"])):
+            for i, e in extras.items():
+                d = table[i].__dict__
+                for k, v in e.items():
+                    d[k] = dec(v)
+
+        for g, hasGeometry in zip(graphs, objs["graph_geometry"]):
+            if hasGeometry:
+                g.enableGeometryStore()
+
+        return graphs[0]
+
+
+def encodeLGraph(graph: LGraph) -> dict:
+    """
+    :return: picklable state of the graph and its nested graphs
+    """
+    return _LGraphEncoder(graph).encode()
+
+
+def decodeLGraph(state: dict) -> LGraph:
+    """
+    Rebuild the graph from the state created by :func:`encodeLGraph`
+    """
+    return _LGraphDecoder(state).decode()
+
+
+def encodeLGraphToSharedMemory(graph: LGraph):
+    """
+    Encode the graph and place its numeric columns in to shared memory
+
+    :return: tuple (SharedMemory, handle), the handle is small picklable object
+        for :func:`decodeLGraphFromSharedMemory`, the caller is responsible
+        for the close() and unlink() of the SharedMemory
+    :raise ImportError: if multiprocessing.shared_memory is not available
+        (python < 3.8)
+    """
+    if shared_memory is None:
+        raise ImportError("multiprocessing.shared_memory is not available")
+
+    state = encodeLGraph(graph)
+    layout = {}
+    offset = 0
+    for name, data in state["columns"].items():
+        offset += -offset % 8
+        layout[name] = (data.typecode, offset, len(data))
+        offset += len(data) * data.itemsize
+
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for name, data in state["columns"].items():
+        _, o, _ = layout[name]
+        b = data.tobytes()
+        shm.buf[o:o + len(b)] = b
+
+    handle = {
+        "version": state["version"],
+        "shm": shm.name,
+        "columns": layout,
+        "objects": state["objects"],
+    }
+    return shm, handle
+
+
+def decodeLGraphFromSharedMemory(handle: dict) -> LGraph:
+    """
+    Rebuild the graph from the shared memory created by
+    :func:`encodeLGraphToSharedMemory`
+
+    :raise ImportError: if multiprocessing.shared_memory is not available
+    """
+    if shared_memory is None:
+        raise ImportError("multiprocessing.shared_memory is not available")
+
+    shm = shared_memory.SharedMemory(name=handle["shm"])
+    try:
+        columns = {}
+        buf = shm.buf
+        for name, (typecode, offset, length) in handle["columns"].items():
+            size = length * array(typecode).itemsize
+            columns[name] = buf[offset:offset + size].cast(typecode)
+
+        decoder = _LGraphDecoder({
+            "version": handle["version"],
+            "columns": columns,
+            "objects": handle["objects"],
+        })
+        for c in columns.values():
+            c.release()
+        del buf
+        return decoder.decode()
+    finally:
+        shm.close()
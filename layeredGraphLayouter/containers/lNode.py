@@ -63,6 +63,10 @@ class LNode(LRectangle):
         self.barycenterAssociates = None
         self.longEdgeHasLabelDummies = False
 
+        geometry = getattr(graph, "geometry", None)
+        if geometry is not None:
+            geometry.attach(self)
+
     def iterPorts(self) -> Generator[LPort, None, None]:
         return chain(self.north, self.east, self.south, self.west)
 
@@ -198,6 +202,14 @@ class LNode(LRectangle):
         for port in self.iterPorts():
             yield from port.iterEdges()
 
+    def getIndex(self) -> int:
+        """
+        :return: index of this node in its layer or -1 if the node is not in any layer
+        """
+        if self.layer is None:
+            return -1
+        return self.layer.indexOf(self)
+
     def setLayer(self, layer):
         if self.layer is layer:
             return
@@ -1,6 +1,7 @@
 from itertools import chain
 from typing import List
 
+from layeredGraphLayouter.containers.edgeList import EdgeList
 from layeredGraphLayouter.containers.geometry import LRectangle
 from layeredGraphLayouter.containers.sizeConfig import PORT_HEIGHT
 
@@ -10,7 +11,8 @@ class LPort(LRectangle):
     Port for component in component diagram
 
     :ivar originObj: original object which this node represents
-    :ivar parent: parent unit of this port
+    :ivar parent: parent unit of this port (LNode or LPort), use setParent() to change it
+    :ivar node: LNode which owns this port (resolved from parent, used as cache)
     :ivar name: name of this port
     :ivar direction: direction of this port
     :ivar geometry: absolute geometry in layout
@@ -22,18 +24,25 @@ class LPort(LRectangle):
         super(LPort, self).__init__()
         self.originObj = None
         self.parent = parent
+        self.node = self._resolveNode()
         self.name = name
         self.direction = direction
 
-        self.outgoingEdges = []
-        self.incomingEdges = []
+        self.outgoingEdges = EdgeList()
+        self.incomingEdges = EdgeList()
         self.children = []
+        if isinstance(parent, LPort):
+            parent.children.append(self)
         self.side = side
 
         self.portDummy = None
         self.insideConnections = False
         self.inputCollect = False
 
+        geometry = getattr(getattr(parent, "graph", None), "geometry", None)
+        if geometry is not None:
+            geometry.attach(self)
+
     def getDegree(self) -> int:
         """
         Returns this port's degree, that is, the number of edges connected to it.
@@ -51,13 +60,42 @@ class LPort(LRectangle):
         """
         return len(self.incomingEdges) - len(self.outgoingEdges)
 
-    def getNode(self):
+    def _resolveNode(self):
         p = self
         while True:
             p = p.parent
             if not isinstance(p, LPort):
                 return p
 
+    def getNode(self):
+        return self.node
+
+    def setParent(self, parent):
+        """
+        Move this port to other parent (LNode or LPort), the list of children
+        of parent port, the cached node of this port and of all its children
+        and the cached end nodes of the edges of these ports are updated
+        """
+        oldParent = self.parent
+        if isinstance(oldParent, LPort):
+            oldParent.children.remove(self)
+        self.parent = parent
+        if isinstance(parent, LPort):
+            parent.children.append(self)
+
+        node = self._resolveNode()
+        stack = [self]
+        while stack:
+            p = stack.pop()
+            p.node = node
+            for e in p.incomingEdges:
+                e.dstNode = node
+                e.isSelfLoop = e.srcNode is node
+            for e in p.outgoingEdges:
+                e.srcNode = node
+                e.isSelfLoop = node is e.dstNode
+            stack.extend(p.children)
+
     def iterEdges(self, filterSelfLoops=False):
         it = chain(self.incomingEdges, self.outgoingEdges)
         if filterSelfLoops:
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Dict, Optional, Tuple, Union
 
 from layeredGraphLayouter.containers.constants import NodeType,\
     UnsupportedConfigurationException, LayeredOptions
@@ -13,29 +13,37 @@ class UnspecifiedSpacingException(UnsupportedConfigurationException):
     pass
 
 
-class LGraphSpacings():
+# names of spacing options (attributes of LayeredOptions)
+SPACING_OPTION_NAMES = (
+    "SPACING_NODE_NODE",
+    "SPACING_NODE_NODE_BETWEEN_LAYERS",
+    "SPACING_EDGE_NODE",
+    "SPACING_EDGE_NODE_BETWEEN_LAYERS",
+    "SPACING_EDGE_EDGE",
+    "SPACING_EDGE_EDGE_BETWEEN_LAYERS",
+    "SPACING_PORT_PORT",
+    "SPACING_LABEL_NODE",
+    "SPACING_LABEL_PORT",
+)
+DEFAULT_SPACING_OPTIONS = tuple(getattr(LayeredOptions, name)
+                                for name in SPACING_OPTION_NAMES)
+NODE_TYPE_CNT = NodeType._VALUES_CNT.value
+
+
+class _NodeTypeSpacingOptions():
     """
-    Container class for a variety of spacing values that are either specified in the general
-    {@link LayeredOptions class or KLay Layered's dedicated {@link LayeredOptions class.
+    Names of the spacing options used between pairs of node types,
+    (does not depend on values of options, resolved only once)
 
-    This class allows to either select the recorded spacing values directly or to query for spacing
-    values using one of the convenience methods. The methods do not provide results for every
-    combination of graph elements yet. In case it does not know the answer a
-    {@link UnspecifiedSpacingException is thrown. In such a case the developer should add the
-    required functionality to this class.
+    :ivar vertical: flat list, option name for the pair of node types t0, t1
+        is at index t0.value * NODE_TYPE_CNT + t1.value (None if not specified)
+    :ivar horizontal: same as vertical for the spacing between layers
     """
 
-    def __init__(self, graph: "LGraph"):
-        """
-        :param graph: the {@link LGraph for which to record the spacing values.
-        """
-        self.graph = graph
-        # pre calculate the spacings between pairs of node types
-        n = NodeType._VALUES_CNT.value
-        self.nodeTypeSpacingOptionsHorizontal = [[0 for _ in range(n)]
-                                                 for _ in range(n)]
-        self.nodeTypeSpacingOptionsVertical = [[0 for _ in range(n)]
-                                               for _ in range(n)]
+    def __init__(self):
+        n = NODE_TYPE_CNT
+        self.vertical = [None for _ in range(n * n)]
+        self.horizontal = [None for _ in range(n * n)]
         self.precalculateNodeTypeSpacings()
 
     def precalculateNodeTypeSpacings(self):
@@ -46,157 +54,215 @@ class LGraphSpacings():
 
         # normal
         nodeTypeSpacingVertHoriz(NodeType.NORMAL,
-                                 LayeredOptions.SPACING_NODE_NODE,
-                                 LayeredOptions.SPACING_NODE_NODE_BETWEEN_LAYERS)
+                                 "SPACING_NODE_NODE",
+                                 "SPACING_NODE_NODE_BETWEEN_LAYERS")
         nodeTypeSpacingVertHorizBetween(NodeType.NORMAL, NodeType.LONG_EDGE,
-                                        LayeredOptions.SPACING_EDGE_NODE,
-                                        LayeredOptions.SPACING_EDGE_NODE_BETWEEN_LAYERS)
+                                        "SPACING_EDGE_NODE",
+                                        "SPACING_EDGE_NODE_BETWEEN_LAYERS")
         nodeTypeSpacingVertBetween(NodeType.NORMAL, NodeType.NORTH_SOUTH_PORT,
-                                   LayeredOptions.SPACING_EDGE_NODE)
+                                   "SPACING_EDGE_NODE")
         nodeTypeSpacingVertBetween(NodeType.NORMAL, NodeType.EXTERNAL_PORT,
-                                   LayeredOptions.SPACING_EDGE_NODE)  # TODO
+                                   "SPACING_EDGE_NODE")  # TODO
         nodeTypeSpacingVertHorizBetween(NodeType.NORMAL, NodeType.LABEL,
-                                        LayeredOptions.SPACING_NODE_NODE,
-                                        LayeredOptions.SPACING_NODE_NODE_BETWEEN_LAYERS)
+                                        "SPACING_NODE_NODE",
+                                        "SPACING_NODE_NODE_BETWEEN_LAYERS")
         nodeTypeSpacingVertHorizBetween(NodeType.NORMAL, NodeType.BIG_NODE,
-                                        LayeredOptions.SPACING_NODE_NODE,
-                                        LayeredOptions.SPACING_NODE_NODE_BETWEEN_LAYERS)
+                                        "SPACING_NODE_NODE",
+                                        "SPACING_NODE_NODE_BETWEEN_LAYERS")
 
         # longedge
         nodeTypeSpacingVertHoriz(NodeType.LONG_EDGE,
-                                 LayeredOptions.SPACING_EDGE_EDGE,
-                                 LayeredOptions.SPACING_EDGE_EDGE_BETWEEN_LAYERS)
+                                 "SPACING_EDGE_EDGE",
+                                 "SPACING_EDGE_EDGE_BETWEEN_LAYERS")
         nodeTypeSpacingVertBetween(NodeType.LONG_EDGE, NodeType.NORTH_SOUTH_PORT,
-                                   LayeredOptions.SPACING_EDGE_EDGE)
+                                   "SPACING_EDGE_EDGE")
         nodeTypeSpacingVertBetween(NodeType.LONG_EDGE, NodeType.EXTERNAL_PORT,
-                                   LayeredOptions.SPACING_EDGE_EDGE)  # TODO
+                                   "SPACING_EDGE_EDGE")  # TODO
         nodeTypeSpacingVertHorizBetween(NodeType.LONG_EDGE, NodeType.LABEL,
-                                        LayeredOptions.SPACING_EDGE_NODE,
-                                        LayeredOptions.SPACING_EDGE_NODE_BETWEEN_LAYERS)
+                                        "SPACING_EDGE_NODE",
+                                        "SPACING_EDGE_NODE_BETWEEN_LAYERS")
         nodeTypeSpacingVertHorizBetween(NodeType.LONG_EDGE, NodeType.BIG_NODE,
-                                        LayeredOptions.SPACING_EDGE_NODE,
-                                        LayeredOptions.SPACING_EDGE_NODE_BETWEEN_LAYERS)
+                                        "SPACING_EDGE_NODE",
+                                        "SPACING_EDGE_NODE_BETWEEN_LAYERS")
 
         # northsouth
         nodeTypeSpacingVert(NodeType.NORTH_SOUTH_PORT,
-                            LayeredOptions.SPACING_EDGE_EDGE)
+                            "SPACING_EDGE_EDGE")
         nodeTypeSpacingVertBetween(NodeType.NORTH_SOUTH_PORT, NodeType.EXTERNAL_PORT,
-                                   LayeredOptions.SPACING_EDGE_EDGE)  # TODO
+                                   "SPACING_EDGE_EDGE")  # TODO
         nodeTypeSpacingVertBetween(NodeType.NORTH_SOUTH_PORT, NodeType.LABEL,
-                                   LayeredOptions.SPACING_LABEL_NODE)
+                                   "SPACING_LABEL_NODE")
         nodeTypeSpacingVertBetween(NodeType.NORTH_SOUTH_PORT, NodeType.BIG_NODE,
-                                   LayeredOptions.SPACING_EDGE_NODE)
+                                   "SPACING_EDGE_NODE")
 
         # external
         nodeTypeSpacingVert(NodeType.EXTERNAL_PORT,
-                            LayeredOptions.SPACING_PORT_PORT)
+                            "SPACING_PORT_PORT")
         nodeTypeSpacingVertBetween(NodeType.EXTERNAL_PORT, NodeType.LABEL,
-                                   LayeredOptions.SPACING_LABEL_PORT)
+                                   "SPACING_LABEL_PORT")
         nodeTypeSpacingVertBetween(NodeType.EXTERNAL_PORT, NodeType.BIG_NODE,
-                                   LayeredOptions.SPACING_PORT_PORT)  # actually shouldnt exist
+                                   "SPACING_PORT_PORT")  # actually shouldnt exist
 
         # label
         nodeTypeSpacingVertHoriz(NodeType.LABEL,
-                                 LayeredOptions.SPACING_EDGE_EDGE,
-                                 LayeredOptions.SPACING_EDGE_EDGE)
+                                 "SPACING_EDGE_EDGE",
+                                 "SPACING_EDGE_EDGE")
         nodeTypeSpacingVertBetween(NodeType.LABEL, NodeType.BIG_NODE,
-                                   LayeredOptions.SPACING_EDGE_NODE)
+                                   "SPACING_EDGE_NODE")
 
         # bignode
         nodeTypeSpacingVertHoriz(NodeType.BIG_NODE,
-                                 LayeredOptions.SPACING_NODE_NODE,
-                                 LayeredOptions.SPACING_NODE_NODE_BETWEEN_LAYERS)
+                                 "SPACING_NODE_NODE",
+                                 "SPACING_NODE_NODE_BETWEEN_LAYERS")
 
         # breaking points
         nodeTypeSpacingVertHoriz(NodeType.BREAKING_POINT,
-                                 LayeredOptions.SPACING_EDGE_EDGE,
-                                 LayeredOptions.SPACING_EDGE_EDGE_BETWEEN_LAYERS)
+                                 "SPACING_EDGE_EDGE",
+                                 "SPACING_EDGE_EDGE_BETWEEN_LAYERS")
         nodeTypeSpacingVertHorizBetween(NodeType.BREAKING_POINT, NodeType.NORMAL,
-                                        LayeredOptions.SPACING_EDGE_NODE,
-                                        LayeredOptions.SPACING_EDGE_NODE_BETWEEN_LAYERS)
+                                        "SPACING_EDGE_NODE",
+                                        "SPACING_EDGE_NODE_BETWEEN_LAYERS")
         nodeTypeSpacingVertHorizBetween(NodeType.BREAKING_POINT, NodeType.LONG_EDGE,
-                                        LayeredOptions.SPACING_EDGE_NODE,
-                                        LayeredOptions.SPACING_EDGE_NODE_BETWEEN_LAYERS)
+                                        "SPACING_EDGE_NODE",
+                                        "SPACING_EDGE_NODE_BETWEEN_LAYERS")
+
+    @staticmethod
+    def index(n1: NodeType, n2: NodeType) -> int:
+        return n1.value * NODE_TYPE_CNT + n2.value
 
     def nodeTypeSpacingVert(self, nt: NodeType,
-                            spacing: float):
-        self.nodeTypeSpacingOptionsVertical[nt.value][nt.value] = spacing
+                            spacing: str):
+        self.vertical[self.index(nt, nt)] = spacing
 
     def nodeTypeSpacingVertHoriz(self, nt: NodeType,
-                                 spacingVert: float, spacingHorz: float):
-        self.nodeTypeSpacingOptionsVertical[nt.value][nt.value] = spacingVert
-        self.nodeTypeSpacingOptionsHorizontal[nt.value][nt.value] = spacingHorz
+                                 spacingVert: str, spacingHorz: str):
+        i = self.index(nt, nt)
+        self.vertical[i] = spacingVert
+        self.horizontal[i] = spacingHorz
 
     def nodeTypeSpacingVertBetween(self, n1: NodeType, n2: NodeType,
-                                   spacing: float):
-        self.nodeTypeSpacingOptionsVertical[n1.value][n2.value] = spacing
-        self.nodeTypeSpacingOptionsVertical[n2.value][n1.value] = spacing
+                                   spacing: str):
+        self.vertical[self.index(n1, n2)] = spacing
+        self.vertical[self.index(n2, n1)] = spacing
 
     def nodeTypeSpacingVertHorizBetween(self, n1: NodeType, n2: NodeType,
-                                        spacingVert: float, spacingHorz: float):
-        self.nodeTypeSpacingOptionsVertical[n1.value][n2.value] = spacingVert
-        self.nodeTypeSpacingOptionsVertical[n2.value][n1.value] = spacingVert
+                                        spacingVert: str, spacingHorz: str):
+        self.nodeTypeSpacingVertBetween(n1, n2, spacingVert)
+        self.horizontal[self.index(n1, n2)] = spacingHorz
+        self.horizontal[self.index(n2, n1)] = spacingHorz
+
 
-        self.nodeTypeSpacingOptionsHorizontal[n1.value][n2.value] = spacingHorz
-        self.nodeTypeSpacingOptionsHorizontal[n2.value][n1.value] = spacingHorz
+_NODE_TYPE_SPACING_OPTIONS = _NodeTypeSpacingOptions()
 
+
+class NodeTypeSpacings():
     """
-     * @param n1
-     *            a node or a node type
-     * @param n2
-     *            another node or node type
-     * @return the spacing to be preserved between {@code n1 and {@code n2
+    Immutable table of spacings between pairs of node types for specified
+    values of spacing options, instances are interned by the option values
+    (use NodeTypeSpacings.get()) and shared between graphs
+
+    :ivar options: tuple of values of options from SPACING_OPTION_NAMES
+    :ivar vertical: flat tuple, spacing between the nodes of types t0, t1
+        in the same layer is at index t0.value * NODE_TYPE_CNT + t1.value
+    :ivar horizontal: same as vertical for the spacing between layers
     """
+    __slots__ = ("options", "vertical", "horizontal")
+    _interned = {}
 
-    def getHorizontalSpacing(self, n1: Union[LNode, NodeType], n2: Union[LNode, NodeType]):
-        return self.getLocalSpacing(n1, n2, self.nodeTypeSpacingOptionsHorizontal)
+    def __init__(self, options: Tuple[float, ...]):
+        assert len(options) == len(SPACING_OPTION_NAMES), options
+        values = dict(zip(SPACING_OPTION_NAMES, options))
+        values[None] = 0
+        self.options = options
+        self.vertical = tuple(values[o]
+                              for o in _NODE_TYPE_SPACING_OPTIONS.vertical)
+        self.horizontal = tuple(values[o]
+                                for o in _NODE_TYPE_SPACING_OPTIONS.horizontal)
 
+    @classmethod
+    def get(cls, options: Tuple[float, ...]=DEFAULT_SPACING_OPTIONS) -> "NodeTypeSpacings":
+        options = tuple(options)
+        t = cls._interned.get(options)
+        if t is None:
+            t = cls._interned[options] = cls(options)
+        return t
+
+    def __reduce__(self):
+        # unpickled instance is interned as well
+        return (self.get, (self.options, ))
+
+
+class LGraphSpacings():
     """
-     * @param n1
-     *            a node or a node type
-     * @param n2
-     *            another node or node type
-     * @return the spacing to be preserved between {@code n1 and {@code n2
-    """
+    Container class for a variety of spacing values that are either specified in the general
+    {@link LayeredOptions class or KLay Layered's dedicated {@link LayeredOptions class.
 
-    def getVerticalSpacing(self, n1: Union[LNode, NodeType], n2: Union[LNode, NodeType]):
-        return self.getLocalSpacing(n1, n2, self.nodeTypeSpacingOptionsVertical)
+    This class allows to either select the recorded spacing values directly or to query for spacing
+    values using one of the convenience methods.
 
-    def getLocalSpacing(self, n1: Union[LNode, NodeType], n2: Union[LNode, NodeType],
-                        nodeTypeSpacingMapping):
-        if isinstance(n1, LNode):
-            t1 = n1.type
-        else:
-            t1 = n1
+    :ivar graph: the graph for which the spacing values are recorded
+    :ivar table: NodeTypeSpacings shared with other graphs with same options
+    :ivar vertical: table.vertical (spacing of nodes in layer,
+        index t0.value * NODE_TYPE_CNT + t1.value)
+    :ivar horizontal: table.horizontal (spacing of layers)
+    """
+    __slots__ = ("graph", "table", "vertical", "horizontal")
 
-        if isinstance(n2, LNode):
-            t2 = n2.type
-        else:
-            t2 = n2
+    def __init__(self, graph: "LGraph", options: Optional[Tuple[float, ...]]=None):
+        """
+        :param graph: the {@link LGraph for which to record the spacing values.
+        :param options: values of the options from SPACING_OPTION_NAMES
+            (None for defaults from LayeredOptions)
+        """
+        self.graph = graph
+        self._setTable(NodeTypeSpacings.get(
+            DEFAULT_SPACING_OPTIONS if options is None else options))
 
-        layoutOption = nodeTypeSpacingMapping[t1.value][t2.value]
+    def _setTable(self, table: NodeTypeSpacings):
+        self.table = table
+        self.vertical = table.vertical
+        self.horizontal = table.horizontal
 
-        # get the spacing value for the first node
-        s1 = self.getIndividualOrDefault(n1, layoutOption)
-        s2 = self.getIndividualOrDefault(n2, layoutOption)
+    @property
+    def options(self) -> Tuple[float, ...]:
+        return self.table.options
 
-        return max(s1, s2)
+    def getOption(self, name: str) -> float:
+        return self.table.options[SPACING_OPTION_NAMES.index(name)]
+
+    def setOptions(self, **options: Dict[str, float]):
+        """
+        Set values of spacing options, e.g. setOptions(SPACING_NODE_NODE=30)
+        """
+        values = list(self.table.options)
+        for name, v in options.items():
+            if name not in SPACING_OPTION_NAMES:
+                raise ValueError("Unknown spacing option %r" % name)
+            values[SPACING_OPTION_NAMES.index(name)] = v
+        self._setTable(NodeTypeSpacings.get(values))
 
     @staticmethod
-    def getIndividualOrDefault(node: Union[LNode, NodeType], property: str):
+    def _nodeType(n: Union[LNode, NodeType]) -> NodeType:
+        if isinstance(n, LNode):
+            return n.type
+        return n
+
+    def getHorizontalSpacing(self, n1: Union[LNode, NodeType], n2: Union[LNode, NodeType]):
+        """
+        :param n1: a node or a node type
+        :param n2: another node or node type
+        :return: the spacing to be preserved between n1 and n2
+        """
+        t1 = self._nodeType(n1)
+        t2 = self._nodeType(n2)
+        return self.horizontal[t1.value * NODE_TYPE_CNT + t2.value]
+
+    def getVerticalSpacing(self, n1: Union[LNode, NodeType], n2: Union[LNode, NodeType]):
         """
-         * Returns the value of the given property as it applies to the given node. First checks whether an individual
-         * override is set on the node that has the given property configured. If so, the configured value is returned.
-         * Otherwise, the node's parent node, if any, is queried.
-         * 
-         * @param node
-         *            the node whose property value to return.
-         * @param property
-         *            the property.
-         * @return the individual override for the property or the default value inherited by the parent node.
+        :param n1: a node or a node type
+        :param n2: another node or node type
+        :return: the spacing to be preserved between n1 and n2
         """
-        # check for individual value
-        if isinstance(node, LNode) and node.spacingIndividualOverride is not None:
-            return getattr(node.spacingIndividualOverride, property)
-        # use the common value
-        return getattr(node.graph, property)
+        t1 = self._nodeType(n1)
+        t2 = self._nodeType(n2)
+        return self.vertical[t1.value * NODE_TYPE_CNT + t2.value]
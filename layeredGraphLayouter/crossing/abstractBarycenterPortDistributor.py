@@ -37,6 +37,8 @@ class AbstractBarycenterPortDistributor():
     All ports are required to be assigned ids in the range of the given array.
 
     :ivar portRanks: port ranks dict {port: rank} in which the results of ranks calculation are stored.
+    :ivar changedPortOrders: set of nodes whose port order was changed by this distributor
+        (the user of the distributor clears it when the changes are processed)
     """
 
     def __init__(self, random, graph):
@@ -44,21 +46,22 @@ class AbstractBarycenterPortDistributor():
         r = self.portRanks = {}
         self.minBarycenter = inf
         self.maxBarycenter = 0.0
-        np = self.nodePositions = {}
-        for i, la in enumerate(graph.layers):
+        for la in graph.layers:
             for node in la:
-                np[node] = i
                 for p in node.iterPorts():
                     r[p] = 0
 
         self.portBarycenter = defaultdict(int)
         self.inLayerPorts = []
+        self.changedPortOrders = set()
 
     # ######################################/
     # Port Rank Assignment
 
     def distributePortsWhileSweeping(self, nodeOrder, currentIndex: int, isForwardSweep: bool):
-        self.updateNodePositions(nodeOrder, currentIndex)
+        """
+        :param nodeOrder: layers of the graph (positions of the nodes are taken from LNodeLayer)
+        """
         freeLayer = nodeOrder[currentIndex]
         side = PortSide.WEST if isForwardSweep else PortSide.EAST
         distributePorts_side = self.distributePorts_side
@@ -216,9 +219,10 @@ class AbstractBarycenterPortDistributor():
     def calculateInLayerPortsBarycenterValues(self, node):
         # go through the list of in-layer ports and calculate their barycenter
         # values
-        nodePositions = self.nodePositions
-        nodeIndexInLayer = nodePositions[node] + 1
-        layerSize = len(node.layer) + 1
+        layer = node.layer
+        indexOf = layer.indexOf
+        nodeIndexInLayer = indexOf(node) + 1
+        layerSize = len(layer) + 1
         minBarycenter = self.minBarycenter
         maxBarycenter = self.maxBarycenter
         portBarycenter = self.portBarycenter
@@ -229,8 +233,9 @@ class AbstractBarycenterPortDistributor():
             inLayerConnections = 0
 
             for connectedPort in inLayerPort.getConnectedPorts():
-                if connectedPort.getNode().layer is node.layer:
-                    sum_ += nodePositions[connectedPort.getNode()] + 1
+                connectedNode = connectedPort.node
+                if connectedNode.layer is layer:
+                    sum_ += indexOf(connectedNode) + 1
                     inLayerConnections += 1
 
             # The port's barycenter value is the mean index of connected nodes. If that
@@ -277,15 +282,15 @@ class AbstractBarycenterPortDistributor():
             # (for southern input ports, the key must be larger than the ones
             # assigned to output ports or inputandoutput ports)
             if port.side == PortSide.NORTH:
-                sum_ = -self.nodePositions[portDummy]
+                sum_ = -portDummy.getIndex()
             else:
-                sum_ = absurdlyLargeFloat - self.nodePositions[portDummy]
+                sum_ = absurdlyLargeFloat - portDummy.getIndex()
         elif output and input_ ^ output:
             # It's an output port the index of its dummy node is its sort key
             # (for northern output ports, the key must be larger than the ones assigned
             # to input ports or inputandoutput ports, which are negative and 0,
             # respectively)
-            sum_ = self.nodePositions[portDummy] + 1.0
+            sum_ = portDummy.getIndex() + 1.0
         elif input_ and output:
             # It's both, an input and an output port it must sit between input and
             # output ports
@@ -298,12 +303,6 @@ class AbstractBarycenterPortDistributor():
 
         return sum_
 
-    def updateNodePositions(self, nodeOrder, currentIndex: int):
-        layer = nodeOrder[currentIndex]
-        nodePositions = self.nodePositions
-        for i, node in enumerate(layer):
-            nodePositions[node] = i
-
     def sortPorts(self, node):
         """
         Sort the ports of a node using the given relative position values.
@@ -312,5 +311,20 @@ class AbstractBarycenterPortDistributor():
         :param node: a node
         """
         portBarycenter = self.portBarycenter
+        changed = False
         for side in node.iterSides():
-            side.sort(key=lambda p: portBarycenter[p])
+            if len(side) > 1:
+                ports = sorted(side, key=lambda p: portBarycenter[p])
+                if ports != side:
+                    side[:] = ports
+                    changed = True
+
+        if changed:
+            self.portOrderChanged(node)
+
+    def portOrderChanged(self, node: LNode):
+        """
+        Notify the distributor that the order of the ports of the node
+        was changed (by this distributor or by the user of the distributor)
+        """
+        self.changedPortOrders.add(node)
@@ -2,6 +2,7 @@ from typing import List
 
 from layeredGraphLayouter.containers.constants import PortSide, NodeType
 from layeredGraphLayouter.containers.lGraph import LGraph, LNodeLayer
+from layeredGraphLayouter.crossing.compressedEdges import CompressedEdges
 from layeredGraphLayouter.crossing.crossingCounter import CrossingsCounter
 from layeredGraphLayouter.crossing.hyperedgeCrossingsCounter import HyperedgeCrossingsCounter
 
@@ -38,11 +39,14 @@ class AllCrossingsCounter():
                 inLayerEdgeCounts[l] += 1
 
         portPos = {}
+        # parallel edges are counted only once (with the weight)
+        edges = CompressedEdges()
         self.hyperedgeCrossingsCounter = HyperedgeCrossingsCounter(
             inLayerEdgeCounts,
             hasNorthSouthPorts,
-            portPos)
-        self.crossingCounter = CrossingsCounter(portPos)
+            portPos,
+            edges)
+        self.crossingCounter = CrossingsCounter(portPos, edges)
 
     def countAllCrossings(self, currentOrder: List[LNodeLayer]):
         """
@@ -2,11 +2,18 @@ from itertools import islice
 from random import Random
 from typing import List
 
+from layeredGraphLayouter.crossing.compressedEdges import CompressedEdges
 from layeredGraphLayouter.crossing.forsterConstraintResolver import ForsterConstraintResolver
 from layeredGraphLayouter.containers.constants import PortType, NodeType
 from layeredGraphLayouter.containers.lGraph import LNodeLayer
 from layeredGraphLayouter.containers.lNode import LNode
 
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional, the pure python implementation is used without it
+    np = None
+
 
 def changeIndex(dir_: bool):
     return 1 if dir_ else -1
@@ -34,9 +41,15 @@ def isFirstLayer(nodeOrder: List[List[LNode]], currentIndex: int,
 
 class BarycenterHeuristic():
     RANDOM_AMOUNT = 0.07
+    BATCH_MIN_LAYER_SIZE = 16
     """
     :note: Ported from ELK.
+    :cvar BATCH_MIN_LAYER_SIZE: minimal number of nodes in layer for which
+        numpy batch computation of barycenters and sorting is used
+        (if numpy is available)
     :ivar states: dict {LNode: BarycenterState}
+    :ivar edges: compressed view on the edges, parallel edges are used
+        only once with the weight equal to their count
     """
 
     def __init__(self, constraintResolver: ForsterConstraintResolver,
@@ -56,7 +69,9 @@ class BarycenterHeuristic():
         self.portDistributor = portDistributor
         self.states = constraintResolver.states
         self.portRanks = portDistributor.portRanks
+        self.edges = CompressedEdges()
         self.isDeterministic = False
+        self.alwaysImproves = False
 
     # the barycenter values of every node in the graph, indexed by layer.id
     # and node.id.
@@ -70,13 +85,13 @@ class BarycenterHeuristic():
         else:
             # Calculate barycenters and assign barycenters to barycenterless
             # node groups
-            self.calculateBarycenters(layer, forward)
+            if not self.calculateBarycentersBatch(layer, forward):
+                self.calculateBarycenters(layer, forward)
             self.fillInUnknownBarycenters(layer, preOrdered)
 
         if layer:
             # Sort the vertices according to their barycenters
-            states = self.states
-            layer.sort(key=lambda n: states[n])
+            self.sortByBarycenter(layer)
 
             # Resolve ordering constraints
             self.constraintResolver.processConstraints(layer)
@@ -93,9 +108,8 @@ class BarycenterHeuristic():
 
         layer = list(order[freeLayerIndex])
         self.minimizeCrossingsInLayer(layer, preOrdered, False, forwardSweep)
-        new_order = {n: i for i, n in enumerate(layer)}
         # apply the new ordering
-        order[freeLayerIndex].sort(key=lambda n: new_order[n])
+        order[freeLayerIndex][:] = layer
 
         return False  # Does not always improve.
 
@@ -117,8 +131,7 @@ class BarycenterHeuristic():
         _startIndex = startIndex(isForwardSweep, len(order))
         layer = list(order[_startIndex])
         self.minimizeCrossingsInLayer(layer, False, True, isForwardSweep)
-        new_order = {n: i for i, n in enumerate(layer)}
-        order[_startIndex].sort(key=lambda n: new_order[n])
+        order[_startIndex][:] = layer
         return False  # Does not always improve
 
     def fillInUnknownBarycenters(self, nodes, preOrdered):
@@ -189,6 +202,85 @@ class BarycenterHeuristic():
             # Calculate the node groups's new barycenter (may be null)
             calculateBarycenter(node, forward)
 
+    def useBatch(self, nodes: List[LNode]) -> bool:
+        return np is not None and len(nodes) >= self.BATCH_MIN_LAYER_SIZE
+
+    def sortByBarycenter(self, nodes: List[LNode]):
+        """
+        Sort nodes by barycenter (stable, nodes without barycenter last)
+        """
+        states = self.states
+        if self.useBatch(nodes):
+            # None is converted to nan which is sorted last
+            bcs = np.array([states[n].barycenter for n in nodes], dtype=float)
+            order = np.argsort(bcs, kind="stable").tolist()
+            nodes[:] = [nodes[i] for i in order]
+        else:
+            nodes.sort(key=lambda n: states[n])
+
+    def calculateBarycentersBatch(self, nodes: List[LNode], forward: bool) -> bool:
+        """
+        Calculate the barycenters of the given nodes using numpy segment reductions.
+        Only layers without in-layer edges and barycenter associates are handled,
+        the results are the same as from :meth:`~.calculateBarycenters`.
+
+        :param nodes: the nodes
+        :param forward: True if the current sweep moves forward
+        :return: False if the nodes can not be processed in batch
+            and :meth:`~.calculateBarycenters` has to be used instead
+        """
+        if not self.useBatch(nodes):
+            return False
+
+        portRanks = self.portRanks
+        connectedPorts = self.edges.predecessors if forward else self.edges.successors
+        ranks = []
+        weights = []
+        segments = []
+        for i, node in enumerate(nodes):
+            if node.barycenterAssociates:
+                return False
+            layer = node.layer
+            for freePort in node.iterPorts():
+                for fixedPort, weight in connectedPorts[freePort].items():
+                    if fixedPort.node.layer is layer:
+                        return False
+                    ranks.append(portRanks[fixedPort])
+                    weights.append(weight)
+                    segments.append(i)
+
+        nodeCnt = len(nodes)
+        segments = np.array(segments, dtype=np.intp)
+        weights = np.array(weights, dtype=float)
+        # (bincount returns integers if there are no edges at all)
+        summedWeights = np.bincount(segments, weights=np.array(ranks, dtype=float) * weights,
+                                    minlength=nodeCnt).astype(float, copy=False)
+        degrees = np.bincount(segments, weights=weights,
+                              minlength=nodeCnt).astype(int)
+        connected = degrees > 0
+
+        # add a small random perturbation in order to increase diversity of
+        # solutions (the random values are generated in same order as in
+        # calculateBarycenter)
+        random = self.random.random
+        ra = self.RANDOM_AMOUNT
+        perturbation = np.array([random() for _ in range(int(np.count_nonzero(connected)))],
+                                dtype=float)
+        summedWeights[connected] += perturbation * ra - ra / 2
+        barycenters = summedWeights / np.maximum(degrees, 1)
+
+        states = self.states
+        for node, degree, summedWeight, barycenter, isConnected in zip(
+                nodes, degrees.tolist(), summedWeights.tolist(),
+                barycenters.tolist(), connected.tolist()):
+            st = states[node]
+            st.visited = True
+            st.degree = degree
+            st.summedWeight = summedWeight
+            st.barycenter = barycenter if isConnected else None
+
+        return True
+
     def calculateBarycenter(self, node, forward: bool):
         """
         Calculate the barycenter of the given single-node node group. This method is able to handle
@@ -215,18 +307,14 @@ class BarycenterHeuristic():
         states = self.states
         portRanks = self.portRanks
         calculateBarycenter = self.calculateBarycenter
+        connectedPorts = self.edges.predecessors if forward else self.edges.successors
 
         for freePort in node.iterPorts():
-            if forward:
-                portIterable = freePort.getPredecessorPorts()
-            else:
-                portIterable = freePort.getSuccessorPorts()
-
-            for fixedPort in portIterable:
+            for fixedPort, weight in connectedPorts[freePort].items():
                 # If the node the fixed port belongs to is part of the free layer (thus, if
                 # we have an in-layer edge), use that node's barycenter
                 # calculation instead
-                fixedNode = fixedPort.getNode()
+                fixedNode = fixedPort.node
 
                 if fixedNode.layer is node.layer:
                     # Self-loops are ignored
@@ -237,11 +325,11 @@ class BarycenterHeuristic():
 
                         # Update this node group's values
                         fst = states[fixedNode]
-                        st.degree += fst.degree
-                        st.summedWeight += fst.summedWeight
+                        st.degree += fst.degree * weight
+                        st.summedWeight += fst.summedWeight * weight
                 else:
-                    st.summedWeight += portRanks[fixedPort]
-                    st.degree += 1
+                    st.summedWeight += portRanks[fixedPort] * weight
+                    st.degree += weight
 
         # Iterate over the node's barycenter associates
         barycenterAssociates = node.barycenterAssociates
@@ -28,26 +28,27 @@ class BinaryIndexedTree():
             self.binarySums.extend(newItems)
             self.numsPerIndex.extend(newItems)
 
-    def add(self, index: int):
+    def add(self, index: int, count: int=1):
         """
         Increment given index.
         :param index: The index to increment.
+        :param count: The number of the entries to add.
         """
         try:
-            self.numsPerIndex[index] += 1
+            self.numsPerIndex[index] += count
         except IndexError:
             if self.fill_with_zero:
                 self.extend_size(index + 1)
-                return self.add(index)
+                return self.add(index, count)
             else:
                 raise
 
-        self.size += 1
+        self.size += count
         i = index + 1
         binarySums = self.binarySums
         len_ = len(binarySums)
         while i < len_:
-            binarySums[i] += 1
+            binarySums[i] += count
             i += i & -i
 
     def rank(self, index: int):
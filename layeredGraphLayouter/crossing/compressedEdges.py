@@ -0,0 +1,77 @@
+from typing import Callable, Dict, Iterable
+
+from layeredGraphLayouter.containers.lPort import LPort
+
+
+def compressPorts(ports: Iterable[LPort]) -> Dict[LPort, int]:
+    """
+    :return: dict {port: number of occurrences of the port}
+        in order of the first occurrence
+    """
+    weights = {}
+    for p in ports:
+        weights[p] = weights.get(p, 0) + 1
+    return weights
+
+
+def neighborPorts(port: LPort) -> Dict[LPort, int]:
+    return compressPorts([e.dst if e.src is port else e.src
+                          for e in port.iterEdges()])
+
+
+def predecessorPorts(port: LPort) -> Dict[LPort, int]:
+    return compressPorts([e.src for e in port.incomingEdges])
+
+
+def successorPorts(port: LPort) -> Dict[LPort, int]:
+    return compressPorts([e.dst for e in port.outgoingEdges])
+
+
+class PortConnectionCache(dict):
+    """
+    dict {port: dict {connected port: weight}} where the connections
+    of the port are resolved on first access
+
+    :ivar resolve: function port -> dict {connected port: weight}
+    """
+
+    def __init__(self, resolve: Callable[[LPort], Dict[LPort, int]]):
+        super(PortConnectionCache, self).__init__()
+        self.resolve = resolve
+
+    def __missing__(self, port: LPort):
+        res = self[port] = self.resolve(port)
+        return res
+
+
+class CompressedEdges():
+    """
+    Compressed view on the edges for crossing minimization, parallel edges
+    between the same pair of ports are represented by a single connection
+    with the weight equal to the number of these edges
+    (e.g. bit-blasted buses), so the counting of crossings and the barycenters
+    scale with the number of distinct connections instead of edges
+
+    The connections are stored in dicts (instead of lists of tuples)
+    because a dict is a single object for the garbage collector.
+
+    :note: the edges of the ports must not change while this object is used
+        (e.g. during crossing minimization)
+    :ivar neighbors: PortConnectionCache for all edges of the port
+        (same as LPort.iterEdges())
+    :ivar predecessors: PortConnectionCache for incoming edges of the port
+    :ivar successors: PortConnectionCache for outgoing edges of the port
+    """
+
+    def __init__(self):
+        self.neighbors = PortConnectionCache(neighborPorts)
+        self.predecessors = PortConnectionCache(predecessorPorts)
+        self.successors = PortConnectionCache(successorPorts)
+
+    def clear(self):
+        """
+        Drop the cached connections (required after the change of the edges)
+        """
+        self.neighbors.clear()
+        self.predecessors.clear()
+        self.successors.clear()
@@ -99,7 +99,7 @@ southern nsl dummies with eastern edges south-to-north
 
 """
 from collections import deque
-from typing import List, Tuple, Dict, Deque
+from typing import List, Tuple, Dict, Deque, Optional
 
 from layeredGraphLayouter.containers.constants import PortSide, NodeType,\
     PortType
@@ -107,6 +107,7 @@ from layeredGraphLayouter.containers.lEdge import LEdge
 from layeredGraphLayouter.containers.lNode import LNode
 from layeredGraphLayouter.containers.lPort import LPort
 from layeredGraphLayouter.crossing.binaryIndexedTree import BinaryIndexedTree
+from layeredGraphLayouter.crossing.compressedEdges import CompressedEdges
 
 
 def reverseForTopDown(seq, topDown: bool):
@@ -177,18 +178,24 @@ def isLayoutUnitChanged(lastUnit: LNode, node: LNode) -> bool:
 class CrossingsCounter():
     """
     :note: ported from ELK
+    :note: parallel edges between the same ports are counted
+        as a single weighted connection (CompressedEdges)
     """
     INDEXING_SIDE = PortSide.WEST
     STACK_SIDE = PortSide.EAST
 
-    def __init__(self, portPositions: Dict[LPort, int]):
+    def __init__(self, portPositions: Dict[LPort, int],
+                 edges: Optional[CompressedEdges]=None):
         """
         Create crossings counter.
 
         :param portPositions: port position array passed to prevent frequent
             large array construction.
+        :param edges: compressed view on the edges (shared with other
+            crossing minimization objects), new one is created if not specified
         """
         self.portPositions = portPositions
+        self.edges = CompressedEdges() if edges is None else edges
         self.indexTree = None
         self.ends = deque()
         self.nodeCardinalities = {}
@@ -362,12 +369,16 @@ class CrossingsCounter():
                                               lowerNode: LNode,
                                               side: PortSide):
         ports = set()
+        neighbors = self.edges.neighbors
         for node in (upperNode, lowerNode):
             for port in inNorthSouthEastWestOrder(node, side):
-                for edge in port.iterEdges(filterSelfLoops=True):
+                for other in neighbors[port]:
+                    if other.node is port.node:
+                        # self loop
+                        continue
                     ports.add(port)
-                    if isInLayer(edge):
-                        ports.add(otherEndOf(edge, port))
+                    if other.node.layer is port.node.layer:
+                        ports.add(other)
         ports = list(ports)
         poss = self.portPositions
         ports.sort(key=lambda x: poss[x])
@@ -375,10 +386,12 @@ class CrossingsCounter():
 
     def connectedPortsSortedByPosition(self, upperPort: LPort, lowerPort: LPort):
         ports = set()
+        neighbors = self.edges.neighbors
         for port in (upperPort, lowerPort):
             ports.add(port)
-            for edge in port.iterEdges(filterSelfLoops=True):
-                ports.add(otherEndOf(edge, port))
+            for other in neighbors[port]:
+                if other.node is not port.node:
+                    ports.add(other)
 
         ports = list(ports)
         poss = self.portPositions
@@ -391,18 +404,22 @@ class CrossingsCounter():
         indexTree = self.indexTree
         ends = self.ends
 
+        neighbors = self.edges.neighbors
+
         for port in ports:
-            indexTree.removeAll(poss[port])
-            # First get crossings for all edges.
-            for edge in port.iterEdges():
-                endPosition = poss[otherEndOf(edge, port)]
-                if endPosition > poss[port]:
-                    crossings += indexTree.rank(endPosition)
-                    ends.append(endPosition)
+            pos = poss[port]
+            indexTree.removeAll(pos)
+            # First get crossings for all edges
+            # (parallel edges do not cross each other)
+            for other, weight in neighbors[port].items():
+                endPosition = poss[other]
+                if endPosition > pos:
+                    crossings += indexTree.rank(endPosition) * weight
+                    ends.append((endPosition, weight))
 
             # Then add end points.
             while ends:
-                indexTree.add(ends.pop())
+                indexTree.add(*ends.pop())
 
         return crossings
 
@@ -412,23 +429,27 @@ class CrossingsCounter():
         indexTree = self.indexTree
         ends = self.ends
 
+        neighbors = self.edges.neighbors
+
         for port in ports:
-            indexTree.removeAll(poss[port])
+            pos = poss[port]
+            indexTree.removeAll(pos)
+            layer = port.node.layer
             numBetweenLayerEdges = 0
             # First get crossings for all edges.
-            for edge in port.iterEdges():
-                if isInLayer(edge):
-                    endPosition = poss[otherEndOf(edge, port)]
-                    if endPosition > poss[port]:
-                        crossings += indexTree.rank(endPosition)
-                        ends.append(endPosition)
+            for other, weight in neighbors[port].items():
+                if other.node.layer is layer:
+                    endPosition = poss[other]
+                    if endPosition > pos:
+                        crossings += indexTree.rank(endPosition) * weight
+                        ends.append((endPosition, weight))
                 else:
-                    numBetweenLayerEdges += 1
+                    numBetweenLayerEdges += weight
 
             crossings += indexTree.size * numBetweenLayerEdges
             # Then add end points.
             while ends:
-                indexTree.add(ends.pop())
+                indexTree.add(*ends.pop())
 
         return crossings
 
@@ -446,7 +467,7 @@ class CrossingsCounter():
             # collect the edges that are incident to the port,
             # which is a bit tedious since north/south ports have no physical
             # edge within the graph at this point
-            t = port.getNode().type
+            t = port.node.type
             if t == NodeType.NORMAL:
                 dummy = port.portDummy
                 # guarded in #initPositionsForNorthSouthCounting(...)
@@ -456,7 +477,7 @@ class CrossingsCounter():
                     targetsAndDegrees.add((p, p.getDegree()))
 
             elif t == NodeType.LONG_EDGE:
-                for p in port.getNode().iterPorts():
+                for p in port.node.iterPorts():
                     if p is port:
                         continue
                     # add an edge to the dummy's other port
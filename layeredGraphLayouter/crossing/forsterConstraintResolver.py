@@ -1,5 +1,6 @@
+from collections import deque
 from math import inf
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from layeredGraphLayouter.crossing.barycenterState import BarycenterState
 from layeredGraphLayouter.containers.lNode import LNode
@@ -19,10 +20,21 @@ class ConstraintGroup():
         node's ports are connected to
     :ivar degree: The number of ports relevant to the barycenter calculation.
     :ivar nodes:  List of nodes this vertex consists of.
-    :ivar outgoingConstraints: List of outgoing constraints.
-    :ivar incomingConstraints: List of incoming constraints.
-    :ivar incomingConstraintsCount: The number of incoming constraints.
+    :ivar outgoingConstraints: dict {successor group: None} (insertion ordered set)
+        of outgoing constraints.
+    :ivar incomingConstraints: dict {predecessor group: None} (insertion ordered set)
+        of incoming constraints whose predecessor was already checked (state DONE)
+    :ivar constraintSources: dict {predecessor group: None} of all groups which have
+        this group in their outgoing constraints (reverse of outgoingConstraints,
+        used to rewire constraints on merge in O(degree)).
+    :ivar prevGroup: previous group in the barycenter ordered list of ForsterConstraintResolver
+    :ivar nextGroup: next group in the barycenter ordered list of ForsterConstraintResolver
+    :ivar state: state of this group in the topological traversal
+        of ForsterConstraintResolver (WAITING, QUEUED, DONE or MERGED)
+    :ivar checkOrder: sequence number of the last check of this group
+        which ended with state DONE
     """
+    WAITING, QUEUED, DONE, MERGED = range(4)
 
     def __init__(self, states: Dict[LNode, BarycenterState]):
         """
@@ -33,6 +45,11 @@ class ConstraintGroup():
         self.degree = 0
         self.incomingConstraints = None
         self.outgoingConstraints = None
+        self.constraintSources = {}
+        self.prevGroup = None
+        self.nextGroup = None
+        self.state = ConstraintGroup.WAITING
+        self.checkOrder = 0
         self.states = states
 
     @classmethod
@@ -47,10 +64,12 @@ class ConstraintGroup():
     @classmethod
     def from_merge(cls, nodeGroup1: "ConstraintGroup", nodeGroup2: "ConstraintGroup") -> "ConstraintGroup":
         """
-        Constructs a new vertex that is the concatenation of the given two vertices. The incoming
-        constraints count is set to zero, while the list of successors are merged, updating the
-        successors' incoming count appropriately if both vertices are predecessors. The new
-        barycenter is derived from the barycenters of the given node groups.
+        Constructs a new vertex that is the concatenation of the given two vertices.
+        The constraints of both vertices are moved to the new vertex (the constraint
+        between them is dropped) and the neighbors of the vertices are rewired
+        to the new vertex. The incoming constraints of already checked predecessors
+        are merged as well. The new barycenter is derived from the barycenters
+        of the given node groups.
 
         :param nodeGroup1: the first vertex
         :param nodeGroup2: the second vertex
@@ -62,23 +81,37 @@ class ConstraintGroup():
         self.nodes.extend(nodeGroup2.nodes)
 
         # Add constraints, taking care not to add any constraints to vertex1 or vertex2
-        # and to decrement the incoming constraints count of those that are
-        # successors to both
-        if nodeGroup1.hasOutgoingConstraints():
-            self.outgoingConstraints = list(nodeGroup1.outgoingConstraints)
-            self.outgoingConstraints.remove(nodeGroup2)
-            if nodeGroup2.hasOutgoingConstraints():
-                for candidate in nodeGroup2.outgoingConstraints:
-                    if candidate == nodeGroup1:
-                        continue
-                    elif candidate in self.outgoingConstraints:
-                        # The candidate was in both vertices' successor list
-                        candidate.incomingConstraintsCount -= 1
-                    else:
-                        self.outgoingConstraints.append(candidate)
-        elif nodeGroup2.hasOutgoingConstraints():
-            self.outgoingConstraints = list(nodeGroup2.outgoingConstraints)
-            self.outgoingConstraints.remove(nodeGroup1)
+        # (the constraints to successors of both vertices are merged)
+        outgoing = self.outgoingConstraints = {}
+        sources = self.constraintSources
+        incoming = self.incomingConstraints = {}
+        for g in (nodeGroup1, nodeGroup2):
+            if g.outgoingConstraints:
+                outgoing.update(g.outgoingConstraints)
+            sources.update(g.constraintSources)
+            if g.incomingConstraints:
+                incoming.update(g.incomingConstraints)
+
+        for g in (nodeGroup1, nodeGroup2):
+            outgoing.pop(g, None)
+            sources.pop(g, None)
+            incoming.pop(g, None)
+            g.state = ConstraintGroup.MERGED
+
+        # successors of the merged groups have to point back to the new group
+        for successor in outgoing.keys():
+            for cs in (successor.constraintSources, successor.incomingConstraints):
+                if cs:
+                    cs.pop(nodeGroup1, None)
+                    cs.pop(nodeGroup2, None)
+            successor.constraintSources[self] = None
+
+        # predecessors of the merged groups have to point to the new group
+        for predecessor in sources.keys():
+            out = predecessor.outgoingConstraints
+            out.pop(nodeGroup1, None)
+            out.pop(nodeGroup2, None)
+            out[self] = None
 
         self.summedWeight = nodeGroup1.summedWeight + nodeGroup2.summedWeight
         self.degree = nodeGroup1.degree + nodeGroup2.degree
@@ -122,23 +155,34 @@ class ConstraintGroup():
 
         return self.states[node].barycenter
 
-    def getOutgoingConstraints(self) -> List["ConstraintGroup"]:
+    def getOutgoingConstraints(self) -> Dict["ConstraintGroup", None]:
         """
-        Returns the list of outgoing constraints, creating it if not yet done before.
+        Returns the outgoing constraints, creating them if not yet done before.
 
-        :return: the outgoing constraints list of the node group
+        :return: the outgoing constraints of the node group
         """
         if self.outgoingConstraints is None:
-            self.outgoingConstraints = []
+            self.outgoingConstraints = {}
 
         return self.outgoingConstraints
 
     def resetOutgoingConstraints(self) -> None:
         """
-        Reset the list of outgoing constraints to None.
+        Reset the outgoing constraints to None.
         """
         self.outgoingConstraints = None
 
+    def addOutgoingConstraint(self, successor: "ConstraintGroup") -> None:
+        """
+        Add constraint "this group has to be before successor",
+        duplicate constraints are ignored.
+        """
+        outgoing = self.getOutgoingConstraints()
+        if successor in outgoing:
+            return
+        outgoing[successor] = None
+        successor.constraintSources[self] = None
+
     def hasOutgoingConstraints(self) -> bool:
         """
         Determine whether there are any outgoing constraints.
@@ -147,20 +191,20 @@ class ConstraintGroup():
         """
         return self.outgoingConstraints is not None and len(self.outgoingConstraints) > 0
 
-    def getIncomingConstraints(self):
+    def getIncomingConstraints(self) -> Dict["ConstraintGroup", None]:
         """
-        Returns the list of incoming constraints, creating it if not yet done before.
+        Returns the incoming constraints, creating them if not yet done before.
 
-        :return: the incoming constraints list of the node group
+        :return: the incoming constraints of the node group
         """
         if self.incomingConstraints is None:
-            self.incomingConstraints = []
+            self.incomingConstraints = {}
 
         return self.incomingConstraints
 
     def resetIncomingConstraints(self):
         """
-        Reset the list of incoming constraints to {@code null}.
+        Reset the incoming constraints to {@code null}.
         """
         self.incomingConstraints = None
 
@@ -172,6 +216,13 @@ class ConstraintGroup():
         """
         return self.incomingConstraints is not None and len(self.incomingConstraints) > 0
 
+    def isReadyToCheck(self) -> bool:
+        """
+        :return: True if all predecessors of this group were already checked
+        """
+        incoming = self.incomingConstraints
+        return len(self.constraintSources) == (0 if incoming is None else len(incoming))
+
     def getNode(self) -> LNode:
         """
         Returns the contained node. This may only be used for node groups with exactly one node.
@@ -190,9 +241,21 @@ class ForsterConstraintResolver():
     an ordering that minimizes edge crossings between the given free layer and a neighboring layer
     with fixed node order. The barycenter heuristic is used here.
 
+    The constraint groups are kept in a doubly linked list ordered by barycenter
+    (ConstraintGroup.prevGroup/nextGroup), so a merge of two groups costs only
+    the degree of the merged groups and the distance to the new position
+    instead of a pass over the whole layer. The topological traversal
+    of the constraint graph is not restarted after a merge, only the merged
+    group and its already checked successors are checked again.
+
     :cvar BARYCENTER_EQUALITY_DELTA: Delta that two barycenters can differ by to still
         be considered equal.
     :ivar states: dict {LNode: BarycenterState}
+    :ivar constraintGroups: dict {LNode: ConstraintGroup} single node group for each node
+    :ivar layoutUnits: dict {LNode: List[LNode]} nodes of the layout unit
+        for each layout unit root node (LNode.inLayerLayoutUnit)
+    :ivar firstGroup: first group of the barycenter ordered list of groups
+    :ivar lastGroup: last group of the barycenter ordered list of groups
     """
     BARYCENTER_EQUALITY_DELTA = 0.0001
 
@@ -204,37 +267,47 @@ class ForsterConstraintResolver():
             for n in layer:
                 states[n] = BarycenterState(n)
                 cGroups[n] = ConstraintGroup.from_node(states, n)
-                units[n] = [n, ]
+                unit = n.inLayerLayoutUnit
+                if unit is not None:
+                    units.setdefault(unit, []).append(n)
+
+        self.firstGroup = None
+        self.lastGroup = None
 
     def processConstraints(self, nodes: List[LNode]):
         """
         :attention: nodes can be modified
         """
-        groups = []
-        for node in nodes:
-            groups.append(self.constraintGroups[node])
+        cGroups = self.constraintGroups
+        groups = [cGroups[node] for node in nodes]
 
         # Build the constraints graph
         self.buildConstraintsGraph(groups)
 
-        # Find violated vertices
-        while True:
-            violatedConstraint = self.findViolatedConstraint(groups)
-            if violatedConstraint is None:
-                break
-
-            self.handleViolatedConstraint(*violatedConstraint,
-                                          groups)
+        # Find and merge violated vertices
+        self.resolveViolatedConstraints()
 
         # Apply the determined order
         nodes.clear()
         states = self.states
-        for group in groups:
+        for group in self.iterGroups():
+            barycenter = group.getBarycenter()
             for node in group.nodes:
                 nodes.append(node)
-                states[node].barycenter = group.getBarycenter()
+                states[node].barycenter = barycenter
 
-    def buildConstraintsGraph(self, groups):
+        self.firstGroup = self.lastGroup = None
+
+    def iterGroups(self):
+        """
+        Iterate constraint groups in the current (barycenter) order
+        """
+        group = self.firstGroup
+        while group is not None:
+            yield group
+            group = group.nextGroup
+
+    def buildConstraintsGraph(self, groups: List[ConstraintGroup]):
         """
         Build the constraint graph for the given vertices. The constraint graph is created from
         the predefined <em>in-layer successor constraints</em> and the <em>layout units</em>.
@@ -242,10 +315,21 @@ class ForsterConstraintResolver():
         :param groups: the array of single-node vertices sorted by their barycenter values.
         """
 
-        # Reset the constraint fields
+        # Reset the constraint fields and link the groups in to the list
+        prev = None
         for group in groups:
             group.resetOutgoingConstraints()
-            group.incomingConstraintsCount = 0
+            group.resetIncomingConstraints()
+            group.constraintSources = {}
+            group.state = ConstraintGroup.WAITING
+            group.prevGroup = prev
+            group.nextGroup = None
+            if prev is not None:
+                prev.nextGroup = group
+            prev = group
+
+        self.firstGroup = groups[0] if groups else None
+        self.lastGroup = prev
 
         # Iterate through the vertices, adding the necessary constraints
         lastNonDummyNode = None
@@ -257,9 +341,7 @@ class ForsterConstraintResolver():
             node = group.getNode()
             # Add the constraints given by the vertex's node
             for successor in node.inLayerSuccessorConstraint:
-                g = cgroups[successor]
-                group.getOutgoingConstraints().append(g)
-                g.incomingConstraintsCount += 1
+                group.addOutgoingConstraint(cgroups[successor])
 
             # Check if we're processing a a normal, none-dummy node
             if node.type == NodeType.NORMAL:
@@ -267,63 +349,112 @@ class ForsterConstraintResolver():
                 # constraints from all of that other node's layout unit's vertices to this
                 # node's layout unit's vertices
                 if lastNonDummyNode is not None:
-                    for lastUnitNode in layoutUnits[lastNonDummyNode]:
-                        for currentUnitNode in layoutUnits[node]:
-                            g = cgroups[currentUnitNode]
-                            cgroups[lastUnitNode].getOutgoingConstraints().append(g)
-                            g.incomingConstraintsCount += 1
+                    currentUnit = [cgroups[n]
+                                   for n in layoutUnits.get(node, ())]
+                    for lastUnitNode in layoutUnits.get(lastNonDummyNode, ()):
+                        addOutgoingConstraint = cgroups[lastUnitNode].addOutgoingConstraint
+                        for g in currentUnit:
+                            addOutgoingConstraint(g)
 
                 lastNonDummyNode = node
 
-    def findViolatedConstraint(self, groups):
-        activeGroups = None
+    def resolveViolatedConstraints(self):
+        """
+        Traverse the constraint graph in topological order and merge the groups
+        with violated constraints. The traversal continues after the merge,
+        the merged group is checked immediately (all its predecessors are already
+        checked) and its successors are checked again after it.
+        """
+        WAITING = ConstraintGroup.WAITING
+        QUEUED = ConstraintGroup.QUEUED
+        activeGroups = deque()
 
-        # Iterate through the constrained vertices
+        # Find sources of the constraint graph to start the constraints check
         lastValue = -inf
-        for group in groups:
-            assert group.getBarycenter() is not None and group.getBarycenter() >= lastValue
-            lastValue = group.getBarycenter()
-            group.resetIncomingConstraints()
-
-            # Find sources of the constraint graph to start the constraints
-            # check
-            if (group.hasOutgoingConstraints() and group.incomingConstraintsCount == 0):
-                if activeGroups is None:
-                    activeGroups = []
+        for group in self.iterGroups():
+            barycenter = group.getBarycenter()
+            assert barycenter is not None and barycenter >= lastValue
+            lastValue = barycenter
+            if group.hasOutgoingConstraints() and not group.constraintSources:
+                group.state = QUEUED
                 activeGroups.append(group)
 
-        # Iterate through the active node groups to find one with violated
-        # constraints
-        if activeGroups is not None:
-            while activeGroups:
-                group = activeGroups.pop(0)
-
-                # See if we can find a violated constraint
-                if group.hasIncomingConstraints():
-                    for predecessor in group.getIncomingConstraints():
-                        if (predecessor.getBarycenter() == group.getBarycenter()):
-                            if groups.index(predecessor) > groups.index(group):
-                                # The predecessor has equal barycenter, but
-                                # higher index
-                                return predecessor, group
-                        elif predecessor.getBarycenter() > group.getBarycenter():
-                            # The predecessor has greater barycenter and thus
-                            # also higher index
-                            return predecessor, group
-                # No violated constraints add outgoing constraints to the
-                # respective incoming list
-                for successor in group.getOutgoingConstraints():
-                    successorIncomingList = successor.getIncomingConstraints()
-                    successorIncomingList.insert(0, group)
-
-                    if successor.incomingConstraintsCount == len(successorIncomingList):
+        findViolatedPredecessor = self.findViolatedPredecessor
+        handleViolatedConstraint = self.handleViolatedConstraint
+        checkOrder = 0
+        while activeGroups:
+            group = activeGroups.popleft()
+            if group.state != QUEUED:
+                # group was merged or one of its predecessors was merged
+                # after it was queued
+                continue
+
+            predecessor = findViolatedPredecessor(group)
+            if predecessor is not None:
+                newGroup = handleViolatedConstraint(predecessor, group)
+                if newGroup.isReadyToCheck():
+                    newGroup.state = QUEUED
+                    activeGroups.appendleft(newGroup)
+                continue
+
+            # No violated constraints add outgoing constraints to the
+            # respective incoming list
+            group.state = ConstraintGroup.DONE
+            checkOrder += 1
+            group.checkOrder = checkOrder
+            if group.outgoingConstraints:
+                for successor in group.outgoingConstraints.keys():
+                    successor.getIncomingConstraints()[group] = None
+                    if successor.state == WAITING and successor.isReadyToCheck():
+                        successor.state = QUEUED
                         activeGroups.append(successor)
-        # No violated constraints found
-        return None
+
+    def findViolatedPredecessor(self, group: ConstraintGroup) -> Optional[ConstraintGroup]:
+        """
+        :return: the last checked predecessor of the group which has to be
+            before the group but it is not, None if there is not any
+        :note: the last checked violated predecessor is not an ancestor
+            of any other violated predecessor, so the merge does not create
+            a cycle in the constraint graph
+        """
+        if not group.hasIncomingConstraints():
+            return None
+
+        barycenter = group.getBarycenter()
+        violated = None
+        for predecessor in group.incomingConstraints.keys():
+            if violated is not None and predecessor.checkOrder < violated.checkOrder:
+                continue
+
+            predBarycenter = predecessor.getBarycenter()
+            if predBarycenter == barycenter:
+                if self._isAfterInEqualRange(predecessor, group):
+                    # The predecessor has equal barycenter, but
+                    # is after the group
+                    violated = predecessor
+            elif predBarycenter > barycenter:
+                # The predecessor has greater barycenter and thus
+                # is also after the group
+                violated = predecessor
+
+        return violated
+
+    @staticmethod
+    def _isAfterInEqualRange(group: ConstraintGroup, other: ConstraintGroup) -> bool:
+        """
+        :return: True if the group is after other group in the list
+            (both groups have the same barycenter)
+        """
+        barycenter = other.getBarycenter()
+        g = other.nextGroup
+        while g is not None and g.getBarycenter() == barycenter:
+            if g is group:
+                return True
+            g = g.nextGroup
+        return False
 
     def handleViolatedConstraint(self, firstNodeGroup: ConstraintGroup,
-                                 secondNodeGroup: ConstraintGroup,
-                                 nodeGroups: List[ConstraintGroup]):
+                                 secondNodeGroup: ConstraintGroup) -> ConstraintGroup:
         """
         Handles the case of a violated constraint. The node groups must be sorted by their
         barycenter values. After this method has finished, the list of node groups is smaller
@@ -332,51 +463,97 @@ class ForsterConstraintResolver():
 
         :param firstNodeGroup: the node group with violated outgoing constraint
         :param secondNodeGroup: the node group with violated incoming constraint
-        :param nodeGroups: the list of vertices
+        :return: the new node group
         """
-        # [TODO] rewrite iterator access to list construction
- 
         # Create a new vertex from the two constrain-violating vertices this also
         # automatically calculates the new vertex's barycenter value
-        newNodeGroup = ConstraintGroup.from_merge(firstNodeGroup, secondNodeGroup)
-        assert (newNodeGroup.getBarycenter() + self.BARYCENTER_EQUALITY_DELTA 
-                    >= secondNodeGroup.getBarycenter())
-        assert (newNodeGroup.getBarycenter() - self.BARYCENTER_EQUALITY_DELTA 
-                    <= firstNodeGroup.getBarycenter())
-
-        # Iterate through the vertices. Remove the old vertices. Insert the new one
-        # according to the barycenter value, thereby keeping the list sorted. Along
-        # the way, constraint relationships will be updated
-        nodeGroupIterator = iter(nodeGroups)
-        alreadyInserted = False
-        while True:
-            nodeGroup = next(nodeGroupIterator)
-
-            if (nodeGroup == firstNodeGroup or nodeGroup == secondNodeGroup):
-                # Remove the two node groups with violated constraint from the list
-                nodeGroupIterator.remove()
-            elif (not alreadyInserted
-                  and nodeGroup.getBarycenter() > newNodeGroup.getBarycenter()):
-                # If we haven't inserted the new node group into the list already, do that now.
-                # Note: we're not calling next() again. This means that during the next iteration,
-                # we will again be looking at the current node group. But then, alreadyInserted will
-                # be true and we can look at that node group's outgoing constraints.
-                nodeGroupIterator.previous()
-                nodeGroupIterator.add(newNodeGroup)
-
-                alreadyInserted = True
-            elif nodeGroup.hasOutgoingConstraints():
-                # Check if the vertex has any constraints with the former two vertices
-                firstNodeGroupConstraint = nodeGroup.getOutgoingConstraints()\
-                        .remove(firstNodeGroup)
-                secondNodeGroupConstraint = nodeGroup.getOutgoingConstraints()\
-                        .remove(secondNodeGroup)
-
-                if firstNodeGroupConstraint or secondNodeGroupConstraint:
-                    nodeGroup.getOutgoingConstraints().add(newNodeGroup)
-                    newNodeGroup.incomingConstraintsCount += 1
-
-        # If we haven't inserted the new node group already, add it to the end
-        if not alreadyInserted:
-            nodeGroups.add(newNodeGroup)
+        newNodeGroup = ConstraintGroup.from_merge(
+            firstNodeGroup, secondNodeGroup)
+        newBarycenter = newNodeGroup.getBarycenter()
+        assert (newBarycenter + self.BARYCENTER_EQUALITY_DELTA
+                >= secondNodeGroup.getBarycenter())
+        assert (newBarycenter - self.BARYCENTER_EQUALITY_DELTA
+                <= firstNodeGroup.getBarycenter())
+
+        # Remove the two node groups with violated constraint from the list,
+        # the first group is always behind the second one
+        insertAfter = secondNodeGroup.prevGroup
+        self._unlink(secondNodeGroup)
+        self._unlink(firstNodeGroup)
+
+        # Insert the new one according to the barycenter value, thereby keeping the list sorted
+        # (before the first group with a greater barycenter). The search starts
+        # at the original position because the new barycenter is between
+        # the barycenters of the merged groups.
+        while insertAfter is not None and insertAfter.getBarycenter() > newBarycenter:
+            insertAfter = insertAfter.prevGroup
+
+        insertBefore = self.firstGroup if insertAfter is None else insertAfter.nextGroup
+        while insertBefore is not None and insertBefore.getBarycenter() <= newBarycenter:
+            insertAfter = insertBefore
+            insertBefore = insertBefore.nextGroup
+
+        self._linkAfter(newNodeGroup, insertAfter)
+
+        # The successors have to be checked again after the new group
+        # because its barycenter and position are different
+        self._uncheck(newNodeGroup.outgoingConstraints.keys())
+
+        return newNodeGroup
+
+    @staticmethod
+    def _uncheck(groups):
+        """
+        Return the queued or checked groups and their checked descendants
+        back to the WAITING state
 
+        :note: a checked group has to have only checked predecessors,
+            otherwise a merge of a group with its predecessor may create a cycle
+            in the constraint graph (there could be an other path between them
+            through an unchecked group)
+        """
+        WAITING = ConstraintGroup.WAITING
+        DONE = ConstraintGroup.DONE
+        toUncheck = [g for g in groups if g.state != WAITING]
+        while toUncheck:
+            group = toUncheck.pop()
+            if group.state == DONE and group.outgoingConstraints:
+                for successor in group.outgoingConstraints.keys():
+                    successor.incomingConstraints.pop(group, None)
+                    if successor.state != WAITING:
+                        toUncheck.append(successor)
+
+            group.state = WAITING
+
+    def _unlink(self, group: ConstraintGroup):
+        prev = group.prevGroup
+        next_ = group.nextGroup
+        if prev is None:
+            self.firstGroup = next_
+        else:
+            prev.nextGroup = next_
+
+        if next_ is None:
+            self.lastGroup = prev
+        else:
+            next_.prevGroup = prev
+
+        group.prevGroup = group.nextGroup = None
+
+    def _linkAfter(self, group: ConstraintGroup, prev: Optional[ConstraintGroup]):
+        """
+        Insert group in to list after prev group (prev=None means at the beginning)
+        """
+        if prev is None:
+            next_ = self.firstGroup
+            self.firstGroup = group
+        else:
+            next_ = prev.nextGroup
+            prev.nextGroup = group
+
+        group.prevGroup = prev
+        group.nextGroup = next_
+        if next_ is None:
+            self.lastGroup = group
+        else:
+            next_.prevGroup = group
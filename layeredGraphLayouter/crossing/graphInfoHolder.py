@@ -1,5 +1,6 @@
 from typing import List
 
+from layeredGraphLayouter.containers.constants import HierarchyHandling
 from layeredGraphLayouter.containers.lGraph import LGraph
 from layeredGraphLayouter.crossing.allCrossingsCounter import AllCrossingsCounter
 from layeredGraphLayouter.crossing.forsterConstraintResolver import ForsterConstraintResolver
@@ -12,6 +13,10 @@ class GraphInfoHolder():
 
     :note: Ported from ELK.
     :ivar lGraph: Raw graph data.
+    :ivar changedLayers: indexes of layers whose node order may have changed
+        since the last snapshot (currentlyBestNodeAndPortOrder)
+    :ivar changedPortOrders: nodes whose port order may have changed
+        since the last snapshot
     """
 
     def __init__(self, graph: LGraph,
@@ -35,20 +40,28 @@ class GraphInfoHolder():
 
         # Hierarchy information.
         self.parent = graph.parentLnode
+        if self.parent is not None and self.parent.graph not in graphs:
+            # parent graph is not part of this layout run
+            # (the graph is layouted separately)
+            self.parent = None
         self.hasParent = self.parent is not None
         self.parentGraphData = graphs[self.parent.graph] if self.hasParent else None
         self.hasExternalPorts = graph.p_externalPorts
         self.childGraphs = []
-        for layer in graph.layers:
-            for node in layer:
-                if node.nestedLgraph is not None:
-                    self.childGraphs.append(node.nestedLgraph)
+        if graph.hierarchyHandling == HierarchyHandling.INCLUDE_CHILDREN:
+            # otherwise children are layouted separately
+            for layer in graph.layers:
+                for node in layer:
+                    if node.nestedLgraph is not None:
+                        self.childGraphs.append(node.nestedLgraph)
 
         # Init all objects needing initialization by graph traversal.
         self.crossingsCounter = AllCrossingsCounter(self.lGraph)
         self.random = graph.random
         self.portDistributor = portDistributorCls(
             graph.random, self.lGraph)
+        self.changedLayers = set()
+        self.changedPortOrders = self.portDistributor.changedPortOrders
         layerSweepTypeDecider = LayerSweepTypeDecider(self)
 
         self.constraintResolver = ForsterConstraintResolver(
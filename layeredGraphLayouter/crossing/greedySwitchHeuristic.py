@@ -0,0 +1,195 @@
+from bisect import bisect_left, bisect_right
+from typing import List, Dict
+
+from layeredGraphLayouter.containers.constants import PortSide, NodeType
+from layeredGraphLayouter.containers.lNode import LNode
+from layeredGraphLayouter.containers.lPort import LPort
+from layeredGraphLayouter.crossing.barycenterHeuristic import startIndex
+from layeredGraphLayouter.crossing.compressedEdges import CompressedEdges
+from layeredGraphLayouter.crossing.crossingCounter import CrossingsCounter,\
+    inNorthSouthEastWestOrder, isInLayer, otherEndOf
+from layeredGraphLayouter.crossing.forsterConstraintResolver import ForsterConstraintResolver
+
+
+def fixedPortPositions(fixedLayer: List[LNode], side: PortSide) -> Dict[LPort, int]:
+    """
+    :return: dict {port: position} for ports on specified side of nodes
+        of fixed layer in north to south order
+    """
+    positions = {}
+    for node in fixedLayer:
+        for port in inNorthSouthEastWestOrder(node, side):
+            positions[port] = len(positions)
+    return positions
+
+
+def fixedEndPositions(node: LNode, positions: Dict[LPort, int]) -> List[int]:
+    """
+    :return: sorted list of positions of the ends of the edges
+        from the node to the fixed layer
+    """
+    ends = []
+    for port in node.iterPorts():
+        for e in port.iterEdges():
+            p = positions.get(otherEndOf(e, port), None)
+            if p is not None:
+                ends.append(p)
+    ends.sort()
+    return ends
+
+
+def countCrossingsBetweenNodesInBothOrders(upperEnds: List[int], lowerEnds: List[int]):
+    """
+    Count crossings between edges of two neighbor nodes and the fixed layer
+
+    :param upperEnds: sorted positions of edge ends in fixed layer for upper node
+    :param lowerEnds: sorted positions of edge ends in fixed layer for lower node
+    :return: tuple (crossings in current order, crossings in switched order)
+    """
+    upperLower = 0
+    lowerUpper = 0
+    lowerCnt = len(lowerEnds)
+    for p in upperEnds:
+        # lower edges with end above this end cross it in current order
+        upperLower += bisect_left(lowerEnds, p)
+        # lower edges with end below this end cross it in switched order
+        lowerUpper += lowerCnt - bisect_right(lowerEnds, p)
+    return upperLower, lowerUpper
+
+
+class GreedySwitchHeuristic():
+    """
+    Two-sided greedy switch heuristic. Neighbor nodes in free layer are switched
+    if it reduces the number of crossings with both neighbor layers
+    (and number of in-layer crossings). Crossings are counted only locally
+    for the pair of switched nodes, switches are repeated until there is any improvement.
+
+    :note: inspired by GreedySwitchHeuristic from ELK,
+        north/south port crossings are not counted
+    :ivar isDeterministic: greedy switch does not use random
+    :ivar alwaysImproves: number of crossings is never increased,
+        LayerSweepCrossingMinimizer does not need to count crossings between sweeps
+    :ivar edges: compressed view on the edges shared by in-layer crossing counters
+    """
+
+    def __init__(self, constraintResolver: ForsterConstraintResolver,
+                 random, portDistributor, layers):
+        """
+        Arguments are same as for BarycenterHeuristic
+        (constraint resolver and port distributor are not used)
+        """
+        self.random = random
+        self.constraintResolver = constraintResolver
+        self.portDistributor = portDistributor
+        self.isDeterministic = True
+        self.alwaysImproves = True
+
+        self.westEnds = {}
+        self.eastEnds = {}
+        self.inLayerCounters = []
+        self.edges = CompressedEdges()
+        self.multiNodeLayoutUnits = set()
+
+    def setFirstLayerOrder(self, order: List[List[LNode]], isForwardSweep: bool) -> bool:
+        _startIndex = startIndex(isForwardSweep, len(order))
+        return self.minimizeCrossings(order, _startIndex, isForwardSweep, True)
+
+    def minimizeCrossings(self, order: List[List[LNode]], freeLayerIndex: int,
+                          forwardSweep: bool, isFirstSweep: bool) -> bool:
+        freeLayer = order[freeLayerIndex]
+        if len(freeLayer) < 2:
+            return False
+
+        self.initForLayer(order, freeLayerIndex)
+        doesSwitchReduceCrossings = self.doesSwitchReduceCrossings
+        switchNodes = self.switchNodes
+
+        improved = False
+        continueSwitching = True
+        while continueSwitching:
+            continueSwitching = False
+            for i in range(len(freeLayer) - 1):
+                if doesSwitchReduceCrossings(freeLayer, i):
+                    switchNodes(freeLayer, i)
+                    improved = continueSwitching = True
+
+        return improved
+
+    def initForLayer(self, order: List[List[LNode]], freeLayerIndex: int):
+        freeLayer = order[freeLayerIndex]
+        for ends, fixedLayerIndex, fixedSide in (
+                (self.westEnds, freeLayerIndex - 1, PortSide.EAST),
+                (self.eastEnds, freeLayerIndex + 1, PortSide.WEST)):
+            ends.clear()
+            if 0 <= fixedLayerIndex < len(order):
+                positions = fixedPortPositions(order[fixedLayerIndex], fixedSide)
+                for node in freeLayer:
+                    ends[node] = fixedEndPositions(node, positions)
+
+        hasInLayerEdges = any(isInLayer(e)
+                              for node in freeLayer
+                              for port in node.iterPorts()
+                              for e in port.outgoingEdges)
+        inLayerCounters = self.inLayerCounters
+        inLayerCounters.clear()
+        if hasInLayerEdges:
+            for side in (PortSide.WEST, PortSide.EAST):
+                c = CrossingsCounter({}, self.edges)
+                c.initPortPositionsForInLayerCrossings(freeLayer, side)
+                inLayerCounters.append((c, side))
+
+        units = self.multiNodeLayoutUnits
+        units.clear()
+        for node in freeLayer:
+            unit = node.inLayerLayoutUnit
+            if unit is not None and unit is not node:
+                units.add(unit)
+
+    def isConstrained(self, upperNode: LNode, lowerNode: LNode) -> bool:
+        """
+        :return: True if the nodes can not be switched because of in-layer
+            successor constraints or layout units
+        """
+        if lowerNode in upperNode.inLayerSuccessorConstraint:
+            return True
+
+        upperUnit = upperNode.inLayerLayoutUnit
+        lowerUnit = lowerNode.inLayerLayoutUnit
+        if (upperUnit is lowerUnit
+                or upperNode.type == NodeType.LONG_EDGE
+                or lowerNode.type == NodeType.LONG_EDGE):
+            return False
+
+        units = self.multiNodeLayoutUnits
+        return upperUnit in units or lowerUnit in units
+
+    def doesSwitchReduceCrossings(self, freeLayer: List[LNode], upperIndex: int) -> bool:
+        upperNode = freeLayer[upperIndex]
+        lowerNode = freeLayer[upperIndex + 1]
+        if self.isConstrained(upperNode, lowerNode):
+            return False
+
+        upperLower = 0
+        lowerUpper = 0
+        for ends in (self.westEnds, self.eastEnds):
+            if ends:
+                ul, lu = countCrossingsBetweenNodesInBothOrders(
+                    ends[upperNode], ends[lowerNode])
+                upperLower += ul
+                lowerUpper += lu
+
+        for counter, side in self.inLayerCounters:
+            ul, lu = counter.countInLayerCrossingsBetweenNodesInBothOrders(
+                upperNode, lowerNode, side)
+            upperLower += ul
+            lowerUpper += lu
+
+        return upperLower > lowerUpper
+
+    def switchNodes(self, freeLayer: List[LNode], upperIndex: int):
+        upperNode = freeLayer[upperIndex]
+        lowerNode = freeLayer[upperIndex + 1]
+        freeLayer[upperIndex] = lowerNode
+        freeLayer[upperIndex + 1] = upperNode
+        for counter, side in self.inLayerCounters:
+            counter.switchNodes(upperNode, lowerNode, side)
@@ -1,13 +1,13 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 from enum import Enum
 
 from layeredGraphLayouter.containers.lNode import LNode
 from layeredGraphLayouter.containers.constants import PortSide
+from layeredGraphLayouter.crossing.compressedEdges import CompressedEdges
 
 
 class Hyperedge():
     def __init__(self):
-        self.edges = []
         self.ports = []
         self.upperLeft = 0
         self.lowerLeft = 0
@@ -63,6 +63,17 @@ class HyperedgeCorner():
         return 0
 
 
+def isConnectedToOtherLayer(connectedPorts, layer) -> bool:
+    """
+    :param connectedPorts: dict {port: weight} from CompressedEdges
+    :return: True if any of the ports is not in the specified layer
+    """
+    for p in connectedPorts:
+        if p.node.layer is not layer:
+            return True
+    return False
+
+
 class HyperedgeCrossingsCounter():
     """
     Crossings counter implementation specialized for hyperedges. It also works for normal edges,
@@ -76,19 +87,24 @@ class HyperedgeCrossingsCounter():
     volume 8578 of LNAI, Springer, 2014.
 
     :ivar portPos: Port position array used for counting the number of edge crossings.
+    :ivar edges: compressed view on the edges, parallel edges are always part of the same
+        hyperedge and they are processed only once
     """
 
     def __init__(self, inLayerEdgeCount: List[int],
                  hasNorthSouthPorts: List[bool],
-                 portPos: Dict[LNode, int]):
+                 portPos: Dict[LNode, int],
+                 edges: Optional[CompressedEdges]=None):
         """
         :param inLayerEdgeCount: The number of in-layer edges for each layer, including virtual connections to
                 north/south dummies
         :param hasNorthSouthPorts:
                 Whether the layers contain north / south port dummies or not
         :param portPos: Port position array used for counting the number of edge crossings
+        :param edges: compressed view on the edges (new one is created if not specified)
         """
         self.portPos = portPos
+        self.edges = CompressedEdges() if edges is None else edges
 
     def countCrossings(self, leftLayer: List[LNode],
                        rightLayer: List[LNode]) -> int:
@@ -103,16 +119,15 @@ class HyperedgeCrossingsCounter():
         :param rightLayer: the right layer
         :return: the number of edge crossings
         """
+        successors = self.edges.successors
+        predecessors = self.edges.predecessors
         # Assign index values to the ports of the left layer
         sourceCount = 0
         for node in leftLayer:
+            layer = node.layer
             # Assign index values in the order north - east - south - west
             for port in node.iterPorts():
-                portEdges = 0
-                for edge in port.outgoingEdges:
-                    if node.layer is not edge.dstNode.layer:
-                        portEdges += 1
-                if portEdges > 0:
+                if isConnectedToOtherLayer(successors[port], layer):
                     self.portPos[port] = sourceCount
                     sourceCount += 1
 
@@ -121,24 +136,18 @@ class HyperedgeCrossingsCounter():
         for node in rightLayer:
             # Determine how many input ports there are on the north side
             # (note that the standard port order is north - east - south - west)
+            layer = node.layer
             northInputPorts = 0
             for port in node.iterPorts():
                 if port.side == PortSide.NORTH:
-                    for edge in port.incomingEdges:
-                        if node.layer is not edge.srcNode.layer:
-                            northInputPorts += 1
-                            break
+                    if isConnectedToOtherLayer(predecessors[port], layer):
+                        northInputPorts += 1
                 else:
                     break
             # Assign index values in the order north - west - south - east
             otherInputPorts = 0
             for port in node.iterPortsReversed():
-                portEdges = 0
-                for edge in port.incomingEdges:
-                    if node.layer is not edge.srcNode.layer:
-                        portEdges += 1
-
-                if portEdges > 0:
+                if isConnectedToOtherLayer(predecessors[port], layer):
                     if port.side == PortSide.NORTH:
                         self.portPos[port] = targetCount
                         targetCount += 1
@@ -153,36 +162,30 @@ class HyperedgeCrossingsCounter():
         port2HyperedgeMap = {}
         hyperedgeSet = set()
         for node in leftLayer:
+            layer = node.layer
             for sourcePort in node.iterPorts():
-                for edge in sourcePort.outgoingEdges:
-                    targetPort = edge.dst
-                    if node.layer is not targetPort.getNode().layer:
+                # parallel edges always belong to the same hyperedge
+                for targetPort in successors[sourcePort]:
+                    if layer is not targetPort.node.layer:
                         sourceHE = port2HyperedgeMap.get(sourcePort, None)
                         targetHE = port2HyperedgeMap.get(targetPort, None)
                         if sourceHE is None and targetHE is None:
                             hyperedge = Hyperedge()
                             hyperedgeSet.add(hyperedge)
-                            hyperedge.edges.append(edge)
                             hyperedge.ports.append(sourcePort)
                             port2HyperedgeMap[sourcePort] = hyperedge
                             hyperedge.ports.append(targetPort)
                             port2HyperedgeMap[targetPort] = hyperedge
                         elif sourceHE is None:
-                            targetHE.edges.append(edge)
                             targetHE.ports.append(sourcePort)
                             port2HyperedgeMap[sourcePort] = targetHE
                         elif targetHE is None:
-                            sourceHE.edges.append(edge)
                             sourceHE.ports.append(targetPort)
                             port2HyperedgeMap[targetPort] = sourceHE
-                        elif sourceHE == targetHE:
-                            sourceHE.edges.append(edge)
-                        else:
-                            sourceHE.edges.append(edge)
+                        elif sourceHE is not targetHE:
                             for p in targetHE.ports:
                                 port2HyperedgeMap[p] = sourceHE
 
-                            sourceHE.edges.extend(targetHE.edges)
                             sourceHE.ports.extend(targetHE.ports)
                             hyperedgeSet.remove(targetHE)
 
@@ -195,14 +198,14 @@ class HyperedgeCrossingsCounter():
             he.upperRight = targetCount
             for port in he.ports:
                 pos = self.portPos[port]
-                if port.getNode().layer is leftLayerRef:
+                if port.node.layer is leftLayerRef:
                     if pos < he.upperLeft:
                         he.upperLeft = pos
 
                     if pos > he.lowerLeft:
                         he.lowerLeft = pos
 
-                elif port.getNode().layer is rightLayerRef:
+                elif port.node.layer is rightLayerRef:
                     if pos < he.upperRight:
                         he.upperRight = pos
 
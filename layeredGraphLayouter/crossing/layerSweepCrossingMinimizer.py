@@ -12,12 +12,15 @@ from layeredGraphLayouter.crossing.barycenterHeuristic import BarycenterHeuristi
 from layeredGraphLayouter.crossing.dummyPortDistributor import DummyPortDistributor
 from layeredGraphLayouter.crossing.forsterConstraintResolver import ForsterConstraintResolver
 from layeredGraphLayouter.crossing.graphInfoHolder import GraphInfoHolder
+from layeredGraphLayouter.crossing.greedySwitchHeuristic import GreedySwitchHeuristic
 from layeredGraphLayouter.crossing.nodeRelativePortDistributor import NodeRelativePortDistributor
 from layeredGraphLayouter.crossing.sweepCopy import SweepCopy
 from layeredGraphLayouter.iLayoutProcessor import ILayoutProcessor
 from layeredGraphLayouter.layoutProcessorConfiguration import LayoutProcessorConfiguration
+from layeredGraphLayouter.edgeManipulators.hyperedgeDummyMerger import HyperedgeDummyMerger
 from layeredGraphLayouter.edgeManipulators.longEdgeSplitter import LongEdgeSplitter
 from layeredGraphLayouter.nodeManipulators.inLayerConstraintProcessor import InLayerConstraintProcessor
+from layeredGraphLayouter.trace import span
 from layeredGraphLayouter.edgeManipulators.longEdgeJoiner import LongEdgeJoiner
 
 
@@ -97,21 +100,40 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
     are optimized to yield as few edge crossings as possible
 
     :note: port from ELK
+    :ivar crossMinCls: class of two-layer crossing minimization heuristic
+        (BarycenterHeuristic or GreedySwitchHeuristic)
+    :ivar postGreedySwitch: if True the result is improved by
+        GreedySwitchHeuristic after crossMinCls heuristic
+    :ivar warmStart: if True the current order of the nodes in layers
+        is used as the initial order (no randomized first layer, no restarts)
+        and the result of the sweep is used only if it has less crossings
+        than the current order (used for incremental relayout)
+    :ivar fixedLayers: indexes of layers of the root graph whose order
+        is not changed (e.g. context layers of a part of the graph)
     """
 
-    def __init__(self):
+    def __init__(self, crossMinCls=BarycenterHeuristic, postGreedySwitch=False,
+                 warmStart=False, fixedLayers=()):
         self.randomSeed = 0
         self.random = Random(self.randomSeed)
+        self.crossMinCls = crossMinCls
+        self.postGreedySwitch = postGreedySwitch
+        self.warmStart = warmStart
+        self.fixedLayers = fixedLayers
 
     @staticmethod
     def getLayoutProcessorConfiguration(graph: LGraph)->Optional[LayoutProcessorConfiguration]:
-        return LayoutProcessorConfiguration(
+        c = LayoutProcessorConfiguration(
             p3_node_ordering_before=[LongEdgeSplitter(),
                                      # PortListSorter()
                                      ],
             p4_node_placement_before=[InLayerConstraintProcessor()],
             p5_edge_routing_after=[LongEdgeJoiner()],
         )
+        if graph.p_hyperedges:
+            # one long edge dummy per hyperedge and layer
+            c.p3_node_ordering_before.append(HyperedgeDummyMerger())
+        return c
 
     def process(self, graph: LGraph):
         """
@@ -139,6 +161,9 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
         self.minimizeCrossings(graphsToSweepOn, minimizingMethod)
         self.transferNodeAndPortOrdersToGraph(graphsToSweepOn)
 
+        if self.postGreedySwitch and self.crossMinCls is not GreedySwitchHeuristic:
+            LayerSweepCrossingMinimizer(GreedySwitchHeuristic).process(graph)
+
     def initialize(self, rootGraph: LGraph) ->List[GraphInfoHolder]:
         """
         Traverses inclusion breadth-first and initializes each Graph.
@@ -155,12 +180,15 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
             g = _graphsToSweepOn.pop()
             g.random = self.random
             gih = GraphInfoHolder(g,
-                                  BarycenterHeuristic,
+                                  self.crossMinCls,
                                   NodeRelativePortDistributor,
                                   self.graphInfoHolders)
             assert g not in self.graphInfoHolders
             self.graphInfoHolders[g] = gih
             graphsToSweepOn.append(gih)
+            if g.hierarchyHandling != HierarchyHandling.INCLUDE_CHILDREN:
+                # children are layouted separately
+                continue
             _graphsToSweepOn.extend(g.childGraphs)
             for n in g.nodes:
                 if n.nestedLgraph is not None:
@@ -169,9 +197,11 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
         return graphsToSweepOn
 
     def chooseMinimizingMethod(self, root: GraphInfoHolder):
-        if not root.crossMinimizer.isDeterministic:
+        if self.warmStart:
+            return self.minimizeCrossingsFromCurrentOrder
+        elif not root.crossMinimizer.isDeterministic:
             return self.compareDifferentRandomizedLayouts
-        elif root.crossMinAlwaysImproves:
+        elif root.crossMinAlwaysImproves():
             return self.minimizeCrossingsNoCounter
         else:
             return self.minimizeCrossingsWithCounter
@@ -187,18 +217,49 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
 
         bestCrossings = inf
         thouroughness = gData.lGraph.thoroughness
-        for _ in range(thouroughness):
-            crossings = self.minimizeCrossingsWithCounter(gData)
+        for i in range(thouroughness):
+            with span("restart", "crossing", {"i": i}):
+                crossings = self.minimizeCrossingsWithCounter(gData)
             if crossings < bestCrossings:
                 bestCrossings = crossings
                 self.saveAllNodeOrdersOfChangedGraphs()
                 if bestCrossings == 0:
                     break
 
+    def minimizeCrossingsFromCurrentOrder(self, gData: GraphInfoHolder):
+        """
+        Sweep from the current order (warm start), alternate the direction
+        of the sweeps while the number of crossings decreases,
+        the current order is kept if no sweep improves it
+        """
+        self.random.seed(self.randomSeed)
+        changed = self.graphsWhoseNodeOrderChanged
+        changed.clear()
+        changed.add(gData)
+        for child in gData.childGraphs:
+            changed.add(self.graphInfoHolders[child])
+
+        self.setCurrentlyBestNodeOrders()
+        self.saveAllNodeOrdersOfChangedGraphs()
+        bestCrossings = self.countCurrentNumberOfCrossings(gData)
+
+        isForwardSweep = True
+        while bestCrossings > 0:
+            self.sweepReducingCrossings(gData, isForwardSweep, False)
+            crossings = self.countCurrentNumberOfCrossings(gData)
+            if crossings >= bestCrossings:
+                break
+            bestCrossings = crossings
+            self.setCurrentlyBestNodeOrders()
+            self.saveAllNodeOrdersOfChangedGraphs()
+            isForwardSweep = not isForwardSweep
+
+        return bestCrossings
+
     def saveAllNodeOrdersOfChangedGraphs(self):
         for graph in self.graphsWhoseNodeOrderChanged:
-            sc = SweepCopy(graph.currentlyBestNodeAndPortOrder)
-            graph.bestNodeAndPortOrder = sc
+            # snapshots are immutable and can be shared
+            graph.bestNodeAndPortOrder = graph.currentlyBestNodeAndPortOrder
 
     def countCurrentNumberOfCrossings(self, currentGraph):
         """
@@ -229,6 +290,8 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
 
         gData.crossMinimizer.setFirstLayerOrder(
             gData.currentNodeOrder, isForwardSweep)
+        gData.changedLayers.add(
+            firstIndex(isForwardSweep, len(gData.currentNodeOrder)))
         sweepReducingCrossings(gData, isForwardSweep, True)
 
         crossingsInGraph = self.countCurrentNumberOfCrossings(gData)
@@ -252,7 +315,8 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
     def minimizeCrossings(self, graphsToSweepOn: List[GraphInfoHolder], minimizingMethod):
         for gData in graphsToSweepOn:
             if gData.currentNodeOrder:
-                minimizingMethod(gData)
+                with span("minimizeCrossings", "crossing", {"parent": gData.parent}):
+                    minimizingMethod(gData)
                 if gData.parent is not None:
                     self.setPortOrderOnParentGraph(gData)
 
@@ -277,6 +341,9 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
 
         j = firstIndex(onRightMostLayer, len(lastLayer))
         ports = parent.getPortSideView(sideForStep(onRightMostLayer))
+        parentGraph = self.graphInfoHolders.get(parent.graph, None)
+        if parentGraph is not None:
+            parentGraph.portDistributor.portOrderChanged(parent)
         step = 1 if onRightMostLayer else -1
         for i in range(len(ports)):
             port = ports[i]
@@ -288,7 +355,9 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
         for gD in graphsToSweepOn:
             bestSweep = gD.getBestSweep()
             if bestSweep is not None:
-                bestSweep.transferNodeAndPortOrdersToGraph(gD)
+                # only the entries which differ from the current order are transferred
+                current = self.snapshotCurrentOrder(gD)
+                bestSweep.transferNodeAndPortOrdersToGraph(gD, current)
 
     # For use with any two-layer crossing minimizer which always improves
     # crossings (e.g. two-sided greedy switch).
@@ -299,6 +368,8 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
             improved = False
             improved = gData.crossMinimizer.setFirstLayerOrder(
                 gData.currentNodeOrder, isForwardSweep)
+            gData.changedLayers.add(
+                firstIndex(isForwardSweep, len(gData.currentNodeOrder)))
             improved |= self.sweepReducingCrossings(
                 gData, isForwardSweep, False)
             isForwardSweep = not isForwardSweep
@@ -307,8 +378,20 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
 
     def setCurrentlyBestNodeOrders(self):
         for graph in self.graphsWhoseNodeOrderChanged:
-            graph.currentlyBestNodeAndPortOrder = SweepCopy(
-                graph.currentNodeOrder)
+            graph.currentlyBestNodeAndPortOrder = self.snapshotCurrentOrder(graph)
+            graph.changedLayers.clear()
+            graph.changedPortOrders.clear()
+
+    @staticmethod
+    def snapshotCurrentOrder(graph: GraphInfoHolder) -> SweepCopy:
+        """
+        :return: snapshot of the current order of the graph, only the layers
+            and nodes changed since the last snapshot are copied
+        """
+        return SweepCopy(graph.currentNodeOrder,
+                         graph.currentlyBestNodeAndPortOrder,
+                         graph.changedLayers,
+                         graph.changedPortOrders)
 
     def sweepReducingCrossings(self, graph, forward: bool, firstSweep: bool):
         layers = graph.currentNodeOrder
@@ -318,16 +401,22 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
 
         length = len(layers)
         index0 = firstIndex(forward, length)
-        improved = graph.portDistributor.distributePortsWhileSweeping(
-            layers, index0, forward)
-        firstLayer = layers[index0]
-        improved |= sweepInHierarchicalNodes(firstLayer, forward, firstSweep)
-
-        for i in iterLayerIndexes(length, forward):
-            improved |= minimizeCrossings(layers, i, forward, firstSweep)
-            improved |= distributePortsWhileSweeping(layers, i, forward)
-            improved |= sweepInHierarchicalNodes(
-                layers[i], forward, firstSweep)
+        fixedLayers = self.fixedLayers if graph.parent is None else ()
+        changedLayers = graph.changedLayers
+        with span("sweep", "crossing", {"forward": forward, "first": firstSweep}):
+            improved = graph.portDistributor.distributePortsWhileSweeping(
+                layers, index0, forward)
+            firstLayer = layers[index0]
+            improved |= sweepInHierarchicalNodes(firstLayer, forward, firstSweep)
+
+            for i in iterLayerIndexes(length, forward):
+                if i in fixedLayers:
+                    continue
+                improved |= minimizeCrossings(layers, i, forward, firstSweep)
+                changedLayers.add(i)
+                improved |= distributePortsWhileSweeping(layers, i, forward)
+                improved |= sweepInHierarchicalNodes(
+                    layers[i], forward, firstSweep)
 
         self.graphsWhoseNodeOrderChanged.add(graph)
         return improved
@@ -337,9 +426,10 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
         for node in layer:
             if (node.nestedGraph is not None
                     and not self.graphInfoHolders[node.nestedGraph].dontSweepInto()):
-                improved |= self.sweepInHierarchicalNode(
-                    isForwardSweep,
-                    node, isFirstSweep)
+                with span("sweepInHierarchicalNode", "crossing", {"node": node}):
+                    improved |= self.sweepInHierarchicalNode(
+                        isForwardSweep,
+                        node, isFirstSweep)
 
         return improved
 
@@ -356,9 +446,11 @@ class LayerSweepCrossingMinimizer(ILayoutProcessor):
                 node,
                 nestedGraphNodeOrder[startIndex],
                 sideOpposedSweepDirection(isForwardSweep))
-        else:
+            nestedGraph.changedLayers.add(startIndex)
+        elif not self.warmStart:
             nestedGraph.crossMinimizer.setFirstLayerOrder(
                 nestedGraphNodeOrder, isForwardSweep)
+            nestedGraph.changedLayers.add(startIndex)
 
         improved = self.sweepReducingCrossings(
             nestedGraph, isForwardSweep, isFirstSweep)
@@ -1,9 +1,159 @@
+from typing import List
+
 from layeredGraphLayouter.containers.constants import PortType, PortSide
 from layeredGraphLayouter.containers.lNode import LNode
 from layeredGraphLayouter.crossing.abstractBarycenterPortDistributor import AbstractBarycenterPortDistributor
 
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional, the pure python implementation is used without it
+    np = None
+
+
+class PortRankTable():
+    """
+    Precomputed port tables of a layer for the port rank calculation
+    of :class:`~.NodeRelativePortDistributor`
+
+    The ports of each node form chains (for input ports north chain and chain
+    of the rest of ports, for output ports a single chain). The first port
+    of the chain has rank "node index + startBase + startOffset", each next
+    port has rank of the previous port + step. The ranks are computed
+    level by level (n-th port of every chain at once), which performs
+    same floating point operations as the sequential algorithm.
+
+    :ivar nodeIndex: dict {LNode: index of node in the table}
+    :ivar ports: flat list of ports (in order of chains)
+    :ivar portNode: array, index of the node for each port
+    :ivar first: array, indexes of the first ports of the chains
+    :ivar startBase: array, base rank of the chain (0 or 1) for each chain
+    :ivar startOffset: array, offset of the first port for each chain
+    :ivar levels: list of tuples (port indexes, previous port indexes, steps)
+    :ivar ranks: dense array of ranks, indexed by the index in ports
+    """
+
+    def __init__(self, nodes: List[LNode], typ: PortType):
+        self.nodeIndex = {}
+        ports = self.ports = []
+        portNode = []
+        first = []
+        startBase = []
+        startOffset = []
+        # [(port indexes, previous port indexes, steps)]
+        levels = []
+
+        def addChain(nodeI, chain, base, offset, step):
+            if not chain:
+                return
+            prev = None
+            for k, port in enumerate(chain):
+                i = len(ports)
+                ports.append(port)
+                portNode.append(nodeI)
+                if k == 0:
+                    first.append(i)
+                    startBase.append(base)
+                    startOffset.append(offset)
+                else:
+                    if len(levels) < k:
+                        levels.append(([], [], []))
+                    idx, prevIdx, steps = levels[k - 1]
+                    idx.append(i)
+                    prevIdx.append(prev)
+                    steps.append(step)
+                prev = i
+
+        for nodeI, node in enumerate(nodes):
+            self.nodeIndex[node] = nodeI
+            if typ == PortType.INPUT:
+                northPorts = []
+                restPorts = []
+                for port in node.iterPorts():
+                    if port.incomingEdges:
+                        if port.side == PortSide.NORTH:
+                            northPorts.append(port)
+                        else:
+                            restPorts.append(port)
+                incr = 1.0 / (len(northPorts) + len(restPorts) + 1)
+                addChain(nodeI, northPorts, 0, len(northPorts) * incr, -incr)
+                addChain(nodeI, restPorts, 1, -incr, -incr)
+            elif typ == PortType.OUTPUT:
+                outputPorts = [port for port in node.iterPorts()
+                               if port.outgoingEdges]
+                incr = 1.0 / (len(outputPorts) + 1)
+                addChain(nodeI, outputPorts, 0, incr, incr)
+            else:
+                # this means illegal input to the method
+                raise ValueError("Port type is undefined", typ)
+
+        self.portNode = np.array(portNode, dtype=np.intp)
+        self.first = np.array(first, dtype=np.intp)
+        self.startBase = np.array(startBase, dtype=float)
+        self.startOffset = np.array(startOffset, dtype=float)
+        self.levels = [(np.array(idx, dtype=np.intp),
+                        np.array(prevIdx, dtype=np.intp),
+                        np.array(steps, dtype=float))
+                       for idx, prevIdx, steps in levels]
+        self.ranks = np.zeros(len(ports), dtype=float)
+
+    def isValidFor(self, nodes: List[LNode]) -> bool:
+        nodeIndex = self.nodeIndex
+        return len(nodes) == len(nodeIndex) and all(n in nodeIndex for n in nodes)
+
+    def calculateRanks(self, nodes: List[LNode]):
+        """
+        Compute ranks for current order of the nodes
+
+        :return: dense array of ranks, indexed by the index in ports
+        """
+        nodeIndex = self.nodeIndex
+        # rank sum of each node (each node consumes rank 1)
+        rankSum = np.empty(len(nodes), dtype=float)
+        rankSum[[nodeIndex[n] for n in nodes]] = np.arange(len(nodes), dtype=float)
+
+        ranks = self.ranks
+        first = self.first
+        ranks[first] = (rankSum[self.portNode[first]] + self.startBase) + self.startOffset
+        for idx, prevIdx, steps in self.levels:
+            ranks[idx] = ranks[prevIdx] + steps
+
+        return ranks
+
 
 class NodeRelativePortDistributor(AbstractBarycenterPortDistributor):
+    """
+    :cvar BATCH_MIN_LAYER_SIZE: minimal number of nodes in layer for which
+        ranks are computed using :class:`~.PortRankTable` (if numpy is available)
+    :ivar portRankTables: dict {(id of layer, PortType): PortRankTable}
+    """
+    BATCH_MIN_LAYER_SIZE = 16
+
+    def __init__(self, random, graph):
+        super(NodeRelativePortDistributor, self).__init__(random, graph)
+        self.portRankTables = {}
+
+    def calculatePortRanks_many(self, layer: List[LNode], portType: PortType):
+        if np is None or not layer or len(layer) < self.BATCH_MIN_LAYER_SIZE:
+            return super(NodeRelativePortDistributor, self).calculatePortRanks_many(
+                layer, portType)
+
+        key = (id(layer[0].layer), portType)
+        table = self.portRankTables.get(key, None)
+        if table is None or not table.isValidFor(layer):
+            table = self.portRankTables[key] = PortRankTable(layer, portType)
+
+        ranks = table.calculateRanks(layer)
+        self.portRanks.update(zip(table.ports, ranks.tolist()))
+
+    def portOrderChanged(self, node: LNode):
+        super(NodeRelativePortDistributor, self).portOrderChanged(node)
+        if self.portRankTables:
+            # tables of this layer have to be rebuilt
+            layerId = id(node.layer)
+            tables = self.portRankTables
+            tables.pop((layerId, PortType.INPUT), None)
+            tables.pop((layerId, PortType.OUTPUT), None)
 
     def calculatePortRanks(self, node: LNode, rankSum: float, typ: PortType):
         portRanks = self.portRanks
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterable, List, Optional
 
 from layeredGraphLayouter.containers.constants import NodeType, PortSide
 from layeredGraphLayouter.containers.lGraph import LNodeLayer
@@ -6,19 +6,138 @@ from layeredGraphLayouter.crossing.graphInfoHolder import GraphInfoHolder
 from layeredGraphLayouter.containers.lNode import LNode
 
 
+def _sameItems(a: list, b: list) -> bool:
+    # LNodeLayer.__eq__ compares identity, list.__eq__ is used to compare items
+    # (both arguments has to be lists)
+    return list.__eq__(a, b) is True
+
+
 class SweepCopy():
     """
     :note: Ported from ELK.
 
     Stores node and port order for a sweep.
+
+    Snapshots are copy-on-write, snapshot layers and port orders are never
+    modified after construction, which allows to share unchanged layers
+    and port orders with the previous snapshot. If the changes since
+    the previous snapshot are known (changedLayers, changedPortOrders)
+    only the changed layers and nodes are copied.
+
+    :ivar nodeOrder: list of snapshot layers (lists of nodes, do not modify)
+    :ivar northSouthPortDummies: list of lists of north/south port dummies
+        for each layer of nodeOrder
+    :ivar portOrders: list of dicts {node: (north, east, south, west)}
+        (lists of ports, do not modify) for each layer of nodeOrder
     """
 
-    def __init__(self, nodeOrderIn):
-        # Saves a copy of the node order.
-        self.nodeOrder = [layer[:] for layer in nodeOrderIn]
-        # Saves a copy of the orders of the ports on each node, because they
-        # are reordered in each sweep. */
-        self.portOrders = {}
+    def __init__(self, nodeOrderIn, previous: Optional["SweepCopy"]=None,
+                 changedLayers: Optional[Iterable[int]]=None,
+                 changedPortOrders: Iterable[LNode]=()):
+        """
+        :param nodeOrderIn: current node order (list of layers)
+        :param previous: previous snapshot of the same graph,
+            layers and port orders which did not change since are shared with it
+        :param changedLayers: indexes of layers whose node order may have changed
+            since the previous snapshot, None if unknown (all layers
+            are compared with the previous snapshot)
+        :param changedPortOrders: nodes whose port order may have changed
+            since the previous snapshot (used only with changedLayers)
+        """
+        if previous is not None and len(previous.nodeOrder) != len(nodeOrderIn):
+            previous = None
+
+        if previous is not None and changedLayers is not None:
+            self._updateFrom(nodeOrderIn, previous, changedLayers, changedPortOrders)
+            return
+
+        nodeOrder = self.nodeOrder = []
+        northSouthPortDummies = self.northSouthPortDummies = []
+        portOrders = self.portOrders = []
+        for i, layer in enumerate(nodeOrderIn):
+            if previous is not None and _sameItems(previous.nodeOrder[i], layer):
+                nodeOrder.append(previous.nodeOrder[i])
+                northSouthPortDummies.append(previous.northSouthPortDummies[i])
+                prevPortOrders = previous.portOrders[i]
+            else:
+                nodeOrder.append(list(layer))
+                northSouthPortDummies.append(
+                    [n for n in layer if n.type == NodeType.NORTH_SOUTH_PORT])
+                prevPortOrders = None
+
+            portOrders.append(self._snapshotPortOrders(layer, prevPortOrders))
+
+    def _updateFrom(self, nodeOrderIn, previous: "SweepCopy",
+                    changedLayers: Iterable[int], changedPortOrders: Iterable[LNode]):
+        """
+        Take the entries of the previous snapshot and copy only the changed
+        layers and port orders of the changed nodes
+        """
+        nodeOrder = self.nodeOrder = list(previous.nodeOrder)
+        northSouthPortDummies = self.northSouthPortDummies = list(
+            previous.northSouthPortDummies)
+        portOrders = self.portOrders = list(previous.portOrders)
+
+        for i in changedLayers:
+            layer = nodeOrderIn[i]
+            if not _sameItems(nodeOrder[i], layer):
+                nodeOrder[i] = list(layer)
+                northSouthPortDummies[i] = [
+                    n for n in layer if n.type == NodeType.NORTH_SOUTH_PORT]
+
+        if not changedPortOrders:
+            return
+
+        # {id of layer: index of layer}
+        layerIndex = {id(layer): i for i, layer in enumerate(nodeOrderIn)}
+        # {index of layer: new port orders of the layer}
+        newPortOrders = {}
+        for node in changedPortOrders:
+            i = layerIndex.get(id(node.layer), None)
+            if i is None:
+                # node from an other graph
+                continue
+
+            sides = (list(node.north), list(node.east),
+                     list(node.south), list(node.west))
+            if portOrders[i][node] == sides:
+                continue
+
+            layerPortOrders = newPortOrders.get(i, None)
+            if layerPortOrders is None:
+                layerPortOrders = newPortOrders[i] = dict(portOrders[i])
+            layerPortOrders[node] = sides
+
+        for i, layerPortOrders in newPortOrders.items():
+            portOrders[i] = layerPortOrders
+
+    @staticmethod
+    def _snapshotPortOrders(layer, prevPortOrders):
+        """
+        :return: prevPortOrders if port order of any node did not change
+            else new dict {node: (north, east, south, west)}
+        """
+        if prevPortOrders is not None:
+            for node in layer:
+                n, e, s, w = prevPortOrders[node]
+                if not (_sameItems(node.north, n) and _sameItems(node.east, e)
+                        and _sameItems(node.south, s) and _sameItems(node.west, w)):
+                    break
+            else:
+                return prevPortOrders
+
+        portOrders = {}
+        for node in layer:
+            sides = (list(node.north), list(node.east),
+                     list(node.south), list(node.west))
+            if prevPortOrders is not None:
+                prevSides = prevPortOrders.get(node, None)
+                if prevSides == sides:
+                    # share the lists of the unchanged node
+                    sides = prevSides
+            portOrders[node] = sides
+
+        return portOrders
 
     def __len__(self):
         return len(self.nodeOrder)
@@ -26,82 +145,77 @@ class SweepCopy():
     def __getitem__(self, index):
         return self.nodeOrder[index]
 
-    def __setitem__(self, index, item):
-        self.nodeOrder[index] = item
-
     @classmethod
     def from_order(cls, nodeOrderIn: List[LNodeLayer]):
         # Copies on construction.
-        self = cls()
-        self.nodeOrder = [list(layer) for layer in nodeOrderIn]
-        po = self.portOrders
-        for layer in nodeOrderIn:
-            for node in layer:
-                po[node] = list(node.iterPorts())
+        return cls(nodeOrderIn)
 
-    def transferNodeAndPortOrdersToGraph(self, g: GraphInfoHolder)-> None:
+    def transferNodeAndPortOrdersToGraph(self, g: GraphInfoHolder,
+                                         current: Optional["SweepCopy"]=None)-> None:
         """
+        Apply node and port orders of this snapshot on the graph.
+        The layers and nodes which already have the order from snapshot
+        are skipped.
+
+        :param current: snapshot of the current order of the graph, the layers
+            and port orders shared with this snapshot are skipped without comparison
+
         the 'NORTH_OR_SOUTH_PORT' option allows the crossing minimizer to decide
         the side a corresponding dummy node is placed on in order to reduce the number of crossings
         as a consequence the configured port side may not be valid anymore and has to be corrected
         """
-        northSouthPortDummies = []
-        # updatePortOrder = set()
-
-        # iterate the layers
-        for i, layer in enumerate(g.lGraph.layers):
-            northSouthPortDummies.clear()
-            templateLayer = self.nodeOrder[i]
-            # iterate and order the nodes within the layer
-            for j, _ in enumerate(layer):
-                node = templateLayer[j]
-                # use the id field to remember the order within the layer
-                if node.type == NodeType.NORTH_SOUTH_PORT:
-                    northSouthPortDummies.append(node)
-
-                layer[j] = node
-                assert node.layer is layer
-
-                # order ports as computed
-                # node.getPorts().clear()
-                # node.getPorts().extend(portOrders.get(i).get(j))
-
-        # assert that the port side is set properly
-        for dummy in northSouthPortDummies:
-            origin = self.assertCorrectPortSides(dummy)
-            #updatePortOrder.add(origin)
-            #updatePortOrder.add(dummy)
-        #
-        # since the side of certain ports may have changed at this point,
-        # the list of ports must be re-sorted (see PortListSorter)
-        # and the port list views must be re-cached.
-        # for node in updatePortOrder:
-        #    Collections.sort(node.getPorts(), PortListSorter.DEFAULT_SORT_COMPARATOR)
-        #    node.cachePortSides()
-
-    def assertCorrectPortSides(self, dummy: LNode) -> LNode:
+        for i, (layer, templateLayer, portOrders, northSouthPortDummies) in enumerate(zip(
+                g.lGraph.layers, self.nodeOrder, self.portOrders, self.northSouthPortDummies)):
+            # order the nodes within the layer
+            if ((current is None or current.nodeOrder[i] is not templateLayer)
+                    and not _sameItems(templateLayer, layer)):
+                assert len(layer) == len(templateLayer)
+                layer[:] = templateLayer
+                assert all(node.layer is layer for node in templateLayer)
+
+            # order ports as computed
+            currentPortOrders = None if current is None else current.portOrders[i]
+            if currentPortOrders is not portOrders:
+                for node, sides in portOrders.items():
+                    if currentPortOrders is not None and currentPortOrders[node] is sides:
+                        continue
+                    n, e, s, w = sides
+                    for side, ports in ((node.north, n), (node.east, e),
+                                        (node.south, s), (node.west, w)):
+                        if not _sameItems(side, ports):
+                            side[:] = ports
+
+            if northSouthPortDummies:
+                # assert that the port side is set properly
+                positions = {n: i for i, n in enumerate(templateLayer)}
+                for dummy in northSouthPortDummies:
+                    self.assertCorrectPortSides(dummy, positions)
+
+    def assertCorrectPortSides(self, dummy: LNode, positions) -> LNode:
         """
         Corrects the {@link PortSide} of dummy's origin.
 
+        :param positions: dict {LNode: index in layer} for nodes in layer of the dummy
         :return: The {@link LNode} ('origin') whose port {@code dummy} represents.
         """
-        assert dummy.getType() == NodeType.NORTH_SOUTH_PORT
+        assert dummy.type == NodeType.NORTH_SOUTH_PORT
 
-        origin = dummy.in_layer_layout_unit
+        origin = dummy.inLayerLayoutUnit
 
         # a north south port dummy has exactly one port
-        dummyPorts = dummy.getPorts()
-        dummyPort = dummyPorts[0]
+        dummyPort = next(dummy.iterPorts())
+        dummyIndex = positions[dummy]
+        originIndex = positions[origin]
 
         # find the corresponding port on the regular node
         for port in origin.iterPorts():
             if port is dummyPort.origin:
                 # switch the port's side if necessary
-                if ((port.side == PortSide.NORTH) and (dummy.id > origin.id)):
-                    origin.nort.remove(port)
+                if ((port.side == PortSide.NORTH) and (dummyIndex > originIndex)):
+                    origin.north.remove(port)
                     port.side = PortSide.SOUTH
                     origin.south.append(port)
-                elif ((port.side == PortSide.SOUTH) and (origin.id > dummy.id)):
+                elif ((port.side == PortSide.SOUTH) and (originIndex > dummyIndex)):
                     origin.south.remove(port)
                     port.side = PortSide.NORTH
                     origin.north.append(port)
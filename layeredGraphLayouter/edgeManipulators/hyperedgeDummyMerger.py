@@ -0,0 +1,111 @@
+from math import floor
+
+from layeredGraphLayouter.containers.constants import NodeType
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lNode import LNode
+from layeredGraphLayouter.edgeManipulators.longEdgeSplitter import LongEdgeSplitter
+from layeredGraphLayouter.iLayoutProcessor import ILayoutProcessor
+
+
+class HyperedgeDummyMerger(ILayoutProcessor):
+    """
+    Merges long edge dummy nodes (nodes of type {@link NodeType#LONG_EDGE})
+    in the same layer which belong to the same long edge source port (hyperedge).
+    For a net with high fanout (clock, reset, ...) there is then only one dummy
+    in each layer instead of one for each edge of the net.
+
+    The edges of the merged dummy are moved to the dummy which is kept, in the same order
+    for the input and the output port, so the edges with the same index in the lists
+    of incoming and outgoing edges still belong to the same long edge.
+    This is required by {@link LongEdgeJoiner} which splits the merged dummies back
+    to the bend points of the original edges.
+
+    :note: inspired by HyperedgeDummyMerger from ELK, unlike ELK the dummies
+        are merged before crossing minimization (not only the neighbor dummies
+        in the final order), so all following phases work with the merged dummies.
+        The edges between two merged dummies are parallel edges
+        (see :class:`layeredGraphLayouter.crossing.compressedEdges.CompressedEdges`).
+    :note: dummies of the reversed edges are not merged, because the ReversedEdgeRestorer
+        reverses the edges before they are joined and this changes the order
+        of the edges on the ports of the dummy
+
+    Precondition:
+        a properly layered graph (long edges split by LongEdgeSplitter)
+    Postcondition:
+        there is at most one long edge dummy for each long edge source port in each layer
+        (except the dummies of the reversed edges)
+    Slots:
+        Before phase 3.
+    Same-slot dependencies:
+        {@link LongEdgeSplitter}
+    """
+    SAME_SLOT_DEPENDENCIES = (LongEdgeSplitter, )
+
+    def process(self, layeredGraph: LGraph):
+        # the dummies of the reversed edges
+        reversedDummies = set()
+        removed = set()
+        mergeNodes = self.mergeNodes
+
+        for layer in layeredGraph.layers:
+            # {long edge source port: dummy which the other dummies are merged to}
+            mergeTargets = {}
+            toRemove = []
+            for node in layer:
+                if node.type != NodeType.LONG_EDGE:
+                    continue
+
+                inEdge = node.west[0].incomingEdges[0]
+                if inEdge.reversed or inEdge.srcNode in reversedDummies:
+                    reversedDummies.add(node)
+                    continue
+
+                src = node.longEdgeSource
+                if src is None:
+                    continue
+
+                target = mergeTargets.get(src, None)
+                if target is None:
+                    mergeTargets[src] = node
+                else:
+                    mergeNodes(node, target)
+                    toRemove.append(node)
+
+            if toRemove:
+                layer.removeAll(toRemove)
+                removed.update(toRemove)
+
+        if removed:
+            layeredGraph.nodes = [n for n in layeredGraph.nodes
+                                  if n not in removed]
+
+    @staticmethod
+    def mergeNodes(mergeSource: LNode, mergeTarget: LNode):
+        """
+        Move all edges of the mergeSource dummy to the mergeTarget dummy,
+        the mergeSource dummy is then ready to be removed from the graph.
+
+        :param mergeSource: the dummy node which is merged (removed)
+        :param mergeTarget: the dummy node which is kept
+        """
+        inputPort = mergeTarget.west[0]
+        outputPort = mergeTarget.east[0]
+
+        # the order of the edges has to be same on both ports (LongEdgeJoiner)
+        for edge in list(mergeSource.west[0].incomingEdges):
+            edge.setTarget(inputPort)
+
+        for edge in list(mergeSource.east[0].outgoingEdges):
+            edge.setSource(outputPort)
+
+        if mergeSource.longEdgeTarget is not mergeTarget.longEdgeTarget:
+            # the merged dummy leads to multiple targets
+            mergeTarget.longEdgeTarget = None
+
+        # the merged dummy has to be thick enough for the thickest edge
+        thickness = mergeSource.size.y
+        if thickness > mergeTarget.size.y:
+            mergeTarget.size.y = thickness
+            portPos = floor(thickness / 2)
+            inputPort.possition.y = portPos
+            outputPort.possition.y = portPos
@@ -1,4 +1,7 @@
+from typing import Optional, Set
+
 from layeredGraphLayouter.iLayoutProcessor import ILayoutProcessor
+from layeredGraphLayouter.containers.lEdge import LEdge
 from layeredGraphLayouter.containers.lNode import LNode
 from layeredGraphLayouter.containers.constants import NodeType
 from layeredGraphLayouter.containers.lGraph import LGraph
@@ -34,20 +37,26 @@ class LongEdgeJoiner(ILayoutProcessor):
     def process(self, layeredGraph: LGraph):
         addUnnecessaryBendpoints = layeredGraph.unnecessaryBendpoints
         joinAt = self.joinAt
+        droppedEdges = set()
 
         for layer in layeredGraph.layers:
-            toRemoveIndexes = []
-            for i, node in enumerate(layer):
+            toRemove = []
+            for node in layer:
                 # Check if it's a dummy edge we're looking for
                 if node.type == NodeType.LONG_EDGE:
-                    joinAt(layeredGraph, node, addUnnecessaryBendpoints)
-                    toRemoveIndexes.append(i)
+                    joinAt(layeredGraph, node, addUnnecessaryBendpoints,
+                           droppedEdges)
+                    toRemove.append(node)
+
+            layer.removeAll(toRemove)
 
-            for i in reversed(toRemoveIndexes):
-                del layer[i]
+        if droppedEdges:
+            layeredGraph.edges = [e for e in layeredGraph.edges
+                                  if e not in droppedEdges]
 
     @staticmethod
-    def joinAt(layeredGraph: LGraph, longEdgeDummy: LNode, addUnnecessaryBendpoints: bool):
+    def joinAt(layeredGraph: LGraph, longEdgeDummy: LNode,
+               addUnnecessaryBendpoints: bool, droppedEdges: Optional[Set[LEdge]]=None):
         """
         Joins the edges connected to the given dummy node. The dummy node is then ready to be removed
         from the graph.
@@ -55,13 +64,15 @@ class LongEdgeJoiner(ILayoutProcessor):
         :param longEdgeDummy: the dummy node whose incident edges to join.
         :param addUnnecessaryBendpoints: {@code true} if a bend point should be added to the edges at the position of the
                    dummy node.
+        :param droppedEdges: if specified the dropped edges are added to this set
+            and the caller is responsible for removing them from layeredGraph.edges
+            (removal from the list one by one is O(n) for each edge)
         """
         # Get the input and output port (of which we assume to have only one, on the western side and
         # on the eastern side, respectively) the incoming edges are retained, and the outgoing edges
         # are discarded
         inputPortEdges = longEdgeDummy.west[0].incomingEdges
         outputPortEdges = longEdgeDummy.east[0].outgoingEdges
-        edgeCount = len(inputPortEdges)
 
         # If we are to add unnecessary bend points, we need to know where. We take the position of the
         # first port we find. (It doesn't really matter which port we're using, so we opt to keep it
@@ -71,11 +82,8 @@ class LongEdgeJoiner(ILayoutProcessor):
         # The following code assumes that edges with the same indices in the two lists originate from
         # the same long edge, which is true for the current implementation of LongEdgeSplitter and
         # HyperedgeDummyMerger
-        while edgeCount > 0:
-            edgeCount -= 1
-            # Get the two edges
-            survivingEdge = inputPortEdges[0]
-            droppedEdge = outputPortEdges[0]
+        for survivingEdge, droppedEdge in zip(list(inputPortEdges),
+                                              list(outputPortEdges)):
 
             # The surviving edge's target needs to be set to the old target of the dropped edge.
             # However, this doesn't replace the dropped edge with the surviving edge in the list of
@@ -84,15 +92,14 @@ class LongEdgeJoiner(ILayoutProcessor):
             # output ports of long edge dummies belong to each other. Thus, we need to ensure that the
             # surviving edge is at the correct index in the list of incoming edges. Hence the
             # complicated code below. (KIPRA-1670)
-            targetIncomingEdges = droppedEdge.dst.incomingEdges
-            droppedEdgeListIndex = targetIncomingEdges.index(droppedEdge)
-            survivingEdge.setTargetAndInsertAtIndex(
-                droppedEdge.dst, droppedEdgeListIndex)
+            survivingEdge.setTargetInPlaceOf(droppedEdge)
 
             # Remove the dropped edge from the graph
             droppedEdge.setSource(None)
-            droppedEdge.setTarget(None)
-            layeredGraph.edges.remove(droppedEdge)
+            if droppedEdges is None:
+                layeredGraph.edges.remove(droppedEdge)
+            else:
+                droppedEdges.add(droppedEdge)
 
             # Join their bend points and add possibly an unnecessary one
             survivingBendPoints = survivingEdge.bendPoints
@@ -7,6 +7,7 @@ from layeredGraphLayouter.containers.lGraph import LGraph, LNodeLayer
 from layeredGraphLayouter.containers.lNode import LNode
 from layeredGraphLayouter.containers.lPort import LPort
 from layeredGraphLayouter.iLayoutProcessor import ILayoutProcessor
+from layeredGraphLayouter.nodeManipulators.layerConstraintProcessor import LayerConstraintProcessor
 
 
 class LongEdgeSplitter(ILayoutProcessor):
@@ -32,6 +33,7 @@ class LongEdgeSplitter(ILayoutProcessor):
         Same-slot dependencies:
     {@link LayerConstraintProcessor}
     """
+    SAME_SLOT_DEPENDENCIES = (LayerConstraintProcessor, )
 
     def process(self, layeredGraph: LGraph):
         if len(layeredGraph.layers) <= 2:
@@ -0,0 +1,389 @@
+"""
+Streaming importer of Yosys JSON netlists (output of "write_json")
+
+The file is read by :class:`JsonPullParser` which reads the input in chunks
+and decodes only single small values (port, cell, net name) at once,
+so the memory use is given by the output graph and not by the size
+of the file.
+
+Mapping to LGraph:
+
+* each cell is LNode, input ports of the cell are on the west side,
+  output ports on the east side (inout ports are treated as inputs)
+* ports of the module are LayoutExternalPort nodes
+* nets are converted per bit, each (driver port, sink port) pair connected
+  by any bit is one LEdge, net with more sinks is a hyperedge
+* cells which are instances of other modules of the file get a nested LGraph
+  (LNode.nestedLgraph) built from that module
+"""
+import json
+import re
+from typing import Optional, List
+
+from layeredGraphLayouter.containers.constants import PortSide, PortType
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lGraphBulkBuilder import LGraphBulkBuilder
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# characters which can follow a prefix of a number
+_NUMBER_CONTINUATION = set("0123456789.eE+-")
+
+
+class JsonPullParser():
+    """
+    Incremental JSON parser, the caller walks the document using
+    iterObject()/iterArray() and decodes the values it needs by readValue()
+    (or skips them by skipValue()).
+
+    :ivar buf: currently buffered part of the input
+    :ivar pos: position of the next unread character in buf
+    """
+
+    def __init__(self, fileObj, chunkSize=1 << 16):
+        self.fileObj = fileObj
+        self.chunkSize = chunkSize
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size: int) -> bool:
+        """
+        Read next data from input, drop already read data from buffer
+
+        :return: False if the end of input was reached
+        """
+        data = self.fileObj.read(size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Skip whitespaces and return next character
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill(self.chunkSize):
+                raise ValueError("Unexpected end of JSON")
+
+    def expect(self, c: str):
+        if self.peek() != c:
+            raise ValueError("Expected %r at %r" % (
+                c, self.buf[self.pos:self.pos + 20]))
+        self.pos += 1
+
+    def readValue(self):
+        """
+        Decode next value
+        """
+        self.peek()
+        readSize = self.chunkSize
+        while True:
+            try:
+                v, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                end = None
+
+            # number at the end of buffer may continue in next data
+            if end is not None and (self.eof or (
+                    end < len(self.buf)
+                    and self.buf[end] not in _NUMBER_CONTINUATION)):
+                self.pos = end
+                return v
+
+            if not self._fill(readSize) and end is None:
+                # raise the decode error
+                self.decoder.raw_decode(self.buf, self.pos)
+            readSize *= 2
+
+    def iterObject(self):
+        """
+        Iterate keys of the object, the value of each key has to be
+        consumed by the caller before next iteration
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.readValue()
+            self.expect(":")
+            yield key
+            c = self.peek()
+            self.pos += 1
+            if c == "}":
+                return
+            elif c != ",":
+                raise ValueError("Expected ',' or '}' at %r" % (
+                    self.buf[self.pos - 1:self.pos + 20]))
+
+    def iterArray(self):
+        """
+        Iterate items of the array, the value of each item has to be
+        consumed by the caller before next iteration
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield
+            c = self.peek()
+            self.pos += 1
+            if c == "]":
+                return
+            elif c != ",":
+                raise ValueError("Expected ',' or ']' at %r" % (
+                    self.buf[self.pos - 1:self.pos + 20]))
+
+    def skipValue(self):
+        """
+        Skip next value without decoding of whole containers
+        """
+        c = self.peek()
+        if c == "{":
+            for _ in self.iterObject():
+                self.skipValue()
+        elif c == "[":
+            for _ in self.iterArray():
+                self.skipValue()
+        else:
+            self.readValue()
+
+
+def _attrIsTrue(v) -> bool:
+    # yosys writes integer attributes as binary strings
+    if isinstance(v, str) and v and not v.strip("01"):
+        return int(v, 2) != 0
+    return bool(v)
+
+
+class YosysModule():
+    """
+    Module of the netlist stored in the form of tables
+    for :class:`layeredGraphLayouter.containers.lGraphBulkBuilder.LGraphBulkBuilder`
+
+    :ivar nodeCellTypes: cell type for each node (None for module ports)
+    :ivar bitDrivers: dict {net bit: index of driver port},
+        only while the module is parsed
+    :ivar bitSinks: dict {net bit: list of indexes of sink ports},
+        only while the module is parsed
+    :ivar bitNames: dict {net bit: name of the net}
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.isTop = False
+        self.nodeNames = []
+        self.nodeOriginObjs = []
+        self.nodeExternalPortDirections = []
+        self.nodeCellTypes = []
+        self.portNodes = []
+        self.portSides = []
+        self.portTypes = []
+        self.portNames = []
+        self.edgeSrc = []
+        self.edgeDst = []
+        self.edgeNames = []
+
+        self.bitDrivers = {}
+        self.bitSinks = {}
+        self.bitNames = {}
+
+    def addNode(self, name, originObj, externalPortDirection, cellType):
+        self.nodeNames.append(name)
+        self.nodeOriginObjs.append(originObj)
+        self.nodeExternalPortDirections.append(externalPortDirection)
+        self.nodeCellTypes.append(cellType)
+        return len(self.nodeNames) - 1
+
+    def addPort(self, node: int, name: str, isDriver: bool, bits: List):
+        i = len(self.portNodes)
+        self.portNodes.append(node)
+        self.portNames.append(name)
+        if isDriver:
+            self.portSides.append(PortSide.EAST)
+            self.portTypes.append(PortType.OUTPUT)
+        else:
+            self.portSides.append(PortSide.WEST)
+            self.portTypes.append(PortType.INPUT)
+
+        bitDrivers = self.bitDrivers
+        bitSinks = self.bitSinks
+        for b in bits:
+            if isinstance(b, str):
+                # constant "0", "1", "x", "z"
+                continue
+            if isDriver and b not in bitDrivers:
+                bitDrivers[b] = i
+            else:
+                # other drivers of the net are connected as sinks
+                sinks = bitSinks.get(b)
+                if sinks is None:
+                    bitSinks[b] = [i]
+                elif sinks[-1] != i:
+                    sinks.append(i)
+
+    def resolveNets(self):
+        """
+        Create edges from per bit connections and drop the per bit tables
+        """
+        seen = set()
+        bitDrivers = self.bitDrivers
+        bitNames = self.bitNames
+        for b, sinks in self.bitSinks.items():
+            src = bitDrivers.get(b)
+            if src is None:
+                continue
+            for dst in sinks:
+                if dst == src:
+                    continue
+                k = (src, dst)
+                if k in seen:
+                    continue
+                seen.add(k)
+                self.edgeSrc.append(src)
+                self.edgeDst.append(dst)
+                self.edgeNames.append(bitNames.get(b))
+
+        self.bitDrivers = None
+        self.bitSinks = None
+        self.bitNames = None
+
+
+class FromYosysJson():
+    """
+    Importer of Yosys JSON netlist (described in module docstring)
+
+    :ivar modules: dict {module name: YosysModule} of the last parsed file
+    :ivar initDim: if True LNode.initDim() is called on all nodes
+    """
+
+    def __init__(self, initDim=True, chunkSize=1 << 16):
+        self.initDim = initDim
+        self.chunkSize = chunkSize
+        self.modules = {}
+
+    def parseModule(self, name: str, p: JsonPullParser) -> YosysModule:
+        m = YosysModule(name)
+        for k in p.iterObject():
+            if k == "attributes":
+                attrs = p.readValue()
+                m.isTop = _attrIsTrue(attrs.get("top", 0))
+            elif k == "ports":
+                for portName in p.iterObject():
+                    port = p.readValue()
+                    isInput = port.get("direction", "input") != "output"
+                    n = m.addNode(portName, None,
+                                  PortType.INPUT if isInput else PortType.OUTPUT,
+                                  None)
+                    # input of the module drives the nets inside
+                    m.addPort(n, portName, isInput, port.get("bits", ()))
+            elif k == "cells":
+                for cellName in p.iterObject():
+                    cell = p.readValue()
+                    cellType = cell.get("type")
+                    if _attrIsTrue(cell.get("hide_name", 0)):
+                        label = cellType
+                    else:
+                        label = cellName
+                    n = m.addNode(label, cellName, None, cellType)
+                    directions = cell.get("port_directions", {})
+                    for portName, bits in cell.get("connections", {}).items():
+                        isDriver = directions.get(portName) == "output"
+                        m.addPort(n, portName, isDriver, bits)
+            elif k == "netnames":
+                bitNames = m.bitNames
+                for netName in p.iterObject():
+                    net = p.readValue()
+                    if _attrIsTrue(net.get("hide_name", 0)):
+                        continue
+                    for b in net.get("bits", ()):
+                        if not isinstance(b, str):
+                            bitNames.setdefault(b, netName)
+            else:
+                p.skipValue()
+
+        m.resolveNets()
+        return m
+
+    def findTop(self) -> YosysModule:
+        modules = self.modules
+        for m in modules.values():
+            if m.isTop:
+                return m
+
+        instantiated = set()
+        for m in modules.values():
+            instantiated.update(m.nodeCellTypes)
+        for m in modules.values():
+            if m.name not in instantiated:
+                return m
+
+        raise ValueError("Can not resolve top module")
+
+    def buildModule(self, m: YosysModule, _stack=()) -> LGraph:
+        """
+        Create LGraph for the module, instances of other modules
+        get its own nested graph
+        """
+        b = LGraphBulkBuilder()
+        g = b.build(m.nodeNames, m.portNodes, m.portSides, m.portTypes,
+                    m.edgeSrc, m.edgeDst,
+                    portNames=m.portNames,
+                    edgeNames=m.edgeNames,
+                    nodeExternalPortDirections=m.nodeExternalPortDirections,
+                    nodeOriginObjs=m.nodeOriginObjs)
+        stack = _stack + (m.name, )
+        for n, cellType in zip(b.nodes, m.nodeCellTypes):
+            sub = self.modules.get(cellType)
+            if sub is not None:
+                if cellType in stack:
+                    raise ValueError("Recursive instantiation of module", stack)
+                nested = self.buildModule(sub, stack)
+                n.compoundNode = True
+                n.nestedLgraph = nested
+                nested.parentLnode = n
+
+            if self.initDim and (n.west or n.east):
+                n.initDim()
+
+        return g
+
+    def parse(self, fileObj, top: Optional[str]=None) -> LGraph:
+        """
+        :param fileObj: text file-like object with Yosys JSON
+        :param top: name of the top module, if None the module with "top"
+            attribute or the module which is not instantiated is used
+        :return: LGraph of the top module
+        """
+        p = JsonPullParser(fileObj, self.chunkSize)
+        modules = self.modules = {}
+        for k in p.iterObject():
+            if k == "modules":
+                for name in p.iterObject():
+                    modules[name] = self.parseModule(name, p)
+            else:
+                p.skipValue()
+
+        if top is None:
+            topModule = self.findTop()
+        else:
+            topModule = modules[top]
+
+        return self.buildModule(topModule)
+
+    def parseFile(self, fileName: str, top: Optional[str]=None) -> LGraph:
+        with open(fileName, encoding="utf-8") as f:
+            return self.parse(f, top=top)
@@ -102,7 +102,8 @@ class GreedyCycleBreaker(ILayoutProcessor):
         for node in nodes:
             # look at the node's outgoing edges
             for port in node.iterPorts():
-                for edge in port.outgoingEdges:
+                # copy, reversed edges are removed from the port
+                for edge in list(port.outgoingEdges):
                     if node.mark > edge.dstNode.mark:
                         edge.reverse(graph, True)
 
@@ -4,6 +4,10 @@ from layeredGraphLayouter.layoutProcessorConfiguration import LayoutProcessorCon
 
 
 class ILayoutProcessor():
+    # classes of processors which have to run before this processor
+    # if they are in the same slot of LayoutProcessorConfiguration
+    SAME_SLOT_DEPENDENCIES = ()
+
     @staticmethod
     def getLayoutProcessorConfiguration(graph: LGraph) -> Optional[LayoutProcessorConfiguration]:
         return None
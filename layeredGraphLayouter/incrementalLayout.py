@@ -0,0 +1,717 @@
+"""
+Incremental relayout of the graph after small edits
+
+The edits of the already layouted graph are recorded in GraphDiff
+(or GraphDiff methods are used to edit the graph), IncrementalLayouter.relayout()
+then updates the previous layout instead of running whole layout again:
+
+1. Previous layer of each untouched node is kept, new nodes are placed after
+   its predecessors (or before its successors) and the successors of the nodes
+   are pushed to next layers only if a new edge requires it.
+   The new edges which would close a cycle stay backward edges
+   (as if they were reversed by cycle breaker).
+2. Dirty layers (layers of changed nodes and layers spanned by changed edges)
+   and margin layers around them are copied to a window graph. Long edges are
+   split only inside of the window and the edges which leave the window end
+   in the neighbor layers of the window which are used as fixed context
+   (the order of these layers is not changed).
+3. Nodes of the window are ordered by the previous order (new nodes and dummy
+   nodes are inserted by the positions of its neighbors) and this order is used
+   as warm start of LayerSweepCrossingMinimizer (no randomized layers or restarts,
+   the previous order is kept if sweeps do not reduce the crossings).
+4. The order of nodes and ports is written back to the layers of the window.
+
+The layers and the order of the nodes outside of the windows are not modified,
+which keeps the drawing stable and the relayout time depends on the size of
+the windows instead of the size of the graph.
+
+.. code-block:: python
+
+    layouter = IncrementalLayouter()
+    layouter.layout(graph)
+
+    diff = GraphDiff(graph)
+    n = diff.addNode("n")
+    diff.addEdge(src, diff.addPort(n, "i", PortType.INPUT, PortSide.WEST))
+    layouter.relayout(graph, diff)
+
+Graphs with hierarchy, external ports, north/south ports and layer constraints
+are layouted from scratch.
+"""
+from math import ceil, floor
+from typing import Callable, Dict, List, Set, Tuple
+
+from layeredGraphLayouter.containers.constants import NodeType, PortType,\
+    PortSide, LayerConstraint, HierarchyHandling
+from layeredGraphLayouter.containers.lEdge import LEdge
+from layeredGraphLayouter.containers.lGraph import LGraph, LNodeLayer
+from layeredGraphLayouter.containers.lNode import LNode
+from layeredGraphLayouter.containers.lPort import LPort
+from layeredGraphLayouter.crossing.layerSweepCrossingMinimizer import LayerSweepCrossingMinimizer
+from layeredGraphLayouter.iLayoutProcessor import ILayoutProcessor
+from layeredGraphLayouter.layoutProcessor import LayoutProcessor, defaultConfig
+from layeredGraphLayouter.layoutProcessorConfiguration import LayoutProcessorConfiguration
+from layeredGraphLayouter.nodeManipulators.inLayerConstraintProcessor import InLayerConstraintProcessor
+from layeredGraphLayouter.trace import span
+
+
+class GraphDiff():
+    """
+    Record of edits of the layouted graph
+
+    Use the methods of this object to edit the graph, or edit the graph
+    directly and append the changed objects to the lists.
+
+    :ivar graph: the edited graph
+    :ivar addedNodes: list of new LNode instances
+    :ivar removedNodes: list of removed LNode instances
+    :ivar addedPorts: list of new LPort instances
+    :ivar removedPorts: list of removed LPort instances
+    :ivar addedEdges: list of new LEdge instances
+    :ivar removedEdges: list of removed LEdge instances
+    :ivar touchedNodes: set of nodes whose ports or edges were changed
+    """
+
+    def __init__(self, graph: LGraph):
+        self.graph = graph
+        self.addedNodes = []
+        self.removedNodes = []
+        self.addedPorts = []
+        self.removedPorts = []
+        self.addedEdges = []
+        self.removedEdges = []
+        self.touchedNodes = set()
+
+    def addNode(self, name: str=None, originObj=None, **kwargs) -> LNode:
+        n = self.graph.add_node(name=name, originObj=originObj, **kwargs)
+        self.addedNodes.append(n)
+        return n
+
+    def addPort(self, node: LNode, name: str, direction: PortType, side: PortSide) -> LPort:
+        p = node.addPort(name, direction, side)
+        self.addedPorts.append(p)
+        self.touchedNodes.add(node)
+        return p
+
+    def addEdge(self, src: LPort, dst: LPort, name: str=None, originObj=None) -> LEdge:
+        e = self.graph.add_edge(src, dst, name=name, originObj=originObj)
+        self.addedEdges.append(e)
+        self.touchedNodes.add(e.srcNode)
+        self.touchedNodes.add(e.dstNode)
+        return e
+
+    def removeEdge(self, edge: LEdge):
+        self.touchedNodes.add(edge.srcNode)
+        self.touchedNodes.add(edge.dstNode)
+        edge.setSource(None)
+        edge.setTarget(None)
+        self.graph.edges.remove(edge)
+        self.removedEdges.append(edge)
+
+    def removePort(self, port: LPort):
+        for e in list(port.iterEdges()):
+            self.removeEdge(e)
+        node = port.node
+        node.getPortSideView(port.side).remove(port)
+        self.touchedNodes.add(node)
+        self.removedPorts.append(port)
+
+    def removeNode(self, node: LNode):
+        for p in list(node.iterPorts()):
+            self.removePort(p)
+        if node.layer is not None and node in node.layer:
+            node.layer.remove(node)
+        node.layer = None
+        self.graph.nodes.remove(node)
+        self.touchedNodes.discard(node)
+        self.removedNodes.append(node)
+
+    def dirtyNodes(self) -> Set[LNode]:
+        """
+        :return: set of new nodes and nodes whose ports or edges were changed
+            (removed nodes are not included)
+        """
+        dirty = set(self.addedNodes)
+        dirty.update(self.touchedNodes)
+        for e in self.addedEdges:
+            dirty.add(e.srcNode)
+            dirty.add(e.dstNode)
+        dirty.difference_update(self.removedNodes)
+        dirty.discard(None)
+        return dirty
+
+
+class LayerOrderRecorder(ILayoutProcessor):
+    """
+    Record relative positions of nodes and long edges in each layer
+    (the positions of long edge dummy nodes are lost once the long edges
+    are joined)
+
+    Precondition: ordered layers with long edge dummy nodes
+    Slots: after phase 3.
+
+    :ivar layerOrders: dict {layer: {node or edge: relative position}},
+        long edge dummy nodes are recorded as the first edge of the long edge
+        (the edge which is kept by LongEdgeJoiner), a dummy merged by
+        HyperedgeDummyMerger is recorded for each of its long edges
+    """
+
+    def __init__(self, layerOrders: Dict[LNodeLayer, Dict[object, float]]):
+        self.layerOrders = layerOrders
+
+    def process(self, graph: LGraph):
+        layerOrders = self.layerOrders
+        # {edge from long edge dummy: first edge of the long edge}
+        longEdgeOf = {}
+        for layer in graph.layers:
+            size = len(layer)
+            order = layerOrders[layer] = {}
+            for i, n in enumerate(layer):
+                pos = i / size
+                if n.type == NodeType.LONG_EDGE:
+                    # edges with the same index belong to the same long edge
+                    for inEdge, outEdge in zip(n.west[0].incomingEdges,
+                                               n.east[0].outgoingEdges):
+                        e = longEdgeOf.get(inEdge, inEdge)
+                        longEdgeOf[outEdge] = e
+                        order[e] = pos
+                else:
+                    order[n] = pos
+
+
+class _NeedsFullLayout(Exception):
+    """
+    The change can not be handled incrementally
+    """
+
+
+class IncrementalLayouter():
+    """
+    Layouter which reuses the previous layout of the graph
+    (described in module docstring)
+
+    :ivar configFactory: function which creates LayoutProcessorConfiguration
+        for the full layout (a new one is required for each run)
+    :ivar margin: number of layers before and after the dirty layers which
+        can be reordered as well
+    :ivar dirtyLayers: list of layers whose order was changed by the last
+        layout/relayout (all layers after the full layout), the placement
+        of the nodes has to be recomputed only for these layers
+    :ivar lastLayoutWasFull: True if the last layout/relayout
+        had to layout the whole graph
+    :ivar layerOrders: dict {layer: {node or edge: relative position}}
+        positions of nodes and long edges in previous layout
+        (LayerOrderRecorder), used as initial order of relayout
+    """
+
+    def __init__(self,
+                 configFactory: Callable[[], LayoutProcessorConfiguration]=defaultConfig,
+                 margin: int=1):
+        self.configFactory = configFactory
+        self.margin = margin
+        self.dirtyLayers = []
+        self.lastLayoutWasFull = False
+        self.layerOrders = {}
+
+    def layout(self, graph: LGraph) -> LGraph:
+        """
+        Layout the whole graph from scratch
+        """
+        with span("layout", "incremental"):
+            for l in graph.layers:
+                for n in l:
+                    n.layer = None
+            graph.layers.clear()
+            self._removeLongEdgeDummies(graph)
+            for n in graph.nodes:
+                n.layer = None
+
+            self.layerOrders = {}
+            config = self.configFactory()
+            config.p3_node_ordering_after = list(config.p3_node_ordering_after or ())
+            config.p3_node_ordering_after.append(LayerOrderRecorder(self.layerOrders))
+            LayoutProcessor(graph, config).run()
+            # LongEdgeJoiner removes dummies only from layers
+            self._removeLongEdgeDummies(graph)
+
+        self.dirtyLayers = list(graph.layers)
+        self.lastLayoutWasFull = True
+        return graph
+
+    @staticmethod
+    def _removeLongEdgeDummies(graph: LGraph):
+        graph.nodes[:] = [n for n in graph.nodes
+                          if n.type != NodeType.LONG_EDGE]
+
+    def relayout(self, graph: LGraph, diff: GraphDiff) -> LGraph:
+        """
+        Update the previous layout of the graph after the edits from diff
+        (falls back to the full layout if the change
+        can not be handled incrementally)
+        """
+        if not graph.layers:
+            return self.layout(graph)
+
+        with span("relayout", "incremental"):
+            try:
+                self._relayout(graph, diff)
+            except _NeedsFullLayout:
+                pass
+            else:
+                self.lastLayoutWasFull = False
+                return graph
+
+        return self.layout(graph)
+
+    def _relayout(self, graph: LGraph, diff: GraphDiff):
+        dirty = diff.dirtyNodes()
+        if graph.p_externalPorts:
+            raise _NeedsFullLayout()
+        for n in dirty:
+            if (n.nestedLgraph is not None or n.nestedGraph is not None
+                    or n.north or n.south
+                    or n.layeringLayerConstraint != LayerConstraint.NONE):
+                raise _NeedsFullLayout()
+
+        layers = graph.layers
+        # relative position of the new and moved nodes in the previous layout
+        seedRank = {}
+        for n in diff.addedNodes:
+            if n in dirty and n.layer is None:
+                seedRank[n] = self._neighborRank(n)
+
+        with span("assignLayers", "incremental"):
+            newLevels = self._assignLayers(graph, diff, dirty)
+            movedNodes = self._applyLevels(graph, newLevels, seedRank)
+
+        layerIndex = {l: i for i, l in enumerate(layers)}
+        windows = self._dirtyWindows(layerIndex, dirty, movedNodes, diff)
+        with span("orderWindows", "incremental", {"windows": len(windows)}):
+            for lo, hi in windows:
+                self._orderWindow(graph, layerIndex, lo, hi, seedRank)
+
+        dirtyLayers = []
+        for lo, hi in windows:
+            dirtyLayers.extend(layers[lo:hi + 1])
+        for l in layers:
+            if not l:
+                self.layerOrders.pop(l, None)
+        layers[:] = [l for l in layers if l]
+        self.dirtyLayers = [l for l in dirtyLayers if l]
+
+    def _relativePosition(self, node: LNode) -> float:
+        """
+        :return: relative position of the node in its layer (0 top, 1 bottom)
+        """
+        order = self.layerOrders.get(node.layer)
+        if order is not None:
+            r = order.get(node)
+            if r is not None:
+                return r
+        return node.getIndex() / len(node.layer)
+
+    def _neighborRank(self, node: LNode) -> float:
+        """
+        :return: average relative position of the layouted neighbors
+            (1.0 = end of layer if there is not any)
+        """
+        ranks = []
+        for e in node.getConnectedEdges():
+            other = e.dstNode if e.srcNode is node else e.srcNode
+            if other is not node and other.layer is not None:
+                ranks.append(self._relativePosition(other))
+        if not ranks:
+            return 1.0
+        return sum(ranks) / len(ranks)
+
+    def _assignLayers(self, graph: LGraph, diff: GraphDiff,
+                      dirty: Set[LNode]) -> Dict[LNode, int]:
+        """
+        Place new nodes and push the successors of the nodes
+        if required by new edges
+
+        New node is put to the first layer after its predecessors, if this layer
+        is not before its successors, a new layer between predecessors and
+        successors is used instead of moving the successors
+        (the level of such a node is not an integer).
+
+        :return: dict {node: new index of layer} for new and moved nodes
+            (the index may be negative, out of range of the current layers
+            or between existing layers)
+        """
+        layerIndex = {l: i for i, l in enumerate(graph.layers)}
+        level = {}
+
+        def getLevel(n: LNode) -> int:
+            lvl = level.get(n)
+            if lvl is None:
+                if n.layer is None:
+                    # node which is not in the diff and not in the layout
+                    raise _NeedsFullLayout()
+                lvl = layerIndex[n.layer]
+            return lvl
+
+        def isPlaced(n: LNode) -> bool:
+            return n in level or n.layer is not None
+
+        added = [n for n in diff.addedNodes if n in dirty and n.layer is None]
+        for n in self._topologicalOrder(added):
+            preds = [getLevel(e.srcNode) for e in n.getIncomingEdges()
+                     if not e.isSelfLoop and isPlaced(e.srcNode)]
+            succs = [getLevel(e.dstNode) for e in n.getOutgoingEdges()
+                     if not e.isSelfLoop and isPlaced(e.dstNode)]
+            if preds:
+                p = max(preds)
+                lvl = floor(p) + 1
+                if succs:
+                    s = min(succs)
+                    if p < s <= lvl:
+                        lvl = (p + s) / 2
+            elif succs:
+                lvl = ceil(min(succs)) - 1
+            else:
+                lvl = 0
+            level[n] = lvl
+
+        edges = list(diff.addedEdges)
+        for n in added:
+            edges.extend(n.getConnectedEdges())
+
+        seen = set()
+        for e in edges:
+            if e in seen or e.src is None or e.dst is None or e.isSelfLoop:
+                continue
+            seen.add(e)
+            u = e.srcNode
+            v = e.dstNode
+            lu = getLevel(u)
+            if lu < getLevel(v):
+                continue
+            if not self._push(v, floor(lu) + 1, u, level, getLevel) and lu == getLevel(v):
+                # cycle inside of the layer, the cycle breaker has to decide
+                raise _NeedsFullLayout()
+
+        return level
+
+    @staticmethod
+    def _topologicalOrder(nodes: List[LNode]) -> List[LNode]:
+        """
+        Order new nodes so predecessors are before successors
+        (nodes in cycles are appended in the original order)
+        """
+        nodeSet = set(nodes)
+        indeg = {n: 0 for n in nodes}
+        for n in nodes:
+            for e in n.getOutgoingEdges():
+                if not e.isSelfLoop and e.dstNode in nodeSet:
+                    indeg[e.dstNode] += 1
+
+        order = []
+        stack = [n for n in reversed(nodes) if indeg[n] == 0]
+        while stack:
+            n = stack.pop()
+            order.append(n)
+            for e in n.getOutgoingEdges():
+                d = e.dstNode
+                if not e.isSelfLoop and d in nodeSet:
+                    indeg[d] -= 1
+                    if indeg[d] == 0:
+                        stack.append(d)
+
+        if len(order) != len(nodes):
+            inOrder = set(order)
+            order.extend(n for n in nodes if n not in inOrder)
+        return order
+
+    @staticmethod
+    def _push(node: LNode, minLevel: int, source: LNode,
+              level: Dict[LNode, int], getLevel) -> bool:
+        """
+        Move the node and its successors to higher layers so the node
+        is at least in minLevel layer
+
+        :param source: source of the new edge which requires the move,
+            if the source has to be moved as well the edge closes a cycle
+            and the levels are not changed
+        :return: True if the levels were updated
+        """
+        saved = {}
+        stack = [(node, minLevel)]
+        while stack:
+            n, lvl = stack.pop()
+            cur = getLevel(n)
+            if cur >= lvl:
+                continue
+            if n is source:
+                for n2, prev in saved.items():
+                    if prev is None:
+                        del level[n2]
+                    else:
+                        level[n2] = prev
+                return False
+            saved.setdefault(n, level.get(n))
+            level[n] = lvl
+            for e in n.getOutgoingEdges():
+                if e.isSelfLoop:
+                    continue
+                # follow only the edges which pointed forward
+                # (backward edges stay backward)
+                if getLevel(e.dstNode) > cur:
+                    stack.append((e.dstNode, lvl + 1))
+
+        return True
+
+    def _applyLevels(self, graph: LGraph, level: Dict[LNode, int],
+                     seedRank: Dict[LNode, float]) -> List[LNode]:
+        """
+        Move nodes to layers specified by level (new layers are created if required)
+
+        :param seedRank: dict {node: relative position}, the previous relative
+            position of moved nodes is added to it
+        :return: list of the moved nodes
+        """
+        if not level:
+            return []
+        layers = graph.layers
+        layerCnt = len(layers)
+        layerOfLevel = {}
+        for lvl in sorted(set(level.values())):
+            if lvl != int(lvl) or lvl < 0 or lvl >= layerCnt:
+                layerOfLevel[lvl] = LNodeLayer(graph, registerOnGraph=False)
+
+        if layerOfLevel:
+            newLayers = []
+            newLevels = iter(sorted(layerOfLevel.items()))
+            lvl, newLayer = next(newLevels)
+            for i, l in enumerate(layers):
+                while newLayer is not None and lvl < i:
+                    newLayers.append(newLayer)
+                    lvl, newLayer = next(newLevels, (None, None))
+                layerOfLevel.setdefault(i, l)
+                newLayers.append(l)
+            while newLayer is not None:
+                newLayers.append(newLayer)
+                lvl, newLayer = next(newLevels, (None, None))
+            layers[:] = newLayers
+        else:
+            layerOfLevel = dict(enumerate(layers))
+
+        moved = []
+        for n, lvl in level.items():
+            target = layerOfLevel[lvl]
+            if n.layer is not target:
+                if n not in seedRank:
+                    seedRank[n] = self._relativePosition(n)
+                n.setLayer(target)
+                moved.append(n)
+        return moved
+
+    def _dirtyWindows(self, layerIndex: Dict[LNodeLayer, int],
+                      dirty: Set[LNode], movedNodes: List[LNode],
+                      diff: GraphDiff) -> List[Tuple[int, int]]:
+        """
+        :return: list of disjoint ranges (first, last) of indexes of layers
+            which have to be reordered
+        """
+        margin = self.margin
+        maxIndex = len(layerIndex) - 1
+        ranges = []
+        for n in dirty:
+            if n.layer is None:
+                # node which is not in the diff and not in the layout
+                raise _NeedsFullLayout()
+            i = layerIndex[n.layer]
+            ranges.append((i, i))
+
+        edges = list(diff.addedEdges)
+        for n in movedNodes:
+            edges.extend(n.getConnectedEdges())
+        for e in edges:
+            if e.src is None or e.dst is None:
+                continue
+            a = layerIndex[e.srcNode.layer]
+            b = layerIndex[e.dstNode.layer]
+            ranges.append((min(a, b), max(a, b)))
+
+        ranges.sort()
+        windows = []
+        for lo, hi in ranges:
+            lo = max(lo - margin, 0)
+            hi = min(hi + margin, maxIndex)
+            if windows and lo <= windows[-1][1] + 1:
+                if hi > windows[-1][1]:
+                    windows[-1] = (windows[-1][0], hi)
+            else:
+                windows.append((lo, hi))
+        return windows
+
+    def _windowEdges(self, layers: List[LNodeLayer], clo: int, chi: int) -> List[LEdge]:
+        """
+        :return: edges which may cross the layers clo..chi (including), the edges
+            of the nodes in these layers and the long edges recorded in layerOrders
+            for these layers (the edges are not checked, some of them
+            may not cross the layers anymore)
+        :note: the layers without record (new layers) may be spanned by long edges
+            which are not recorded for any other layer of the window,
+            the range is extended to the nearest recorded layer before them
+        """
+        layerOrders = self.layerOrders
+        while clo > 0 and layers[clo] not in layerOrders:
+            clo -= 1
+
+        # used as ordered set
+        edges = {}
+        for i in range(clo, chi + 1):
+            layer = layers[i]
+            for n in layer:
+                for e in n.getConnectedEdges():
+                    edges[e] = None
+            order = layerOrders.get(layer)
+            if order is not None:
+                for item in order.keys():
+                    if isinstance(item, LEdge):
+                        edges[item] = None
+        return list(edges.keys())
+
+    def _orderWindow(self, graph: LGraph, layerIndex: Dict[LNodeLayer, int],
+                     lo: int, hi: int, seedRank: Dict[LNode, float]):
+        """
+        Minimize crossings in layers lo..hi (including) using a window graph,
+        layers lo - 1 and hi + 1 are used as fixed context
+        """
+        layers = graph.layers
+        clo = max(lo - 1, 0)
+        chi = min(hi + 1, len(layers) - 1)
+
+        wg = LGraph()
+        wg.random = graph.random
+        wg.hierarchyHandling = HierarchyHandling.SEPARATE_CHILDREN
+        wLayers = [[] for _ in range(clo, chi + 1)]
+        layerOrders = self.layerOrders
+        proxyOf = {}
+        realNode = {}
+        realPort = {}
+        proxyPort = {}
+        # {proxy long edge dummy: real edge}
+        realEdge = {}
+        rank = {}
+        relPos = {}
+
+        def relativePosition(n: LNode) -> float:
+            r = relPos.get(n)
+            if r is None:
+                r = seedRank.get(n)
+                if r is None:
+                    r = self._relativePosition(n)
+                relPos[n] = r
+            return r
+
+        for i in range(clo, chi + 1):
+            wLayer = wLayers[i - clo]
+            for n in layers[i]:
+                if n.north or n.south:
+                    raise _NeedsFullLayout()
+                p = wg.add_node(n.name, portConstraint=n.portConstraints)
+                p.inLayerConstraint = n.inLayerConstraint
+                for port in n.iterPorts():
+                    pp = p.addPort(port.name, port.direction, port.side)
+                    realPort[pp] = port
+                    proxyPort[port] = pp
+                proxyOf[n] = p
+                realNode[p] = n
+                rank[p] = relativePosition(n)
+                wLayer.append(p)
+
+        extraPorts = {}
+
+        def endPort(n: LNode, port: LPort, side: PortSide) -> LPort:
+            pp = proxyPort[port]
+            if pp.side is side:
+                return pp
+            # backward edge, use port on the opposite side
+            # (does not exist in the real graph)
+            k = (pp, side)
+            pp2 = extraPorts.get(k)
+            if pp2 is None:
+                d = PortType.OUTPUT if side is PortSide.EAST else PortType.INPUT
+                pp2 = extraPorts[k] = proxyOf[n].addPort(None, d, side)
+            return pp2
+
+        def dummy(i: int, e: LEdge, r: float) -> Tuple[LPort, LPort]:
+            d = wg.add_node()
+            d.type = NodeType.LONG_EDGE
+            west = d.addPort(None, PortType.INPUT, PortSide.WEST)
+            east = d.addPort(None, PortType.OUTPUT, PortSide.EAST)
+            # position of the long edge in this layer or in neighbor layer
+            # (if this layer is new)
+            for j in (i, i - 1, i + 1):
+                order = layerOrders.get(layers[j])
+                if order is not None and e in order:
+                    r = order[e]
+                    break
+            rank[d] = r
+            realEdge[d] = e
+            wLayers[i - clo].append(d)
+            return west, east
+
+        for e in self._windowEdges(layers, clo, chi):
+            s = e.srcNode
+            d = e.dstNode
+            if s is None or d is None or e.isSelfLoop:
+                continue
+            ls = layerIndex[s.layer]
+            ld = layerIndex[d.layer]
+            if ls < ld:
+                a, b, left, right, lp, rp = ls, ld, s, d, e.src, e.dst
+            elif ls > ld:
+                a, b, left, right, lp, rp = ld, ls, d, s, e.dst, e.src
+            else:
+                continue
+            ca = max(a, clo)
+            cb = min(b, chi)
+            if ca >= cb:
+                continue
+
+            ra = relativePosition(left)
+            rb = relativePosition(right)
+            prev = None
+            for i in range(ca, cb + 1):
+                if i == a:
+                    west = None
+                    east = endPort(left, lp, PortSide.EAST)
+                elif i == b:
+                    west = endPort(right, rp, PortSide.WEST)
+                    east = None
+                else:
+                    west, east = dummy(i, e, ra + (rb - ra) * (i - a) / (b - a))
+                if prev is not None:
+                    wg.add_edge(prev, west)
+                prev = east
+
+        for wLayer in wLayers:
+            wLayer.sort(key=rank.__getitem__)
+            wg.append_layer(wLayer)
+
+        fixedLayers = set()
+        if clo < lo:
+            fixedLayers.add(0)
+        if chi > hi:
+            fixedLayers.add(chi - clo)
+        LayerSweepCrossingMinimizer(warmStart=True, fixedLayers=fixedLayers).process(wg)
+        InLayerConstraintProcessor().process(wg)
+
+        for i in range(lo, hi + 1):
+            wLayer = wg.layers[i - clo]
+            size = len(wLayer)
+            layerOrders[layers[i]] = {
+                realNode.get(p) or realEdge[p]: j / size
+                for j, p in enumerate(wLayer)}
+            layers[i].setOrder([realNode[p] for p in wLayer if p in realNode])
+            for p in wLayer:
+                n = realNode.get(p)
+                if n is None:
+                    continue
+                for side, proxySide in ((n.west, p.west), (n.east, p.east)):
+                    ports = [realPort[pp] for pp in proxySide if pp in realPort]
+                    if ports != side:
+                        side[:] = ports
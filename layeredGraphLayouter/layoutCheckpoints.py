@@ -0,0 +1,136 @@
+"""
+Checkpoints of the layout, snapshots of the graph after main phases
+of :class:`layeredGraphLayouter.layoutProcessor.LayoutProcessor`
+
+The snapshot is the compact state from :func:`encodeLGraph`
+(layer assignment, node and port order, positions and all other
+attributes of the graph including dummy nodes of the unfinished layout),
+so the layout can be resumed from any phase after the snapshot,
+e.g. when only spacing or node placement options have changed
+the cycle breaking, layering and crossing minimization do not have to run again.
+
+.. code-block:: python
+
+    checkpoints = LayoutCheckpoints()
+    LayoutProcessor(graph, config, checkpoints=checkpoints).run()
+    checkpoints.dump("layout.ckpt")
+
+    checkpoints = LayoutCheckpoints.load("layout.ckpt")
+    proc = LayoutProcessor.resume(checkpoints, "p4_node_placement", newConfig)
+    proc.graph.nodePlacementBkFixedAlignment = FixedAlignment.BALANCED
+    graph = proc.run()
+
+:note: the configuration used for resume has to contain the processors
+    of the previous phases as well (e.g. crossing minimizer),
+    they are not executed but they are required for the load
+    of the sub processors of the later phases
+"""
+import pickle
+from typing import Dict, Iterable, Optional, Union, BinaryIO
+
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lGraphCodec import encodeLGraph, decodeLGraph
+from layeredGraphLayouter.layoutProcessorConfiguration import LayoutProcessorConfiguration
+
+
+class LayoutCheckpoints():
+    """
+    Container of snapshots of the graph after main phases of the layout
+
+    :ivar phases: names of the main phases after which the snapshot
+        is taken (None for all)
+    :ivar states: dict {phase name: state of the graph after this phase}
+    :note: phases without any processor share the state with the previous phase
+    """
+    PHASE_NAMES = LayoutProcessorConfiguration.MAIN_PHASE_NAMES
+
+    def __init__(self, phases: Optional[Iterable[str]]=None):
+        if phases is not None:
+            phases = set(phases)
+            for p in phases:
+                self._checkPhaseName(p)
+        self.phases = phases
+        self.states = {}
+
+    @classmethod
+    def _checkPhaseName(cls, phaseName: str):
+        if phaseName not in cls.PHASE_NAMES:
+            raise ValueError("Unknown phase %r, expected one of %r" % (
+                phaseName, cls.PHASE_NAMES))
+
+    def isEnabledFor(self, phaseName: str) -> bool:
+        return self.phases is None or phaseName in self.phases
+
+    def save(self, phaseName: str, graph: LGraph, changed=True):
+        """
+        Take the snapshot of the graph after the phase
+
+        :param changed: if False the graph was not modified by the phase
+            and the snapshot of the previous phase is reused if present
+        """
+        self._checkPhaseName(phaseName)
+        if not self.isEnabledFor(phaseName):
+            return
+
+        if not changed:
+            i = self.PHASE_NAMES.index(phaseName)
+            if i > 0:
+                prev = self.states.get(self.PHASE_NAMES[i - 1])
+                if prev is not None:
+                    self.states[phaseName] = prev
+                    return
+
+        self.states[phaseName] = encodeLGraph(graph)
+
+    def previousPhase(self, phaseName: str) -> str:
+        """
+        :return: name of the phase whose snapshot is used to start the phase
+        """
+        self._checkPhaseName(phaseName)
+        i = self.PHASE_NAMES.index(phaseName)
+        if i == 0:
+            raise ValueError(
+                "Phase %r is the first one, there is nothing to resume from" % phaseName)
+        return self.PHASE_NAMES[i - 1]
+
+    def restore(self, phaseName: str) -> LGraph:
+        """
+        :return: new instance of the graph in the state before the phase
+            (the state after the previous phase)
+        """
+        prev = self.previousPhase(phaseName)
+        try:
+            state = self.states[prev]
+        except KeyError:
+            raise KeyError("No checkpoint after phase %r to resume %r from" % (
+                prev, phaseName)) from None
+        return decodeLGraph(state)
+
+    def __contains__(self, phaseName: str) -> bool:
+        return phaseName in self.states
+
+    def dump(self, file: Union[str, BinaryIO]):
+        """
+        Store checkpoints to the file (path or binary file object)
+        """
+        state = (self.phases, self.states)
+        if isinstance(file, str):
+            with open(file, "wb") as f:
+                pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+        else:
+            pickle.dump(state, file, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, file: Union[str, BinaryIO]) -> "LayoutCheckpoints":
+        """
+        Load checkpoints stored by :meth:`dump`
+        """
+        if isinstance(file, str):
+            with open(file, "rb") as f:
+                phases, states = pickle.load(f)
+        else:
+            phases, states = pickle.load(file)
+
+        self = cls(phases)
+        self.states = states
+        return self
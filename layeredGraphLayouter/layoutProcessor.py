@@ -1,15 +1,82 @@
+from time import perf_counter
+from typing import Callable, Optional
+
 from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.crossing.layerSweepCrossingMinimizer import LayerSweepCrossingMinimizer
+from layeredGraphLayouter.greedyCycleBreaker import GreedyCycleBreaker
+from layeredGraphLayouter.iLayoutProcessor import ILayoutProcessor
+from layeredGraphLayouter.layoutCheckpoints import LayoutCheckpoints
 from layeredGraphLayouter.layoutProcessorConfiguration import LayoutProcessorConfiguration
+from layeredGraphLayouter.minWidthLayerer import MinWidthLayerer
+from layeredGraphLayouter.trace import span
+
+
+def defaultConfig() -> LayoutProcessorConfiguration:
+    """
+    :return: configuration with the default processors of the main phases
+        (intermediate processors are resolved by LayoutProcessorConfiguration.compile())
+    """
+    return LayoutProcessorConfiguration(
+        p1_cycle_breaking=[GreedyCycleBreaker()],
+        p2_layering=[MinWidthLayerer()],
+        p3_node_ordering=[LayerSweepCrossingMinimizer()],
+    )
 
 
 class LayoutProcessor():
-    def __init__(self, graph: LGraph, config: LayoutProcessorConfiguration):
+    """
+    :ivar checkpoints: optional LayoutCheckpoints where the snapshots
+        of the graph after each main phase are stored
+    :ivar startPhase: name of the main phase where the run starts,
+        processors of the previous phases are skipped (None for the first phase)
+    :ivar processorTimer: optional function
+        (main phase name, slot name, processor, time in seconds)
+        which is called after each processor (e.g. benchmarks)
+    """
+
+    def __init__(self, graph: LGraph, config: LayoutProcessorConfiguration,
+                 checkpoints: Optional[LayoutCheckpoints]=None,
+                 startPhase: Optional[str]=None,
+                 processorTimer: Optional[Callable[[str, str, ILayoutProcessor, float], None]]=None):
+        if startPhase is not None and startPhase not in config.MAIN_PHASE_NAMES:
+            raise ValueError("Unknown phase %r" % (startPhase, ))
         self.graph = graph
-        config.load(graph)
-        self.config = config
+        self.config = config.compile(graph)
+        self.checkpoints = checkpoints
+        self.startPhase = startPhase
+        self.processorTimer = processorTimer
+
+    @classmethod
+    def resume(cls, checkpoints: LayoutCheckpoints, phaseName: str,
+               config: LayoutProcessorConfiguration) -> "LayoutProcessor":
+        """
+        Create LayoutProcessor which continues the layout from the phase
+        on the copy of the graph from the checkpoint of the previous phase,
+        the graph (LayoutProcessor.graph) can be modified before the run
+        (e.g. spacings or node placement options)
+        """
+        graph = checkpoints.restore(phaseName)
+        return cls(graph, config, checkpoints=checkpoints, startPhase=phaseName)
 
     def run(self):
-        for proc in self.config.iterProcessors():
-            proc.process(self.graph)
+        config = self.config
+        checkpoints = self.checkpoints
+        processorTimer = self.processorTimer
+        phaseNames = config.MAIN_PHASE_NAMES
+        if self.startPhase is not None:
+            phaseNames = phaseNames[phaseNames.index(self.startPhase):]
+
+        for phaseName in phaseNames:
+            changed = False
+            for slotName, proc in config.iterPhaseSlots(phaseName):
+                t = perf_counter()
+                with span(proc.__class__.__name__, "processor"):
+                    proc.process(self.graph)
+                if processorTimer is not None:
+                    processorTimer(phaseName, slotName, proc, perf_counter() - t)
+                changed = True
+
+            if checkpoints is not None:
+                checkpoints.save(phaseName, self.graph, changed)
 
-        return self.graph
\ No newline at end of file
+        return self.graph
@@ -1,3 +1,5 @@
+from itertools import product
+
 from layeredGraphLayouter.containers.lGraph import LGraph
 
 
@@ -37,6 +39,8 @@ class LayoutProcessorConfiguration():
                  p4_node_placement_before=None, p4_node_placement=None, p4_node_placement_after=None,
                  p5_edge_routing_before=None, p5_edge_routing=None, p5_edge_routing_after=None):
         self.loaded = False
+        # cache of compiled configurations
+        self._plans = {}
 
         self.p1_cycle_breaking_before = p1_cycle_breaking_before
         self.p1_cycle_breaking = p1_cycle_breaking
@@ -58,21 +62,143 @@ class LayoutProcessorConfiguration():
         self.p5_edge_routing = p5_edge_routing
         self.p5_edge_routing_after = p5_edge_routing_after
 
+    SUB_PHASE_NAMES = ["_before", "", "_after"]
+    SLOT_NAMES = [phase + subPhase
+                  for phase, subPhase in product(MAIN_PHASE_NAMES, SUB_PHASE_NAMES)]
+    # properties of LGraph which are used by getLayoutProcessorConfiguration()
+    GRAPH_FEATURE_FLAGS = (
+        "hierarchyHandling", "p_comments", "p_externalPorts", "p_hyperedges",
+        "p_hypernodes", "p_nonFreePorts", "p_northSouthPorts", "p_selfLoops",
+        "p_centerLabels", "p_endLabels", "p_partitions", "feedbackEdges")
+
+    def iterPhaseProcessors(self, phaseName: str):
+        """
+        Iterate processors of the main phase (including _before and _after)
+        """
+        for _, proc in self.iterPhaseSlots(phaseName):
+            yield proc
+
+    def iterPhaseSlots(self, phaseName: str):
+        """
+        Iterate (slot name, processor) of the main phase
+        (including _before and _after)
+        """
+        for subPhaseName in self.SUB_PHASE_NAMES:
+            slotName = phaseName + subPhaseName
+            phase = getattr(self, slotName)
+            if phase:
+                for proc in phase:
+                    yield slotName, proc
+
     def iterProcessors(self):
         for phaseName in self.MAIN_PHASE_NAMES:
-            for subPhaseName in ["_before", "", "_after"]:
-                phase = getattr(self, phaseName + subPhaseName)
-                if phase:
-                    yield from phase
+            yield from self.iterPhaseProcessors(phaseName)
+
+    def _slotSignature(self) -> tuple:
+        return tuple(tuple(map(id, getattr(self, slot) or ()))
+                     for slot in self.SLOT_NAMES)
+
+    @classmethod
+    def graphSignature(cls, graph: LGraph) -> tuple:
+        """
+        :return: tuple of values of the graph properties which
+            affect the selection of the intermediate processors
+        """
+        return tuple(getattr(graph, name, None)
+                     for name in cls.GRAPH_FEATURE_FLAGS)
+
+    def compile(self, graph: LGraph) -> "LayoutProcessorConfiguration":
+        """
+        Resolve the intermediate processors required by the processors
+        (getLayoutProcessorConfiguration) for this graph
+
+        * the intermediate processor is not added to the slot if there
+          already is a processor of same class
+        * processors in each slot are ordered by SAME_SLOT_DEPENDENCIES
+
+        :return: new loaded configuration, it is cached for the current content
+            of this configuration and the graphSignature() of the graph,
+            so it is shared between all graphs with same features
+            (the processors have to be reusable between the graphs)
+        """
+        if self.loaded:
+            return self
+
+        key = (self._slotSignature(), self.graphSignature(graph))
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = LayoutProcessorConfiguration(**{
+                slot: list(getattr(self, slot) or ())
+                for slot in self.SLOT_NAMES})
+            plan._addIntermediateProcessors(graph, list(plan.iterProcessors()), set())
+            for slot in self.SLOT_NAMES:
+                procs = getattr(plan, slot)
+                if len(procs) > 1:
+                    setattr(plan, slot, self._sortBySameSlotDependencies(procs))
+            plan.loaded = True
+            self._plans[key] = plan
+
+        return plan
+
+    def _addIntermediateProcessors(self, graph: LGraph, processors, seen: set):
+        for proc in processors:
+            if id(proc) in seen:
+                continue
+            seen.add(id(proc))
+            subConfig = proc.getLayoutProcessorConfiguration(graph)
+            if not subConfig:
+                continue
+
+            added = []
+            for slot in self.SLOT_NAMES:
+                procs = getattr(self, slot)
+                for p in getattr(subConfig, slot) or ():
+                    t = p.__class__
+                    if not any(p2.__class__ is t for p2 in procs):
+                        procs.append(p)
+                        added.append(p)
+
+            self._addIntermediateProcessors(graph, added, seen)
+
+    @staticmethod
+    def _sortBySameSlotDependencies(processors: list) -> list:
+        """
+        Stable topological sort, the processor is moved behind the processors
+        of classes from its SAME_SLOT_DEPENDENCIES
+        """
+        res = []
+        done = set()
+        inProgress = set()
+
+        def place(proc):
+            if id(proc) in done:
+                return
+            elif id(proc) in inProgress:
+                raise ValueError("Cyclic same-slot dependency", proc)
+            inProgress.add(id(proc))
+            deps = getattr(proc, "SAME_SLOT_DEPENDENCIES", ())
+            if deps:
+                for p in processors:
+                    if p is not proc and isinstance(p, deps):
+                        place(p)
+            inProgress.discard(id(proc))
+            done.add(id(proc))
+            res.append(proc)
+
+        for proc in processors:
+            place(proc)
+
+        return res
 
     def load(self, graph: LGraph):
-        """Load nestested sub processors"""
+        """
+        Load nestested sub processors (in place variant of compile())
+        """
         assert not self.loaded
-        for proc in self.iterProcessors():
-            subConfig = proc.getLayoutProcessorConfiguration(graph)
-            if subConfig:
-                subConfig.load(graph)
-                self.merge(subConfig)
+        plan = self.compile(graph)
+        for slot in self.SLOT_NAMES:
+            procs = getattr(plan, slot)
+            setattr(self, slot, procs[:] if procs else getattr(self, slot))
 
         self.loaded = True
 
@@ -3,6 +3,7 @@ from layeredGraphLayouter.containers.lGraph import LGraph
 from math import inf
 from layeredGraphLayouter.containers.lPort import LPort
 from layeredGraphLayouter.containers.lNode import LNode
+from layeredGraphLayouter.containers.spacings import NODE_TYPE_CNT
 from _collections import defaultdict
 
 
@@ -130,9 +131,9 @@ class BKAlignedLayout():
     def calculateDelta(self, src: LPort, tgt: LPort):
         y = self.y
         innerShift = self.innerShift
-        srcPos = (y[src.getNode()] + innerShift[src.getNode()]
+        srcPos = (y[src.node] + innerShift[src.node]
                   + src.getPosition().y + src.getAnchor().y)
-        tgtPos = (y[tgt.getNode()] + innerShift[tgt.getNode()]
+        tgtPos = (y[tgt.node] + innerShift[tgt.node]
                   + tgt.getPosition().y + tgt.getAnchor().y)
         return tgtPos - srcPos
 
@@ -177,7 +178,7 @@ class BKAlignedLayout():
         getMinY = self.getMinY
         getMaxY = self.getMaxY
         getUpperNeighbor = self.getUpperNeighbor
-        spacings = self.spacings
+        verticalSpacings = self.spacings.vertical
 
         while True:
             current = align[current]
@@ -185,14 +186,15 @@ class BKAlignedLayout():
             minYCurrent = getMinY(current)
 
             neighbor = getUpperNeighbor(
-                current, current.getIndex())  # FIXME getindex SLOW
+                current, current.getIndex())
             if neighbor is not None:
                 maxYNeighbor = getMaxY(neighbor)
                 # minimal position at which the current block node could
                 # validly be placed
+                spacing = verticalSpacings[
+                    current.type.value * NODE_TYPE_CNT + neighbor.type.value]
                 availableSpace = min(availableSpace,
-                                     minYCurrent
-                                     - (maxYNeighbor + spacings.getVerticalSpacing(current, neighbor)))
+                                     minYCurrent - (maxYNeighbor + spacing))
             # until we wrap around
             if rootNode == current:
                 break
@@ -220,7 +222,7 @@ class BKAlignedLayout():
         getMinY = self.getMinY
         getMaxY = self.getMaxY
         getLowerNeighbor = self.getLowerNeighbor
-        spacings = self.spacings
+        verticalSpacings = self.spacings.vertical
 
         while True:
             current = align[current]
@@ -229,15 +231,16 @@ class BKAlignedLayout():
 
             # get the lower neighbor and check its position allows shifting
             neighbor = getLowerNeighbor(
-                current, current.getIndex())  # FIXME getindex SLOW
+                current, current.getIndex())
             if neighbor is not None:
                 minYNeighbor = getMinY(neighbor)
 
                 # minimal position at which the current block node could
                 # validly be placed
+                spacing = verticalSpacings[
+                    current.type.value * NODE_TYPE_CNT + neighbor.type.value]
                 availableSpace = min(availableSpace,
-                                     minYNeighbor
-                                     - (maxYCurrent + spacings.getVerticalSpacing(current, neighbor)))
+                                     minYNeighbor - (maxYCurrent + spacing))
             # until we wrap around
             if rootNode == current:
                 break
@@ -97,14 +97,14 @@ class BKAligner():
 
                                 # Again, getEdge won't return null because the neighbor relationship
                                 # ensures that at least one edge exists
-                                if u_m_edge not in markedEdges and r > ni.nodeIndex[u_m]:
+                                if u_m_edge not in markedEdges and r > u_m.getIndex():
                                     bal.align[u_m] = v_i_k
                                     bal.root[v_i_k] = bal.root[u_m]
                                     bal.align[v_i_k] = bal.root[v_i_k]
                                     bal.od[bal.root[v_i_k]
                                            ] &= v_i_k.type == NodeType.LONG_EDGE
 
-                                    r = ni.nodeIndex[u_m]
+                                    r = u_m.getIndex()
                     else:
                         # Check, whether vik can be added to a block of its
                         # upper/lower neighbor(s)
@@ -112,13 +112,13 @@ class BKAligner():
                             if bal.align[v_i_k] == v_i_k:
                                 um, um_edge = neighbors[m]
 
-                                if um_edge not in markedEdges and r < ni.nodeIndex[um]:
+                                if um_edge not in markedEdges and r < um.getIndex():
                                     bal.align[um] = v_i_k
                                     bal.root[v_i_k] = bal.root[um]
                                     bal.align[v_i_k] = bal.root[v_i_k]
                                     _k = bal.root[v_i_k]
                                     bal.od[_k] &= v_i_k.type == NodeType.LONG_EDGE
-                                    r = ni.nodeIndex[um]
+                                    r = um.getIndex()
 
     """
      * This phase moves the nodes inside a block, ensuring that all edges inside a block can be drawn
@@ -6,6 +6,7 @@ from layeredGraphLayouter.containers.lNode import LNode
 from _collections import deque
 from layeredGraphLayouter.containers.lGraph import LGraph
 from layeredGraphLayouter.containers.constants import EdgeStraighteningStrategy
+from layeredGraphLayouter.containers.spacings import NODE_TYPE_CNT
 from layeredGraphLayouter.p4NodePlacerBK.tresholdStrategy import SimpleThresholdStrategy,\
     NullThresholdStrategy
 
@@ -180,11 +181,12 @@ class BKCompactor():
         placeBlock = self.placeBlock
         ni = self.ni
         threshStrategy = self.threshStrategy
-        spacings = self.spacings
+        # vertical spacing between node types t0, t1 is at [t0 * NODE_TYPE_CNT + t1]
+        verticalSpacings = self.spacings.vertical
         getOrCreateClassNode = self.getOrCreateClassNode
         layeredGraph = self.layeredGraph
         while True:
-            currentIndexInLayer = ni.nodeIndex[currentNode]
+            currentIndexInLayer = currentNode.getIndex()
             currentLayerSize = len(currentNode.layer)
 
             # If the node is the top or bottom node of its layer, it can be placed safely since it is
@@ -219,8 +221,8 @@ class BKCompactor():
                     # They are part of the same class
                     # The minimal spacing between the two nodes depends on
                     # their node type
-                    spacing = spacings.getVerticalSpacing(
-                        currentNode, neighbor)
+                    spacing = verticalSpacings[
+                        currentNode.type.value * NODE_TYPE_CNT + neighbor.type.value]
                     # Determine the block's position
                     if (bal.vdir == VDirection.UP):
                         currentBlockPosition = bal.y[root]
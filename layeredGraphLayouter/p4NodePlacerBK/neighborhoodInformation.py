@@ -14,8 +14,6 @@ class NeighborhoodInformation():
         self.nodeCount = 0
         """ For a layer l the entry at layerIndex[l.id] holds the index of layer l."""
         self.layerIndex = {}
-        """ For a node n the entry at nodeIndex[n.id] holds the index of n in its layer."""
-        self.nodeIndex = {}
         """
          * For a node n holds leftNeighbors.get(n.id) holds a list with all left neighbors along with
          * any edge that connects n to its neighbor.
@@ -25,14 +23,13 @@ class NeighborhoodInformation():
         self.rightNeighbors = {}
 
     def neighborSortKey(self, neighborPair):
-        return self.nodeIndex[neighborPair[0]]
+        return neighborPair[0].getIndex()
 
     def cleanup(self):
         """
          * Release allocated resources.
         """
         self.layerIndex = None
-        self.nodeIndex = None
         self.leftNeighbors.clear()
         self.rightNeighbors.clear()
 
@@ -55,13 +52,11 @@ class NeighborhoodInformation():
         for layer in graph.layers:
             ni.nodeCount += len(layer)
 
-        # cache indexes of layers and of nodes
+        # cache indexes of layers
+        # (index of node is maintained by its layer, LNode.getIndex())
         ni.layerIndex = {}
-        ni.nodeIndex = {}
         for lIndex, layer in enumerate(graph.layers):
             ni.layerIndex[layer] = lIndex
-            for nIndex, n in enumerate(layer):
-                ni.nodeIndex[n] = nIndex
 
         # determine all left and right neighbors of the graph's nodes
         ni.leftNeighbors = {}
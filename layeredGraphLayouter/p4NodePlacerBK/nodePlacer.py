@@ -15,6 +15,7 @@ from layeredGraphLayouter.p4NodePlacerBK.alignedLayout import BKAlignedLayout,\
 from layeredGraphLayouter.p4NodePlacerBK.neighborhoodInformation import NeighborhoodInformation
 from layeredGraphLayouter.p4NodePlacerBK.aligner import BKAligner
 from layeredGraphLayouter.p4NodePlacerBK.compactor import BKCompactor
+from layeredGraphLayouter.trace import span
 
 
 class BKNodePlacer(ILayoutProcessor):
@@ -169,21 +170,23 @@ class BKNodePlacer(ILayoutProcessor):
 
         aligner = BKAligner(layeredGraph, ni)
         for bal in layouts:
-            # Phase which determines the nodes' memberships in blocks. This happens in four different
-            # ways, either from processing the nodes from the first layer to
-            # the last or vice versa.
-            aligner.verticalAlignment(bal, markedEdges)
+            with span("alignment", "bk", {"vdir": bal.vdir.name, "hdir": bal.hdir.name}):
+                # Phase which determines the nodes' memberships in blocks. This happens in four different
+                # ways, either from processing the nodes from the first layer to
+                # the last or vice versa.
+                aligner.verticalAlignment(bal, markedEdges)
 
-            # Additional phase which is not included in the original Brandes-Koepf Algorithm.
-            # It makes sure that the connected ports within a block are aligned to avoid unnecessary
-            # bend points. Also, the required size of each block is determined.
-            aligner.insideBlockShift(bal)
+                # Additional phase which is not included in the original Brandes-Koepf Algorithm.
+                # It makes sure that the connected ports within a block are aligned to avoid unnecessary
+                # bend points. Also, the required size of each block is determined.
+                aligner.insideBlockShift(bal)
 
         compacter = BKCompactor(layeredGraph, ni)
         for bal in layouts:
-            # This phase determines the y coordinates of the blocks and thus the vertical coordinates
-            # of all nodes.
-            compacter.horizontalCompaction(bal)
+            with span("compaction", "bk", {"vdir": bal.vdir.name, "hdir": bal.hdir.name}):
+                # This phase determines the y coordinates of the blocks and thus the vertical coordinates
+                # of all nodes.
+                compacter.horizontalCompaction(bal)
 
         # Debug output
         if self.debugMode:
@@ -298,14 +301,14 @@ class BKNodePlacer(ILayoutProcessor):
                 if l_1 == ((layerSize[i + 1]) - 1) or incidentToInnerSegment(v_l_i, i + 1, i):
                     k_1 = layerSize[i] - 1
                     if incidentToInnerSegment(v_l_i, i + 1, i):
-                        k_1 = ni.nodeIndex[ni.leftNeighbors[v_l_i][0][0]]
+                        k_1 = ni.leftNeighbors[v_l_i][0][0].getIndex()
 
                     while la <= l_1:
                         v_l = currentLayer[la]
 
                         if not incidentToInnerSegment(v_l, i + 1, i):
                             for upperNeighborNode, upperNeighborEdge in ni.leftNeighbors[v_l]:
-                                k = ni.nodeIndex[upperNeighborNode]
+                                k = upperNeighborNode.getIndex()
 
                                 if k < k_0 or k > k_1:
                                     # Marked edge can't return None here, because the upper neighbor
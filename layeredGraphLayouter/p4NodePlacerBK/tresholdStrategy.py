@@ -251,13 +251,13 @@ class SimpleThresholdStrategy(AbstractThresholdStrategy):
                 rootPort = right if bal.hdir == HDirection.RIGHT else left
                 otherPort = left if bal.hdir == HDirection.RIGHT else right
 
-                otherRoot = bal.root[otherPort.getNode()]
+                otherRoot = bal.root[otherPort.node]
                 threshold = (bal.y[otherRoot]
-                             + bal.innerShift[otherPort.getNode()]
+                             + bal.innerShift[otherPort.node]
                              + otherPort.getPosition().y
                              + otherPort.getAnchor().y
                              # root node
-                             - bal.innerShift[rootPort.getNode()]
+                             - bal.innerShift[rootPort.node]
                              - rootPort.getPosition().y
                              - rootPort.getAnchor().y)
             else:
@@ -265,19 +265,19 @@ class SimpleThresholdStrategy(AbstractThresholdStrategy):
                 rootPort = right if bal.hdir == HDirection.LEFT else left
                 otherPort = left if bal.hdir == HDirection.LEFT else right
 
-                threshold = (bal.y[bal.root[otherPort.getNode()]]
-                             + bal.innerShift[otherPort.getNode()]
+                threshold = (bal.y[bal.root[otherPort.node]]
+                             + bal.innerShift[otherPort.node]
                              + otherPort.getPosition().y
                              + otherPort.getAnchor().y
                              # root node
-                             - bal.innerShift[rootPort.getNode()]
+                             - bal.innerShift[rootPort.node]
                              - rootPort.getPosition().y
                              - rootPort.getAnchor().y)
 
             # we are not allowed to move this block anymore
             # in order to straighten another edge
-            bal.su[bal.root[left.getNode()]] = True
-            bal.su[bal.root[right.getNode()]] = True
+            bal.su[bal.root[left.node]] = True
+            bal.su[bal.root[right.node]] = True
 
             return threshold
 
@@ -337,18 +337,18 @@ class SimpleThresholdStrategy(AbstractThresholdStrategy):
 
         if (delta > 0 and delta < self.THRESHOLD):
             # target y larger than source y --> shift upwards?
-            availableSpace = bal.checkSpaceAbove(block.getNode(), delta)
+            availableSpace = bal.checkSpaceAbove(block.node, delta)
             assert isclose(availableSpace, 0,
                            rel_tol=0, abs_tol=self.EPSILON) or availableSpace >= 0
-            bal.shiftBlock(block.getNode(), -availableSpace)
+            bal.shiftBlock(block.node, -availableSpace)
             return availableSpace > 0
         elif delta < 0 and -delta < self.THRESHOLD:
             # direction is up, we possibly shifted some blocks too far upward
             # for an edge to be straight, so check if we can shift down again
-            availableSpace = bal.checkSpaceBelow(block.getNode(), -delta)
+            availableSpace = bal.checkSpaceBelow(block.node, -delta)
             assert isclose(availableSpace, 0,
                            rel_tol=0, abs_tol=self.EPSILON) or availableSpace >= 0
-            bal.shiftBlock(block.getNode(), availableSpace)
+            bal.shiftBlock(block.node, availableSpace)
             return availableSpace > 0
 
         return False
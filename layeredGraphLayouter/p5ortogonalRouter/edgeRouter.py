@@ -1,8 +1,12 @@
 from layeredGraphLayouter.iLayoutProcessor import ILayoutProcessor
 from layeredGraphLayouter.p5ortogonalRouter.routingGenerator import OrthogonalRoutingGenerator,\
     RoutingDirection
+from layeredGraphLayouter.containers.constants import NodeType
 from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.spacings import NODE_TYPE_CNT
+from layeredGraphLayouter.edgeManipulators.hyperedgeDummyMerger import HyperedgeDummyMerger
 from layeredGraphLayouter.layoutProcessorConfiguration import LayoutProcessorConfiguration
+from layeredGraphLayouter.trace import span
 
 
 class OrthogonalEdgeRouter(ILayoutProcessor):
@@ -48,10 +52,10 @@ class OrthogonalEdgeRouter(ILayoutProcessor):
       - For center edge labels:
         - LABEL_DUMMY_SWITCHER
 
-    Before phase 4:
       - For hyperedges:
-        - HYPEREDGE_DUMMY_MERGER
+        - HyperedgeDummyMerger
 
+    Before phase 4:
       - For hierarchical ports:
         - HIERARCHICAL_PORT_DUMMY_SIZE_PROCESSOR
 
@@ -92,7 +96,7 @@ class OrthogonalEdgeRouter(ILayoutProcessor):
         if graph.p_hyperedges:
             # additional processor dependencies for graphs with hyperedges.
             HYPEREDGE_PROCESSING_ADDITIONS = LayoutProcessorConfiguration(
-                p4_node_placement_before=[HYPEREDGE_DUMMY_MERGER()])
+                p3_node_ordering_before=[HyperedgeDummyMerger()])
             configuration.addAll(HYPEREDGE_PROCESSING_ADDITIONS)
             configuration.addAll(INVERTED_PORT_PROCESSING_ADDITIONS)
 
@@ -148,10 +152,13 @@ class OrthogonalEdgeRouter(ILayoutProcessor):
 
     def process(self, layeredGraph: LGraph):
         # Retrieve some generic values
-        spacings = layeredGraph.spacings
-        nodeNodeSpacing = layeredGraph.spacingNodeNodeBetweenLayers
-        edgeEdgeSpacing = layeredGraph.spacingEdgeEdgeBetweenLayers
-        edgeNodeSpacing = layeredGraph.spacingEdgeNodeBetweenLayers
+        # spacing between layers for node types t0, t1 is at [t0 * NODE_TYPE_CNT + t1]
+        horizontalSpacings = layeredGraph.spacings.horizontal
+        normal = NodeType.NORMAL.value
+        longEdge = NodeType.LONG_EDGE.value
+        nodeNodeSpacing = horizontalSpacings[normal * NODE_TYPE_CNT + normal]
+        edgeEdgeSpacing = horizontalSpacings[longEdge * NODE_TYPE_CNT + longEdge]
+        edgeNodeSpacing = horizontalSpacings[normal * NODE_TYPE_CNT + longEdge]
         debug = layeredGraph.debugMode
 
         # Prepare for iterationnot
@@ -180,8 +187,9 @@ class OrthogonalEdgeRouter(ILayoutProcessor):
 
             # Route edges between the two layers
             startPos = xpos if leftLayer is None else xpos + edgeNodeSpacing
-            slotsCount = routingGenerator.routeEdges(layeredGraph, leftLayerNodes, leftLayerIndex,
-                                                     rightLayerNodes, startPos)
+            with span("routeEdges", "routing", {"leftLayer": leftLayerIndex}):
+                slotsCount = routingGenerator.routeEdges(layeredGraph, leftLayerNodes, leftLayerIndex,
+                                                         rightLayerNodes, startPos)
 
             isLeftLayerExternal = leftLayer is None or Iterables.all(leftLayerNodes,
                                                                      PolylineEdgeRouter.PRED_EXTERNAL_WEST_OR_EAST_PORT)
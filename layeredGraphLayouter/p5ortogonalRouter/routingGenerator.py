@@ -91,9 +91,9 @@ class HyperNode():
     def __repr__(self):
         buff = []
         for port in self.ports:
-            name = port.getNode().name
+            name = port.node.name
             if (name is None):
-                name = "n" + port.getNode().getIndex()
+                name = "n%d" % port.node.getIndex()
 
             buff.append(name)
 
@@ -711,7 +711,7 @@ class WestToEastRoutingStrategy():
 
     @staticmethod
     def getPortPositionOnHyperNode(port: LPort) -> float:
-        return (port.getNode().getPosition().y
+        return (port.node.getPosition().y
                 + port.getPosition().y
                 + port.getAnchor().y)
 
@@ -750,7 +750,7 @@ class NorthToSouthRoutingStrategy():
     """
     @staticmethod
     def getPortPositionOnHyperNode(port: LPort):
-        return (port.getNode().getPosition().x +
+        return (port.node.getPosition().x +
                 port.getPosition().x +
                 port.getAnchor().x)
 
@@ -791,7 +791,7 @@ class SouthToNorthRoutingStrategy():
     """
     @staticmethod
     def getPortPositionOnHyperNode(port: LPort):
-        return (port.getNode().getPosition().x
+        return (port.node.getPosition().x
                 + port.getPosition().x
                 + port.getAnchor().x)
 
@@ -115,7 +115,7 @@ class InvertedPortProcessor(ILayoutProcessor):
     """
     def createEastPortSideDummies(self, layeredGraph: LGraph, eastwardPort: LPort,
             edge: LEdge, layerNodeList: List[LNode]):
-        if (edge.srcNode == eastwardPort.getNode()):
+        if (edge.srcNode == eastwardPort.node):
             return
 
         # Dummy node in the same layer
@@ -173,7 +173,7 @@ class InvertedPortProcessor(ILayoutProcessor):
     def createWestPortSideDummies(self, layeredGraph: LGraph, westwardPort: LPort,
             edge: LEdge, layerNodeList: List[LNode]):
 
-        if (edge.dstNode == westwardPort.getNode()):
+        if (edge.dstNode == westwardPort.node):
             return
 
         # Dummy node in the same layer
@@ -221,11 +221,11 @@ class InvertedPortProcessor(ILayoutProcessor):
 
         # There's exactly one edge connected to the input and output port
         sourcePort = dummyInputPort.incomingEdges[0].src
-        sourceNode = sourcePort.getNode()
+        sourceNode = sourcePort.node
         sourceNodeType = sourceNode.type
 
         targetPort = dummyOutputPort.outgoingEdges[0].dst
-        targetNode = targetPort.getNode()
+        targetNode = targetPort.node
         targetNodeType = targetNode.type
 
         # Set the LONG_EDGE_SOURCE property
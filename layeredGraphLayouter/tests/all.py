@@ -3,26 +3,72 @@
 
 import unittest
 
+from layeredGraphLayouter.tests.benchmarks_test import BenchmarksTC
 from layeredGraphLayouter.tests.crossing.abstractBarycenterPortDistributor_test import AbstractBarycenterPortDistributorTC
 from layeredGraphLayouter.tests.crossing.barycenterHeuristic_test import BarycenterHeuristicTC
 from layeredGraphLayouter.tests.crossing.binaryIndexedTree_test import BinaryIndexedTreeTC
 from layeredGraphLayouter.tests.crossing.crossingCounter_test import CrossingsCounterTC
+from layeredGraphLayouter.tests.crossing.forsterConstraintResolver_test import ForsterConstraintResolverTC
+from layeredGraphLayouter.tests.crossing.greedySwitchHeuristic_test import GreedySwitchHeuristicTC
 from layeredGraphLayouter.tests.crossing.layerSweepCrossingMinimizer_test import LayerSweepCrossingMinimizerTC
+from layeredGraphLayouter.tests.crossing.nodeRelativePortDistributor_test import NodeRelativePortDistributorTC
+from layeredGraphLayouter.tests.crossing.sweepCopy_test import SweepCopyTC
 from layeredGraphLayouter.tests.cycleBreaker_test import CycleBreakerTC
+from layeredGraphLayouter.tests.edgeList_test import EdgeListTC
+from layeredGraphLayouter.tests.edgeManipulators.hyperedgeDummyMerger_test import HyperedgeDummyMergerTC
 from layeredGraphLayouter.tests.edgeManipulators.longEdgeSplitter_test import LongEdgeSplitterTC
+from layeredGraphLayouter.tests.fromYosysJson_test import FromYosysJsonTC
+from layeredGraphLayouter.tests.geometryStore_test import GeometryStoreTC
+from layeredGraphLayouter.tests.incrementalLayout_test import IncrementalLayoutTC
 from layeredGraphLayouter.tests.layer_test import LayerTC
+from layeredGraphLayouter.tests.layoutCheckpoints_test import LayoutCheckpointsTC
+from layeredGraphLayouter.tests.layoutProcessorConfiguration_test import LayoutProcessorConfigurationTC
+from layeredGraphLayouter.tests.lGraphBulkBuilder_test import LGraphBulkBuilderTC
+from layeredGraphLayouter.tests.lGraphCodec_test import LGraphCodecTC
+from layeredGraphLayouter.tests.lPort_test import LPortTC
+from layeredGraphLayouter.tests.spacings_test import SpacingsTC
+from layeredGraphLayouter.tests.toJson_test import ToJsonTC
+from layeredGraphLayouter.tests.toLayoutBinary_test import ToLayoutBinaryTC
+from layeredGraphLayouter.tests.toMxGraphStream_test import ToMxGraphStreamTC
+from layeredGraphLayouter.tests.toSvgStream_test import ToSvgStreamTC
+from layeredGraphLayouter.tests.toSvgTiles_test import ToSvgTilesTC
+from layeredGraphLayouter.tests.trace_test import TraceTC
 
 
 TCS = [
     CycleBreakerTC,
     LayerTC,
+    LPortTC,
+    LGraphBulkBuilderTC,
+    LGraphCodecTC,
+    EdgeListTC,
+    GeometryStoreTC,
+    SpacingsTC,
+    FromYosysJsonTC,
 
     BinaryIndexedTreeTC,
     AbstractBarycenterPortDistributorTC,
     BarycenterHeuristicTC,
     CrossingsCounterTC,
+    ForsterConstraintResolverTC,
     LongEdgeSplitterTC,
+    HyperedgeDummyMergerTC,
+    GreedySwitchHeuristicTC,
     LayerSweepCrossingMinimizerTC,
+    NodeRelativePortDistributorTC,
+    SweepCopyTC,
+    IncrementalLayoutTC,
+    LayoutCheckpointsTC,
+    LayoutProcessorConfigurationTC,
+
+    ToSvgStreamTC,
+    ToMxGraphStreamTC,
+    ToLayoutBinaryTC,
+    ToJsonTC,
+    ToSvgTilesTC,
+
+    BenchmarksTC,
+    TraceTC,
 ]
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+import unittest
+
+from layeredGraphLayouter.benchmarks.generators import GENERATORS,\
+    multiLevelHierarchy
+from layeredGraphLayouter.benchmarks.runner import BenchmarkRunner,\
+    compareWithBaseline, defaultConfig, iterGraphsBottomUp
+from layeredGraphLayouter.iLayoutProcessor import ILayoutProcessor
+
+
+def countNodes(graph):
+    return sum(len(g.nodes) for g in iterGraphsBottomUp(graph))
+
+
+def edgeDescription(graph):
+    return [(e.srcNode.name, e.dstNode.name) for e in graph.edges]
+
+
+class BenchmarksTC(unittest.TestCase):
+
+    def test_generators_deterministic(self):
+        for name, gen in GENERATORS.items():
+            a = gen(60, 3)
+            b = gen(60, 3)
+            self.assertEqual(countNodes(a), 60, name)
+            self.assertEqual(edgeDescription(a), edgeDescription(b), name)
+
+    def test_hierarchy_bottomUp(self):
+        g = multiLevelHierarchy(1000, 0)
+        graphs = list(iterGraphsBottomUp(g))
+        self.assertGreater(len(graphs), 1)
+        self.assertIs(graphs[-1], g)
+        seen = set()
+        for sub in graphs:
+            for n in sub.nodes:
+                if n.nestedLgraph is not None:
+                    self.assertIn(id(n.nestedLgraph), seen)
+            seen.add(id(sub))
+
+    def test_runner(self):
+        r = BenchmarkRunner()
+        res = r.run(["randomDag", "multiLevelHierarchy"], [30], seed=1)
+        self.assertEqual(set(res.keys()),
+                         {"randomDag/30", "multiLevelHierarchy/30"})
+        for case in res.values():
+            self.assertIsNone(case["error"])
+            self.assertGreater(case["peakMemory"], 0)
+            self.assertIn("p1_cycle_breaking:GreedyCycleBreaker", case["processors"])
+            self.assertIn("p2_layering", case["phases"])
+            self.assertAlmostEqual(sum(case["processors"].values()),
+                                   sum(v for k, v in case["phases"].items()
+                                       if k != "load"))
+
+        self.assertEqual(compareWithBaseline(res, res), [])
+
+    def test_runner_error(self):
+        class FailingProcessor(ILayoutProcessor):
+            def process(self, graph):
+                raise ValueError("failed")
+
+        def config():
+            c = defaultConfig()
+            c.p2_layering_after = [FailingProcessor()]
+            return c
+
+        res = BenchmarkRunner(config).runCase("randomDag", 20)
+        self.assertEqual(res["error"], "ValueError: failed")
+        self.assertIsNone(res["peakMemory"])
+        self.assertIn("p1_cycle_breaking", res["phases"])
+
+    def test_compareWithBaseline(self):
+        base = {"a/10": {"error": None, "total": 1.0, "peakMemory": 1000,
+                         "processors": {"p1:X": 0.5, "p1:Y": 0.001}}}
+
+        def cur(total=1.0, x=0.5, y=0.001, mem=1000, error=None):
+            return {"a/10": {"error": error, "total": total, "peakMemory": mem,
+                             "processors": {"p1:X": x, "p1:Y": y}}}
+
+        self.assertEqual(compareWithBaseline(cur(total=1.2, x=0.6), base), [])
+        # tiny absolute difference is tolerated
+        self.assertEqual(compareWithBaseline(cur(y=0.004), base), [])
+        self.assertEqual(len(compareWithBaseline(cur(total=1.3), base)), 1)
+        self.assertEqual(len(compareWithBaseline(cur(x=0.7), base)), 1)
+        self.assertEqual(len(compareWithBaseline(cur(mem=1200), base)), 1)
+        self.assertEqual(compareWithBaseline(cur(mem=1200), base,
+                                             memoryTolerance=0.5), [])
+        self.assertEqual(len(compareWithBaseline(cur(error="E"), base)), 1)
+        self.assertEqual(compareWithBaseline({"b/10": cur()["a/10"]}, base), [])
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(BenchmarksTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
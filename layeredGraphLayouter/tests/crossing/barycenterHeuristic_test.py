@@ -1,8 +1,10 @@
 from collections import defaultdict
+from random import Random
 import unittest
 
 from layeredGraphLayouter.containers.constants import PortType, PortSide
 from layeredGraphLayouter.containers.lGraph import LNodeLayer
+from layeredGraphLayouter.crossing import barycenterHeuristic
 from layeredGraphLayouter.crossing.barycenterHeuristic import BarycenterHeuristic
 from layeredGraphLayouter.crossing.forsterConstraintResolver import ForsterConstraintResolver
 from layeredGraphLayouter.crossing.nodeRelativePortDistributor import NodeRelativePortDistributor
@@ -216,6 +218,56 @@ class BarycenterHeuristicTC(unittest.TestCase):
 
         self.assertSequenceEqual(layers[1], expectedOrder)
 
+    def createWideTwoLayerGraph(self, nodeCnt):
+        gb = self.gb
+        leftNodes = gb.addNodesToLayer(nodeCnt, gb.makeLayer())
+        rightNodes = gb.addNodesToLayer(nodeCnt, gb.makeLayer())
+        for i, n in enumerate(leftNodes):
+            gb.eastWestEdgeFromTo(n, rightNodes[(i * 7) % nodeCnt])
+            if i % 3 == 0:
+                gb.eastWestEdgeFromTo(n, rightNodes[(i * 5 + 1) % nodeCnt])
+        # node without any edge
+        gb.addNodeToLayer(gb.graph.layers[1])
+        return gb.graph.layers
+
+    def minimizeCrossingsWithBatch(self, layers, batch: bool):
+        gb = self.gb
+        portDist = NodeRelativePortDistributor(gb.random, gb.graph)
+        constraintResolver = ForsterConstraintResolver(layers)
+        portDist.calculatePortRanks_many(layers[0], PortType.OUTPUT)
+        crossMin = BarycenterHeuristic(
+            constraintResolver, Random(0), portDist, layers)
+        crossMin.BATCH_MIN_LAYER_SIZE = 1 if batch else len(layers[1]) + 1
+
+        nodes = list(layers[1])
+        self.assertEqual(crossMin.calculateBarycentersBatch(nodes, True), batch)
+        crossMin.random = Random(0)
+        crossMin.minimizeCrossingsInLayer(nodes, False, False, True)
+        barycenters = [crossMin.states[n].barycenter for n in nodes]
+        return nodes, barycenters
+
+    @unittest.skipIf(barycenterHeuristic.np is None, "numpy not available")
+    def test_batchBarycenters_sameAsRecursive(self):
+        layers = self.createWideTwoLayerGraph(24)
+        expectedOrder, expectedBarycenters = self.minimizeCrossingsWithBatch(
+            layers, False)
+        order, barycenters = self.minimizeCrossingsWithBatch(layers, True)
+
+        self.assertSequenceEqual(order, expectedOrder)
+        self.assertSequenceEqual(barycenters, expectedBarycenters)
+
+    @unittest.skipIf(barycenterHeuristic.np is None, "numpy not available")
+    def test_batchBarycenters_fallbackForInLayerEdges(self):
+        layers = self.createWideTwoLayerGraph(24)
+        self.gb.addInLayerEdge(layers[1][0], layers[1][2], PortSide.WEST)
+        portDist = NodeRelativePortDistributor(self.gb.random, self.gb.graph)
+        crossMin = BarycenterHeuristic(
+            ForsterConstraintResolver(layers), self.random, portDist, layers)
+        portDist.calculatePortRanks_many(layers[0], PortType.OUTPUT)
+        crossMin.BATCH_MIN_LAYER_SIZE = 1
+
+        self.assertFalse(crossMin.calculateBarycentersBatch(list(layers[1]), True))
+
     def minimizeCrossings(self, crossMin: BarycenterHeuristic, layer: LNodeLayer,
                           preOrdered: bool, randomized: bool, forward: bool):
         """
@@ -4,6 +4,7 @@ import unittest
 
 from layeredGraphLayouter.containers.constants import PortSide
 from layeredGraphLayouter.containers.lPort import LPort
+from layeredGraphLayouter.crossing.compressedEdges import CompressedEdges
 from layeredGraphLayouter.crossing.crossingCounter import CrossingsCounter
 from layeredGraphLayouter.crossing.graphInfoHolder import GraphInfoHolder
 from layeredGraphLayouter.tests.inLayerEdgeTestGraphCreator import InLayerEdgeTestGraphCreator
@@ -324,6 +325,67 @@ class CrossingsCounterTC(unittest.TestCase):
         )
         self.assertEqual(crossings[0], 1)
 
+    def test_countCrossingsBetweenLayers_parallelEdgeBundles(self):
+        """
+        *===  *
+            \\//
+            //\\
+        *===  *
+
+        (3 parallel edges crossing 2 parallel edges)
+        """
+        gb = self.gb
+        order = self.order
+        left = gb.addNodesToLayer(2, gb.makeLayer())
+        right = gb.addNodesToLayer(2, gb.makeLayer())
+        l0 = gb.addPortOnSide(left[0], PortSide.EAST)
+        l1 = gb.addPortOnSide(left[1], PortSide.EAST)
+        r0 = gb.addPortOnSide(right[0], PortSide.WEST)
+        r1 = gb.addPortOnSide(right[1], PortSide.WEST)
+        for _ in range(3):
+            gb.addEdgeBetweenPorts(l0, r1)
+        for _ in range(2):
+            gb.addEdgeBetweenPorts(l1, r0)
+
+        edges = CompressedEdges()
+        self.assertEqual(dict(edges.successors[l0]), {r1: 3})
+        self.assertEqual(dict(edges.neighbors[r0]), {l1: 2})
+
+        counter = CrossingsCounter(self.getInitPortOrder(), edges)
+        self.assertEqual(counter.countCrossingsBetweenLayers(
+            order()[0], order()[1]), 6)
+        self.assertEqual(counter.countCrossingsBetweenPortsInBothOrders(
+            r0, r1), (6, 0))
+
+    def test_countCrossingsBetweenLayers_parallelEdgesSameAsPairwise(self):
+        gb = self.gb
+        order = self.order
+        random = Random(0)
+        leftPorts = []
+        rightPorts = []
+        for n in gb.addNodesToLayer(6, gb.makeLayer()):
+            leftPorts.extend(gb.addPortsOnSide(2, n, PortSide.EAST))
+        for n in gb.addNodesToLayer(6, gb.makeLayer()):
+            rightPorts.extend(gb.addPortsOnSide(2, n, PortSide.WEST))
+        edges = []
+        for _ in range(20):
+            src = random.choice(leftPorts)
+            dst = random.choice(rightPorts)
+            for _ in range(random.randint(1, 4)):
+                gb.addEdgeBetweenPorts(src, dst)
+                edges.append((src, dst))
+
+        counter = CrossingsCounter(self.getInitPortOrder())
+        crossings = counter.countCrossingsBetweenLayers(order()[0], order()[1])
+        # (ports of the right layer are numbered counter clockwise)
+        pos = counter.portPositions
+        expected = 0
+        for i, (s0, d0) in enumerate(edges):
+            for s1, d1 in edges[i + 1:]:
+                if (pos[s0] - pos[s1]) * (pos[d0] - pos[d1]) > 0:
+                    expected += 1
+        self.assertEqual(crossings, expected)
+
     def makeTwoLayerRandomGraphWithNodesPerLayer(self, numNodes: int, edgesPerNode: int):
         gb = self.gb
         leftNodes = gb.addNodesToLayer(numNodes, gb.makeLayer())
@@ -0,0 +1,109 @@
+import unittest
+
+from layeredGraphLayouter.containers.constants import NodeType
+from layeredGraphLayouter.crossing.forsterConstraintResolver import ForsterConstraintResolver
+from layeredGraphLayouter.tests.testGraphCreator import TestGraphCreator
+
+
+class ForsterConstraintResolverTC(unittest.TestCase):
+    def setUp(self):
+        self.gb = TestGraphCreator()
+
+    def makeDummies(self, layer, amount):
+        nodes = self.gb.addNodesToLayer(amount, layer)
+        for n in nodes:
+            n.type = NodeType.NORTH_SOUTH_PORT
+        return nodes
+
+    def processConstraints(self, layer, barycenters):
+        resolver = ForsterConstraintResolver([layer])
+        for n, bc in zip(layer, barycenters):
+            resolver.states[n].barycenter = bc
+
+        nodes = sorted(layer, key=lambda n: resolver.states[n].barycenter)
+        resolver.processConstraints(nodes)
+        return resolver, nodes
+
+    def assertConstraintsSatisfied(self, resolver, nodes):
+        self.assertEqual(len(set(nodes)), len(nodes))
+        index = {n: i for i, n in enumerate(nodes)}
+        for n in nodes:
+            for succ in n.inLayerSuccessorConstraint:
+                self.assertLess(index[n], index[succ])
+
+        bcs = [resolver.states[n].barycenter for n in nodes]
+        self.assertSequenceEqual(bcs, sorted(bcs))
+
+    def test_noConstraints_keepsOrder(self):
+        layer = self.gb.makeLayer()
+        a, b, c = self.makeDummies(layer, 3)
+        _, nodes = self.processConstraints(layer, [2.0, 0.0, 1.0])
+        self.assertSequenceEqual(nodes, [b, c, a])
+
+    def test_violatedConstraint_mergesGroups(self):
+        layer = self.gb.makeLayer()
+        a, b, c = self.makeDummies(layer, 3)
+        # c has to be before a but has greater barycenter
+        c.inLayerSuccessorConstraint.append(a)
+        resolver, nodes = self.processConstraints(layer, [0.0, 1.5, 2.0])
+
+        # merged group (c, a) has barycenter 1.0 and goes before b
+        self.assertSequenceEqual(nodes, [c, a, b])
+        self.assertEqual(resolver.states[c].barycenter, 1.0)
+        self.assertEqual(resolver.states[a].barycenter, 1.0)
+        self.assertConstraintsSatisfied(resolver, nodes)
+
+    def test_chainOfViolatedConstraints(self):
+        layer = self.gb.makeLayer()
+        nodes = self.makeDummies(layer, 6)
+        # reverse chain of constraints, everything ends up in a single group
+        for n0, n1 in zip(nodes[1:], nodes):
+            n0.inLayerSuccessorConstraint.append(n1)
+
+        resolver, res = self.processConstraints(layer, range(6))
+        self.assertSequenceEqual(res, list(reversed(nodes)))
+        self.assertConstraintsSatisfied(resolver, res)
+
+    def test_violatedPredecessorsOnPath(self):
+        layer = self.gb.makeLayer()
+        a, x, b, c = self.makeDummies(layer, 4)
+        # a and x are both violated predecessors of b, merge of a and b
+        # would create a cycle through x
+        a.inLayerSuccessorConstraint.extend([x, b])
+        x.inLayerSuccessorConstraint.append(b)
+        resolver, nodes = self.processConstraints(layer, [1.0, 2.0, 0.0, 3.0])
+
+        self.assertSequenceEqual(nodes, [a, x, b, c])
+        self.assertConstraintsSatisfied(resolver, nodes)
+
+    def test_manyNorthSouthDummies(self):
+        layer = self.gb.makeLayer()
+        gb = self.gb
+        normals = gb.addNodesToLayer(3, layer)
+        dummies = self.makeDummies(layer, 60)
+        for i, d in enumerate(dummies):
+            owner = normals[i % len(normals)]
+            d.inLayerLayoutUnit = owner
+            if i % 2:
+                d.inLayerSuccessorConstraint.append(owner)
+            else:
+                owner.inLayerSuccessorConstraint.append(d)
+
+        barycenters = [10.0, 20.0, 30.0] + [
+            float((i * 7) % 41) for i in range(len(dummies))]
+        resolver, nodes = self.processConstraints(layer, barycenters)
+        self.assertEqual(len(nodes), len(layer))
+        self.assertConstraintsSatisfied(resolver, nodes)
+
+        # nodes of the layout units are not interleaved
+        index = {n: i for i, n in enumerate(nodes)}
+        for n0, n1 in zip(normals, normals[1:]):
+            self.assertLess(max(index[n] for n in layer if n.inLayerLayoutUnit is n0),
+                            min(index[n] for n in layer if n.inLayerLayoutUnit is n1))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(ForsterConstraintResolverTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
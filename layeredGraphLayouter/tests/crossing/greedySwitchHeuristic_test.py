@@ -0,0 +1,102 @@
+import unittest
+
+from layeredGraphLayouter.containers.constants import PortSide
+from layeredGraphLayouter.crossing.allCrossingsCounter import AllCrossingsCounter
+from layeredGraphLayouter.crossing.greedySwitchHeuristic import GreedySwitchHeuristic,\
+    countCrossingsBetweenNodesInBothOrders
+from layeredGraphLayouter.crossing.layerSweepCrossingMinimizer import LayerSweepCrossingMinimizer
+from layeredGraphLayouter.tests.testGraphCreator import TestGraphCreator
+
+
+class GreedySwitchHeuristicTC(unittest.TestCase):
+    def setUp(self):
+        self.gb = TestGraphCreator()
+
+    def countAllCrossings(self):
+        g = self.gb.graph
+        return AllCrossingsCounter(g).countAllCrossings(g.layers)
+
+    def test_countCrossingsBetweenNodesInBothOrders(self):
+        self.assertEqual(countCrossingsBetweenNodesInBothOrders([1], [0]), (1, 0))
+        self.assertEqual(countCrossingsBetweenNodesInBothOrders([0], [1]), (0, 1))
+        # edges to same port do not cross
+        self.assertEqual(countCrossingsBetweenNodesInBothOrders([1], [1]), (0, 0))
+        self.assertEqual(countCrossingsBetweenNodesInBothOrders(
+            [0, 2, 3], [1, 2]), (3, 2))
+
+    def test_simpleCross_isRemoved(self):
+        """
+        *  *
+         \/
+         /\
+        *  *
+        """
+        gb = self.gb
+        leftNodes = gb.addNodesToLayer(2, gb.makeLayer())
+        rightNodes = gb.addNodesToLayer(2, gb.makeLayer())
+        gb.eastWestEdgeFromTo(leftNodes[0], rightNodes[1])
+        gb.eastWestEdgeFromTo(leftNodes[1], rightNodes[0])
+
+        crossMin = LayerSweepCrossingMinimizer(GreedySwitchHeuristic)
+        crossMin.process(gb.graph)
+        self.assertEqual(self.countAllCrossings(), 0)
+
+    def test_inLayerSuccessorConstraint_preventsSwitch(self):
+        gb = self.gb
+        leftNodes = gb.addNodesToLayer(2, gb.makeLayer())
+        rightNodes = gb.addNodesToLayer(2, gb.makeLayer())
+        gb.eastWestEdgeFromTo(leftNodes[0], rightNodes[1])
+        gb.eastWestEdgeFromTo(leftNodes[1], rightNodes[0])
+        for layer in gb.graph.layers:
+            layer[0].inLayerSuccessorConstraint.append(layer[1])
+
+        crossMin = LayerSweepCrossingMinimizer(GreedySwitchHeuristic)
+        crossMin.process(gb.graph)
+        self.assertSequenceEqual(gb.graph.layers[0], leftNodes)
+        self.assertSequenceEqual(gb.graph.layers[1], rightNodes)
+
+    def test_neverIncreasesCrossings(self):
+        gb = self.gb
+        layers = [gb.addNodesToLayer(8, gb.makeLayer()) for _ in range(4)]
+        for li, (left, right) in enumerate(zip(layers, layers[1:])):
+            for i, n in enumerate(left):
+                gb.eastWestEdgeFromTo(n, right[(i * 5 + li) % len(right)])
+                if i % 2:
+                    gb.eastWestEdgeFromTo(n, right[(i * 3 + 1) % len(right)])
+        before = self.countAllCrossings()
+
+        crossMin = LayerSweepCrossingMinimizer(GreedySwitchHeuristic)
+        crossMin.process(gb.graph)
+
+        after = self.countAllCrossings()
+        self.assertLess(after, before)
+        for layer in gb.graph.layers:
+            for n in layer:
+                self.assertIs(n.layer, layer)
+
+    def test_inLayerEdges(self):
+        """
+        in-layer edge from the first to the third node on the west side
+        crosses the edge of the second node
+        """
+        gb = self.gb
+        leftNode = gb.addNodeToLayer(gb.makeLayer())
+        rightNodes = gb.addNodesToLayer(3, gb.makeLayer())
+        gb.setFixedOrderConstraint(rightNodes[0])
+        gb.eastWestEdgeFromTo(leftNode, rightNodes[0])
+        gb.addInLayerEdge(rightNodes[0], rightNodes[2], PortSide.WEST)
+        gb.eastWestEdgeFromTo(leftNode, rightNodes[1])
+
+        layers = gb.graph.layers
+        crossMin = GreedySwitchHeuristic(None, gb.random, None, layers)
+        self.assertTrue(crossMin.minimizeCrossings(layers, 1, True, False))
+        # the second node is not between the nodes connected by in-layer edge
+        order = layers[1]
+        self.assertEqual(abs(order.index(rightNodes[0]) - order.index(rightNodes[2])), 1)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(GreedySwitchHeuristicTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
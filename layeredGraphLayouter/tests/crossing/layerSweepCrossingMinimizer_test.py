@@ -1,10 +1,11 @@
 from typing import List
 import unittest
 
-from layeredGraphLayouter.containers.constants import PortSide
+from layeredGraphLayouter.containers.constants import PortSide, HierarchyHandling
 from layeredGraphLayouter.containers.lGraph import LGraph
 from layeredGraphLayouter.containers.lNode import LNode
 from layeredGraphLayouter.containers.lPort import LPort
+from layeredGraphLayouter.crossing.allCrossingsCounter import AllCrossingsCounter
 from layeredGraphLayouter.crossing.barycenterHeuristic import BarycenterHeuristic
 from layeredGraphLayouter.crossing.layerSweepCrossingMinimizer import LayerSweepCrossingMinimizer
 from layeredGraphLayouter.tests.testGraphCreator import TestGraphCreator,\
@@ -107,6 +108,56 @@ class LayerSweepCrossingMinimizerTC(unittest.TestCase):
         self.assertSequenceEqual(
             innerGraph.layers[1], expectedOrderRightBaryCenter)
 
+    def makeSeparateChildrenGraph(self) -> LGraph:
+        """
+        ________
+        |*  *  |
+        | \/   |---*
+        | /\   |
+        |*  *  |
+        |------|
+
+        Both graphs are layouted separately (SEPARATE_CHILDREN).
+
+        :return: the nested graph
+        """
+        gb = self.gb
+        node = gb.addNodeToLayer(gb.makeLayer())
+        gb.eastWestEdgeFromTo(node, gb.addNodeToLayer(gb.makeLayer()))
+        innerGraph = gb.nestedGraph(node)
+        innerNodesLeft = gb.addNodesToLayer(2, gb.makeLayer(innerGraph))
+        innerNodesRight = gb.addNodesToLayer(2, gb.makeLayer(innerGraph))
+        gb.eastWestEdgeFromTo(innerNodesLeft[0], innerNodesRight[1])
+        gb.eastWestEdgeFromTo(innerNodesLeft[1], innerNodesRight[0])
+
+        gb.graph.hierarchyHandling = HierarchyHandling.SEPARATE_CHILDREN
+        innerGraph.hierarchyHandling = HierarchyHandling.SEPARATE_CHILDREN
+        return innerGraph
+
+    def test_separateChildren_doesNotSweepIntoChildren(self):
+        innerGraph = self.makeSeparateChildrenGraph()
+        expectedInnerOrder = [list(layer) for layer in innerGraph.layers]
+
+        self.setUpAndMinimizeCrossings()
+
+        self.assertSequenceEqual(
+            list(self.crossMin.graphInfoHolders.keys()), [self.gb.graph])
+        self.assertSequenceEqual(
+            [list(layer) for layer in innerGraph.layers], expectedInnerOrder)
+
+    def test_separateChildren_nestedGraphLayoutedAlone(self):
+        innerGraph = self.makeSeparateChildrenGraph()
+        innerGraph.thoroughness = 1
+
+        self.crossMin.process(innerGraph)
+
+        # parent graph is not part of this run
+        gData = self.crossMin.graphInfoHolders[innerGraph]
+        self.assertIsNone(gData.parent)
+        self.assertIsNone(gData.parentGraphData)
+        self.assertEqual(
+            AllCrossingsCounter(innerGraph).countAllCrossings(innerGraph.layers), 0)
+
     def test_givenSimpleHierarchicalCross_ShouldResultInNoCrossing(self):
         """
         ____  ____
@@ -0,0 +1,105 @@
+import unittest
+
+from layeredGraphLayouter.containers.constants import PortType, PortSide
+from layeredGraphLayouter.crossing import nodeRelativePortDistributor
+from layeredGraphLayouter.crossing.nodeRelativePortDistributor import NodeRelativePortDistributor
+from layeredGraphLayouter.tests.testGraphCreator import TestGraphCreator
+
+
+@unittest.skipIf(nodeRelativePortDistributor.np is None, "numpy not available")
+class NodeRelativePortDistributorTC(unittest.TestCase):
+    def setUp(self):
+        self.gb = TestGraphCreator()
+
+    def createGraph(self, nodeCnt):
+        """
+        Two layers with multiple ports per node on east, west and north side
+        """
+        gb = self.gb
+        leftNodes = gb.addNodesToLayer(nodeCnt, gb.makeLayer())
+        rightNodes = gb.addNodesToLayer(nodeCnt, gb.makeLayer())
+        for i, n in enumerate(leftNodes):
+            for k in range(i % 4 + 1):
+                dst = rightNodes[(i * 7 + k) % nodeCnt]
+                src = gb.addPortOnSide(n, PortSide.EAST)
+                dstSide = PortSide.NORTH if k == 2 else PortSide.WEST
+                gb.addEdgeBetweenPorts(src, gb.addPortOnSide(dst, dstSide))
+
+        return gb.graph.layers
+
+    def calculatePortRanks(self, layers, layerI, portType, batch):
+        portDist = NodeRelativePortDistributor(self.gb.random, self.gb.graph)
+        portDist.BATCH_MIN_LAYER_SIZE = 1 if batch else len(layers[layerI]) + 1
+        portDist.calculatePortRanks_many(layers[layerI], portType)
+        self.assertEqual(len(portDist.portRankTables), int(batch))
+        return portDist
+
+    def assertPortRanksEqual(self, layers, layerI, portType):
+        expected = self.calculatePortRanks(layers, layerI, portType, False)
+        portDist = self.calculatePortRanks(layers, layerI, portType, True)
+        self.assertDictEqual(portDist.portRanks, expected.portRanks)
+
+    def test_outputRanks_sameAsPerNode(self):
+        layers = self.createGraph(20)
+        self.assertPortRanksEqual(layers, 0, PortType.OUTPUT)
+
+    def test_inputRanks_sameAsPerNode(self):
+        layers = self.createGraph(20)
+        self.assertPortRanksEqual(layers, 1, PortType.INPUT)
+
+    def test_reorderedLayer_reusesTable(self):
+        layers = self.createGraph(20)
+        portDist = self.calculatePortRanks(layers, 0, PortType.OUTPUT, True)
+        table = portDist.portRankTables[(id(layers[0]), PortType.OUTPUT)]
+
+        layers[0].reverse()
+        portDist.calculatePortRanks_many(layers[0], PortType.OUTPUT)
+        self.assertIs(
+            portDist.portRankTables[(id(layers[0]), PortType.OUTPUT)], table)
+
+        expected = self.calculatePortRanks(layers, 0, PortType.OUTPUT, False)
+        self.assertDictEqual(portDist.portRanks, expected.portRanks)
+
+    def test_distributePorts_invalidatesTable(self):
+        layers = self.createGraph(20)
+        portDist = self.calculatePortRanks(layers, 1, PortType.INPUT, True)
+        # ranks of the connected ports, so the distribution changes the port order
+        portDist.calculatePortRanks_many(layers[0], PortType.OUTPUT)
+        node = layers[1][0]
+        ports = list(node.west)
+        portDist.distributePorts_side(node, PortSide.WEST)
+        self.assertNotEqual(node.west, ports)
+        self.assertNotIn((id(layers[1]), PortType.INPUT),
+                         portDist.portRankTables)
+        self.assertIn(node, portDist.changedPortOrders)
+
+    def test_distributePortsWithoutChange_keepsTable(self):
+        layers = self.createGraph(20)
+        portDist = self.calculatePortRanks(layers, 1, PortType.INPUT, True)
+        node = layers[1][0]
+        ports = list(node.west)
+        portDist.distributePorts_side(node, PortSide.WEST)
+        self.assertEqual(node.west, ports)
+        self.assertIn((id(layers[1]), PortType.INPUT),
+                      portDist.portRankTables)
+
+    def test_portOrderChanged_invalidatesTable(self):
+        layers = self.createGraph(20)
+        portDist = self.calculatePortRanks(layers, 0, PortType.OUTPUT, True)
+        # port order changed outside of the distributor
+        node = layers[0][-1]
+        node.east.reverse()
+        portDist.portOrderChanged(node)
+        self.assertNotIn((id(layers[0]), PortType.OUTPUT),
+                         portDist.portRankTables)
+
+        portDist.calculatePortRanks_many(layers[0], PortType.OUTPUT)
+        expected = self.calculatePortRanks(layers, 0, PortType.OUTPUT, False)
+        self.assertDictEqual(portDist.portRanks, expected.portRanks)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(NodeRelativePortDistributorTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
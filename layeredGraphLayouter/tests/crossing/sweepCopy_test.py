@@ -0,0 +1,119 @@
+import unittest
+
+from layeredGraphLayouter.containers.constants import PortSide
+from layeredGraphLayouter.crossing.graphInfoHolder import GraphInfoHolder
+from layeredGraphLayouter.crossing.barycenterHeuristic import BarycenterHeuristic
+from layeredGraphLayouter.crossing.nodeRelativePortDistributor import NodeRelativePortDistributor
+from layeredGraphLayouter.crossing.sweepCopy import SweepCopy
+from layeredGraphLayouter.tests.testGraphCreator import TestGraphCreator
+
+
+class SweepCopyTC(unittest.TestCase):
+    def setUp(self):
+        self.gb = TestGraphCreator()
+
+    def createGraph(self):
+        gb = self.gb
+        left = gb.addNodesToLayer(3, gb.makeLayer())
+        middle = gb.addNodesToLayer(3, gb.makeLayer())
+        right = gb.addNodesToLayer(2, gb.makeLayer())
+        for i, n in enumerate(left):
+            gb.eastWestEdgeFromTo(n, middle[2 - i])
+        gb.eastWestEdgeFromTo(middle[0], right[1])
+        gb.eastWestEdgeFromTo(middle[0], right[0])
+        return gb.graph.layers
+
+    def test_unchangedLayersAreShared(self):
+        layers = self.createGraph()
+        sc0 = SweepCopy(layers)
+        layers[1].reverse()
+        sc1 = SweepCopy(layers, sc0)
+
+        self.assertIs(sc1.nodeOrder[0], sc0.nodeOrder[0])
+        self.assertIs(sc1.portOrders[0], sc0.portOrders[0])
+        self.assertIsNot(sc1.nodeOrder[1], sc0.nodeOrder[1])
+        self.assertSequenceEqual(sc1.nodeOrder[1], layers[1])
+        self.assertIs(sc1.nodeOrder[2], sc0.nodeOrder[2])
+
+        # snapshots are not modified by changes of the graph
+        self.assertSequenceEqual(sc0.nodeOrder[1], list(reversed(layers[1])))
+
+    def test_changedPortOrderIsRecorded(self):
+        layers = self.createGraph()
+        sc0 = SweepCopy(layers)
+        node = layers[1][0]
+        node.east.reverse()
+        sc1 = SweepCopy(layers, sc0)
+
+        self.assertIs(sc1.nodeOrder[1], sc0.nodeOrder[1])
+        self.assertIsNot(sc1.portOrders[1], sc0.portOrders[1])
+        self.assertSequenceEqual(sc1.portOrders[1][node][1], node.east)
+        # other nodes of the layer still share the port orders
+        other = layers[1][1]
+        self.assertIs(sc1.portOrders[1][other], sc0.portOrders[1][other])
+
+    def test_onlyChangedLayersAndNodesAreCopied(self):
+        layers = self.createGraph()
+        sc0 = SweepCopy(layers)
+        node = layers[1][0]
+        layers[1].reverse()
+        layers[2].reverse()
+        node.east.reverse()
+        # layer 2 and port order of node are not reported as changed
+        sc1 = SweepCopy(layers, sc0, changedLayers={1}, changedPortOrders=())
+
+        self.assertSequenceEqual(sc1.nodeOrder[1], layers[1])
+        self.assertIs(sc1.nodeOrder[2], sc0.nodeOrder[2])
+        self.assertIs(sc1.portOrders[1], sc0.portOrders[1])
+
+        sc2 = SweepCopy(layers, sc1, changedLayers=(), changedPortOrders={node})
+        self.assertIs(sc2.nodeOrder[1], sc1.nodeOrder[1])
+        self.assertIsNot(sc2.portOrders[1], sc1.portOrders[1])
+        self.assertSequenceEqual(sc2.portOrders[1][node][1], node.east)
+        other = layers[1][0]
+        self.assertIs(sc2.portOrders[1][other], sc1.portOrders[1][other])
+
+    def test_transferNodeAndPortOrdersToGraph(self):
+        layers = self.createGraph()
+        gData = GraphInfoHolder(self.gb.graph, BarycenterHeuristic,
+                                NodeRelativePortDistributor, {})
+        expectedOrder = [list(layer) for layer in layers]
+        node = layers[1][0]
+        expectedEast = list(node.east)
+        sc = SweepCopy(layers)
+
+        layers[1].reverse()
+        layers[2].reverse()
+        node.east.reverse()
+        sc.transferNodeAndPortOrdersToGraph(gData)
+
+        for layer, expected in zip(layers, expectedOrder):
+            self.assertSequenceEqual(layer, expected)
+            for n in layer:
+                self.assertIs(n.layer, layer)
+        self.assertSequenceEqual(node.east, expectedEast)
+        self.assertSequenceEqual(node.getPortSideView(PortSide.EAST), expectedEast)
+
+    def test_transferSkipsEntriesSharedWithCurrent(self):
+        layers = self.createGraph()
+        gData = GraphInfoHolder(self.gb.graph, BarycenterHeuristic,
+                                NodeRelativePortDistributor, {})
+        best = SweepCopy(layers)
+        expectedLayer1 = list(layers[1])
+
+        layers[1].reverse()
+        current = SweepCopy(layers, best, changedLayers={1})
+        # a change which is not in current snapshot is not transferred
+        layers[2].reverse()
+        changedLayer2 = list(layers[2])
+        best.transferNodeAndPortOrdersToGraph(gData, current)
+
+        self.assertSequenceEqual(layers[1], expectedLayer1)
+        self.assertSequenceEqual(layers[2], changedLayer2)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(SweepCopyTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
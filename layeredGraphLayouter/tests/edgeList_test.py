@@ -0,0 +1,136 @@
+import pickle
+import unittest
+
+from layeredGraphLayouter.containers.constants import PortSide, PortType
+from layeredGraphLayouter.containers.edgeList import EdgeList
+from layeredGraphLayouter.containers.lEdge import LEdge
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.edgeManipulators.longEdgeJoiner import LongEdgeJoiner
+from layeredGraphLayouter.edgeManipulators.longEdgeSplitter import LongEdgeSplitter
+
+
+def createFanout(sinkCnt: int):
+    g = LGraph()
+    src = g.add_node("src")
+    o = src.addPort("o", PortType.OUTPUT, PortSide.EAST)
+    sinks = []
+    for i in range(sinkCnt):
+        n = g.add_node("n%d" % i)
+        sinks.append(n.addPort("i", PortType.INPUT, PortSide.WEST))
+
+    for i in sinks:
+        g.add_edge(o, i)
+    return g, o, sinks
+
+
+class EdgeListTC(unittest.TestCase):
+
+    def test_order(self):
+        for cnt in (3, 50):
+            edges = [LEdge() for _ in range(cnt)]
+            l = EdgeList(edges)
+            ref = list(edges)
+            for i in range(0, cnt, 2):
+                l.remove(edges[i])
+                ref.remove(edges[i])
+                self.assertEqual(l, ref)
+                self.assertEqual(len(l), len(ref))
+
+            e = LEdge()
+            l.append(e)
+            ref.append(e)
+            self.assertEqual(l, ref)
+            self.assertEqual(l[0], ref[0])
+            self.assertEqual(l[-1], e)
+            self.assertEqual(l.index(e), len(ref) - 1)
+            self.assertIn(e, l)
+            self.assertNotIn(edges[0], l)
+            self.assertEqual(list(reversed(l)), ref[::-1])
+
+            e2 = LEdge()
+            l.insert(1, e2)
+            ref.insert(1, e2)
+            self.assertEqual(l, ref)
+            self.assertEqual(l.index(e2), 1)
+
+            for e in list(l):
+                l.remove(e)
+            self.assertFalse(l)
+            self.assertEqual(l, [])
+
+    def test_remove_missing(self):
+        l = EdgeList([LEdge() for _ in range(20)])
+        with self.assertRaises(ValueError):
+            l.remove(LEdge())
+
+    def test_replace(self):
+        edges = [LEdge() for _ in range(20)]
+        l = EdgeList(edges)
+        e = LEdge()
+        l.replace(edges[5], e)
+        edges[5] = e
+        self.assertEqual(l, edges)
+        self.assertEqual(l.index(e), 5)
+
+    def test_pickle(self):
+        g, o, _ = createFanout(20)
+        g2 = pickle.loads(pickle.dumps(g))
+        o2 = g2.nodes[0].east[0]
+        self.assertIsInstance(o2.outgoingEdges, EdgeList)
+        self.assertEqual([e.dst.getNode().name for e in o2.outgoingEdges],
+                         [e.dst.getNode().name for e in o.outgoingEdges])
+
+    def test_reverse_fanout(self):
+        g, o, sinks = createFanout(100)
+        edges = list(o.outgoingEdges)
+        for e in edges[::2]:
+            e.reverse(g, False)
+        self.assertEqual(o.outgoingEdges, edges[1::2])
+        self.assertEqual(o.incomingEdges, edges[::2])
+        for e, i in zip(edges, sinks):
+            if e.reversed:
+                self.assertEqual(i.outgoingEdges, [e])
+            else:
+                self.assertEqual(i.incomingEdges, [e])
+
+    def test_setTargetInPlaceOf(self):
+        g = LGraph()
+        a = g.add_node("a").addPort("o", PortType.OUTPUT, PortSide.EAST)
+        b = g.add_node("b").addPort("o", PortType.OUTPUT, PortSide.EAST)
+        c = g.add_node("c").addPort("i", PortType.INPUT, PortSide.WEST)
+        edges = [g.add_edge(a, c) for _ in range(3)]
+        e = g.add_edge(b, g.add_node("d").addPort("i", PortType.INPUT, PortSide.WEST))
+        e.setTargetInPlaceOf(edges[1])
+        self.assertEqual(c.incomingEdges, [edges[0], e, edges[2]])
+        self.assertIs(e.dst, c)
+        self.assertIs(e.dstNode, c.getNode())
+        self.assertIsNone(edges[1].dst)
+
+    def test_splitAndJoin_keepsOrder(self):
+        g, o, sinks = createFanout(30)
+        nodes = list(g.nodes)
+        g.append_layer(nodes[:1])
+        g.append_layer([])
+        g.append_layer([])
+        g.append_layer(nodes[1:])
+        g.unnecessaryBendpoints = False
+        edges = list(o.outgoingEdges)
+
+        LongEdgeSplitter().process(g)
+        self.assertEqual(len(g.layers[1]), 30)
+        self.assertEqual(len(g.edges), 90)
+
+        LongEdgeJoiner().process(g)
+        self.assertEqual(len(g.layers[1]), 0)
+        self.assertEqual(g.edges, edges)
+        self.assertEqual(o.outgoingEdges, edges)
+        for e, i in zip(edges, sinks):
+            self.assertIs(e.dst, i)
+            self.assertEqual(i.incomingEdges, [e])
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(EdgeListTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
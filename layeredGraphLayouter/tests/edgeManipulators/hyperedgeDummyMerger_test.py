@@ -0,0 +1,85 @@
+import unittest
+
+from layeredGraphLayouter.containers.constants import NodeType, PortSide
+from layeredGraphLayouter.edgeManipulators.hyperedgeDummyMerger import HyperedgeDummyMerger
+from layeredGraphLayouter.edgeManipulators.longEdgeJoiner import LongEdgeJoiner
+from layeredGraphLayouter.edgeManipulators.longEdgeSplitter import LongEdgeSplitter
+from layeredGraphLayouter.tests.testGraphCreator import TestGraphCreator
+
+
+def longEdgeDummies(layer):
+    return [n for n in layer if n.type == NodeType.LONG_EDGE]
+
+
+class HyperedgeDummyMergerTC(unittest.TestCase):
+    def setUp(self):
+        self.gb = TestGraphCreator()
+
+    def makeNet(self):
+        """
+        src --+-----> a
+              +-----> b
+              +--> c
+        other ------> d
+        """
+        gb = self.gb
+        l0, l1, l2, l3 = [gb.makeLayer() for _ in range(4)]
+        src = gb.addNodeToLayer(l0)
+        other = gb.addNodeToLayer(l0)
+        a = gb.addNodeToLayer(l3)
+        b = gb.addNodeToLayer(l3)
+        c = gb.addNodeToLayer(l2)
+        d = gb.addNodeToLayer(l3)
+
+        srcPort = gb.addPortOnSide(src, PortSide.EAST)
+        edges = [gb.eastWestEdgeFromTo(srcPort, n) for n in (a, b, c)]
+        edges.append(gb.eastWestEdgeFromTo(other, d))
+        return edges
+
+    def test_merge(self):
+        gb = self.gb
+        edges = self.makeNet()
+        ends = [(e.src, e.dst) for e in edges]
+        LongEdgeSplitter().process(gb.graph)
+        layers = gb.graph.layers
+        self.assertEqual(len(longEdgeDummies(layers[1])), 4)
+        self.assertEqual(len(longEdgeDummies(layers[2])), 3)
+
+        HyperedgeDummyMerger().process(gb.graph)
+        l1Dummies = longEdgeDummies(layers[1])
+        l2Dummies = longEdgeDummies(layers[2])
+        self.assertEqual(len(l1Dummies), 2)
+        self.assertEqual(len(l2Dummies), 2)
+
+        merged = l1Dummies[0]
+        self.assertEqual(len(merged.west[0].incomingEdges), 3)
+        self.assertEqual(len(merged.east[0].outgoingEdges), 3)
+        self.assertIsNone(merged.longEdgeTarget)
+        self.assertIsNotNone(l1Dummies[1].longEdgeTarget)
+        # edges between merged dummies are parallel
+        self.assertEqual({e.dst for e in merged.east[0].outgoingEdges},
+                         {l2Dummies[0].west[0], ends[2][1]})
+        self.assertEqual(len(gb.graph.nodes), 6 + 4)
+
+        LongEdgeJoiner().process(gb.graph)
+        self.assertEqual([(e.src, e.dst) for e in edges], ends)
+        self.assertEqual(len(gb.graph.edges), len(edges))
+        for layer in layers:
+            self.assertEqual(longEdgeDummies(layer), [])
+
+    def test_reversedNotMerged(self):
+        gb = self.gb
+        edges = self.makeNet()
+        edges[1].reversed = True
+        LongEdgeSplitter().process(gb.graph)
+        HyperedgeDummyMerger().process(gb.graph)
+        layers = gb.graph.layers
+        self.assertEqual(len(longEdgeDummies(layers[1])), 3)
+        self.assertEqual(len(longEdgeDummies(layers[2])), 3)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(HyperedgeDummyMergerTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
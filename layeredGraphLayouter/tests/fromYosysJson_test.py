@@ -0,0 +1,123 @@
+from io import StringIO
+import json
+import unittest
+
+from layeredGraphLayouter.containers.constants import PortSide, PortType
+from layeredGraphLayouter.containers.lNode import LayoutExternalPort
+from layeredGraphLayouter.fromYosysJson import FromYosysJson, JsonPullParser
+
+
+NETLIST = {
+    "creator": "Yosys",
+    "modules": {
+        "inv": {
+            "attributes": {},
+            "ports": {
+                "a": {"direction": "input", "bits": [2]},
+                "y": {"direction": "output", "bits": [3]},
+            },
+            "cells": {
+                "$not$1": {
+                    "hide_name": 1,
+                    "type": "$not",
+                    "parameters": {"A_WIDTH": "00000000000000000000000000000001"},
+                    "port_directions": {"A": "input", "Y": "output"},
+                    "connections": {"A": [2], "Y": [3]},
+                },
+            },
+            "netnames": {},
+        },
+        "top": {
+            "attributes": {"top": "00000000000000000000000000000001"},
+            "ports": {
+                "a": {"direction": "input", "bits": [2, 3]},
+                "y": {"direction": "output", "bits": [4, 5]},
+            },
+            "cells": {
+                "u0": {
+                    "hide_name": 0,
+                    "type": "inv",
+                    "port_directions": {"a": "input", "y": "output"},
+                    "connections": {"a": [2], "y": [4]},
+                },
+                "u1": {
+                    "hide_name": 0,
+                    "type": "inv",
+                    "port_directions": {"a": "input", "y": "output"},
+                    "connections": {"a": [3], "y": [5]},
+                },
+                "$and$2": {
+                    "hide_name": 1,
+                    "type": "$and",
+                    "port_directions": {"A": "input", "B": "input", "Y": "output"},
+                    "connections": {"A": [2, 3], "B": ["1", 2], "Y": [6]},
+                },
+            },
+            "netnames": {
+                "a": {"hide_name": 0, "bits": [2, 3]},
+                "$auto": {"hide_name": 1, "bits": [6]},
+            },
+        },
+    },
+}
+
+
+class FromYosysJsonTC(unittest.TestCase):
+
+    def test_pullParser(self):
+        doc = {"a": [1, 22.5, {"b": None, "c": "x\"y"}], "d": {}, "e": [], "f": 123456}
+        for chunkSize in (1, 2, 7, 1 << 16):
+            p = JsonPullParser(StringIO(json.dumps(doc, indent=1)), chunkSize)
+            res = {}
+            for k in p.iterObject():
+                if k == "a":
+                    res[k] = [p.readValue() for _ in p.iterArray()]
+                elif k == "d":
+                    p.skipValue()
+                else:
+                    res[k] = p.readValue()
+            self.assertEqual(res, {"a": doc["a"], "e": [], "f": 123456})
+
+    def test_importNetlist(self):
+        for chunkSize in (3, 1 << 16):
+            imp = FromYosysJson(chunkSize=chunkSize)
+            g = imp.parse(StringIO(json.dumps(NETLIST)))
+            self.assertEqual([n.name for n in g.nodes],
+                             ["a", "y", "u0", "u1", "$and"])
+            a, y, u0, u1, _and = g.nodes
+            self.assertIsInstance(a, LayoutExternalPort)
+            self.assertEqual(a.direction, PortType.INPUT)
+            self.assertEqual(len(a.east), 1)
+            self.assertEqual(len(y.west), 1)
+            self.assertEqual([p.name for p in _and.west], ["A", "B"])
+            self.assertIs(_and.east[0].side, PortSide.EAST)
+
+            # bits 2 and 3 of "a" go to u0, u1 and both inputs of $and
+            self.assertEqual(sorted(e.dst.getNode().name for e in a.east[0].outgoingEdges),
+                             ["$and", "$and", "u0", "u1"])
+            self.assertTrue(all(e.name == "a" for e in a.east[0].outgoingEdges))
+            self.assertTrue(g.p_hyperedges)
+            self.assertTrue(g.p_externalPorts)
+            # output of $and is not connected
+            self.assertEqual(_and.east[0].outgoingEdges, [])
+            self.assertEqual(len(y.west[0].incomingEdges), 2)
+
+            nested = u0.nestedLgraph
+            self.assertIsNotNone(nested)
+            self.assertIs(nested.parentLnode, u0)
+            self.assertTrue(u0.compoundNode)
+            self.assertIsNot(nested, u1.nestedLgraph)
+            self.assertEqual([n.name for n in nested.nodes], ["a", "y", "$not"])
+            self.assertEqual(len(nested.edges), 2)
+            self.assertGreater(u0.size.x, 0)
+
+    def test_selectTop(self):
+        g = FromYosysJson().parse(StringIO(json.dumps(NETLIST)), top="inv")
+        self.assertEqual(len(g.nodes), 3)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(FromYosysJsonTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
@@ -0,0 +1,164 @@
+import gc
+import pickle
+import tracemalloc
+import unittest
+
+from layeredGraphLayouter.benchmarks.generators import randomDag, portHeavyBus
+from layeredGraphLayouter.containers.constants import PortSide, PortType
+from layeredGraphLayouter.containers.geometry import Point
+from layeredGraphLayouter.containers.geometryStore import GeometryStore,\
+    PointView, SpacingView
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lNode import LNode
+from layeredGraphLayouter.tests.toSvgStream_test import createExportTestGraph
+
+
+def geometry(g: LGraph):
+    res = []
+    for n in g.nodes:
+        for r in (n, *n.iterPorts()):
+            res.append((tuple(r.possition), tuple(r.size), tuple(r.anchor),
+                        tuple(r.margin)))
+    return res
+
+
+class GeometryStoreTC(unittest.TestCase):
+
+    def test_views(self):
+        g = LGraph()
+        n = g.add_node("n")
+        n.possition.x = 3
+        n.margin.left = 2
+        s = GeometryStore()
+        i = s.attach(n)
+        self.assertEqual(i, 0)
+        self.assertEqual(s.attach(n), 0)
+        self.assertIsInstance(n.possition, PointView)
+        self.assertIsInstance(n.margin, SpacingView)
+        # views are created on access, the element does not own them
+        self.assertNotIn("possition", vars(n))
+        self.assertNotIn("margin", vars(n))
+        self.assertEqual(tuple(n.possition), (3, 0))
+        self.assertEqual(n.margin[2], 2)
+
+        n.possition.y = 5
+        n.size[0] = 7
+        n.margin.bottom = 1
+        self.assertEqual(s.y[0], 5)
+        self.assertEqual(s.w[0], 7)
+        self.assertEqual(s.marginBottom[0], 1)
+        self.assertEqual(tuple(n.possition + Point(1, 1)), (4, 6))
+        self.assertEqual(tuple(n.possition[:]), (3, 5))
+        self.assertEqual(tuple(n.margin), (0, 1, 2, 0))
+        n.translate(1, 1)
+        self.assertEqual((s.x[0], s.y[0]), (4, 6))
+
+        s.detach(n)
+        self.assertIs(n.possition.__class__, Point)
+        self.assertEqual(tuple(n.possition), (4, 6))
+        self.assertEqual(tuple(n.margin), (0, 1, 2, 0))
+        self.assertIsNone(s.indexOf(n))
+
+    def test_enable(self):
+        g = createExportTestGraph(4)
+        before = geometry(g)
+        s = g.enableGeometryStore()
+        self.assertEqual(geometry(g), before)
+        self.assertEqual(len(s), sum(1 + len(list(n.iterPorts())) for n in g.nodes))
+
+        # new nodes and ports are attached automatically
+        n = g.add_node("new")
+        p = n.addPort("p", PortType.INPUT, PortSide.WEST)
+        d = LNode(g)
+        for r in (n, p, d):
+            self.assertIsNotNone(s.indexOf(r))
+
+        g.disableGeometryStore()
+        self.assertIsNone(g.geometry)
+        self.assertEqual(geometry(g)[:len(before)], before)
+        self.assertIs(g.nodes[0].possition.__class__, Point)
+
+    def test_memory(self):
+        tracemalloc.start()
+        try:
+            g = portHeavyBus(20, 0)
+            gc.collect()
+            before = tracemalloc.get_traced_memory()[0]
+            objCnt = len(gc.get_objects())
+            s = g.enableGeometryStore()
+            gc.collect()
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(after, before)
+        self.assertLess(len(gc.get_objects()), objCnt)
+        self.assertGreater(len(s), 1000)
+
+    def _testBulk(self, nodeCnt):
+        g = randomDag(nodeCnt, 0)
+        for i, n in enumerate(g.nodes):
+            n.translate(i * 10, i)
+            n.margin.left = 1
+            n.margin.bottom = 2
+        ref = randomDag(nodeCnt, 0)
+        for i, n in enumerate(ref.nodes):
+            n.translate(i * 10, i)
+
+        s = g.enableGeometryStore()
+        nodes = g.nodes[1:]
+        ids = s.idsOf(nodes, withPorts=True)
+        s.translate(ids, 5, -3)
+        for n in ref.nodes[1:]:
+            n.translate(5, -3)
+        self.assertEqual([tuple(n.possition) for n in g.nodes],
+                         [tuple(n.possition) for n in ref.nodes])
+        self.assertEqual([tuple(p.possition) for n in g.nodes for p in n.iterPorts()],
+                         [tuple(p.possition) for n in ref.nodes for p in n.iterPorts()])
+
+        x0 = min(n.possition.x for n in nodes)
+        y0 = min(n.possition.y for n in nodes)
+        x1 = max(n.possition.x + n.size.x for n in nodes)
+        y1 = max(n.possition.y + n.size.y for n in nodes)
+        nodeIds = s.idsOf(nodes)
+        self.assertEqual(s.boundingBox(nodeIds), (x0, y0, x1, y1))
+        self.assertEqual(s.boundingBox(nodeIds, withMargins=True),
+                         (x0 - 1, y0, x1, y1 + 2))
+        self.assertIsNone(s.boundingBox([]))
+
+        n = nodes[3]
+        x, y = n.possition
+        w, h = n.size
+        s.scale(nodeIds, 2, 0.5, originX=10, originY=4)
+        self.assertEqual(tuple(n.possition), (10 + (x - 10) * 2, 4 + (y - 4) * 0.5))
+        self.assertEqual(tuple(n.size), (w * 2, h * 0.5))
+        self.assertEqual(tuple(n.margin), (0, 1, 2, 0))
+
+    def test_bulk_small(self):
+        self._testBulk(10)
+
+    def test_bulk_large(self):
+        self._testBulk(300)
+
+    def test_pickle(self):
+        g = createExportTestGraph(3)
+        g.enableGeometryStore()
+        g.nodes[0].possition.x = 11
+        g2 = pickle.loads(pickle.dumps(g))
+        self.assertIsNotNone(g2.geometry)
+        self.assertIsNot(g2.geometry, g.geometry)
+        self.assertEqual(geometry(g2), geometry(g))
+        self.assertEqual(g2.geometry.indexOf(g2.nodes[0]), 0)
+        self.assertEqual(g2.geometry.x[0], 11)
+
+        g.disableGeometryStore()
+        g3 = pickle.loads(pickle.dumps(g))
+        self.assertIsNone(g3.geometry)
+        self.assertEqual(geometry(g3), geometry(g))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(GeometryStoreTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
@@ -0,0 +1,152 @@
+import unittest
+
+from layeredGraphLayouter.benchmarks.generators import randomDag
+from layeredGraphLayouter.containers.constants import PortType, PortSide
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.crossing.layerSweepCrossingMinimizer import LayerSweepCrossingMinimizer
+from layeredGraphLayouter.incrementalLayout import IncrementalLayouter, GraphDiff
+
+
+def addIoNode(g: LGraph, name: str):
+    n = g.add_node(name)
+    n.addPort("i", PortType.INPUT, PortSide.WEST)
+    n.addPort("o", PortType.OUTPUT, PortSide.EAST)
+    return n
+
+
+def layerIndexes(g: LGraph):
+    return {n: i for i, l in enumerate(g.layers) for n in l}
+
+
+class IncrementalLayoutTC(unittest.TestCase):
+
+    def assertProperLayering(self, g: LGraph):
+        index = layerIndexes(g)
+        self.assertEqual(set(index.keys()), set(g.nodes))
+        for l in g.layers:
+            self.assertTrue(l)
+            for n in l:
+                self.assertIs(n.layer, l)
+        for e in g.edges:
+            if not e.isSelfLoop:
+                self.assertNotEqual(index[e.srcNode], index[e.dstNode], e)
+
+    def chain(self, names):
+        g = LGraph()
+        nodes = [addIoNode(g, n) for n in names]
+        for a, b in zip(nodes, nodes[1:]):
+            g.add_edge(a.east[0], b.west[0])
+        return g, nodes
+
+    def test_addNode_betweenNeighborLayers(self):
+        g, (a, b, c) = self.chain("abc")
+        layouter = IncrementalLayouter()
+        layouter.layout(g)
+        self.assertEqual([list(l) for l in g.layers], [[a], [b], [c]])
+
+        d = GraphDiff(g)
+        n = d.addNode("n")
+        d.addEdge(a.east[0], d.addPort(n, "i", PortType.INPUT, PortSide.WEST))
+        d.addEdge(d.addPort(n, "o", PortType.OUTPUT, PortSide.EAST), b.west[0])
+        layouter.relayout(g, d)
+
+        self.assertFalse(layouter.lastLayoutWasFull)
+        self.assertProperLayering(g)
+        # new layer is inserted, successors are not moved
+        self.assertEqual([list(l) for l in g.layers], [[a], [n], [b], [c]])
+
+    def test_addEdge_pushesSuccessors(self):
+        g, (a, b) = self.chain("ab")
+        x, y = addIoNode(g, "x"), addIoNode(g, "y")
+        g.add_edge(x.east[0], y.west[0])
+        # previous layout
+        g.append_layer([a, x])
+        g.append_layer([b, y])
+        layouter = IncrementalLayouter()
+
+        d = GraphDiff(g)
+        d.addEdge(b.east[0], y.west[0])
+        layouter.relayout(g, d)
+
+        self.assertFalse(layouter.lastLayoutWasFull)
+        self.assertProperLayering(g)
+        self.assertEqual([set(l) for l in g.layers], [{a, x}, {b}, {y}])
+
+    def test_addEdge_cycle_staysBackward(self):
+        g, (a, b, c) = self.chain("abc")
+        layouter = IncrementalLayouter()
+        layouter.layout(g)
+        before = [list(l) for l in g.layers]
+
+        d = GraphDiff(g)
+        d.addEdge(c.east[0], a.west[0])
+        layouter.relayout(g, d)
+
+        self.assertFalse(layouter.lastLayoutWasFull)
+        self.assertEqual([list(l) for l in g.layers], before)
+
+    def test_removeNode_dropsEmptyLayer(self):
+        g, (a, b, c) = self.chain("abc")
+        layouter = IncrementalLayouter()
+        layouter.layout(g)
+
+        d = GraphDiff(g)
+        d.removeNode(b)
+        layouter.relayout(g, d)
+
+        self.assertProperLayering(g)
+        self.assertEqual([list(l) for l in g.layers], [[a], [c]])
+        self.assertNotIn(b, g.nodes)
+        self.assertEqual(a.east[0].outgoingEdges, [])
+
+    def test_relayout_keepsUntouchedLayers(self):
+        g = randomDag(150, 0)
+        layouter = IncrementalLayouter()
+        layouter.layout(g)
+        self.assertProperLayering(g)
+        before = {l: list(l) for l in g.layers}
+
+        src = g.layers[3][0]
+        dst = g.layers[4][0]
+        d = GraphDiff(g)
+        n = d.addNode("n")
+        d.addEdge(src.east[0], d.addPort(n, "i", PortType.INPUT, PortSide.WEST))
+        d.addEdge(d.addPort(n, "o", PortType.OUTPUT, PortSide.EAST), dst.west[0])
+        layouter.relayout(g, d)
+
+        self.assertFalse(layouter.lastLayoutWasFull)
+        self.assertProperLayering(g)
+        self.assertIn(n.layer, layouter.dirtyLayers)
+        for l in g.layers:
+            if l in before:
+                if l in layouter.dirtyLayers:
+                    self.assertEqual(set(l), set(before[l]))
+                else:
+                    self.assertEqual(list(l), before[l])
+
+    def test_notLayouted_fullLayout(self):
+        g, _ = self.chain("abc")
+        layouter = IncrementalLayouter()
+        layouter.relayout(g, GraphDiff(g))
+        self.assertTrue(layouter.lastLayoutWasFull)
+        self.assertEqual(len(g.layers), 3)
+
+    def test_warmStart_keepsOrderWithoutCrossings(self):
+        g = LGraph()
+        left = [addIoNode(g, "l%d" % i) for i in range(3)]
+        right = [addIoNode(g, "r%d" % i) for i in range(3)]
+        for a, b in zip(left, right):
+            g.add_edge(a.east[0], b.west[0])
+        g.append_layer(left)
+        g.append_layer(right)
+
+        LayerSweepCrossingMinimizer(warmStart=True).process(g)
+        self.assertEqual(list(g.layers[0]), left)
+        self.assertEqual(list(g.layers[1]), right)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(IncrementalLayoutTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
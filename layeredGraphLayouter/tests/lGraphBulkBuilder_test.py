@@ -0,0 +1,99 @@
+import unittest
+
+from layeredGraphLayouter.containers.constants import PortSide, PortType
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lGraphBulkBuilder import LGraphBulkBuilder,\
+    buildLGraph
+from layeredGraphLayouter.containers.lNode import LayoutExternalPort
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+I = PortType.INPUT
+O = PortType.OUTPUT
+E = PortSide.EAST
+W = PortSide.WEST
+
+
+def attrs(g: LGraph):
+    """
+    :return: comparable description of the graph
+    """
+    ports = {}
+    res = []
+    for n in g.nodes:
+        res.append((n.__class__, n.name, n.portConstraints, tuple(n.size)))
+        for side in n.iterSides():
+            for p in side:
+                ports[p] = len(ports)
+                res.append((p.name, p.side, p.direction))
+
+    for e in g.edges:
+        res.append((e.name, ports[e.src], ports[e.dst],
+                    e.srcNode is e.src.getNode(), e.dstNode is e.dst.getNode(),
+                    e.isSelfLoop))
+    for p in ports:
+        res.append(([ports[e.dst] for e in p.outgoingEdges],
+                    [ports[e.src] for e in p.incomingEdges]))
+    return res
+
+
+class LGraphBulkBuilderTC(unittest.TestCase):
+
+    def test_sameAsAddNode(self):
+        g = LGraph()
+        n0 = g.add_node("n0")
+        n0o = n0.addPort("o", O, E)
+        n1 = g.add_node("n1")
+        n1i = n1.addPort("i", I, W)
+        n1o = n1.addPort("o", O, E)
+        g.add_edge(n0o, n1i, name="a")
+        g.add_edge(n1o, n1i)
+
+        b = LGraphBulkBuilder()
+        g2 = b.build(["n0", "n1"],
+                     [0, 1, 1], [E, W, E], [O, I, O],
+                     [0, 2], [1, 1],
+                     portNames=["o", "i", "o"], edgeNames=["a", None])
+        self.assertEqual(attrs(g2), attrs(g))
+        self.assertEqual(len(b.ports), 3)
+        self.assertTrue(g2.p_selfLoops)
+        self.assertTrue(g2.p_hyperedges)
+        self.assertFalse(g2.p_northSouthPorts)
+        self.assertFalse(g2.p_externalPorts)
+
+    def test_flagsAndExternalPorts(self):
+        g = buildLGraph(["ext", "n"],
+                        [0, 1, 1], [E, W, PortSide.NORTH], [O, I, I],
+                        [0], [1],
+                        nodeSizes=[(10, 20), (30, 40)],
+                        nodeExternalPortDirections=[I, None])
+        self.assertIsInstance(g.nodes[0], LayoutExternalPort)
+        self.assertNotIsInstance(g.nodes[1], LayoutExternalPort)
+        self.assertEqual(tuple(g.nodes[1].size), (30, 40))
+        self.assertTrue(g.p_externalPorts)
+        self.assertTrue(g.p_northSouthPorts)
+        self.assertFalse(g.p_selfLoops)
+        self.assertFalse(g.p_hyperedges)
+        self.assertEqual(len(g.nodes[1].north), 1)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_numpyTables(self):
+        g = buildLGraph(["a", "b"],
+                        np.array([0, 1]),
+                        np.array([E.value, W.value]),
+                        np.array([O.value, I.value]),
+                        np.array([0, 0]), np.array([1, 1]))
+        self.assertEqual(len(g.edges), 2)
+        self.assertIs(g.nodes[0].east[0].side, E)
+        self.assertIs(g.edges[1].dstNode, g.nodes[1])
+        self.assertTrue(g.p_hyperedges)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(LGraphBulkBuilderTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
@@ -0,0 +1,142 @@
+import pickle
+from random import Random
+import unittest
+
+from layeredGraphLayouter.containers.constants import PortSide
+from layeredGraphLayouter.containers.geometry import Point
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lGraphCodec import encodeLGraph,\
+    decodeLGraph, encodeLGraphToSharedMemory, decodeLGraphFromSharedMemory,\
+    shared_memory
+from layeredGraphLayouter.crossing.layerSweepCrossingMinimizer import LayerSweepCrossingMinimizer
+from layeredGraphLayouter.tests.crossing.layerSweepCrossingMinimizer_test import makeNestedTwoNodeGraphWithEasternPorts
+from layeredGraphLayouter.tests.testGraphCreator import TestGraphCreator
+
+
+def describeGraph(g: LGraph):
+    """
+    :return: comparable description of the graph hierarchy
+        where objects are replaced by indexes
+    """
+    graphs = []
+    nodes = {}
+    ports = {}
+    edges = {}
+
+    def collect(g):
+        graphs.append(g)
+        for l in g.layers:
+            for n in l:
+                nodes.setdefault(n, len(nodes))
+        for n in g.nodes:
+            nodes.setdefault(n, len(nodes))
+            for p in n.iterPorts():
+                ports.setdefault(p, len(ports))
+            if n.nestedLgraph is not None:
+                collect(n.nestedLgraph)
+        for e in g.edges:
+            edges.setdefault(e, len(edges))
+
+    collect(g)
+
+    def ref(table, o):
+        return None if o is None else table[o]
+
+    res = []
+    for g in graphs:
+        res.append(([nodes[n] for n in g.nodes], [edges[e] for e in g.edges],
+                    [[nodes[n] for n in l] for l in g.layers],
+                    ref(nodes, g.parentLnode), g.p_externalPorts, tuple(g.size)))
+        for l in g.layers:
+            res.append(l.graph is g)
+    for n in nodes:
+        res.append((n.__class__, n.name, n.type, n.portConstraints,
+                    tuple(n.possition), tuple(n.size),
+                    [[ports[p] for p in side] for side in n.iterSides()],
+                    ref(nodes, n.inLayerLayoutUnit), graphs.index(n.graph),
+                    n.layer is None or n in n.layer,
+                    ref(ports, n.origin), n.extPortSide, n.compoundNode,
+                    [nodes[s] for s in n.inLayerSuccessorConstraint]))
+    for p in ports:
+        res.append((p.name, p.side, p.direction, nodes[p.parent],
+                    [edges[e] for e in p.outgoingEdges],
+                    [edges[e] for e in p.incomingEdges],
+                    ref(nodes, p.portDummy), p.insideConnections))
+    for e in edges:
+        res.append((ports[e.src], ports[e.dst], nodes[e.srcNode], nodes[e.dstNode],
+                    e.reversed, e.isSelfLoop,
+                    [tuple(bp) for bp in e.bendPoints]))
+    return res
+
+
+class LGraphCodecTC(unittest.TestCase):
+
+    def createNestedGraph(self):
+        gb = TestGraphCreator()
+        leftOuterNode = gb.addNodeToLayer(gb.makeLayer())
+        rightNodes = gb.addNodesToLayer(2, gb.makeLayer())
+        leftOuterPorts = gb.addPortsOnSide(2, leftOuterNode, PortSide.EAST)
+        gb.eastWestEdgeFromTo(leftOuterPorts[0], rightNodes[1])
+        gb.eastWestEdgeFromTo(leftOuterPorts[1], rightNodes[0])
+        makeNestedTwoNodeGraphWithEasternPorts(gb, leftOuterNode, leftOuterPorts)
+        rightNodes[0].inLayerSuccessorConstraint.append(rightNodes[1])
+
+        g = gb.graph
+        # MockRandom is not picklable, graphs share one Random as with MockRandom
+        r = Random(0)
+        g.random = r
+        leftOuterNode.nestedLgraph.random = r
+        g.edges[0].bendPoints.append(Point(1.5, 2))
+        g.edges[0].reversed = True
+        g.size.x = 10
+        g.nodes[0].customAttr = [rightNodes[0], "x"]
+        return g
+
+    def test_roundTrip(self):
+        g = self.createNestedGraph()
+        g2 = decodeLGraph(encodeLGraph(g))
+        self.assertEqual(describeGraph(g2), describeGraph(g))
+        # not in columns, stored as extra attribute
+        self.assertIs(g2.nodes[0].customAttr[0], g2.layers[1][0])
+
+    def test_pickle_sameCrossingMinimization(self):
+        g = self.createNestedGraph()
+        g2 = pickle.loads(pickle.dumps(g))
+        self.assertEqual(describeGraph(g2), describeGraph(g))
+        self.assertIs(g2.random, g2.nodes[0].nestedLgraph.random)
+
+        for _g in (g, g2):
+            LayerSweepCrossingMinimizer().process(_g)
+        self.assertEqual(describeGraph(g2), describeGraph(g))
+
+    def test_deepGraph_noRecursionLimit(self):
+        gb = TestGraphCreator()
+        prev = gb.addNodeToLayer(gb.makeLayer())
+        for _ in range(3000):
+            n = gb.addNodeToLayer(gb.makeLayer())
+            gb.eastWestEdgeFromTo(prev, n)
+            prev = n
+
+        gb.graph.random = Random(0)
+        g2 = pickle.loads(pickle.dumps(gb.graph))
+        self.assertEqual(len(g2.layers), 3001)
+        self.assertIs(g2.edges[-1].dstNode, g2.nodes[-1])
+
+    @unittest.skipIf(shared_memory is None, "shared_memory not available")
+    def test_sharedMemory(self):
+        g = self.createNestedGraph()
+        shm, handle = encodeLGraphToSharedMemory(g)
+        try:
+            # the handle is what would be sent to a worker
+            g2 = decodeLGraphFromSharedMemory(pickle.loads(pickle.dumps(handle)))
+        finally:
+            shm.close()
+            shm.unlink()
+        self.assertEqual(describeGraph(g2), describeGraph(g))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(LGraphCodecTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
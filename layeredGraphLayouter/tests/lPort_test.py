@@ -0,0 +1,84 @@
+import pickle
+import unittest
+
+from layeredGraphLayouter.containers.constants import PortSide, PortType
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lPort import LPort
+
+
+class LPortTC(unittest.TestCase):
+
+    def test_node(self):
+        g = LGraph()
+        n = g.add_node("n")
+        p = n.addPort("p", PortType.OUTPUT, PortSide.EAST)
+        self.assertIs(p.node, n)
+        self.assertIs(p.getNode(), n)
+
+        child = LPort(p, PortType.OUTPUT, PortSide.EAST, name="c")
+        self.assertIs(child.node, n)
+        self.assertEqual(p.children, [child])
+
+        # the nested port follows its parent port
+        n2 = g.add_node("n2")
+        p.setParent(n2)
+        self.assertIs(child.node, n2)
+
+    def test_setParent(self):
+        g = LGraph()
+        a = g.add_node("a")
+        b = g.add_node("b")
+        p = a.addPort("p", PortType.OUTPUT, PortSide.EAST)
+        child = LPort(a, PortType.OUTPUT, PortSide.EAST, name="c")
+        grandChild = LPort(a, PortType.OUTPUT, PortSide.EAST, name="gc")
+        child.setParent(p)
+        grandChild.setParent(child)
+        self.assertEqual(p.children, [child])
+        self.assertEqual(child.children, [grandChild])
+        self.assertIs(grandChild.node, a)
+
+        # move the whole subtree to other node
+        p.setParent(b)
+        for port in (p, child, grandChild):
+            self.assertIs(port.node, b)
+
+        # unnest the port
+        grandChild.setParent(a)
+        self.assertEqual(child.children, [])
+        self.assertIs(grandChild.node, a)
+        self.assertIs(child.node, b)
+
+    def test_edgeEndNodes(self):
+        g = LGraph()
+        a = g.add_node("a")
+        b = g.add_node("b")
+        p0 = a.addPort("o", PortType.OUTPUT, PortSide.EAST)
+        p1 = b.addPort("i", PortType.INPUT, PortSide.WEST)
+        e = g.add_edge(p0, p1)
+        self.assertIs(e.srcNode, a)
+        self.assertIs(e.dstNode, b)
+
+        # the cached end nodes follow the moved ports
+        c = g.add_node("c")
+        p1.setParent(c)
+        self.assertIs(e.dstNode, c)
+        p0.setParent(c)
+        self.assertIs(e.srcNode, c)
+        self.assertTrue(e.isSelfLoop)
+        p0.setParent(a)
+        self.assertIs(e.srcNode, a)
+        self.assertFalse(e.isSelfLoop)
+        p1.setParent(b)
+        self.assertIs(e.dstNode, b)
+
+        g2 = pickle.loads(pickle.dumps(g))
+        for n in g2.nodes:
+            for p in n.iterPorts():
+                self.assertIs(p.node, n)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(LPortTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
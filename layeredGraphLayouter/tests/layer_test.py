@@ -1,4 +1,7 @@
+import pickle
 import unittest
+
+from layeredGraphLayouter.containers.lGraph import LGraph
 from layeredGraphLayouter.tests.testGraphCreator import TestGraphCreator
 
 
@@ -7,6 +10,99 @@ class LayerTC(unittest.TestCase):
         self.gb = TestGraphCreator()
         self.random = self.gb.random
 
+    def assertIndexValid(self, layer):
+        for i, n in enumerate(layer):
+            self.assertEqual(layer.indexOf(n), i)
+            self.assertEqual(n.getIndex(), i)
+            self.assertIn(n, layer)
+
+    def test_indexOf(self):
+        gb = self.gb
+        layer = gb.makeLayer()
+        nodes = gb.addNodesToLayer(6, layer)
+        self.assertIndexValid(layer)
+
+        layer.remove(nodes[1])
+        self.assertNotIn(nodes[1], layer)
+        with self.assertRaises(ValueError):
+            layer.indexOf(nodes[1])
+        self.assertIndexValid(layer)
+
+        layer.insert(0, nodes[1])
+        self.assertIndexValid(layer)
+        layer.insert(-1, layer.pop(0))
+        self.assertIndexValid(layer)
+
+        layer[0], layer[1] = layer[1], layer[0]
+        self.assertIndexValid(layer)
+
+        layer.sort(key=lambda n: -nodes.index(n))
+        self.assertEqual(list(layer), nodes[::-1])
+        self.assertIndexValid(layer)
+
+        layer.setOrder(nodes)
+        self.assertIndexValid(layer)
+        layer.reverse()
+        self.assertIndexValid(layer)
+
+        layer[:] = nodes[:3]
+        self.assertNotIn(nodes[4], layer)
+        self.assertIndexValid(layer)
+
+        layer.extend(nodes[3:])
+        layer.removeAll(nodes[::2])
+        self.assertEqual(list(layer), nodes[1::2])
+        self.assertIndexValid(layer)
+
+        del layer[0]
+        self.assertEqual(list(layer), nodes[3::2])
+        self.assertIndexValid(layer)
+
+    def test_setitemAfterPopAndInsert(self):
+        gb = self.gb
+        layer = gb.makeLayer()
+        a, b, c, x, y = gb.addNodesToLayer(5, layer)
+        layer.pop()
+        layer.pop()
+        layer.insert(0, x)
+        # positions of a, b, c are stale now
+        layer[3] = y
+        self.assertEqual(list(layer), [x, a, b, y])
+        self.assertNotIn(c, layer)
+        with self.assertRaises(ValueError):
+            layer.indexOf(c)
+        self.assertIndexValid(layer)
+
+        layer.remove(b)
+        self.assertEqual(list(layer), [x, a, y])
+        self.assertIndexValid(layer)
+
+        # swap in the stale part of the index
+        layer.insert(0, c)
+        layer[2], layer[3] = layer[3], layer[2]
+        self.assertEqual(list(layer), [c, x, y, a])
+        self.assertIndexValid(layer)
+
+    def test_setLayer(self):
+        gb = self.gb
+        a = gb.makeLayer()
+        b = gb.makeLayer()
+        nodes = gb.addNodesToLayer(20, a)
+        for n in nodes[::3]:
+            n.setLayer(b)
+        self.assertEqual(list(a), [n for i, n in enumerate(nodes) if i % 3])
+        self.assertEqual(list(b), nodes[::3])
+        self.assertIndexValid(a)
+        self.assertIndexValid(b)
+
+    def test_pickle(self):
+        g = LGraph()
+        g.append_layer([g.add_node("n%d" % i) for i in range(5)])
+        g = pickle.loads(pickle.dumps(g))
+        layer = g.layers[0]
+        layer.remove(layer[2])
+        self.assertIndexValid(layer)
+
 
 if __name__ == "__main__":
     suite = unittest.TestSuite()
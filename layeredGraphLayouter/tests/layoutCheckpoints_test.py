@@ -0,0 +1,104 @@
+from io import BytesIO
+import unittest
+
+from layeredGraphLayouter.benchmarks.generators import randomDag
+from layeredGraphLayouter.containers.constants import FixedAlignment
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.greedyCycleBreaker import GreedyCycleBreaker
+from layeredGraphLayouter.iLayoutProcessor import ILayoutProcessor
+from layeredGraphLayouter.layoutCheckpoints import LayoutCheckpoints
+from layeredGraphLayouter.layoutProcessor import LayoutProcessor, defaultConfig
+from layeredGraphLayouter.layoutProcessorConfiguration import LayoutProcessorConfiguration
+
+
+class RecordingProcessor(ILayoutProcessor):
+
+    def __init__(self, log: list):
+        self.log = log
+
+    def process(self, graph: LGraph):
+        self.log.append(graph.nodePlacementBkFixedAlignment)
+
+
+def layerNames(g: LGraph):
+    return [[n.name for n in l] for l in g.layers]
+
+
+def config(log: list):
+    c = defaultConfig()
+    c.p4_node_placement = [RecordingProcessor(log)]
+    return c
+
+
+class LayoutCheckpointsTC(unittest.TestCase):
+
+    def layout(self, log=None, checkpoints=None):
+        g = randomDag(80, 1)
+        return LayoutProcessor(g, config([] if log is None else log),
+                               checkpoints=checkpoints).run()
+
+    def test_allPhasesSaved(self):
+        checkpoints = LayoutCheckpoints()
+        self.layout(checkpoints=checkpoints)
+        for p in LayoutCheckpoints.PHASE_NAMES:
+            self.assertIn(p, checkpoints)
+
+    def test_unchangedPhase_sharesState(self):
+        checkpoints = LayoutCheckpoints()
+        c = LayoutProcessorConfiguration(p1_cycle_breaking=[GreedyCycleBreaker()])
+        LayoutProcessor(randomDag(20, 0), c, checkpoints=checkpoints).run()
+        states = checkpoints.states
+        # (p5 contains ReversedEdgeRestorer of the GreedyCycleBreaker)
+        for p in LayoutCheckpoints.PHASE_NAMES[1:-1]:
+            # nothing happened in this phase
+            self.assertTrue(states[p] is states["p1_cycle_breaking"], p)
+
+    def test_resume_skipsPreviousPhases(self):
+        checkpoints = LayoutCheckpoints()
+        ref = layerNames(self.layout(checkpoints=checkpoints))
+
+        log = []
+        c = config(log)
+        c.p3_node_ordering[0].process = None  # must not be called
+        proc = LayoutProcessor.resume(checkpoints, "p4_node_placement", c)
+        proc.graph.nodePlacementBkFixedAlignment = FixedAlignment.BALANCED
+        g = proc.run()
+
+        self.assertEqual(log, [FixedAlignment.BALANCED])
+        self.assertEqual(layerNames(g), ref)
+
+    def test_resume_crossingMinimization_sameResult(self):
+        checkpoints = LayoutCheckpoints()
+        ref = layerNames(self.layout(checkpoints=checkpoints))
+        g = LayoutProcessor.resume(
+            checkpoints, "p3_node_ordering", config([])).run()
+        self.assertEqual(layerNames(g), ref)
+
+    def test_dumpLoad(self):
+        checkpoints = LayoutCheckpoints(phases=["p3_node_ordering"])
+        ref = layerNames(self.layout(checkpoints=checkpoints))
+        self.assertEqual(list(checkpoints.states.keys()), ["p3_node_ordering"])
+
+        f = BytesIO()
+        checkpoints.dump(f)
+        f.seek(0)
+        checkpoints = LayoutCheckpoints.load(f)
+
+        g = LayoutProcessor.resume(
+            checkpoints, "p4_node_placement", config([])).run()
+        self.assertEqual(layerNames(g), ref)
+        with self.assertRaises(KeyError):
+            checkpoints.restore("p3_node_ordering")
+
+    def test_invalidPhase(self):
+        with self.assertRaises(ValueError):
+            LayoutCheckpoints(phases=["p6"])
+        with self.assertRaises(ValueError):
+            LayoutCheckpoints().restore("p1_cycle_breaking")
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(LayoutCheckpointsTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
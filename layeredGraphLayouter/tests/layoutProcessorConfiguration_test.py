@@ -0,0 +1,123 @@
+import unittest
+
+from layeredGraphLayouter.benchmarks.generators import randomDag
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.edgeManipulators.longEdgeJoiner import LongEdgeJoiner
+from layeredGraphLayouter.edgeManipulators.longEdgeSplitter import LongEdgeSplitter
+from layeredGraphLayouter.edgeManipulators.reversedEdgeRestorer import ReversedEdgeRestorer
+from layeredGraphLayouter.greedyCycleBreaker import GreedyCycleBreaker
+from layeredGraphLayouter.iLayoutProcessor import ILayoutProcessor
+from layeredGraphLayouter.layoutProcessor import LayoutProcessor, defaultConfig
+from layeredGraphLayouter.layoutProcessorConfiguration import LayoutProcessorConfiguration
+from layeredGraphLayouter.minWidthLayerer import MinWidthLayerer
+from layeredGraphLayouter.nodeManipulators.layerConstraintProcessor import LayerConstraintProcessor
+
+
+class ProcessorA(ILayoutProcessor):
+    pass
+
+
+class ProcessorB(ILayoutProcessor):
+    SAME_SLOT_DEPENDENCIES = (ProcessorA, )
+
+
+class RequiresSplitter(ILayoutProcessor):
+    """
+    Requires same intermediate processors as GreedyCycleBreaker
+    and LayerSweepCrossingMinimizer, depending on the graph features
+    """
+
+    @staticmethod
+    def getLayoutProcessorConfiguration(graph: LGraph):
+        c = LayoutProcessorConfiguration(
+            p3_node_ordering_before=[LongEdgeSplitter()],
+            p5_edge_routing_after=[ReversedEdgeRestorer()])
+        if graph.p_hyperedges:
+            c.p5_edge_routing_after.append(LongEdgeJoiner())
+        return c
+
+
+def slotClasses(config, slot):
+    return [p.__class__ for p in getattr(config, slot)]
+
+
+class LayoutProcessorConfigurationTC(unittest.TestCase):
+
+    def test_intermediateProcessors_deduplicated(self):
+        c = defaultConfig()
+        c.p3_node_ordering.append(RequiresSplitter())
+        plan = c.compile(LGraph())
+        self.assertEqual(slotClasses(plan, "p3_node_ordering_before"),
+                         [LayerConstraintProcessor, LongEdgeSplitter])
+        self.assertEqual(slotClasses(plan, "p5_edge_routing_after"),
+                         [ReversedEdgeRestorer, LongEdgeJoiner])
+        self.assertEqual(len(c.p3_node_ordering), 2)
+        self.assertIsNone(c.p3_node_ordering_before)
+        self.assertTrue(plan.loaded)
+        self.assertFalse(c.loaded)
+
+    def test_sameSlotDependencies(self):
+        b = ProcessorB()
+        a = ProcessorA()
+        s = LongEdgeSplitter()
+        l = LayerConstraintProcessor()
+        c = LayoutProcessorConfiguration(p3_node_ordering=[b, s, a, l])
+        self.assertEqual(c.compile(LGraph()).p3_node_ordering, [a, b, l, s])
+
+        # LongEdgeSplitter is requested before LayerConstraintProcessor
+        c = LayoutProcessorConfiguration(p1_cycle_breaking=[RequiresSplitter()],
+                                         p2_layering=[MinWidthLayerer()])
+        self.assertEqual(slotClasses(c.compile(LGraph()), "p3_node_ordering_before"),
+                         [LayerConstraintProcessor, LongEdgeSplitter])
+
+    def test_cache(self):
+        c = LayoutProcessorConfiguration(p1_cycle_breaking=[GreedyCycleBreaker()],
+                                         p3_node_ordering=[RequiresSplitter()])
+        g0 = LGraph()
+        g1 = LGraph()
+        plan = c.compile(g0)
+        self.assertIs(c.compile(g1), plan)
+
+        g1.p_hyperedges = True
+        plan1 = c.compile(g1)
+        self.assertIsNot(plan1, plan)
+        self.assertEqual(slotClasses(plan1, "p5_edge_routing_after"),
+                         [ReversedEdgeRestorer, LongEdgeJoiner])
+
+        # modification of the configuration invalidates the cache
+        c.p2_layering = [ProcessorA()]
+        plan2 = c.compile(g0)
+        self.assertIsNot(plan2, plan)
+        self.assertEqual(slotClasses(plan2, "p2_layering"), [ProcessorA])
+
+    def test_load(self):
+        c = defaultConfig()
+        c.load(LGraph())
+        self.assertTrue(c.loaded)
+        self.assertEqual(slotClasses(c, "p5_edge_routing_after"),
+                         [ReversedEdgeRestorer, LongEdgeJoiner])
+        self.assertIs(c.compile(LGraph()), c)
+
+    def test_processorTimer(self):
+        timed = []
+
+        def processorTimer(phaseName, slotName, proc, t):
+            self.assertGreaterEqual(t, 0.0)
+            timed.append((phaseName, slotName, proc))
+
+        lp = LayoutProcessor(randomDag(20, 0), defaultConfig(),
+                             processorTimer=processorTimer)
+        lp.run()
+        plan = lp.config
+        self.assertEqual(timed, [(phaseName, slotName, proc)
+                                 for phaseName in plan.MAIN_PHASE_NAMES
+                                 for slotName, proc in plan.iterPhaseSlots(phaseName)])
+        self.assertIn(("p3_node_ordering_before", LongEdgeSplitter),
+                      [(slotName, proc.__class__) for _, slotName, proc in timed])
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(LayoutProcessorConfigurationTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
@@ -0,0 +1,70 @@
+import pickle
+import unittest
+
+from layeredGraphLayouter.containers.constants import NodeType, LayeredOptions
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lGraphCodec import encodeLGraph, decodeLGraph
+from layeredGraphLayouter.containers.spacings import NodeTypeSpacings,\
+    NODE_TYPE_CNT
+
+
+class SpacingsTC(unittest.TestCase):
+
+    def test_sharedBetweenGraphs(self):
+        a = LGraph()
+        b = LGraph()
+        self.assertIsNot(a.spacings, b.spacings)
+        self.assertIs(a.spacings.table, b.spacings.table)
+        self.assertIs(a.spacings.vertical, NodeTypeSpacings.get().vertical)
+
+    def test_values(self):
+        s = LGraph().spacings
+        N = NodeType.NORMAL
+        L = NodeType.LONG_EDGE
+        self.assertEqual(len(s.vertical), NODE_TYPE_CNT * NODE_TYPE_CNT)
+        self.assertEqual(s.getVerticalSpacing(N, N), LayeredOptions.SPACING_NODE_NODE)
+        self.assertEqual(s.getVerticalSpacing(N, L), LayeredOptions.SPACING_EDGE_NODE)
+        self.assertEqual(s.getVerticalSpacing(L, N), LayeredOptions.SPACING_EDGE_NODE)
+        self.assertEqual(s.getHorizontalSpacing(L, L),
+                         LayeredOptions.SPACING_EDGE_EDGE_BETWEEN_LAYERS)
+        self.assertEqual(s.vertical[N.value * NODE_TYPE_CNT + L.value],
+                         LayeredOptions.SPACING_EDGE_NODE)
+        self.assertEqual(s.getVerticalSpacing(NodeType.BREAKING_POINT,
+                                              NodeType.LABEL), 0)
+
+        g = LGraph()
+        n = g.add_node("n")
+        self.assertEqual(g.spacings.getVerticalSpacing(n, L),
+                         LayeredOptions.SPACING_EDGE_NODE)
+
+    def test_setOptions(self):
+        a = LGraph()
+        b = LGraph()
+        default = a.spacings.table
+        a.spacings.setOptions(SPACING_NODE_NODE=33)
+        self.assertIsNot(a.spacings.table, default)
+        self.assertIs(b.spacings.table, default)
+        self.assertEqual(a.spacings.getVerticalSpacing(NodeType.NORMAL, NodeType.NORMAL), 33)
+        self.assertEqual(a.spacings.getOption("SPACING_NODE_NODE"), 33)
+
+        b.spacings.setOptions(SPACING_NODE_NODE=33)
+        self.assertIs(a.spacings.table, b.spacings.table)
+        with self.assertRaises(ValueError):
+            b.spacings.setOptions(SPACING_UNKNOWN=1)
+
+    def test_serialization(self):
+        g = LGraph()
+        g.spacings.setOptions(SPACING_EDGE_EDGE=7)
+        table = g.spacings.table
+        self.assertIs(pickle.loads(pickle.dumps(table)), table)
+
+        g2 = decodeLGraph(encodeLGraph(g))
+        self.assertIs(g2.spacings.table, table)
+        self.assertIs(g2.spacings.graph, g2)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(SpacingsTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
@@ -0,0 +1,45 @@
+from io import StringIO
+import json
+import unittest
+
+from layeredGraphLayouter.containers.geometry import Point
+from layeredGraphLayouter.tests.toSvgStream_test import createExportTestGraph
+from layeredGraphLayouter.toJson import ToJson
+
+
+class ToJsonTC(unittest.TestCase):
+
+    def test_columns(self):
+        g = createExportTestGraph()
+        g.edges[1].bendPoints.append(Point(5, 6.5))
+        j = ToJson().LGraph_toJson(g)
+
+        self.assertEqual(j["width"], 301.5)
+        nodes = j["nodes"]
+        self.assertEqual(nodes["name"], ["n0<&>", "n1<&>", "n2<&>"])
+        self.assertEqual(nodes["isExternalPort"], [0, 0, 0])
+        self.assertEqual(nodes["x"], [0, 100.5, 201])
+        self.assertEqual(nodes["portOffsets"], [0, 2, 4, 6])
+        self.assertEqual(j["ports"]["name"], ["o", "i"] * 3)
+        edges = j["edges"]
+        self.assertEqual(edges["src"], [0, 2, 4])
+        self.assertEqual(edges["dst"], [3, 5, 1])
+        self.assertEqual(edges["reversed"], [0, 0, 1])
+        self.assertEqual(edges["bendOffsets"], [0, 0, 1, 1])
+        self.assertEqual(edges["bendX"], [5])
+        self.assertEqual(edges["bendY"], [6.5])
+
+    def test_streamSameAsDict(self):
+        g = createExportTestGraph(10)
+        for chunkSize in (1, 3, 4096):
+            buff = StringIO()
+            ToJson(chunkSize=chunkSize).writeJson(g, buff)
+            self.assertEqual(json.loads(buff.getvalue()),
+                             ToJson().LGraph_toJson(g))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(ToJsonTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
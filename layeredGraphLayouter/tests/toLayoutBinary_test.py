@@ -0,0 +1,65 @@
+from io import BytesIO
+import os
+from tempfile import TemporaryDirectory
+import unittest
+
+from layeredGraphLayouter.containers.geometry import Point
+from layeredGraphLayouter.tests.toSvgStream_test import createExportTestGraph
+from layeredGraphLayouter.toLayoutBinary import ToLayoutBinary, LayoutBinaryReader
+
+
+class ToLayoutBinaryTC(unittest.TestCase):
+
+    def writeAndRead(self, g, d):
+        fileName = os.path.join(d, "g.lglb")
+        ToLayoutBinary().writeLayoutFile(g, fileName)
+        return LayoutBinaryReader(fileName)
+
+    def test_columns(self):
+        g = createExportTestGraph()
+        g.edges[0].bendPoints.extend([Point(1, 2), Point(3, 4.5)])
+
+        with TemporaryDirectory() as d, self.writeAndRead(g, d) as r:
+            for asNumpy in (False, True):
+                col = lambda name: list(r.column(name, asNumpy=asNumpy))
+                self.assertEqual(col("node_x"), [n.possition.x for n in g.nodes])
+                self.assertEqual(col("node_h"), [n.size.y for n in g.nodes])
+                self.assertEqual(col("node_port_offsets"), [0, 2, 4, 6])
+                ports = [p for n in g.nodes for p in n.iterPorts()]
+                self.assertEqual(col("port_y"), [p.possition.y for p in ports])
+                self.assertEqual(col("port_side"), [p.side.value for p in ports])
+                self.assertEqual(col("edge_src"), [ports.index(e.src) for e in g.edges])
+                self.assertEqual(col("edge_dst"), [ports.index(e.dst) for e in g.edges])
+                self.assertEqual(col("edge_flags"), [0, 0, 1])
+                self.assertEqual(col("edge_bend_offsets"), [0, 2, 2, 2])
+                self.assertEqual(col("bend_x"), [1, 3])
+                self.assertEqual(col("bend_y"), [2, 4.5])
+
+            self.assertEqual(r.nodeName(1), "n1<&>")
+            del col
+
+    def test_alignment(self):
+        g = createExportTestGraph(1)
+        buff = BytesIO()
+        ToLayoutBinary().writeLayout(g, buff)
+        self.assertEqual(buff.getvalue()[:4], b"LGLB")
+        with TemporaryDirectory() as d, self.writeAndRead(g, d) as r:
+            self.assertIn("bend_x", r.columns())
+            for _, offset, _ in r.columnsInfo.values():
+                self.assertEqual(offset % 8, 0)
+            self.assertEqual(len(r.column("bend_x")), 0)
+
+    def test_notLayoutFile(self):
+        with TemporaryDirectory() as d:
+            fileName = os.path.join(d, "g.lglb")
+            with open(fileName, "wb") as f:
+                f.write(b"<svg>" + b"\0" * 32)
+            with self.assertRaises(ValueError):
+                LayoutBinaryReader(fileName)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(ToLayoutBinaryTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
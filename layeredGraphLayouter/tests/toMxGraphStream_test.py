@@ -0,0 +1,53 @@
+from io import StringIO
+import unittest
+import xml.etree.ElementTree as etree
+
+from layeredGraphLayouter.toMxGraph import ToMxGraph
+from layeredGraphLayouter.toMxGraphStream import ToMxGraphStream, decompressDiagram
+from layeredGraphLayouter.tests.toSvgStream_test import createExportTestGraph
+
+
+def elementToTuple(e: etree.Element):
+    return (e.tag, dict(e.attrib), [elementToTuple(ch) for ch in e])
+
+
+class ToMxGraphStreamTC(unittest.TestCase):
+
+    def test_sameAsToMxGraph(self):
+        g = createExportTestGraph()
+        expected = elementToTuple(ToMxGraph().LGraph_toMxGraph(g))
+
+        buff = StringIO()
+        ToMxGraphStream().writeMxGraph(g, buff)
+        res = elementToTuple(etree.fromstring(buff.getvalue()))
+
+        self.assertEqual(res, expected)
+
+    def test_idsAreContiguous(self):
+        g = createExportTestGraph(5)
+        buff = StringIO()
+        ToMxGraphStream().writeMxGraph(g, buff)
+        gm = etree.fromstring(buff.getvalue())
+        ids = [int(c.get("id")) for c in gm.iter("mxCell")]
+        self.assertEqual(ids, list(range(len(ids))))
+
+    def test_compressed(self):
+        g = createExportTestGraph(20)
+        buff = StringIO()
+        ToMxGraphStream().writeMxGraph(g, buff)
+        uncompressed = buff.getvalue()
+
+        buff = StringIO()
+        ToMxGraphStream().writeMxGraph(g, buff, compressed=True)
+        mxfile = etree.fromstring(buff.getvalue())
+        diagram = mxfile.find("diagram")
+        self.assertEqual(diagram.get("name"), "Page-1")
+        self.assertEqual(decompressDiagram(diagram.text), uncompressed)
+        self.assertLess(len(buff.getvalue()), len(uncompressed))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(ToMxGraphStreamTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
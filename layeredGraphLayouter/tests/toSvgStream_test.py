@@ -0,0 +1,101 @@
+import gzip
+from io import StringIO
+import os
+from tempfile import TemporaryDirectory
+import unittest
+import xml.etree.ElementTree as etree
+
+from layeredGraphLayouter.containers.constants import PortType, PortSide
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.toSvg import ToSvg
+from layeredGraphLayouter.toSvgStream import ToSvgStream
+
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+
+def createExportTestGraph(nodeCnt=3) -> LGraph:
+    """
+    Chain of nodes with input and output port, placed in to a row
+    """
+    g = LGraph()
+    prevOut = None
+    for i in range(nodeCnt):
+        n = g.add_node(name="n%d<&>" % i)
+        inp = n.addPort("i", PortType.INPUT, PortSide.WEST)
+        out = n.addPort("o", PortType.OUTPUT, PortSide.EAST)
+        n.initDim()
+        n.translate(i * 100.5, 10)
+        if prevOut is not None:
+            g.add_edge(prevOut, inp)
+        prevOut = out
+
+    # reversed edge back to the first node
+    e = g.add_edge(prevOut, g.nodes[0].west[0])
+    e.reversed = True
+    g.size.x = nodeCnt * 100.5
+    g.size.y = 100
+    return g
+
+
+def shapes(svg: etree.Element, ns=""):
+    """
+    :return: list of rect/text/polyline attributes in document order
+    """
+    res = []
+    for e in svg.iter():
+        tag = e.tag[len(ns):] if e.tag.startswith(ns) else e.tag
+        if tag == "rect":
+            res.append((tag, float(e.get("x")), float(e.get("y")),
+                        float(e.get("width")), float(e.get("height"))))
+        elif tag == "text":
+            res.append((tag, float(e.get("x")), float(e.get("y")), e.text))
+        elif tag == "polyline":
+            points = tuple(tuple(float(v) for v in p.split(","))
+                           for p in e.get("points").split())
+            res.append((tag, points))
+    return res
+
+
+class ToSvgStreamTC(unittest.TestCase):
+
+    def test_sameShapesAsToSvg(self):
+        g = createExportTestGraph()
+        expected = shapes(ToSvg().LGraph_toSvg(g))
+
+        buff = StringIO()
+        ToSvgStream().writeSvg(g, buff)
+        svg = etree.fromstring(buff.getvalue())
+
+        self.assertEqual(shapes(svg, SVG_NS), expected)
+        self.assertEqual(svg.get("width"), "301.5")
+
+    def test_styleClasses(self):
+        g = createExportTestGraph(2)
+        buff = StringIO()
+        ToSvgStream(reversed_edge_stroke="red").writeSvg(g, buff)
+        svg = etree.fromstring(buff.getvalue())
+
+        polylines = list(svg.iter(SVG_NS + "polyline"))
+        self.assertEqual([p.get("class") for p in polylines], ["e", "r"])
+        # only the marker has inline style
+        inlineStyles = [e.tag for e in svg.iter() if e.get("style") is not None]
+        self.assertEqual(inlineStyles, [SVG_NS + "circle"])
+        self.assertIn("stroke:red", svg.find(SVG_NS + "defs/" + SVG_NS + "style").text)
+
+    def test_gzipFile(self):
+        g = createExportTestGraph()
+        with TemporaryDirectory() as d:
+            fileName = os.path.join(d, "g.svgz")
+            ToSvgStream().writeSvgFile(g, fileName)
+            with gzip.open(fileName, "rt", encoding="utf-8") as f:
+                svg = etree.fromstring(f.read())
+
+        self.assertEqual(shapes(svg, SVG_NS), shapes(ToSvg().LGraph_toSvg(g)))
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(ToSvgStreamTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
@@ -0,0 +1,102 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+import unittest
+import xml.etree.ElementTree as etree
+
+from layeredGraphLayouter.containers.geometry import Point
+from layeredGraphLayouter.tests.toSvgStream_test import createExportTestGraph, SVG_NS
+from layeredGraphLayouter.toSvgTiles import ToSvgTiles, GridIndex
+from layeredGraphLayouter.trace import tracing
+
+
+class ToSvgTilesTC(unittest.TestCase):
+
+    def test_gridIndex(self):
+        index = GridIndex(10)
+        index.insert(0, 0, 0, 5, 5)
+        index.insert(1, 8, 8, 12, 25)
+        index.insert(2, 30, 30, 31, 31)
+        self.assertEqual(index.cells[(0, 0)], [0, 1])
+        self.assertEqual(index.cells[(1, 2)], [1])
+        self.assertEqual(index.query(0, 0, 19, 19), [0, 1])
+        self.assertEqual(index.query(25, 25, 35, 35), [2])
+        self.assertEqual(index.query(50, 50, 60, 60), [])
+
+    def writeTiles(self, g, d, **kwargs):
+        res = ToSvgTiles(**kwargs).writeTiles(g, d)
+        with open(os.path.join(d, "index.json")) as f:
+            self.assertEqual(json.load(f), res)
+        return res
+
+    def readTile(self, d, zoom, x, y):
+        with open(os.path.join(d, str(zoom), "%d_%d.svg" % (x, y))) as f:
+            return etree.fromstring(f.read())
+
+    def test_levelsOfDetail(self):
+        g = createExportTestGraph()
+        with TemporaryDirectory() as d:
+            res = self.writeTiles(g, d, tileSize=128, levels=3)
+            levels = res["levels"]
+            self.assertEqual([l["scale"] for l in levels], [0.25, 0.5, 1])
+            self.assertEqual(levels[2]["columns"], 3)
+            self.assertEqual(levels[0]["tiles"], [[0, 0]])
+
+            # full detail contains port labels
+            full = self.readTile(d, 2, 0, 0)
+            texts = [t.text for t in full.iter(SVG_NS + "text")]
+            self.assertIn("i", texts)
+            self.assertEqual(full.get("viewBox"), "0 0 128 128")
+
+            # ports without labels
+            middle = self.readTile(d, 1, 0, 0)
+            texts = [t.text for t in middle.iter(SVG_NS + "text")]
+            self.assertNotIn("i", texts)
+            self.assertEqual(len(list(middle.iter(SVG_NS + "rect"))), 9)
+
+            # coarse level has only nodes with labels
+            coarse = self.readTile(d, 0, 0, 0)
+            texts = [t.text for t in coarse.iter(SVG_NS + "text")]
+            self.assertEqual(texts, ["n0<&>", "n1<&>", "n2<&>"])
+            self.assertEqual(len(list(coarse.iter(SVG_NS + "rect"))), 3)
+
+    def test_parallelEdgesCollapse(self):
+        g = createExportTestGraph(2)
+        src = g.nodes[0].east[0]
+        dst = g.nodes[1].west[0]
+        for _ in range(10):
+            g.add_edge(src, dst).bendPoints.append(Point(90, 20))
+
+        t = ToSvgTiles(tileSize=64, levels=2)
+        fine = [p for p in t.LGraph_toPrimitives(g, 1) if p[0] == "line"]
+        coarse = [p for p in t.LGraph_toPrimitives(g, 0.5) if p[0] == "line"]
+        self.assertEqual(len(fine), 12)
+        self.assertLess(len(coarse), 6)
+
+    def test_parallelWriteSameAsSequential(self):
+        g = createExportTestGraph(8)
+        with TemporaryDirectory() as d0, TemporaryDirectory() as d1:
+            res0 = self.writeTiles(g, d0, tileSize=128, levels=2)
+            res1 = self.writeTiles(g, d1, tileSize=128, levels=2, workers=2)
+            self.assertEqual(res0, res1)
+            for level in res0["levels"]:
+                for x, y in level["tiles"]:
+                    name = os.path.join(str(level["zoom"]), "%d_%d.svg" % (x, y))
+                    with open(os.path.join(d0, name)) as f0, open(os.path.join(d1, name)) as f1:
+                        self.assertEqual(f0.read(), f1.read())
+
+    def test_parallelWriteTraced(self):
+        g = createExportTestGraph(8)
+        with TemporaryDirectory() as d, tracing() as tracer:
+            res = self.writeTiles(g, d, tileSize=128, levels=2, workers=2)
+        tiles = [e for e in tracer.events if e[0] == "tile"]
+        self.assertEqual(len(tiles), sum(len(l["tiles"]) for l in res["levels"]))
+        self.assertNotIn(os.getpid(), {e[4] for e in tiles})
+        self.assertEqual(len([e for e in tracer.events if e[0] == "level"]), 2)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(ToSvgTilesTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
@@ -0,0 +1,131 @@
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import tempfile
+import unittest
+
+from layeredGraphLayouter.crossing.layerSweepCrossingMinimizer import LayerSweepCrossingMinimizer
+from layeredGraphLayouter.greedyCycleBreaker import GreedyCycleBreaker
+from layeredGraphLayouter.layoutProcessor import LayoutProcessor
+from layeredGraphLayouter.layoutProcessorConfiguration import LayoutProcessorConfiguration
+from layeredGraphLayouter.minWidthLayerer import MinWidthLayerer
+from layeredGraphLayouter.benchmarks.generators import randomDag
+from layeredGraphLayouter.trace import span, getTracer, tracing, Tracer
+
+
+def _work(i):
+    with tracing() as tracer:
+        with span("work", "test", {"i": i}):
+            pass
+    return tracer.events
+
+
+def checkSpeedscopeNesting(tc, profile):
+    stack = []
+    last = None
+    for ev in profile["events"]:
+        if last is not None:
+            tc.assertGreaterEqual(ev["at"], last)
+        last = ev["at"]
+        if ev["type"] == "O":
+            stack.append(ev["frame"])
+        else:
+            tc.assertEqual(stack.pop(), ev["frame"])
+    tc.assertEqual(stack, [])
+
+
+class TraceTC(unittest.TestCase):
+
+    def test_disabled(self):
+        self.assertIsNone(getTracer())
+        a = span("a")
+        b = span("b", "x", {"v": 1})
+        self.assertIs(a, b)
+        with a:
+            pass
+
+    def test_nested(self):
+        with tracing() as t:
+            with span("outer", "test"):
+                with span("inner", "test", {"obj": object()}):
+                    pass
+                with span("inner", "test"):
+                    pass
+        self.assertIsNone(getTracer())
+        self.assertEqual([e[0] for e in t.events], ["inner", "inner", "outer"])
+
+        ct = t.toChromeTrace()
+        evs = [e for e in ct["traceEvents"] if e["ph"] == "X"]
+        self.assertEqual([e["name"] for e in evs], ["outer", "inner", "inner"])
+        outer = evs[0]
+        for e in evs[1:]:
+            self.assertGreaterEqual(e["ts"], outer["ts"])
+            self.assertLessEqual(e["ts"] + e["dur"], outer["ts"] + outer["dur"] + 1e-3)
+        self.assertIsInstance(evs[1]["args"]["obj"], str)
+        json.dumps(ct)
+
+        ss = t.toSpeedscope()
+        self.assertEqual([f["name"] for f in ss["shared"]["frames"]], ["outer", "inner"])
+        self.assertEqual(len(ss["profiles"]), 1)
+        checkSpeedscopeNesting(self, ss["profiles"][0])
+
+    def test_layout(self):
+        g = randomDag(40, 0)
+        config = LayoutProcessorConfiguration(
+            p1_cycle_breaking=[GreedyCycleBreaker()],
+            p2_layering=[MinWidthLayerer()],
+            p3_node_ordering=[LayerSweepCrossingMinimizer()])
+        with tracing() as t:
+            LayoutProcessor(g, config).run()
+
+        names = {e[0] for e in t.events}
+        for n in ["GreedyCycleBreaker", "MinWidthLayerer",
+                  "LayerSweepCrossingMinimizer", "LongEdgeSplitter",
+                  "minimizeCrossings", "restart", "sweep"]:
+            self.assertIn(n, names)
+
+        with tempfile.TemporaryDirectory() as d:
+            f0 = os.path.join(d, "layout.json")
+            f1 = os.path.join(d, "layout.speedscope.json")
+            t.write(f0)
+            t.write(f1)
+            with open(f0) as f:
+                self.assertIn("traceEvents", json.load(f))
+            with open(f1) as f:
+                ss = json.load(f)
+            self.assertIn("profiles", ss)
+            for p in ss["profiles"]:
+                checkSpeedscopeNesting(self, p)
+
+    def test_merge_workers(self):
+        with tracing() as t:
+            with span("main", "test"):
+                with ProcessPoolExecutor(2) as executor:
+                    for events in executor.map(_work, range(4)):
+                        t.merge(events)
+
+        self.assertEqual(len(t.events), 5)
+        ct = t.toChromeTrace()
+        workers = {e["pid"] for e in ct["traceEvents"]
+                   if e["ph"] == "X" and e["name"] == "work"}
+        self.assertNotIn(os.getpid(), workers)
+        mainEv, = [e for e in ct["traceEvents"] if e["name"] == "main"]
+        for e in ct["traceEvents"]:
+            if e["name"] == "work":
+                # same clock in all processes
+                self.assertGreaterEqual(e["ts"], mainEv["ts"])
+                self.assertLessEqual(e["ts"], mainEv["ts"] + mainEv["dur"])
+
+        ss = t.toSpeedscope()
+        self.assertEqual(len(ss["profiles"]), 1 + len(workers))
+
+    def test_write_unknown_format(self):
+        with self.assertRaises(ValueError):
+            Tracer().write(os.devnull, format="xml")
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TraceTC))
+    runner = unittest.TextTestRunner(verbosity=3)
+    runner.run(suite)
@@ -1,51 +1,145 @@
-from layeredGraphLayouter.containers.constants import PortType
+"""
+Columnar JSON exporter of the layout result
+
+Nodes, ports and edges are stored as objects of parallel arrays
+(same columns as :mod:`layeredGraphLayouter.toLayoutBinary` uses)::
+
+    {
+      "version": 1,
+      "width": ..., "height": ...,
+      "nodes": {"name": [...], "isExternalPort": [0/1, ...],
+                "x": [...], "y": [...], "w": [...], "h": [...],
+                "portOffsets": [0, ...]},
+      "ports": {"name": [...], "x": [...], "y": [...], "w": [...], "h": [...],
+                "side": [PortSide value, ...]},
+      "edges": {"name": [...], "src": [port id, ...], "dst": [port id, ...],
+                "reversed": [0/1, ...], "bendOffsets": [0, ...],
+                "bendX": [...], "bendY": [...]}
+    }
+
+Id of node/port/edge is its index in the arrays, ports of node i are
+ports[portOffsets[i]:portOffsets[i + 1]] (same for bend points of edges).
+"""
+from itertools import islice
+import json
+from typing import Dict
+
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lNode import LayoutExternalPort
+from layeredGraphLayouter.toLayoutBinary import ToLayoutBinary
+
+
+LAYOUT_JSON_VERSION = 1
+
+# (section, json key, column of ToLayoutBinary or name column)
+LAYOUT_JSON_COLUMNS = {
+    "nodes": (
+        ("name", "node_name"),
+        ("isExternalPort", "node_external"),
+        ("x", "node_x"),
+        ("y", "node_y"),
+        ("w", "node_w"),
+        ("h", "node_h"),
+        ("portOffsets", "node_port_offsets"),
+    ),
+    "ports": (
+        ("name", "port_name"),
+        ("x", "port_x"),
+        ("y", "port_y"),
+        ("w", "port_w"),
+        ("h", "port_h"),
+        ("side", "port_side"),
+    ),
+    "edges": (
+        ("name", "edge_name"),
+        ("src", "edge_src"),
+        ("dst", "edge_dst"),
+        ("reversed", "edge_flags"),
+        ("bendOffsets", "edge_bend_offsets"),
+        ("bendX", "bend_x"),
+        ("bendY", "bend_y"),
+    ),
+}
 
 
 class ToJson():
-    def LPort_toJson(self, lp):
-        return {"id": lp.id,
-                "geometry": self.toJson(lp.geometry),
-                "name": lp.name}
-
-    def LNode_toJson(self, lu):
-        toJson = self.toJson
-        return {"name": lu.name,
-                "id": lu.id,
-                "isExternalPort": False,
-                "geometry": toJson(lu.geometry),
-                "inputs":  [toJson(i)
-                            for i in self.inputs],
-                "outputs": [toJson(o)
-                            for o in self.outputs]
-                }
-
-    def LayoutExternalPort_toJson(self, lep):
-        j = self.LNode_toJson(lep)
-        j["direction"] = PortType.opposite(
-            lep.direction).toStr()
-        j["isExternalPort"] = True
-        return j
+    """
+    Exporter of layout result to columnar JSON
 
-    def LEdge_toJson(self, ln):
-        j = {}
-        if ln.name:
-            j['name'] = ln.name
-        j['source'] = ln.source.id
-        j['endpoints'] = list(map(lambda t: t.id, self.endpoints))
+    :ivar chunkSize: number of items of column serialized at once
+        when streaming
+    """
 
-        return j
+    def __init__(self, chunkSize=4096):
+        self.chunkSize = chunkSize
 
-    def LGraph_toJson(self, la):
-        # nets = sorted(nets , key=lambda x : x.name)
-        n2j = self.LNode_toJson
-        e2j = self.LEdge_toJson
-        return {"nodes": [n2j(n) for n in la.nodes],
-                "edges": [e2j(n) for n in la.nets]}
-
-    def GeometryRect_toJson(self, gr):
-        return {
-            "x": gr.x,
-            "y": gr.y,
-            "width": gr.width,
-            "height": gr.height
+    def LGraph_toColumns(self, la: LGraph) -> Dict[str, list]:
+        """
+        :return: dict {column name: sequence}
+        """
+        columns = ToLayoutBinary().LGraph_toColumns(la)
+        del columns["node_name_offsets"]
+        del columns["node_names"]
+        columns["node_name"] = [n.name for n in la.nodes]
+        columns["node_external"] = [1 if isinstance(n, LayoutExternalPort) else 0
+                                    for n in la.nodes]
+        columns["port_name"] = [p.name for n in la.nodes for p in n.iterPorts()]
+        columns["edge_name"] = [e.name for e in la.edges]
+        return columns
+
+    def LGraph_toJson(self, la: LGraph):
+        """
+        :return: json serializable dict (for small graphs, use writeJson()
+            for large ones)
+        """
+        columns = self.LGraph_toColumns(la)
+        j = {
+            "version": LAYOUT_JSON_VERSION,
+            "width": la.size.x,
+            "height": la.size.y,
         }
+        for section, sectionColumns in LAYOUT_JSON_COLUMNS.items():
+            j[section] = {k: list(columns[c]) for k, c in sectionColumns}
+        return j
+
+    def writeColumn(self, data, write):
+        """
+        Write json array in chunks of chunkSize items
+        """
+        write("[")
+        chunkSize = self.chunkSize
+        it = iter(data)
+        first = True
+        while True:
+            chunk = list(islice(it, chunkSize))
+            if not chunk:
+                break
+            if not first:
+                write(",")
+            first = False
+            write(json.dumps(chunk, separators=(",", ":"))[1:-1])
+        write("]")
+
+    def writeJson(self, graph: LGraph, fileObj):
+        """
+        Write the layout to text file-like object, columns are serialized
+        in chunks so there is no big intermediate string
+        """
+        columns = self.LGraph_toColumns(graph)
+        write = fileObj.write
+        write('{"version":%d,"width":%s,"height":%s' % (
+            LAYOUT_JSON_VERSION,
+            json.dumps(graph.size.x), json.dumps(graph.size.y)))
+        for section, sectionColumns in LAYOUT_JSON_COLUMNS.items():
+            write(',"%s":{' % section)
+            for i, (k, c) in enumerate(sectionColumns):
+                if i:
+                    write(",")
+                write('"%s":' % k)
+                self.writeColumn(columns[c], write)
+            write("}")
+        write("}\n")
+
+    def writeJsonFile(self, graph: LGraph, fileName: str):
+        with open(fileName, "w", encoding="utf-8") as f:
+            self.writeJson(graph, f)
@@ -0,0 +1,267 @@
+"""
+Columnar binary format of the layout result
+
+The file contains typed columns stored in contiguous little-endian arrays,
+so the reader can memory-map the file and use only the columns it needs
+without any parsing.
+
+File layout (all numbers little-endian)::
+
+    magic           4B  b"LGLB"
+    version         u32 (1)
+    column count    u32
+    column directory, for each column:
+        name        24B ascii, padded by zeros
+        type code   1B  ascii, type code of python array module
+                        ('d' f64, 'q' i64, 'i' i32, 'B' u8)
+        padding     7B
+        offset      u64 offset of the data from the start of the file
+                        (aligned to 8B)
+        length      u64 number of items
+    column data
+
+Columns (N nodes, P ports, E edges, B bend points):
+
+    node_x, node_y, node_w, node_h      f64[N]  node geometry
+    node_port_offsets                   i64[N + 1] ports of node i are
+                                        ports node_port_offsets[i]:node_port_offsets[i + 1]
+    node_name_offsets                   i64[N + 1] name of node i is utf-8
+                                        node_names[node_name_offsets[i]:node_name_offsets[i + 1]]
+    node_names                          u8[]
+    port_x, port_y, port_w, port_h      f64[P]  port geometry
+    port_side                           i32[P]  PortSide value
+    edge_src, edge_dst                  i64[E]  index of source/destination port
+                                        (-1 if not connected)
+    edge_flags                          u8[E]   bit 0: edge is reversed
+    edge_bend_offsets                   i64[E + 1] bend points of edge i are
+                                        bend_x/y[edge_bend_offsets[i]:edge_bend_offsets[i + 1]]
+    bend_x, bend_y                      f64[B]
+
+Node id is the index of the node in LGraph.nodes, port id is the index in the
+order of LNode.iterPorts() of all nodes.
+"""
+from array import array
+import mmap
+import struct
+import sys
+from typing import Dict, List
+
+from layeredGraphLayouter.containers.lGraph import LGraph
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional, columns are returned as memoryview without it
+    np = None
+
+
+LAYOUT_BINARY_MAGIC = b"LGLB"
+LAYOUT_BINARY_VERSION = 1
+_HEADER = struct.Struct("<4sII")
+_COLUMN_HEADER = struct.Struct("<24sc7xQQ")
+_ALIGNMENT = 8
+# numpy dtype for array module type code
+_NUMPY_DTYPE = {"d": "<f8", "q": "<i8", "i": "<i4", "B": "u1"}
+
+
+class ToLayoutBinary():
+    """
+    Exporter of layout result to columnar binary format
+    (described in module docstring)
+    """
+
+    def LGraph_toColumns(self, la: LGraph) -> Dict[str, array]:
+        """
+        :return: dict {column name: array}
+        """
+        node_x = array("d")
+        node_y = array("d")
+        node_w = array("d")
+        node_h = array("d")
+        node_port_offsets = array("q", [0])
+        node_name_offsets = array("q", [0])
+        node_names = bytearray()
+        port_x = array("d")
+        port_y = array("d")
+        port_w = array("d")
+        port_h = array("d")
+        port_side = array("i")
+        portIndex = {}
+
+        for n in la.nodes:
+            pos = n.possition
+            size = n.size
+            node_x.append(pos.x)
+            node_y.append(pos.y)
+            node_w.append(size.x)
+            node_h.append(size.y)
+            if n.name:
+                node_names.extend(n.name.encode("utf-8"))
+            node_name_offsets.append(len(node_names))
+
+            for p in n.iterPorts():
+                portIndex[p] = len(port_x)
+                pos = p.possition
+                size = p.size
+                port_x.append(pos.x)
+                port_y.append(pos.y)
+                port_w.append(size.x)
+                port_h.append(size.y)
+                port_side.append(p.side.value)
+            node_port_offsets.append(len(port_x))
+
+        edge_src = array("q")
+        edge_dst = array("q")
+        edge_flags = array("B")
+        edge_bend_offsets = array("q", [0])
+        bend_x = array("d")
+        bend_y = array("d")
+        for e in la.edges:
+            edge_src.append(portIndex.get(e.src, -1))
+            edge_dst.append(portIndex.get(e.dst, -1))
+            edge_flags.append(1 if e.reversed else 0)
+            for bp in e.bendPoints:
+                bend_x.append(bp.x)
+                bend_y.append(bp.y)
+            edge_bend_offsets.append(len(bend_x))
+
+        return {
+            "node_x": node_x,
+            "node_y": node_y,
+            "node_w": node_w,
+            "node_h": node_h,
+            "node_port_offsets": node_port_offsets,
+            "node_name_offsets": node_name_offsets,
+            "node_names": array("B", node_names),
+            "port_x": port_x,
+            "port_y": port_y,
+            "port_w": port_w,
+            "port_h": port_h,
+            "port_side": port_side,
+            "edge_src": edge_src,
+            "edge_dst": edge_dst,
+            "edge_flags": edge_flags,
+            "edge_bend_offsets": edge_bend_offsets,
+            "bend_x": bend_x,
+            "bend_y": bend_y,
+        }
+
+    def writeColumns(self, columns: Dict[str, array], fileObj):
+        """
+        Write columns to binary file-like object
+        """
+        offset = _HEADER.size + _COLUMN_HEADER.size * len(columns)
+        header = [_HEADER.pack(LAYOUT_BINARY_MAGIC, LAYOUT_BINARY_VERSION, len(columns))]
+        offsets = []
+        for name, data in columns.items():
+            name = name.encode("ascii")
+            if len(name) > 24:
+                raise ValueError("Column name too long", name)
+            offset += -offset % _ALIGNMENT
+            offsets.append(offset)
+            header.append(_COLUMN_HEADER.pack(name,
+                                              data.typecode.encode("ascii"),
+                                              offset, len(data)))
+            offset += len(data) * data.itemsize
+
+        fileObj.write(b"".join(header))
+        pos = len(header[0]) + _COLUMN_HEADER.size * len(columns)
+        for data, offset in zip(columns.values(), offsets):
+            fileObj.write(b"\0" * (offset - pos))
+            if sys.byteorder == "big":
+                data = array(data.typecode, data)
+                data.byteswap()
+            fileObj.write(data.tobytes())
+            pos = offset + len(data) * data.itemsize
+
+    def writeLayout(self, graph: LGraph, fileObj):
+        self.writeColumns(self.LGraph_toColumns(graph), fileObj)
+
+    def writeLayoutFile(self, graph: LGraph, fileName: str):
+        with open(fileName, "wb") as f:
+            self.writeLayout(graph, f)
+
+
+class LayoutBinaryReader():
+    """
+    Memory-mapped reader of the columnar layout format,
+    columns are loaded lazily by the OS when accessed
+
+    :ivar columnsInfo: dict {name: (type code, offset, length)}
+    """
+
+    def __init__(self, fileName: str):
+        self._file = open(fileName, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty file can not be mapped
+            self._file.close()
+            raise ValueError("Not a layout binary file", fileName)
+
+        self._buff = memoryview(self._mmap)
+        magic, version, columnCnt = _HEADER.unpack_from(self._buff, 0)
+        if magic != LAYOUT_BINARY_MAGIC:
+            self.close()
+            raise ValueError("Not a layout binary file", fileName)
+        if version != LAYOUT_BINARY_VERSION:
+            self.close()
+            raise ValueError("Unsupported version of layout binary file", version)
+
+        self.columnsInfo = {}
+        for i in range(columnCnt):
+            name, typecode, offset, length = _COLUMN_HEADER.unpack_from(
+                self._buff, _HEADER.size + i * _COLUMN_HEADER.size)
+            self.columnsInfo[name.rstrip(b"\0").decode("ascii")] = (
+                typecode.decode("ascii"), offset, length)
+
+    def columns(self) -> List[str]:
+        return list(self.columnsInfo.keys())
+
+    def column(self, name: str, asNumpy=None):
+        """
+        :param asNumpy: if True numpy array is returned, if False memoryview,
+            if None numpy array is returned if numpy is available
+        :return: zero copy view of the column
+        :raise RuntimeError: if memoryview is requested on big-endian machine
+            (the data in the file are little-endian)
+        """
+        typecode, offset, length = self.columnsInfo[name]
+        if asNumpy is None:
+            asNumpy = np is not None
+
+        if asNumpy:
+            return np.frombuffer(self._mmap, dtype=_NUMPY_DTYPE[typecode],
+                                 count=length, offset=offset)
+
+        itemsize = array(typecode).itemsize
+        if sys.byteorder == "big" and itemsize > 1:
+            raise RuntimeError(
+                "memoryview columns are available only on little-endian machines, use numpy")
+        return self._buff[offset:offset + length * itemsize].cast(typecode)
+
+    def nodeName(self, nodeIndex: int) -> str:
+        offsets = self.column("node_name_offsets", asNumpy=False)
+        names = self.column("node_names", asNumpy=False)
+        return bytes(names[offsets[nodeIndex]:offsets[nodeIndex + 1]]).decode("utf-8")
+
+    def close(self):
+        """
+        Close the file, the mapping itself is released
+        when all returned columns are released
+        """
+        if self._buff is not None:
+            self._buff.release()
+            self._buff = None
+            try:
+                self._mmap.close()
+            except BufferError:
+                # some column is still used
+                pass
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
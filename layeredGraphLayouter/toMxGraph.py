@@ -55,7 +55,7 @@ class ToMxGraph():
         }
 
     def LPort_coordinates(self, lp):
-        p = lp.getNode()
+        p = lp.node
         ch = lp
 
         if p.size.x == 0:
@@ -145,9 +145,9 @@ class ToMxGraph():
             _src = e.src
             _dst = e.dst
 
-        srcId = self.getMxGraphId(_src.getNode())
+        srcId = self.getMxGraphId(_src.node)
         srcX, srcY = self.LPort_coordinates(_src)
-        dstId = self.getMxGraphId(_dst.getNode())
+        dstId = self.getMxGraphId(_dst.node)
         dstX, dstY = self.LPort_coordinates(_dst)
 
         c = mxCell(
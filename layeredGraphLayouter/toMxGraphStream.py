@@ -0,0 +1,223 @@
+"""
+Streaming mxGraph (draw.io) exporter
+
+Ids of all cells are assigned in one pass before writing (same ids
+as :class:`layeredGraphLayouter.toMxGraph.ToMxGraph` assigns) and the XML is written
+incrementally to a file-like object. Optionally the diagram is written
+in compressed form used by draw.io (raw deflate + base64 of url encoded XML).
+"""
+import base64
+from urllib.parse import quote, unquote
+from xml.sax.saxutils import quoteattr
+import zlib
+
+from layeredGraphLayouter.containers.lEdge import LEdge
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lNode import LNode, LayoutExternalPort
+from layeredGraphLayouter.containers.sizeConfig import UNIT_HEADER_OFFSET
+from layeredGraphLayouter.toMxGraph import ToMxGraph
+
+
+# characters which are not escaped by javascript encodeURIComponent
+URI_COMPONENT_SAFE = "-_.!~*'()"
+
+MX_GRAPH_MODEL_ATTRS = (
+    '<mxGraphModel dx="0" dy="0" grid="1" gridSize="10" guides="1"'
+    ' tooltips="1" connect="1" arrows="1" fold="1" page="1" pageScale="1"'
+    ' background="#ffffff" math="0" shadow="0">')
+
+NODE_STYLE = "rounded=0;whiteSpace=wrap;html=1;"
+LABEL_STYLE = ("text;html=1;resizable=0;points=[];autosize=1;align=left;"
+               "verticalAlign=top;spacingTop=0;")
+
+
+class DeflateBase64Writer():
+    """
+    Text file-like object which writes url encoded, raw deflate compressed
+    and base64 encoded data to other text file-like object
+    (as draw.io does for compressed diagrams)
+    """
+
+    def __init__(self, fileObj, level=zlib.Z_DEFAULT_COMPRESSION):
+        self.fileObj = fileObj
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        # bytes which were not encoded yet because base64 encodes 3B blocks
+        self.pending = b""
+
+    def write(self, s: str):
+        data = self.compressor.compress(
+            quote(s, safe=URI_COMPONENT_SAFE).encode("ascii"))
+        if data:
+            self._writeBase64(data)
+
+    def _writeBase64(self, data: bytes):
+        data = self.pending + data
+        usable = len(data) - len(data) % 3
+        self.pending = data[usable:]
+        if usable:
+            self.fileObj.write(base64.b64encode(data[:usable]).decode("ascii"))
+
+    def close(self):
+        self._writeBase64(self.compressor.flush())
+        if self.pending:
+            self.fileObj.write(base64.b64encode(self.pending).decode("ascii"))
+            self.pending = b""
+
+
+class ToMxGraphStream():
+    """
+    Streaming version of :class:`layeredGraphLayouter.toMxGraph.ToMxGraph`
+
+    :note: this is not a subclass of ToMxGraph because it can export only
+        whole graphs (ids of all cells are assigned before writing)
+        while ToMxGraph converts also the separate objects
+    :ivar mxGraph: ToMxGraph instance used to resolve the port coordinates
+    :ivar ids: dict {LNode: id} precomputed ids of nodes
+        (ids of labels, ports and edges are derived from order)
+    :ivar firstEdgeId: id of the first edge (edges are after all nodes)
+    :ivar write: write method of current output
+    """
+
+    def __init__(self):
+        self.mxGraph = ToMxGraph()
+        self.ids = {}
+        self.firstEdgeId = 2
+        self.write = None
+
+    def assignIds(self, graph: LGraph) -> None:
+        """
+        Assign contiguous ids to all cells in order in which they are written
+        """
+        ids = self.ids
+        ids.clear()
+        i = 2
+        for n in graph.nodes:
+            ids[n] = i
+            if (n.__class__ is LayoutExternalPort
+                    and len(n.west) + len(n.east) == 1):
+                i += 1
+            else:
+                i += 1 + (1 if n.name else 0) + sum(1 for _ in n.iterPorts())
+        self.firstEdgeId = i
+
+    def geometry(self, x, y, width, height):
+        return ('<mxGeometry x="%s" y="%s" width="%s" height="%s" as="geometry"/>'
+                % (x, y, width, height))
+
+    def LNode_toMxGraph(self, lu: LNode):
+        _id = self.ids[lu]
+        pos = lu.possition
+        size = lu.size
+        px = pos.x
+        py = pos.y
+        parts = ['<mxCell value="" id="%d" style="%s" parent="1" vertex="1">' % (_id, NODE_STYLE),
+                 self.geometry(px, py, size.x, size.y),
+                 '</mxCell>\n']
+        i = _id + 1
+        if lu.name:
+            parts.extend((
+                '<mxCell id="%d" value=%s style="%s" vertex="1" parent="%d">' % (
+                    i, quoteattr(lu.name), LABEL_STYLE, _id),
+                self.geometry(0, 0, size.x, UNIT_HEADER_OFFSET),
+                '</mxCell>\n'))
+            i += 1
+
+        for lp in lu.iterPorts():
+            ppos = lp.possition
+            psize = lp.size
+            parts.extend((
+                '<mxCell value=%s id="%d" style="%s" parent="%d" vertex="1">' % (
+                    quoteattr(lp.name or ""), i, NODE_STYLE, _id),
+                self.geometry(ppos.x - px, ppos.y - py, psize.x, psize.y),
+                '</mxCell>\n'))
+            i += 1
+
+        self.write("".join(parts))
+
+    def LayoutExternalPort_toMxGraph(self, lep):
+        if len(lep.west) + len(lep.east) == 1:
+            pos = lep.possition
+            size = lep.size
+            self.write("".join((
+                '<mxCell id="%d" value=%s style="%s" vertex="1" parent="1">' % (
+                    self.ids[lep], quoteattr(lep.name or ""), NODE_STYLE),
+                self.geometry(pos.x, pos.y, size.x, size.y),
+                '</mxCell>\n')))
+        else:
+            self.LNode_toMxGraph(lep)
+
+    def LEdge_toMxGraph(self, e: LEdge, _id: int):
+        if e.reversed:
+            _src = e.dst
+            _dst = e.src
+        else:
+            _src = e.src
+            _dst = e.dst
+
+        ids = self.ids
+        LPort_coordinates = self.mxGraph.LPort_coordinates
+        srcX, srcY = LPort_coordinates(_src)
+        dstX, dstY = LPort_coordinates(_dst)
+        self.write(
+            '<mxCell id="%d" style="edgeStyle=orthogonalEdgeStyle;rounded=0;html=1;'
+            'exitX=%f;exitY=%f;entryX=%f;entryY=%f;jettySize=auto;orthogonalLoop=1;"'
+            ' edge="1" parent="1" source="%d" target="%d">'
+            '<mxGeometry relative="1" as="geometry"/></mxCell>\n' % (
+                _id, srcX, srcY, dstX, dstY,
+                ids[_src.node], ids[_dst.node]))
+
+    def LGraph_toMxGraph(self, la: LGraph):
+        self.assignIds(la)
+        write = self.write
+        write(MX_GRAPH_MODEL_ATTRS)
+        write('<root><mxCell id="0"/><mxCell id="1" parent="0"/>\n')
+
+        nodeWriters = {
+            LNode: self.LNode_toMxGraph,
+            LayoutExternalPort: self.LayoutExternalPort_toMxGraph,
+        }
+        for n in la.nodes:
+            nodeWriters[n.__class__](n)
+
+        LEdge_toMxGraph = self.LEdge_toMxGraph
+        for i, e in enumerate(la.edges, self.firstEdgeId):
+            LEdge_toMxGraph(e, i)
+
+        write("</root></mxGraphModel>")
+
+    def writeMxGraph(self, graph: LGraph, fileObj, compressed=False,
+                     diagramName="Page-1"):
+        """
+        Write the graph to text file-like object
+
+        :param compressed: if True the mxGraphModel is wrapped in
+            <mxfile><diagram> and compressed as draw.io does
+        """
+        if compressed:
+            fileObj.write('<mxfile><diagram id="0" name=%s>' %
+                          quoteattr(diagramName))
+            out = DeflateBase64Writer(fileObj)
+        else:
+            out = fileObj
+
+        self.write = out.write
+        try:
+            self.LGraph_toMxGraph(graph)
+        finally:
+            self.write = None
+
+        if compressed:
+            out.close()
+            fileObj.write("</diagram></mxfile>\n")
+
+    def writeMxGraphFile(self, graph: LGraph, fileName: str, compressed=False):
+        with open(fileName, "w", encoding="utf-8") as f:
+            self.writeMxGraph(graph, f, compressed=compressed)
+
+
+def decompressDiagram(data: str) -> str:
+    """
+    Decode compressed draw.io diagram (content of <diagram> element)
+    """
+    xml = zlib.decompress(base64.b64decode(data), -15)
+    return unquote(xml.decode("ascii"))
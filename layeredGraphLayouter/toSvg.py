@@ -66,7 +66,7 @@ class ToSvg():
         }
 
     def LPort_coordinates(self, lp: LPort):
-        p = lp.getNode()
+        p = lp.node
         ch = lp
         is_on_right = p.possition.x >= p.possition.x + p.possition.x / 2
         if is_on_right:
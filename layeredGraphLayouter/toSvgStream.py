@@ -0,0 +1,160 @@
+"""
+Streaming SVG exporter
+
+Writes SVG text directly to a file-like object in a single pass over graph.nodes
+and graph.edges. Unlike :class:`layeredGraphLayouter.toSvg.ToSvg` it does not build
+an ElementTree, so the memory use does not depend on the size of the graph.
+Styles are defined once as CSS classes in <defs><style>.
+"""
+import gzip
+from xml.sax.saxutils import escape
+
+from layeredGraphLayouter.containers.geometry import LRectangle
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lNode import LNode, LayoutExternalPort
+from layeredGraphLayouter.containers.lPort import LPort
+from layeredGraphLayouter.containers.sizeConfig import PORT_HEIGHT
+from layeredGraphLayouter.toSvg import ToSvg, COMPONENT_FILL, EXTERNAL_PORT_FILL
+
+
+def svg_num(v) -> str:
+    """
+    Format number for svg attribute (integral values without ".0")
+    """
+    i = int(v)
+    if i == v:
+        return str(i)
+    return repr(float(v))
+
+
+SVG_DEFS = """<defs>
+<style>
+.c{fill:%(component_fill)s;stroke:black;stroke-width:2}
+.x{fill:%(external_port_fill)s;stroke:black;stroke-width:2}
+text{fill:black;text-anchor:middle}
+.e{fill:none;stroke:black;stroke-width:2;marker-end:url(#markerArrow)}
+.r{fill:none;stroke:%(reversed_edge_stroke)s;stroke-width:2;marker-end:url(#markerArrow)}
+</style>
+<marker id="markerCircle" markerWidth="8" markerHeight="8" refX="5" refY="5">
+<circle cx="2" cy="2" r="2" style="stroke: none; fill:#000000;"/>
+</marker>
+<marker id="markerArrow" viewBox="0 0 10 10" refX="1" refY="5" markerUnits="strokeWidth" markerWidth="5" markerHeight="5" orient="auto">
+<path d="M 0 0 L 10 5 L 0 10 z" fill="context-stroke"/>
+</marker>
+</defs>
+"""
+
+
+class ToSvgStream(ToSvg):
+    """
+    Streaming version of :class:`layeredGraphLayouter.toSvg.ToSvg`,
+    output renders the same.
+
+    :ivar write: write method of current output file
+    """
+
+    def __init__(self, reversed_edge_stroke="black"):
+        super(ToSvgStream, self).__init__(reversed_edge_stroke=reversed_edge_stroke)
+        self.write = None
+
+    def rect(self, rect: LRectangle, label=None, cls="c"):
+        pos = rect.possition
+        size = rect.size
+        x = pos.x
+        y = pos.y
+        w = size.x
+        parts = ['<rect class="', cls,
+                 '" x="', svg_num(x),
+                 '" y="', svg_num(y),
+                 '" width="', svg_num(w),
+                 '" height="', svg_num(size.y), '"/>']
+        if label is not None:
+            parts.extend((
+                '<text x="', svg_num(x + w / 2),
+                # center text in the middle
+                '" y="', svg_num(y + PORT_HEIGHT * 0.7),
+                '">', escape(label), '</text>'))
+        parts.append("\n")
+        self.write("".join(parts))
+
+    def LNode_toSvg(self, lu: LNode, cls="c"):
+        write = self.write
+        write("<g>")
+        self.rect(lu, label=lu.name, cls=cls)
+        for lp in lu.iterPorts():
+            self.LPort_toSvg(lp)
+        write("</g>\n")
+
+    def LPort_toSvg(self, lp: LPort):
+        self.rect(lp, label=lp.name)
+
+    def LayoutExternalPort_toSvg(self, lep: LayoutExternalPort):
+        if len(lep.west) + len(lep.east) == 1:
+            self.rect(lep, label=lep.name, cls="x")
+        else:
+            self.LNode_toSvg(lep, cls="x")
+
+    def LEdge_toSvg(self, e):
+        if e.reversed:
+            _src = e.dst
+            _dst = e.src
+            cls = "r"
+        else:
+            _src = e.src
+            _dst = e.dst
+            cls = "e"
+
+        srcX, srcY = self.LPort_coordinates(_src)
+        dstX, dstY = self.LPort_coordinates(_dst)
+        self.write('<polyline class="%s" points="%s,%s %s,%s"/>\n' % (
+            cls, svg_num(srcX), svg_num(srcY), svg_num(dstX), svg_num(dstY)))
+
+    def LGraph_toSvg(self, la: LGraph):
+        write = self.write
+        write('<svg xmlns="http://www.w3.org/2000/svg" width="%s" height="%s">\n' % (
+            svg_num(la.size.x), svg_num(la.size.y)))
+        write(SVG_DEFS % {
+            "component_fill": COMPONENT_FILL,
+            "external_port_fill": EXTERNAL_PORT_FILL,
+            "reversed_edge_stroke": self.reversed_edge_stroke,
+        })
+
+        toSvg = self._toSvg
+        for n in la.nodes:
+            toSvg[n.__class__](n)
+
+        for e in la.edges:
+            toSvg[e.__class__](e)
+
+        write("</svg>\n")
+
+    def toSvg(self, obj):
+        self._toSvg[obj.__class__](obj)
+
+    def writeSvg(self, graph: LGraph, fileObj):
+        """
+        Write svg of the graph to text file-like object
+        """
+        self.write = fileObj.write
+        try:
+            self.LGraph_toSvg(graph)
+        finally:
+            self.write = None
+
+    def writeSvgFile(self, graph: LGraph, fileName: str, compress=None):
+        """
+        Write svg of the graph to file
+
+        :param compress: if True the output is gzip compressed (.svgz),
+            if None it is compressed if the file name ends with ".svgz"
+        """
+        if compress is None:
+            compress = fileName.endswith(".svgz")
+
+        if compress:
+            f = gzip.open(fileName, "wt", encoding="utf-8")
+        else:
+            f = open(fileName, "w", encoding="utf-8")
+
+        with f:
+            self.writeSvg(graph, f)
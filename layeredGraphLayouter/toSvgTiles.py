@@ -0,0 +1,303 @@
+"""
+Tiled level-of-detail SVG exporter for huge layouts
+
+The finished layout is converted to simple primitives (rectangles with
+optional label and polylines) for each zoom level and the primitives are
+put into a grid spatial index whose cells are the tiles of the level.
+Each non-empty tile is written as a standalone SVG file whose viewBox
+is the part of the layout covered by the tile, so a viewer fetches only
+the tiles which are visible.
+
+Level of detail on coarser levels (scale < 1):
+
+* port labels are dropped when scale < portLabelMinScale,
+  ports and long edge dummy nodes when scale < portMinScale
+  and node labels when scale < nodeLabelMinScale
+* edges are split into segments snapped to the pixel grid of the level,
+  so the bundles of parallel edges collapse to a single line
+
+Output directory layout::
+
+    index.json           {"width", "height", "tileSize", "levels": [
+                            {"zoom", "scale", "tileWorldSize",
+                             "columns", "rows", "tiles": [[x, y], ...]}]}
+    <zoom>/<x>_<y>.svg
+
+Zoom 0 is the coarsest level, the last level has scale 1.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import json
+from math import ceil, floor
+import os
+from typing import List, Tuple
+from xml.sax.saxutils import escape
+
+from layeredGraphLayouter.containers.constants import NodeType
+from layeredGraphLayouter.containers.lGraph import LGraph
+from layeredGraphLayouter.containers.lNode import LayoutExternalPort
+from layeredGraphLayouter.containers.sizeConfig import PORT_HEIGHT
+from layeredGraphLayouter.toSvg import ToSvg, COMPONENT_FILL, EXTERNAL_PORT_FILL
+from layeredGraphLayouter.toSvgStream import svg_num, SVG_DEFS
+from layeredGraphLayouter.trace import span, getTracer, tracing
+
+
+# ("rect", x, y, width, height, css class, label or None)
+# ("line", ((x, y), ...), css class)
+Primitive = tuple
+
+
+class GridIndex():
+    """
+    Uniform grid spatial index
+
+    :ivar cellSize: width and height of the cell
+    :ivar cells: dict {(cell x, cell y): list of items}
+    """
+
+    def __init__(self, cellSize: float):
+        self.cellSize = cellSize
+        self.cells = {}
+
+    def cellRange(self, x0, y0, x1, y1):
+        cs = self.cellSize
+        return (int(floor(x0 / cs)), int(floor(y0 / cs)),
+                int(floor(x1 / cs)), int(floor(y1 / cs)))
+
+    def insert(self, item, x0, y0, x1, y1):
+        """
+        Add item with bounding box to all cells which it intersects
+        """
+        cx0, cy0, cx1, cy1 = self.cellRange(x0, y0, x1, y1)
+        cells = self.cells
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                items = cells.get((cx, cy))
+                if items is None:
+                    cells[(cx, cy)] = [item]
+                elif items[-1] != item:
+                    items.append(item)
+
+    def query(self, x0, y0, x1, y1) -> List:
+        """
+        :return: sorted list of unique items from cells intersecting the box
+        """
+        cx0, cy0, cx1, cy1 = self.cellRange(x0, y0, x1, y1)
+        res = set()
+        cells = self.cells
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                items = cells.get((cx, cy))
+                if items:
+                    res.update(items)
+        return sorted(res)
+
+
+def renderTile(viewBox: Tuple[float, float, float, float], tileSize: int,
+               primitives: List[Primitive], defs: str) -> str:
+    """
+    :return: svg document of the tile
+    """
+    x, y, w, h = viewBox
+    parts = ['<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d"'
+             ' viewBox="%s %s %s %s">\n' % (tileSize, tileSize, svg_num(x),
+                                            svg_num(y), svg_num(w), svg_num(h)),
+             defs]
+    for p in primitives:
+        if p[0] == "rect":
+            _, x, y, w, h, cls, label = p
+            parts.append('<rect class="%s" x="%s" y="%s" width="%s" height="%s"/>' % (
+                cls, svg_num(x), svg_num(y), svg_num(w), svg_num(h)))
+            if label is not None:
+                parts.append('<text x="%s" y="%s">%s</text>' % (
+                    svg_num(x + w / 2), svg_num(y + PORT_HEIGHT * 0.7),
+                    escape(label)))
+            parts.append("\n")
+        else:
+            _, points, cls = p
+            parts.append('<polyline class="%s" points="%s"/>\n' % (
+                cls, " ".join("%s,%s" % (svg_num(px), svg_num(py))
+                              for px, py in points)))
+    parts.append("</svg>\n")
+    return "".join(parts)
+
+
+def _writeTile(task, trace=False):
+    """
+    :param trace: if True spans are collected by new Tracer
+        (the function runs in worker process) and returned
+    """
+    if trace:
+        with tracing() as tracer:
+            _writeTile(task)
+        return tracer.events
+
+    fileName, viewBox, tileSize, primitives, defs = task
+    with span("tile", "svgTiles", {"file": fileName}):
+        with open(fileName, "w", encoding="utf-8") as f:
+            f.write(renderTile(viewBox, tileSize, primitives, defs))
+
+
+class ToSvgTiles(ToSvg):
+    """
+    Exporter of the layout to the pyramid of svg tiles
+    (described in module docstring)
+
+    :ivar tileSize: size of the tile in pixels
+    :ivar levels: number of zoom levels, scale of level z
+        is 0.5 ** (levels - 1 - z)
+    :ivar workers: number of processes used to write tiles,
+        tiles are written in this process if None
+    """
+
+    def __init__(self, tileSize=512, levels=4, workers=None,
+                 portLabelMinScale=1, portMinScale=0.5,
+                 nodeLabelMinScale=0.25, reversed_edge_stroke="black"):
+        super(ToSvgTiles, self).__init__(reversed_edge_stroke=reversed_edge_stroke)
+        self.tileSize = tileSize
+        self.levels = levels
+        self.workers = workers
+        self.portLabelMinScale = portLabelMinScale
+        self.portMinScale = portMinScale
+        self.nodeLabelMinScale = nodeLabelMinScale
+
+    def LEdge_points(self, e):
+        if e.reversed:
+            _src = e.dst
+            _dst = e.src
+            cls = "r"
+        else:
+            _src = e.src
+            _dst = e.dst
+            cls = "e"
+
+        points = [self.LPort_coordinates(_src)]
+        points.extend((bp.x, bp.y) for bp in e.bendPoints)
+        points.append(self.LPort_coordinates(_dst))
+        return points, cls
+
+    def LGraph_toPrimitives(self, la: LGraph, scale: float) -> List[Primitive]:
+        """
+        :return: primitives of the layout for the zoom level with the scale
+        """
+        prims = []
+        showPorts = scale >= self.portMinScale
+        showPortLabels = scale >= self.portLabelMinScale
+        showNodeLabels = scale >= self.nodeLabelMinScale
+
+        for n in la.nodes:
+            if n.type == NodeType.LONG_EDGE and not showPorts:
+                continue
+            pos = n.possition
+            size = n.size
+            isExternalPort = isinstance(n, LayoutExternalPort)
+            prims.append(("rect", pos.x, pos.y, size.x, size.y,
+                          "x" if isExternalPort else "c",
+                          n.name if showNodeLabels else None))
+            if isExternalPort and len(n.west) + len(n.east) == 1:
+                # external port is drawn as a single rectangle
+                continue
+
+            if showPorts:
+                for p in n.iterPorts():
+                    pos = p.possition
+                    size = p.size
+                    prims.append(("rect", pos.x, pos.y, size.x, size.y, "c",
+                                  p.name if showPortLabels else None))
+
+        if scale >= 1:
+            for e in la.edges:
+                points, cls = self.LEdge_points(e)
+                prims.append(("line", tuple(points), cls))
+        else:
+            # snap segments to the pixel grid and merge the same ones
+            px = 1 / scale
+            segments = {}
+            for e in la.edges:
+                points, cls = self.LEdge_points(e)
+                points = [(round(x / px) * px, round(y / px) * px)
+                          for x, y in points]
+                for p0, p1 in zip(points, points[1:]):
+                    if p0 != p1:
+                        segments.setdefault((p0, p1), cls)
+            for seg, cls in segments.items():
+                prims.append(("line", seg, cls))
+
+        return prims
+
+    def indexPrimitives(self, prims: List[Primitive], cellSize: float) -> GridIndex:
+        index = GridIndex(cellSize)
+        for i, p in enumerate(prims):
+            if p[0] == "rect":
+                _, x, y, w, h, _, _ = p
+                index.insert(i, x, y, x + w, y + h)
+            else:
+                points = p[1]
+                for (x0, y0), (x1, y1) in zip(points, points[1:]):
+                    index.insert(i, min(x0, x1), min(y0, y1),
+                                 max(x0, x1), max(y0, y1))
+        return index
+
+    def writeTiles(self, graph: LGraph, outDir: str):
+        """
+        Write all tiles and index.json to directory
+
+        :return: the index (same as the content of index.json)
+        """
+        defs = SVG_DEFS % {
+            "component_fill": COMPONENT_FILL,
+            "external_port_fill": EXTERNAL_PORT_FILL,
+            "reversed_edge_stroke": self.reversed_edge_stroke,
+        }
+        width = graph.size.x
+        height = graph.size.y
+        res = {
+            "width": width,
+            "height": height,
+            "tileSize": self.tileSize,
+            "levels": [],
+        }
+        tasks = []
+        for zoom in range(self.levels):
+            scale = 0.5 ** (self.levels - 1 - zoom)
+            tileWorldSize = self.tileSize / scale
+            with span("level", "svgTiles", {"zoom": zoom}):
+                prims = self.LGraph_toPrimitives(graph, scale)
+                index = self.indexPrimitives(prims, tileWorldSize)
+
+            levelDir = os.path.join(outDir, str(zoom))
+            os.makedirs(levelDir, exist_ok=True)
+            tiles = []
+            for (tx, ty), items in sorted(index.cells.items(),
+                                          key=lambda c: (c[0][1], c[0][0])):
+                tiles.append([tx, ty])
+                viewBox = (tx * tileWorldSize, ty * tileWorldSize,
+                           tileWorldSize, tileWorldSize)
+                tasks.append((os.path.join(levelDir, "%d_%d.svg" % (tx, ty)),
+                              viewBox, self.tileSize,
+                              [prims[i] for i in items], defs))
+
+            res["levels"].append({
+                "zoom": zoom,
+                "scale": scale,
+                "tileWorldSize": tileWorldSize,
+                "columns": max(1, ceil(width / tileWorldSize)),
+                "rows": max(1, ceil(height / tileWorldSize)),
+                "tiles": tiles,
+            })
+
+        if self.workers is None:
+            for t in tasks:
+                _writeTile(t)
+        else:
+            tracer = getTracer()
+            trace = [tracer is not None] * len(tasks)
+            with ProcessPoolExecutor(self.workers) as executor:
+                for events in executor.map(_writeTile, tasks, trace,
+                                           chunksize=max(1, len(tasks) // (4 * self.workers))):
+                    if events:
+                        tracer.merge(events)
+
+        with open(os.path.join(outDir, "index.json"), "w") as f:
+            json.dump(res, f)
+
+        return res
@@ -0,0 +1,260 @@
+"""
+Lightweight span instrumentation of the layout
+
+Tracing is disabled by default, in this case span() returns a shared
+no-op context manager and nothing is recorded. When enabled
+(enableTracing() or "with tracing() as tracer:") each span is recorded
+as a complete event and the trace can be written in Chrome trace event
+format (chrome://tracing, https://ui.perfetto.dev) or in speedscope format
+(https://www.speedscope.app).
+
+.. code-block:: python
+
+    with tracing() as tracer:
+        LayoutProcessor(graph, config).run()
+    tracer.write("layout.trace.json")
+
+Spans from worker processes are collected by a separate Tracer
+in the worker (tracing() installed in the worker function), the events
+are returned to the parent process and merged by Tracer.merge().
+Time is taken from time.monotonic_ns() which is shared by all processes
+of the system, so the merged events are on the same timeline.
+"""
+from contextlib import contextmanager
+import json
+import os
+import threading
+from time import monotonic_ns
+from typing import Dict, List, Optional, Tuple
+
+
+# (name, category, start [ns], duration [ns], pid, tid, args)
+TraceEvent = Tuple[str, str, int, int, int, int, Optional[Dict]]
+
+_tracer = None
+
+
+class _NullSpan():
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span():
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: Optional[Dict]):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = monotonic_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        end = monotonic_ns()
+        t = self.tracer
+        t.events.append((self.name, self.cat, self.start, end - self.start,
+                         t.pid, threading.get_ident(), self.args))
+        return False
+
+
+def _jsonArgs(args: Optional[Dict]) -> Optional[Dict]:
+    if not args:
+        return None
+    return {k: v if isinstance(v, (int, float, str, bool)) or v is None
+            else str(v)
+            for k, v in args.items()}
+
+
+class Tracer():
+    """
+    Collector of spans
+
+    :ivar events: list of TraceEvent in order of the end of the span
+    """
+
+    def __init__(self):
+        self.events = []
+        self.pid = os.getpid()
+
+    def span(self, name: str, cat: str="layout", args: Optional[Dict]=None):
+        return _Span(self, name, cat, args)
+
+    def merge(self, events: List[TraceEvent]):
+        """
+        Add events recorded by other Tracer (e.g. in worker process)
+        """
+        self.events.extend(events)
+
+    def _sortedEvents(self) -> List[TraceEvent]:
+        # parents before children
+        return sorted(self.events, key=lambda e: (e[4], e[5], e[2], -e[3]))
+
+    def toChromeTrace(self) -> dict:
+        events = self._sortedEvents()
+        t0 = min((e[2] for e in events), default=0)
+        traceEvents = []
+        pids = set()
+        for name, cat, start, dur, pid, tid, args in events:
+            ev = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (start - t0) / 1000,
+                "dur": dur / 1000,
+                "pid": pid,
+                "tid": tid,
+            }
+            args = _jsonArgs(args)
+            if args:
+                ev["args"] = args
+            traceEvents.append(ev)
+            pids.add(pid)
+
+        for pid in sorted(pids):
+            traceEvents.append({
+                "name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                "args": {"name": "main" if pid == self.pid else "worker %d" % pid},
+            })
+
+        return {"traceEvents": traceEvents, "displayTimeUnit": "ms"}
+
+    def toSpeedscope(self, name="layout") -> dict:
+        """
+        Convert to speedscope evented profiles (one profile for each thread)
+        """
+        events = self._sortedEvents()
+        t0 = min((e[2] for e in events), default=0)
+        frames = []
+        frameIndex = {}
+        profiles = []
+        threads = {}
+        for e in events:
+            threads.setdefault((e[4], e[5]), []).append(e)
+
+        for (pid, tid), threadEvents in threads.items():
+            out = []
+            # stack of (frame, end)
+            stack = []
+            startValue = None
+            endValue = 0
+            for ev in threadEvents:
+                evName, cat, start, dur, _, _, _ = ev
+                start -= t0
+                end = start + dur
+                while stack and stack[-1][1] <= start:
+                    f, fEnd = stack.pop()
+                    out.append({"type": "C", "frame": f, "at": fEnd})
+                if stack:
+                    # rounding of the clock can not break the nesting
+                    end = min(end, stack[-1][1])
+
+                k = (evName, cat)
+                f = frameIndex.get(k)
+                if f is None:
+                    f = frameIndex[k] = len(frames)
+                    frames.append({"name": evName, "file": cat})
+                out.append({"type": "O", "frame": f, "at": start})
+                stack.append((f, end))
+                if startValue is None:
+                    startValue = start
+                endValue = max(endValue, end)
+
+            while stack:
+                f, fEnd = stack.pop()
+                out.append({"type": "C", "frame": f, "at": fEnd})
+
+            profiles.append({
+                "type": "evented",
+                "name": "%s %d thread %d" % (
+                    "main" if pid == self.pid else "worker", pid, tid),
+                "unit": "nanoseconds",
+                "startValue": startValue or 0,
+                "endValue": endValue,
+                "events": out,
+            })
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+            "name": name,
+            "exporter": "layeredGraphLayouter",
+        }
+
+    def write(self, fileName: str, format: Optional[str]=None):
+        """
+        :param format: "chrome" or "speedscope", if None speedscope is used
+            for "*.speedscope.json" files and chrome otherwise
+        """
+        if format is None:
+            format = "speedscope" if fileName.endswith(".speedscope.json") else "chrome"
+        if format == "chrome":
+            data = self.toChromeTrace()
+        elif format == "speedscope":
+            data = self.toSpeedscope()
+        else:
+            raise ValueError(format)
+
+        with open(fileName, "w") as f:
+            json.dump(data, f)
+
+
+def span(name: str, cat: str="layout", args: Optional[Dict]=None):
+    """
+    Context manager which records the span if tracing is enabled
+
+    :param args: optional dict of additional information,
+        values which are not JSON primitives are converted by str()
+        during the export
+    """
+    t = _tracer
+    if t is None:
+        return _NULL_SPAN
+    return _Span(t, name, cat, args)
+
+
+def getTracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def enableTracing(tracer: Optional[Tracer]=None) -> Tracer:
+    global _tracer
+    if tracer is None:
+        tracer = Tracer()
+    _tracer = tracer
+    return tracer
+
+
+def disableTracing() -> Optional[Tracer]:
+    """
+    :return: the tracer which was active
+    """
+    global _tracer
+    t = _tracer
+    _tracer = None
+    return t
+
+
+@contextmanager
+def tracing(tracer: Optional[Tracer]=None):
+    """
+    Enable tracing with new Tracer and restore the previous state on exit
+    """
+    global _tracer
+    prev = _tracer
+    t = enableTracing(tracer)
+    try:
+        yield t
+    finally:
+        _tracer = prev